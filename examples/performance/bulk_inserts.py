@@ -132,6 +132,42 @@ def test_core_insert(n):
         )
 
 
+@Profiler.profile
+def test_core_insert_iterator(n):
+    """A single Core INSERT construct inserting mappings from a generator,
+    consumed in pages so that parameters are never all in memory."""
+    with engine.begin() as conn:
+        conn.execute(
+            Customer.__table__.insert(),
+            (
+                dict(
+                    name="customer name %d" % i,
+                    description="customer description %d" % i,
+                )
+                for i in range(n)
+            ),
+        )
+
+
+@Profiler.profile
+def test_core_insert_iterator_returning(n):
+    """A single Core INSERT..RETURNING construct inserting mappings from a
+    generator, streaming back new primary keys one page at a time."""
+    with engine.begin() as conn:
+        result = conn.execution_options(yield_per=1000).execute(
+            Customer.__table__.insert().returning(Customer.__table__.c.id),
+            (
+                dict(
+                    name="customer name %d" % i,
+                    description="customer description %d" % i,
+                )
+                for i in range(n)
+            ),
+        )
+        for partition in result.partitions():
+            pass
+
+
 @Profiler.profile
 def test_dbapi_raw(n):
     """The DBAPI's API inserting rows in bulk."""
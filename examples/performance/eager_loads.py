@@ -0,0 +1,103 @@
+"""This series of tests illustrates the effect of the chunk size used
+by the "selectin" eager loader when loading a large number of parent
+objects along with their related collections.
+
+By default, the "selectin" loader emits one SELECT for every 500 parent
+objects.  Using ``chunk_size="auto"``, the chunk size is instead derived
+from the maximum number of bound parameters the backend accepts in a
+single statement, so that far fewer round trips are needed for very
+large result sets.
+
+"""
+from sqlalchemy import Column
+from sqlalchemy import create_engine
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session
+from . import Profiler
+
+
+Base = declarative_base()
+engine = None
+
+
+class Parent(Base):
+    __tablename__ = "parent"
+    id = Column(Integer, primary_key=True)
+    data = Column(String(255))
+    children = relationship("Child")
+
+
+class Child(Base):
+    __tablename__ = "child"
+    id = Column(Integer, primary_key=True)
+    parent_id = Column(ForeignKey("parent.id"))
+    data = Column(String(255))
+
+
+Profiler.init("eager_loads", num=100000)
+
+
+@Profiler.setup_once
+def setup_database(dburl, echo, num):
+    global engine
+    engine = create_engine(dburl, echo=echo)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    s = Session(engine)
+    for chunk in range(0, num, 10000):
+        s.execute(
+            Parent.__table__.insert(),
+            params=[
+                {"id": i + 1, "data": "parent %d" % i}
+                for i in range(chunk, chunk + 10000)
+            ],
+        )
+        s.execute(
+            Child.__table__.insert(),
+            params=[
+                {"parent_id": i + 1, "data": "child %d %d" % (i, j)}
+                for i in range(chunk, chunk + 10000)
+                for j in range(3)
+            ],
+        )
+    s.commit()
+
+
+def _load(n, option):
+    sess = Session(engine)
+    for parent in sess.scalars(
+        select(Parent).options(option).order_by(Parent.id).limit(n)
+    ):
+        parent.children
+
+
+@Profiler.profile
+def test_selectinload_default(n):
+    """selectinload using the default chunk size of 500"""
+
+    _load(n, selectinload(Parent.children))
+
+
+@Profiler.profile
+def test_selectinload_chunk_size_5000(n):
+    """selectinload with a fixed chunk size of 5000"""
+
+    _load(n, selectinload(Parent.children, chunk_size=5000))
+
+
+@Profiler.profile
+def test_selectinload_chunk_size_auto(n):
+    """selectinload with the chunk size derived from the dialect"""
+
+    _load(n, selectinload(Parent.children, chunk_size="auto"))
+
+
+if __name__ == "__main__":
+    Profiler.main()
@@ -7,55 +7,15 @@
 
 from __future__ import annotations
 
+import importlib
 from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TYPE_CHECKING
 
 from . import util as _util
-from .engine import AdaptedConnection as AdaptedConnection
-from .engine import BaseRow as BaseRow
-from .engine import BindTyping as BindTyping
-from .engine import ChunkedIteratorResult as ChunkedIteratorResult
-from .engine import Compiled as Compiled
-from .engine import Connection as Connection
-from .engine import create_engine as create_engine
-from .engine import create_mock_engine as create_mock_engine
-from .engine import CreateEnginePlugin as CreateEnginePlugin
-from .engine import CursorResult as CursorResult
-from .engine import Dialect as Dialect
-from .engine import Engine as Engine
-from .engine import engine_from_config as engine_from_config
-from .engine import ExceptionContext as ExceptionContext
-from .engine import ExecutionContext as ExecutionContext
-from .engine import FrozenResult as FrozenResult
-from .engine import Inspector as Inspector
-from .engine import IteratorResult as IteratorResult
-from .engine import make_url as make_url
-from .engine import MappingResult as MappingResult
-from .engine import MergedResult as MergedResult
-from .engine import NestedTransaction as NestedTransaction
-from .engine import Result as Result
-from .engine import result_tuple as result_tuple
-from .engine import ResultProxy as ResultProxy
-from .engine import RootTransaction as RootTransaction
-from .engine import Row as Row
-from .engine import RowMapping as RowMapping
-from .engine import ScalarResult as ScalarResult
-from .engine import Transaction as Transaction
-from .engine import TwoPhaseTransaction as TwoPhaseTransaction
-from .engine import TypeCompiler as TypeCompiler
-from .engine import URL as URL
 from .inspection import inspect as inspect
-from .pool import AssertionPool as AssertionPool
-from .pool import AsyncAdaptedQueuePool as AsyncAdaptedQueuePool
-from .pool import (
-    FallbackAsyncAdaptedQueuePool as FallbackAsyncAdaptedQueuePool,
-)
-from .pool import NullPool as NullPool
-from .pool import Pool as Pool
-from .pool import PoolProxiedConnection as PoolProxiedConnection
-from .pool import PoolResetState as PoolResetState
-from .pool import QueuePool as QueuePool
-from .pool import SingletonThreadPool as SingleonThreadPool
-from .pool import StaticPool as StaticPool
 from .schema import BaseDDLElement as BaseDDLElement
 from .schema import BLANK_SCHEMA as BLANK_SCHEMA
 from .schema import CheckConstraint as CheckConstraint
@@ -203,6 +163,8 @@ from .sql.expression import union_all as union_all
 from .sql.expression import Update as Update
 from .sql.expression import update as update
 from .sql.expression import UpdateBase as UpdateBase
+from .sql.expression import Upsert as Upsert
+from .sql.expression import upsert as upsert
 from .sql.expression import Values as Values
 from .sql.expression import values as values
 from .sql.expression import ValuesBase as ValuesBase
@@ -258,17 +220,134 @@ from .types import Uuid as Uuid
 from .types import VARBINARY as VARBINARY
 from .types import VARCHAR as VARCHAR
 
-__version__ = "2.0.0b4"
+if TYPE_CHECKING:
+    from .engine import AdaptedConnection as AdaptedConnection
+    from .engine import BaseRow as BaseRow
+    from .engine import BindTyping as BindTyping
+    from .engine import ChunkedIteratorResult as ChunkedIteratorResult
+    from .engine import Compiled as Compiled
+    from .engine import Connection as Connection
+    from .engine import create_engine as create_engine
+    from .engine import create_mock_engine as create_mock_engine
+    from .engine import CreateEnginePlugin as CreateEnginePlugin
+    from .engine import CursorResult as CursorResult
+    from .engine import Dialect as Dialect
+    from .engine import Engine as Engine
+    from .engine import engine_from_config as engine_from_config
+    from .engine import ExceptionContext as ExceptionContext
+    from .engine import ExecutionContext as ExecutionContext
+    from .engine import FrozenResult as FrozenResult
+    from .engine import Inspector as Inspector
+    from .engine import IteratorResult as IteratorResult
+    from .engine import make_url as make_url
+    from .engine import MappingResult as MappingResult
+    from .engine import MergedResult as MergedResult
+    from .engine import NestedTransaction as NestedTransaction
+    from .engine import Result as Result
+    from .engine import result_tuple as result_tuple
+    from .engine import ResultProxy as ResultProxy
+    from .engine import RootTransaction as RootTransaction
+    from .engine import Row as Row
+    from .engine import RowMapping as RowMapping
+    from .engine import ScalarResult as ScalarResult
+    from .engine import Transaction as Transaction
+    from .engine import TwoPhaseTransaction as TwoPhaseTransaction
+    from .engine import TypeCompiler as TypeCompiler
+    from .engine import URL as URL
+    from .pool import AssertionPool as AssertionPool
+    from .pool import AsyncAdaptedQueuePool as AsyncAdaptedQueuePool
+    from .pool import (
+        FallbackAsyncAdaptedQueuePool as FallbackAsyncAdaptedQueuePool,
+    )
+    from .pool import NullPool as NullPool
+    from .pool import Pool as Pool
+    from .pool import PoolProxiedConnection as PoolProxiedConnection
+    from .pool import PoolResetState as PoolResetState
+    from .pool import QueuePool as QueuePool
+    from .pool import SingletonThreadPool as SingleonThreadPool
+    from .pool import StaticPool as StaticPool
 
+# names from the engine and pool packages are imported when first used, so
+# that scripts which only work with SQL and schema constructs, or which
+# don't use SQLAlchemy on every run, don't spend time importing them
+_lazy_names: Dict[str, tuple[str, Optional[str]]] = {
+    "engine": ("engine", None),
+    "pool": ("pool", None),
+    "AdaptedConnection": ("engine", "AdaptedConnection"),
+    "BaseRow": ("engine", "BaseRow"),
+    "BindTyping": ("engine", "BindTyping"),
+    "ChunkedIteratorResult": ("engine", "ChunkedIteratorResult"),
+    "Compiled": ("engine", "Compiled"),
+    "Connection": ("engine", "Connection"),
+    "create_engine": ("engine", "create_engine"),
+    "create_mock_engine": ("engine", "create_mock_engine"),
+    "CreateEnginePlugin": ("engine", "CreateEnginePlugin"),
+    "CursorResult": ("engine", "CursorResult"),
+    "Dialect": ("engine", "Dialect"),
+    "Engine": ("engine", "Engine"),
+    "engine_from_config": ("engine", "engine_from_config"),
+    "ExceptionContext": ("engine", "ExceptionContext"),
+    "ExecutionContext": ("engine", "ExecutionContext"),
+    "FrozenResult": ("engine", "FrozenResult"),
+    "Inspector": ("engine", "Inspector"),
+    "IteratorResult": ("engine", "IteratorResult"),
+    "make_url": ("engine", "make_url"),
+    "MappingResult": ("engine", "MappingResult"),
+    "MergedResult": ("engine", "MergedResult"),
+    "NestedTransaction": ("engine", "NestedTransaction"),
+    "Result": ("engine", "Result"),
+    "result_tuple": ("engine", "result_tuple"),
+    "ResultProxy": ("engine", "ResultProxy"),
+    "RootTransaction": ("engine", "RootTransaction"),
+    "Row": ("engine", "Row"),
+    "RowMapping": ("engine", "RowMapping"),
+    "ScalarResult": ("engine", "ScalarResult"),
+    "Transaction": ("engine", "Transaction"),
+    "TwoPhaseTransaction": ("engine", "TwoPhaseTransaction"),
+    "TypeCompiler": ("engine", "TypeCompiler"),
+    "URL": ("engine", "URL"),
+    "AssertionPool": ("pool", "AssertionPool"),
+    "AsyncAdaptedQueuePool": ("pool", "AsyncAdaptedQueuePool"),
+    "FallbackAsyncAdaptedQueuePool": ("pool", "FallbackAsyncAdaptedQueuePool"),
+    "NullPool": ("pool", "NullPool"),
+    "Pool": ("pool", "Pool"),
+    "PoolProxiedConnection": ("pool", "PoolProxiedConnection"),
+    "PoolResetState": ("pool", "PoolResetState"),
+    "QueuePool": ("pool", "QueuePool"),
+    "SingleonThreadPool": ("pool", "SingletonThreadPool"),
+    "StaticPool": ("pool", "StaticPool"),
+}
 
-def __go(lcls: Any) -> None:
-    from . import util as _sa_util
+__version__ = "2.0.0b4"
 
-    _sa_util.preloaded.import_prefix("sqlalchemy")
 
+def __go(lcls: Any) -> None:
     from . import exc
 
     exc._version_token = "".join(__version__.split(".")[0:2])
 
 
 __go(locals())
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__all__":
+        # consulted by "from sqlalchemy import *", which would otherwise
+        # include only the names that were already imported
+        return [key for key in __dir__() if not key.startswith("_")]
+
+    try:
+        module_name, attr = _lazy_names[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, attr) if attr is not None else module
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()).union(_lazy_names))
@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from collections.abc import Mapping
 
 from sqlalchemy import exc
@@ -27,6 +28,8 @@ def _distill_params_20(object params):
         return params
     elif isinstance(params, dict) or isinstance(params, Mapping):
         return [params]
+    elif isinstance(params, Iterator):
+        return params
     else:
         raise exc.ArgumentError("mapping or list expected for parameters")
 
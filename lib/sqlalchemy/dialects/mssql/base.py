@@ -927,6 +927,7 @@ from ...engine import reflection
 from ...engine.reflection import ReflectionDefaults
 from ...sql import coercions
 from ...sql import compiler
+from ...sql import crud
 from ...sql import elements
 from ...sql import expression
 from ...sql import func
@@ -2266,6 +2267,127 @@ class MSSQLCompiler(compiler.SQLCompiler):
             )
         return super(MSSQLCompiler, self).visit_binary(binary, **kwargs)
 
+    def visit_insert(self, insert_stmt, **kw):
+        if insert_stmt._is_upsert:
+            return self._render_upsert_merge(insert_stmt, **kw)
+        return super().visit_insert(insert_stmt, **kw)
+
+    def _render_upsert_merge(self, insert_stmt, **kw):
+        """Render an :class:`.Upsert` as a MERGE statement, which uses the
+        VALUES of the INSERT as its source rows."""
+
+        compile_state = insert_stmt._compile_state_factory(
+            insert_stmt, self, **kw
+        )
+        insert_stmt = compile_state.statement
+
+        if insert_stmt.select is not None:
+            raise exc.CompileError(
+                "The MSSQL dialect does not support UPSERT from a SELECT"
+            )
+
+        toplevel = not self.stack
+        if toplevel:
+            self.isinsert = True
+            if not self.dml_compile_state:
+                self.dml_compile_state = compile_state
+            if not self.compile_state:
+                self.compile_state = compile_state
+
+        self.stack.append(
+            {
+                "correlate_froms": set(),
+                "asfrom_froms": set(),
+                "selectable": insert_stmt,
+            }
+        )
+
+        positiontup_before = len(self.positiontup or ())
+        crud_params_struct = crud._get_crud_params(
+            self, insert_stmt, compile_state, toplevel, **kw
+        )
+        positiontup_after = len(self.positiontup or ())
+
+        crud_params_single = crud_params_struct.single_params
+        if not crud_params_single:
+            raise exc.CompileError(
+                "The MSSQL dialect does not support an UPSERT "
+                "with no column values"
+            )
+
+        self.stack[-1]["insert_columns"] = [
+            col for col, _, _, _ in crud_params_single
+        ]
+        index_elements, update_columns = self._upsert_targets(
+            insert_stmt._post_values_clause
+        )
+
+        if compile_state._has_multi_parameters:
+            values_text = ", ".join(
+                "(%s)" % ", ".join(value for _, _, value, _ in crud_param_set)
+                for crud_param_set in crud_params_struct.all_multi_params
+            )
+        else:
+            single_values_expr = ", ".join(
+                value for _, _, value, _ in crud_params_single
+            )
+            values_text = "(%s)" % single_values_expr
+            if toplevel and self._insert_stmt_should_use_insertmanyvalues(
+                insert_stmt
+            ):
+                self._insertmanyvalues = compiler._InsertManyValues(
+                    False,
+                    single_values_expr,
+                    crud_params_single,
+                    positiontup_after - positiontup_before,
+                )
+
+        preparer = self.preparer
+        table_text = preparer.format_table(insert_stmt.table)
+        column_names = [expr for _, expr, _, _ in crud_params_single]
+
+        on_criteria = []
+        for elem in index_elements:
+            if not isinstance(elem, elements.ColumnClause):
+                raise exc.CompileError(
+                    "The MSSQL dialect supports only columns as the "
+                    "conflict target of an UPSERT"
+                )
+            name = preparer.quote(elem.name)
+            on_criteria.append(f"{table_text}.{name} = excluded.{name}")
+
+        # HOLDLOCK prevents concurrent MERGE statements from both
+        # attempting to INSERT the same key
+        text = (
+            f"MERGE INTO {table_text} WITH (HOLDLOCK) "
+            f"USING (VALUES {values_text}) "
+            f"AS excluded ({', '.join(column_names)}) "
+            f"ON {' AND '.join(on_criteria)}"
+        )
+        if update_columns:
+            text += " WHEN MATCHED THEN UPDATE SET " + ", ".join(
+                f"{name} = excluded.{name}"
+                for name in (
+                    preparer.quote(col.name) for col in update_columns
+                )
+            )
+        text += " WHEN NOT MATCHED THEN INSERT (%s) VALUES (%s)" % (
+            ", ".join(column_names),
+            ", ".join(f"excluded.{name}" for name in column_names),
+        )
+
+        if self.implicit_returning or insert_stmt._returning:
+            text += " " + self.returning_clause(
+                insert_stmt,
+                self.implicit_returning or insert_stmt._returning,
+                populate_result_map=toplevel,
+            )
+
+        self.stack.pop(-1)
+
+        # MERGE must be terminated with a semicolon
+        return text + ";"
+
     def returning_clause(
         self, stmt, returning_cols, *, populate_result_map, **kw
     ):
@@ -1016,6 +1016,7 @@ from sqlalchemy import literal_column
 from sqlalchemy import text
 from sqlalchemy.sql import visitors
 from . import reflection as _reflection
+from .dml import OnDuplicateClause
 from .enumerated import ENUM
 from .enumerated import SET
 from .json import JSON
@@ -1070,6 +1071,7 @@ from ...sql import operators
 from ...sql import roles
 from ...sql import sqltypes
 from ...sql import util as sql_util
+from ...sql.expression import alias
 from ...sql.sqltypes import Unicode
 from ...types import BINARY
 from ...types import BLOB
@@ -1317,6 +1319,19 @@ class MySQLCompiler(compiler.SQLCompiler):
         else:
             cols = statement.table.c
 
+        # VALUES() is deprecated as of MySQL 8.0.20 in favor of an alias
+        # for the row being inserted, which isn't available for
+        # INSERT..SELECT
+        requires_mysql8_alias = (
+            statement.select is None
+            and self.dialect._requires_alias_for_on_duplicate_key
+        )
+        if requires_mysql8_alias:
+            if statement.table.name.lower() == "new":
+                on_dup_alias_name = "new_1"
+            else:
+                on_dup_alias_name = "new"
+
         clauses = []
         # traverses through all table columns to preserve table column order
         for column in (col for col in cols if col.key in on_duplicate.update):
@@ -1340,9 +1355,18 @@ class MySQLCompiler(compiler.SQLCompiler):
                         isinstance(obj, elements.ColumnClause)
                         and obj.table is on_duplicate.inserted_alias
                     ):
-                        obj = literal_column(
-                            "VALUES(" + self.preparer.quote(obj.name) + ")"
-                        )
+                        if requires_mysql8_alias:
+                            obj = literal_column(
+                                "%s.%s"
+                                % (
+                                    on_dup_alias_name,
+                                    self.preparer.quote(obj.name),
+                                )
+                            )
+                        else:
+                            obj = literal_column(
+                                "VALUES(%s)" % self.preparer.quote(obj.name)
+                            )
                         return obj
                     else:
                         # element is not replaced
@@ -1365,7 +1389,36 @@ class MySQLCompiler(compiler.SQLCompiler):
                 )
             )
 
-        return "ON DUPLICATE KEY UPDATE " + ", ".join(clauses)
+        if requires_mysql8_alias:
+            return "AS %s ON DUPLICATE KEY UPDATE %s" % (
+                on_dup_alias_name,
+                ", ".join(clauses),
+            )
+        else:
+            return "ON DUPLICATE KEY UPDATE " + ", ".join(clauses)
+
+    def visit_upsert_clause(self, clause, **kw):
+        # the conflict target isn't used; MySQL considers all unique
+        # constraints of the table
+        _, update_columns = self._upsert_targets(clause)
+
+        if not update_columns:
+            # leave the existing row unchanged
+            name = self.preparer.quote(
+                self.stack[-1]["insert_columns"][0].name
+            )
+            return "ON DUPLICATE KEY UPDATE %s = %s" % (name, name)
+
+        # render as for Insert.on_duplicate_key_update(), with each column
+        # set to the value of the row being inserted
+        inserted_alias = alias(self.current_executable.table, name="inserted")
+        return self.process(
+            OnDuplicateClause(
+                inserted_alias,
+                {col.key: inserted_alias.c[col.key] for col in update_columns},
+            ),
+            **kw,
+        )
 
     def visit_concat_op_expression_clauselist(
         self, clauselist, operator, **kw
@@ -2407,6 +2460,7 @@ class MySQLDialect(default.DefaultDialect):
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = False
     supports_multivalues_insert = True
+    supports_row_value_comparison = True
     insert_null_pk_still_autoincrements = True
 
     supports_comments = True
@@ -2807,6 +2861,15 @@ class MySQLDialect(default.DefaultDialect):
             # ref https://dev.mysql.com/doc/relnotes/mysql/8.0/en/news-8-0-17.html#mysqld-8-0-17-feature  # noqa
             return self.server_version_info >= (8, 0, 17)
 
+    @property
+    def _requires_alias_for_on_duplicate_key(self):
+        # ref https://dev.mysql.com/doc/relnotes/mysql/8.0/en/news-8-0-20.html  # noqa
+        return (
+            self._is_mysql
+            and self.server_version_info is not None
+            and self.server_version_info >= (8, 0, 20)
+        )
+
     @property
     def _is_mariadb(self):
         return self.is_mariadb
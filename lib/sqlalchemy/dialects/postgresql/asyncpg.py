@@ -764,6 +764,32 @@ class AsyncAdapt_asyncpg_connection(AdaptedConnection):
         else:
             self._started = True
 
+    async def _copy_records_to_table(
+        self, table_name, records, columns, schema_name
+    ):
+        async with self._execute_mutex:
+            if not self._started:
+                await self._start_transaction()
+
+            try:
+                await self._connection.copy_records_to_table(
+                    table_name,
+                    records=records,
+                    columns=columns,
+                    schema_name=schema_name,
+                )
+            except Exception as error:
+                self._handle_exception(error)
+
+    def copy_records_to_table(
+        self, table_name, *, records, columns=None, schema_name=None
+    ):
+        self.await_(
+            self._copy_records_to_table(
+                table_name, records, columns, schema_name
+            )
+        )
+
     def cursor(self, server_side=False):
         if server_side:
             return AsyncAdapt_asyncpg_ss_cursor(self)
@@ -937,6 +963,7 @@ class PGDialect_asyncpg(PGDialect):
         },
     )
     is_async = True
+    supports_bulk_load = True
     _invalidate_schema_cache_asof = 0
 
     def _invalidate_schema_cache(self):
@@ -990,6 +1017,14 @@ class PGDialect_asyncpg(PGDialect):
     def do_terminate(self, dbapi_connection) -> None:
         dbapi_connection.terminate()
 
+    def do_bulk_load(self, dbapi_connection, table, columns, rows, schema):
+        dbapi_connection.copy_records_to_table(
+            table.name,
+            records=rows,
+            columns=[col.name for col in columns],
+            schema_name=schema,
+        )
+
     def create_connect_args(self, url):
         opts = url.translate_connect_args(username="user")
 
@@ -1995,6 +1995,9 @@ class PGCompiler(compiler.SQLCompiler):
 
         return "ON CONFLICT %s DO UPDATE SET %s" % (target_text, action_text)
 
+    def visit_upsert_clause(self, clause, **kw):
+        return self._render_upsert_on_conflict(clause, **kw)
+
     def update_from_clause(
         self, update_stmt, from_table, extra_froms, from_hints, **kw
     ):
@@ -2864,9 +2867,12 @@ class PGDialect(default.DefaultDialect):
 
     supports_empty_insert = False
     supports_multivalues_insert = True
+    supports_row_value_comparison = True
 
     supports_identity_columns = True
 
+    supports_exported_snapshots = True
+
     default_paramstyle = "pyformat"
     ischema_names = ischema_names
     colspecs = colspecs
@@ -2999,6 +3005,17 @@ class PGDialect(default.DefaultDialect):
     def get_deferrable(self, connection):
         raise NotImplementedError()
 
+    def do_export_snapshot(self, connection):
+        return connection.exec_driver_sql(
+            "SELECT pg_export_snapshot()"
+        ).scalar()
+
+    def do_import_snapshot(self, connection, snapshot_id):
+        connection.execution_options(isolation_level="REPEATABLE READ")
+        connection.exec_driver_sql(
+            "SET TRANSACTION SNAPSHOT '%s'" % snapshot_id
+        )
+
     def do_begin_twophase(self, connection, xid):
         self.do_begin(connection.connection)
 
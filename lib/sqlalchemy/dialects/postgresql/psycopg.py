@@ -257,6 +257,7 @@ class PGDialect_psycopg(_PGDialect_common_psycopg):
     supports_server_side_cursors = True
     default_paramstyle = "pyformat"
     supports_sane_multi_rowcount = True
+    supports_bulk_load = True
 
     execution_ctx_cls = PGExecutionContext_psycopg
     statement_compiler = PGCompiler_psycopg
@@ -505,6 +506,26 @@ class PGDialect_psycopg(_PGDialect_common_psycopg):
         else:
             self.do_commit(connection.connection)
 
+    def _bulk_load_statement(self, table, columns, schema):
+        preparer = self.identifier_preparer
+        name = preparer.quote(table.name)
+        if schema:
+            name = "%s.%s" % (preparer.quote_schema(schema), name)
+        return "COPY %s (%s) FROM STDIN" % (
+            name,
+            ", ".join(preparer.quote(col.name) for col in columns),
+        )
+
+    def do_bulk_load(self, dbapi_connection, table, columns, rows, schema):
+        statement = self._bulk_load_statement(table, columns, schema)
+        cursor = dbapi_connection.cursor()
+        try:
+            with cursor.copy(statement) as copy:
+                for row in rows:
+                    copy.write_row(row)
+        finally:
+            cursor.close()
+
     @util.memoized_property
     def _dialect_specific_select_one(self):
         return ";"
@@ -656,6 +677,15 @@ class AsyncAdapt_psycopg_connection(AdaptedConnection):
     def set_deferrable(self, value):
         self.await_(self._connection.set_deferrable(value))
 
+    async def _copy_rows(self, statement, rows):
+        async with self._connection.cursor() as cursor:
+            async with cursor.copy(statement) as copy:
+                for row in rows:
+                    await copy.write_row(row)
+
+    def copy_rows(self, statement, rows):
+        self.await_(self._copy_rows(statement, rows))
+
 
 class AsyncAdaptFallback_psycopg_connection(AsyncAdapt_psycopg_connection):
     __slots__ = ()
@@ -726,6 +756,11 @@ class PGDialectAsync_psycopg(PGDialect_psycopg):
     def set_deferrable(self, connection, value):
         connection.set_deferrable(value)
 
+    def do_bulk_load(self, dbapi_connection, table, columns, rows, schema):
+        dbapi_connection.copy_rows(
+            self._bulk_load_statement(table, columns, schema), rows
+        )
+
     def get_driver_connection(self, connection):
         return connection._connection
 
@@ -1441,6 +1441,9 @@ class SQLiteCompiler(compiler.SQLCompiler):
     def visit_not_regexp_match_op_binary(self, binary, operator, **kw):
         return self._generate_generic_binary(binary, " NOT REGEXP ", **kw)
 
+    def visit_upsert_clause(self, clause, **kw):
+        return self._render_upsert_on_conflict(clause, **kw)
+
     def _on_conflict_target(self, clause, **kw):
         if clause.constraint_target is not None:
             target_text = "(%s)" % clause.constraint_target
@@ -1933,6 +1936,7 @@ class SQLiteDialect(default.DefaultDialect):
     supports_multivalues_insert = True
     use_insertmanyvalues = True
     tuple_in_values = True
+    supports_row_value_comparison = True
     supports_statement_cache = True
     insert_null_pk_still_autoincrements = True
     insert_returning = True
@@ -2046,6 +2050,10 @@ class SQLiteDialect(default.DefaultDialect):
                 self.dbapi.sqlite_version_info
                 >= (3, 7, 11)
             )
+            # https://www.sqlite.org/releaselog/3_15_0.html
+            self.supports_row_value_comparison = (
+                self.dbapi.sqlite_version_info >= (3, 15, 0)
+            )
             # see https://www.sqlalchemy.org/trac/ticket/2568
             # as well as https://www.sqlite.org/src/info/600482d161
             self._broken_fk_pragma_quotes = self.dbapi.sqlite_version_info < (
@@ -15,6 +15,8 @@ constructor ``create_engine()``.
 
 """
 
+from typing import Any
+
 from . import events as events
 from . import util as util
 from .base import Connection as Connection
@@ -59,3 +61,13 @@ from .url import make_url as make_url
 from .url import URL as URL
 from .util import connection_memoize as connection_memoize
 from ..sql import ddl as ddl
+
+
+def __go(lcls: Any) -> None:
+    from .. import util as _sa_util
+
+    _sa_util.preloaded.import_prefix("sqlalchemy.engine")
+    _sa_util.preloaded.import_prefix("sqlalchemy.dialects")
+
+
+__go(locals())
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import collections.abc as collections_abc
 import typing
 from typing import Any
 from typing import Mapping
@@ -39,6 +40,10 @@ def _distill_params_20(
         Mapping,
     ):
         return [params]
+    elif isinstance(params, collections_abc.Iterator):
+        # an iterator or generator of parameter sets; passed through
+        # as is, to be consumed in pages by Connection for an INSERT
+        return params  # type: ignore
     else:
         raise exc.ArgumentError("mapping or list expected for parameters")
 
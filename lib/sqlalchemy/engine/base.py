@@ -10,6 +10,7 @@
 from __future__ import annotations
 
 import contextlib
+import itertools
 import sys
 import typing
 from typing import Any
@@ -22,6 +23,7 @@ from typing import Mapping
 from typing import NoReturn
 from typing import Optional
 from typing import overload
+from typing import Sequence
 from typing import Tuple
 from typing import Type
 from typing import TypeVar
@@ -76,6 +78,7 @@ if typing.TYPE_CHECKING:
     from ..sql.schema import DefaultGenerator
     from ..sql.schema import HasSchemaAttr
     from ..sql.schema import SchemaItem
+    from ..sql.selectable import TableClause
     from ..sql.selectable import TypedReturnsRows
 
 
@@ -245,6 +248,7 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
         max_row_buffer: int = ...,
         yield_per: int = ...,
         insertmanyvalues_page_size: int = ...,
+        insertmanyvalues_target_batch_time: float = ...,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
         **opt: Any,
     ) -> Connection:
@@ -474,6 +478,26 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
                 :ref:`engine_insertmanyvalues`
 
+        :param insertmanyvalues_target_batch_time: Available on:
+            :class:`_engine.Connection`, :class:`_engine.Engine`. A target
+            execution time in seconds for each INSERT statement rendered by
+            "insertmanyvalues" mode.  When set, the page size starts at
+            :paramref:`_engine.Connection.execution_options.insertmanyvalues_page_size`
+            and is then adjusted for each subsequent batch based on how long
+            the preceding batch took to execute, growing by no more than a
+            factor of two per batch and remaining within the bound parameter
+            limits of the dialect.  The page sizes used are available from the
+            ``insertmanyvalues_batch_sizes`` attribute of the execution
+            context.  May also be set on a per-engine basis using the
+            :paramref:`_sa.create_engine.insertmanyvalues_target_batch_time`
+            parameter.
+
+            .. versionadded:: 2.0.0rc1
+
+            .. seealso::
+
+                :ref:`engine_insertmanyvalues`
+
         :param schema_translate_map: Available on: :class:`_engine.Connection`,
           :class:`_engine.Engine`, :class:`_sql.Executable`.
 
@@ -1397,6 +1421,22 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
          When a single dictionary is passed, the DBAPI ``cursor.execute()``
          method will be used.
 
+         For an :class:`_expression.Insert` construct, an iterator or
+         generator of dictionaries may also be passed; the iterator is
+         consumed lazily in pages of
+         :paramref:`_engine.Connection.execution_options.insertmanyvalues_page_size`
+         parameter sets, each page being executed in turn, so that the full
+         set of parameters is never materialized in memory.  If the
+         statement includes RETURNING and the
+         :paramref:`_engine.Connection.execution_options.yield_per` or
+         :paramref:`_engine.Connection.execution_options.stream_results`
+         option is used, each page is executed only as the rows of the
+         preceding page are consumed from the returned
+         :class:`_engine.Result`, which must therefore be fully consumed
+         for all rows to be INSERTed.
+
+         .. versionadded:: 2.0.0rc1
+
         :param execution_options: optional dictionary of execution options,
          which will be associated with the statement execution.  This
          dictionary can provide a subset of the options that are accepted
@@ -1593,6 +1633,11 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
     ) -> CursorResult[Any]:
         """Execute a sql.ClauseElement object."""
 
+        if not isinstance(distilled_parameters, (list, tuple)):
+            return self._execute_clauseelement_paged(
+                elem, distilled_parameters, execution_options
+            )
+
         execution_options = elem._execution_options.merge_with(
             self._execution_options, execution_options
         )
@@ -1658,6 +1703,74 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             )
         return ret
 
+    def _execute_clauseelement_paged(
+        self,
+        elem: Executable,
+        parameters: Iterable[_CoreSingleExecuteParams],
+        execution_options: CoreExecuteOptionsParameter,
+    ) -> CursorResult[Any]:
+        """Execute an INSERT against an iterator of parameter sets.
+
+        The iterator is consumed in pages of
+        ``insertmanyvalues_page_size`` parameter sets, each of which is
+        executed as an individual executemany, so that no more than one page
+        of parameters is held in memory at once.
+
+        The returned :class:`_engine.CursorResult` reports the combined
+        :attr:`_engine.CursorResult.rowcount`,
+        :attr:`_engine.CursorResult.inserted_primary_key_rows` and
+        :attr:`_engine.CursorResult.returned_defaults_rows` of all pages.
+        When the statement includes RETURNING and the ``stream_results`` or
+        ``yield_per`` execution option is present, pages are executed only as
+        the rows of the returned :class:`_engine.CursorResult` are consumed,
+        and these accessors reflect only the pages executed so far.
+
+        """
+
+        if not elem.is_insert:
+            raise exc.ArgumentError(
+                "An iterator of parameter sets may only be used with an "
+                "INSERT statement"
+            )
+
+        parameters = iter(parameters)
+        opts = elem._execution_options.merge_with(
+            self._execution_options, execution_options
+        )
+        page_size = opts.get(
+            "insertmanyvalues_page_size",
+            self.dialect.insertmanyvalues_page_size,
+        )
+
+        def pages() -> Iterator[CursorResult[Any]]:
+            while True:
+                page = list(itertools.islice(parameters, page_size))
+                if not page:
+                    break
+                yield self._execute_clauseelement(
+                    elem, page, execution_options
+                )
+
+        results = pages()
+
+        first = next(results, None)
+        if first is None:
+            # no parameter sets at all; same as an empty list
+            return self._execute_clauseelement(elem, [], execution_options)
+
+        if not first.returns_rows:
+            for result in results:
+                first._merge_page(result)
+            return first
+
+        # with stream_results / yield_per, rows are delivered lazily; each
+        # page is INSERTed once the rows of the preceding page have been
+        # consumed
+        return first._with_paged_rows(
+            results,
+            bool(opts.get("stream_results", False) or opts.get("yield_per")),
+        )
+
     def _execute_compiled(
         self,
         compiled: Compiled,
@@ -1708,6 +1821,142 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             )
         return ret
 
+    def bulk_load(
+        self,
+        table: TableClause,
+        rows: Iterable[Mapping[str, Any]],
+        *,
+        columns: Optional[Sequence[str]] = None,
+        execution_options: Optional[CoreExecuteOptionsParameter] = None,
+    ) -> int:
+        """Load rows into a table using the fastest bulk loading facility
+        available for the backend.
+
+        E.g.::
+
+            with engine.begin() as conn:
+                conn.bulk_load(
+                    user_table,
+                    ({"id": i, "name": f"user {i}"} for i in range(1000000)),
+                )
+
+        For dialects which support a native bulk loading facility, as
+        indicated by :attr:`.Dialect.supports_bulk_load`, the values of each
+        row are passed through the bind processors of each column's datatype
+        and streamed to the driver; currently, this includes the psycopg and
+        asyncpg drivers for PostgreSQL, which make use of ``COPY .. FROM
+        STDIN``.  For all other dialects, the rows are INSERTed using
+        :meth:`_engine.Connection.execute` with an iterator of parameter
+        sets.
+
+        Unlike an INSERT, Python-side column defaults are not applied to
+        rows loaded using a native bulk loading facility, and no
+        statement-level events are emitted.  Columns not present in the
+        column list receive their server-side default, if any.
+
+        :param table: the :class:`_schema.Table` to load rows into.
+
+        :param rows: an iterable of dictionaries keyed to column keys.  The
+         iterable is consumed lazily.
+
+        :param columns: optional sequence of column keys to be loaded; if
+         omitted, the keys of the first row are used.  Every row must
+         contain each of these keys.
+
+        :param execution_options: optional dictionary of execution options;
+         of these, ``schema_translate_map`` is applied to the table.
+
+        :return: the number of rows loaded.
+
+        .. versionadded:: 2.0.0rc1
+
+        """
+
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return 0
+        rows = itertools.chain([first], rows)
+
+        if columns is None:
+            columns = list(first)
+        try:
+            cols = [table.c[key] for key in columns]
+        except KeyError as ke:
+            raise exc.ArgumentError(
+                f"Table {table.description!r} has no column {ke.args[0]!r}"
+            ) from ke
+
+        dialect = self.dialect
+        count = 0
+
+        if not dialect.supports_bulk_load:
+
+            def params() -> Iterator[Mapping[str, Any]]:
+                nonlocal count
+                for row in rows:
+                    count += 1
+                    yield {key: row[key] for key in columns}  # type: ignore
+
+            self.execute(
+                table.insert(), params(), execution_options=execution_options
+            )
+            return count
+
+        execution_options = self._execution_options.merge_with(
+            execution_options
+        )
+        schema = table.schema  # type: ignore[attr-defined]
+        schema_translate_map = execution_options.get(
+            "schema_translate_map", None
+        )
+        if schema_translate_map and schema in schema_translate_map:
+            schema = schema_translate_map[schema]
+
+        getters = [
+            (key, col.type._cached_bind_processor(dialect))
+            for key, col in zip(columns, cols)
+        ]
+
+        def processed_rows() -> Iterator[Tuple[Any, ...]]:
+            nonlocal count
+            for row in rows:
+                count += 1
+                yield tuple(
+                    proc(row[key]) if proc else row[key]
+                    for key, proc in getters
+                )
+
+        try:
+            conn = self._dbapi_connection
+            if conn is None:
+                conn = self._revalidate_connection()
+        except BaseException as e:
+            self._handle_dbapi_exception(e, None, None, None, None)
+
+        if (
+            self._transaction
+            and not self._transaction.is_active
+            or (
+                self._nested_transaction
+                and not self._nested_transaction.is_active
+            )
+        ):
+            self._invalid_transaction()
+        elif self._trans_context_manager:
+            TransactionalContext._trans_ctx_check(self)
+
+        if self._transaction is None:
+            self._autobegin()
+
+        try:
+            dialect.do_bulk_load(conn, table, cols, processed_rows(), schema)
+        except BaseException as e:
+            self._handle_dbapi_exception(
+                e, f"bulk load into {table.description}", None, None, None
+            )
+        return count
+
     def exec_driver_sql(
         self,
         statement: str,
@@ -3008,6 +3257,7 @@ class Engine(
         logging_token: str = ...,
         isolation_level: IsolationLevel = ...,
         insertmanyvalues_page_size: int = ...,
+        insertmanyvalues_target_batch_time: float = ...,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
         **opt: Any,
     ) -> OptionEngine:
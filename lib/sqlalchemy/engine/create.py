@@ -59,6 +59,7 @@ def create_engine(
     hide_parameters: bool = ...,
     implicit_returning: Literal[True] = ...,
     insertmanyvalues_page_size: int = ...,
+    insertmanyvalues_target_batch_time: float = ...,
     isolation_level: IsolationLevel = ...,
     json_deserializer: Callable[..., Any] = ...,
     json_serializer: Callable[..., Any] = ...,
@@ -292,6 +293,23 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
 
         :paramref:`_engine.Connection.execution_options.insertmanyvalues_page_size`
 
+    :param insertmanyvalues_target_batch_time: a target execution time in
+     seconds for each INSERT statement when the statement uses
+     "insertmanyvalues" mode.  When set, the number of rows in each batch is
+     adjusted after each execution so that batches take approximately this
+     long to run, starting from
+     :paramref:`_sa.create_engine.insertmanyvalues_page_size` and staying
+     within the bound parameter limits of the dialect.  Defaults to ``None``,
+     which indicates a fixed page size.
+
+     .. versionadded:: 2.0.0rc1
+
+     .. seealso::
+
+        :ref:`engine_insertmanyvalues`
+
+        :paramref:`_engine.Connection.execution_options.insertmanyvalues_target_batch_time`
+
     :param isolation_level: optional string name of an isolation level
         which will be set on all new connections unconditionally.
         Isolation levels are typically some subset of the string names
@@ -1342,6 +1342,57 @@ class FullyBufferedCursorFetchStrategy(CursorFetchStrategy):
         return ret
 
 
+class _PagedCursorFetchStrategy(FullyBufferedCursorFetchStrategy):
+    """A cursor strategy that delivers the rows of a series of
+    :class:`.CursorResult` objects, each of which is produced only once the
+    rows of the preceding one have been consumed.
+
+    Used for an INSERT..RETURNING executed against an iterator of parameter
+    sets, where each :class:`.CursorResult` represents one page of parameter
+    sets.   The execution state of each page is merged into the owning
+    result as the page is produced.
+
+    """
+
+    __slots__ = ("_results",)
+
+    def __init__(self, initial_buffer, results):
+        super().__init__(None, initial_buffer=initial_buffer)
+        self._results = results
+
+    def _next_page(self, result):
+        while not self._rowbuffer:
+            page = next(self._results, None)
+            if page is None:
+                return
+            result._merge_page(page)
+            self._rowbuffer.extend(page._raw_row_iterator())
+
+    def _fetch_all_pages(self, result):
+        for page in self._results:
+            result._merge_page(page)
+            self._rowbuffer.extend(page._raw_row_iterator())
+
+    def hard_close(self, result, dbapi_cursor):
+        # remaining pages are not executed
+        self._results = iter(())
+        super().hard_close(result, dbapi_cursor)
+
+    def fetchone(self, result, dbapi_cursor, hard_close=False):
+        self._next_page(result)
+        return super().fetchone(result, dbapi_cursor, hard_close=hard_close)
+
+    def fetchmany(self, result, dbapi_cursor, size=None):
+        if size is None:
+            return self.fetchall(result, dbapi_cursor)
+        self._next_page(result)
+        return super().fetchmany(result, dbapi_cursor, size)
+
+    def fetchall(self, result, dbapi_cursor):
+        self._fetch_all_pages(result)
+        return super().fetchall(result, dbapi_cursor)
+
+
 class _NoResultMetaData(ResultMetaData):
     __slots__ = ()
 
@@ -1824,18 +1875,76 @@ class CursorResult(Result[_T]):
             :meth:`.CursorResult.splice_horizontally`
 
         """
-        clone = self._generate()
         total_rows = list(self._raw_row_iterator()) + list(
             other._raw_row_iterator()
         )
+        return self._with_buffered_rows(total_rows)
 
+    def _with_buffered_rows(self, rows):
+        """Return a new :class:`.CursorResult` with the same metadata as this
+        one, delivering the given list of raw rows."""
+
+        clone = self._generate()
         clone.cursor_strategy = FullyBufferedCursorFetchStrategy(
             None,
-            initial_buffer=total_rows,
+            initial_buffer=rows,
         )
         clone._reset_memoizations()
         return clone
 
+    def _with_paged_rows(self, results, stream):
+        """Return a new :class:`.CursorResult` with the same metadata as this
+        one, delivering the rows of this result followed by those of each
+        :class:`.CursorResult` produced by the given iterator.
+
+        If ``stream`` is False, all results are produced and their rows
+        buffered up front; otherwise each result is produced only once the
+        rows of the preceding one have been consumed.
+
+        """
+
+        # memoize rowcount while the cursor is still present
+        rowcount = self.rowcount
+        rows = list(self._raw_row_iterator())
+
+        clone = self._generate()
+        clone.cursor_strategy = strategy = _PagedCursorFetchStrategy(
+            rows, results
+        )
+        clone._reset_memoizations()
+        clone.rowcount = rowcount
+        if not stream:
+            strategy._fetch_all_pages(clone)
+        return clone
+
+    def _merge_page(self, other):
+        """Merge the execution state of ``other``, the
+        :class:`.CursorResult` for the next page of parameter sets of an
+        INSERT executed against an iterator of parameter sets, into this
+        one.   Rows are not merged.
+
+        """
+        rowcount = self.rowcount
+        if rowcount > -1:
+            other_rowcount = other.rowcount
+            self.rowcount = (
+                rowcount + other_rowcount if other_rowcount > -1 else -1
+            )
+
+        context = self.context
+        other_context = other.context
+
+        # parameters and explicitly RETURNING rows aren't accumulated, so
+        # that a streamed result remains bounded in memory
+        if not context._is_explicit_returning:
+            context.inserted_primary_key_rows = list(
+                context.inserted_primary_key_rows
+            ) + list(other_context.inserted_primary_key_rows)
+        if other_context.returned_default_rows is not None:
+            context.returned_default_rows = list(
+                context.returned_default_rows or ()
+            ) + list(other_context.returned_default_rows)
+
     def _rewind(self, rows):
         """rewind this result back to the given rowset.
 
@@ -161,6 +161,7 @@ class DefaultDialect(Dialect):
     supports_simple_order_by_label = True
 
     tuple_in_values = False
+    supports_row_value_comparison = False
 
     connection_characteristics = util.immutabledict(
         {"isolation_level": characteristics.IsolationLevelCharacteristic()}
@@ -222,12 +223,17 @@ class DefaultDialect(Dialect):
 
     supports_multivalues_insert = False
 
+    supports_bulk_load = False
+
+    supports_exported_snapshots = False
+
     use_insertmanyvalues: bool = False
 
     use_insertmanyvalues_wo_returning: bool = False
 
     insertmanyvalues_page_size: int = 1000
     insertmanyvalues_max_parameters = 32700
+    insertmanyvalues_target_batch_time: Optional[float] = None
 
     supports_is_distinct_from = True
 
@@ -287,6 +293,7 @@ class DefaultDialect(Dialect):
         max_identifier_length: Optional[int] = None,
         label_length: Optional[int] = None,
         insertmanyvalues_page_size: Union[_NoArg, int] = _NoArg.NO_ARG,
+        insertmanyvalues_target_batch_time: Optional[float] = None,
         use_insertmanyvalues: Optional[bool] = None,
         # util.deprecated_params decorator cannot render the
         # Linting.NO_LINTING constant
@@ -354,6 +361,11 @@ class DefaultDialect(Dialect):
         if insertmanyvalues_page_size is not _NoArg.NO_ARG:
             self.insertmanyvalues_page_size = insertmanyvalues_page_size
 
+        if insertmanyvalues_target_batch_time is not None:
+            self.insertmanyvalues_target_batch_time = (
+                insertmanyvalues_target_batch_time
+            )
+
     @util.deprecated_property(
         "2.0",
         "full_returning is deprecated, please use insert_returning, "
@@ -725,17 +737,61 @@ class DefaultDialect(Dialect):
         batch_size = context.execution_options.get(
             "insertmanyvalues_page_size", self.insertmanyvalues_page_size
         )
+        target_time = context.execution_options.get(
+            "insertmanyvalues_target_batch_time",
+            self.insertmanyvalues_target_batch_time,
+        )
 
         if is_returning:
             context._insertmanyvalues_rows = result = []
 
-        for batch_rec in compiled._deliver_insertmanyvalues_batches(
+        context.insertmanyvalues_batch_sizes = batch_sizes = []
+
+        batches = compiled._deliver_insertmanyvalues_batches(
             statement, parameters, generic_setinputsizes, batch_size
-        ):
-            yield batch_rec
+        )
+        new_batch_size = None
+        while True:
+            try:
+                *batch_rec, num_rows = batches.send(new_batch_size)
+            except StopIteration:
+                break
+
+            batch_sizes.append(num_rows)
+
+            if target_time:
+                start = perf_counter()
+
+            yield tuple(batch_rec)  # type: ignore
             if is_returning:
                 result.extend(cursor.fetchall())
 
+            if target_time:
+                batch_size = new_batch_size = self._adapt_insertmanyvalues(
+                    batch_size, num_rows, perf_counter() - start, target_time
+                )
+
+    def _adapt_insertmanyvalues(
+        self,
+        batch_size: int,
+        num_rows: int,
+        elapsed: float,
+        target_time: float,
+    ) -> int:
+        """Given the time taken to run an "insertmanyvalues" batch, return
+        the batch size to use for the next batch.
+
+        The new size is the number of rows estimated to run within
+        ``target_time``, growing no more than double the current size at
+        each step, so that a single fast batch does not result in an
+        oversized statement.
+
+        """
+        if elapsed <= 0:
+            return batch_size * 2
+        estimated = int(num_rows * target_time / elapsed)
+        return max(1, min(estimated, batch_size * 2))
+
     def do_executemany(self, cursor, statement, parameters, context=None):
         cursor.executemany(statement, parameters)
 
@@ -1040,6 +1096,19 @@ class DefaultExecutionContext(ExecutionContext):
 
     _insertmanyvalues_rows: Optional[List[Tuple[Any, ...]]] = None
 
+    insertmanyvalues_batch_sizes: Optional[List[int]] = None
+    """For an :attr:`.ExecuteStyle.INSERTMANYVALUES` execution, a list of the
+    number of rows rendered into each INSERT statement, in order of
+    execution.
+
+    This is of use for monitoring the page sizes chosen when
+    :paramref:`_sa.create_engine.insertmanyvalues_target_batch_time` is in
+    use.  Is ``None`` for all other kinds of execution.
+
+    .. versionadded:: 2.0.0rc1
+
+    """
+
     @classmethod
     def _init_ddl(
         cls,
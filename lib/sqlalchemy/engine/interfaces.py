@@ -61,10 +61,12 @@ if TYPE_CHECKING:
     from ..sql.compiler import SQLCompiler
     from ..sql.elements import BindParameter
     from ..sql.elements import ClauseElement
+    from ..sql.elements import ColumnElement
     from ..sql.schema import Column
     from ..sql.schema import DefaultGenerator
     from ..sql.schema import SchemaItem
     from ..sql.schema import Sequence as Sequence_SchemaItem
+    from ..sql.selectable import TableClause
     from ..sql.sqltypes import Integer
     from ..sql.type_api import _TypeMemoDict
     from ..sql.type_api import TypeEngine
@@ -277,6 +279,7 @@ class _CoreKnownExecutionOptions(TypedDict, total=False):
     max_row_buffer: int
     yield_per: int
     insertmanyvalues_page_size: int
+    insertmanyvalues_target_batch_time: float
     schema_translate_map: Optional[SchemaTranslateMapType]
 
 
@@ -830,6 +833,28 @@ class Dialect(EventTarget):
 
     """
 
+    supports_bulk_load: bool
+    """dialect / driver provides a native bulk loading facility, such as
+    PostgreSQL's ``COPY .. FROM STDIN``, via the
+    :meth:`.Dialect.do_bulk_load` method.
+
+    When False, :meth:`_engine.Connection.bulk_load` makes use of an
+    INSERT statement with :term:`executemany` instead.
+
+    .. versionadded:: 2.0.0rc1
+
+    """
+
+    supports_exported_snapshots: bool
+    """dialect can export the snapshot of a transaction in progress, so
+    that transactions begun on other connections see the identical state
+    of the database, via the :meth:`.Dialect.do_export_snapshot` and
+    :meth:`.Dialect.do_import_snapshot` methods.
+
+    .. versionadded:: 2.0.0rc1
+
+    """
+
     insert_executemany_returning: bool
     """dialect / driver / database supports some means of providing
     INSERT...RETURNING support when dialect.do_executemany() is used.
@@ -903,6 +928,26 @@ class Dialect(EventTarget):
 
     """
 
+    insertmanyvalues_target_batch_time: Optional[float]
+    """When set to a number of seconds, enables adaptive page sizing for
+    :attr:`.ExecuteStyle.INSERTMANYVALUES` executions.
+
+    The page size of each batch after the first is adjusted based on the
+    measured execution time of the preceding batch, so that each batch runs
+    in approximately this amount of time, while remaining within the limit
+    given by :attr:`.Dialect.insertmanyvalues_max_parameters`.  Defaults to
+    ``None``, meaning :attr:`.Dialect.insertmanyvalues_page_size` is used
+    for all batches.
+
+    .. versionadded:: 2.0.0rc1
+
+    .. seealso::
+
+        :paramref:`_engine.Connection.execution_options.insertmanyvalues_target_batch_time` -
+        execution option available on :class:`_engine.Connection`, statements
+
+    """  # noqa: E501
+
     preexecute_autoincrement_sequences: bool
     """True if 'implicit' primary key functions must be executed separately
       in order to get their value, if RETURNING is not used.
@@ -1158,6 +1203,14 @@ class Dialect(EventTarget):
     tuple_in_values: bool
     """target database supports tuple IN, i.e. (x, y) IN ((q, p), (r, z))"""
 
+    supports_row_value_comparison: bool
+    """target database supports comparison of row values using the
+    ``<`` and ``>`` operators, i.e. (x, y) > (q, p)
+
+    .. versionadded:: 2.0.0rc1
+
+    """
+
     _bind_typing_render_casts: bool
 
     _type_memos: MutableMapping[TypeEngine[Any], "_TypeMemoDict"]
@@ -2151,6 +2204,75 @@ class Dialect(EventTarget):
 
         raise NotImplementedError()
 
+    def do_bulk_load(
+        self,
+        dbapi_connection: PoolProxiedConnection,
+        table: TableClause,
+        columns: Sequence[ColumnElement[Any]],
+        rows: Iterable[Tuple[Any, ...]],
+        schema: Optional[str],
+    ) -> None:
+        """Load rows into a table using the native bulk loading facility
+        of the driver.
+
+        Called by :meth:`_engine.Connection.bulk_load` when
+        :attr:`.Dialect.supports_bulk_load` is True.
+
+        :param dbapi_connection: the pool-proxied DBAPI connection, within
+         a transaction already begun.
+
+        :param table: the :class:`_schema.Table` into which rows are loaded.
+
+        :param columns: the columns of ``table`` present in each row, in
+         order.
+
+        :param rows: an iterator of tuples, one value per column, which have
+         already been passed through the bind processors of each column's
+         datatype.
+
+        :param schema: the effective schema name of the table, taking into
+         account the ``schema_translate_map`` execution option.
+
+        .. versionadded:: 2.0.0rc1
+
+        """
+
+        raise NotImplementedError()
+
+    def do_export_snapshot(self, connection: Connection) -> str:
+        """Export the snapshot of the transaction in progress on the given
+        connection, returning an identifier for it.
+
+        Called when :attr:`.Dialect.supports_exported_snapshots` is True.
+
+        :param connection: a :class:`_engine.Connection`, within a
+         transaction already begun.
+
+        .. versionadded:: 2.0.0rc1
+
+        """
+
+        raise NotImplementedError()
+
+    def do_import_snapshot(
+        self, connection: Connection, snapshot_id: str
+    ) -> None:
+        """Begin a transaction on the given connection which uses a
+        snapshot previously returned by :meth:`.Dialect.do_export_snapshot`.
+
+        Called when :attr:`.Dialect.supports_exported_snapshots` is True.
+
+        :param connection: a :class:`_engine.Connection` on which no
+         statement has yet been emitted.
+
+        :param snapshot_id: the snapshot identifier.
+
+        .. versionadded:: 2.0.0rc1
+
+        """
+
+        raise NotImplementedError()
+
     def do_execute_no_params(
         self,
         cursor: DBAPICursor,
@@ -365,6 +365,7 @@ class AsyncConnection(
         max_row_buffer: int = ...,
         yield_per: int = ...,
         insertmanyvalues_page_size: int = ...,
+        insertmanyvalues_target_batch_time: float = ...,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
         **opt: Any,
     ) -> AsyncConnection:
@@ -1003,6 +1004,7 @@ class AsyncEngine(ProxyComparable[Engine], AsyncConnectable):
         logging_token: str = ...,
         isolation_level: IsolationLevel = ...,
         insertmanyvalues_page_size: int = ...,
+        insertmanyvalues_target_batch_time: float = ...,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
         **opt: Any,
     ) -> AsyncEngine:
@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 from typing import Any
+from typing import AsyncIterator
 from typing import Callable
 from typing import Generic
 from typing import Iterable
@@ -48,11 +49,14 @@ if TYPE_CHECKING:
     from ...orm._typing import _IdentityKeyType
     from ...orm._typing import _O
     from ...orm._typing import OrmExecuteOptionsParameter
+    from ...orm.dynamic import AppenderQuery
     from ...orm.interfaces import ORMOption
     from ...orm.session import _BindArguments
     from ...orm.session import _EntityBindKey
     from ...orm.session import _PKIdentityArgument
     from ...orm.session import _SessionBind
+    from ...orm.writeonly import WriteOnlyCollection
+    from ...sql._typing import _ColumnExpressionArgument
     from ...sql.base import Executable
     from ...sql.elements import ClauseElement
     from ...sql.selectable import ForUpdateArg
@@ -83,9 +87,11 @@ _T = TypeVar("_T", bound=Any)
         "expunge",
         "expunge_all",
         "flush",
+        "get_by",
         "get_bind",
         "is_modified",
         "invalidate",
+        "iter_batches",
         "merge",
         "refresh",
         "rollback",
@@ -732,6 +738,28 @@ class async_scoped_session(Generic[_AS]):
 
         return await self._proxied.flush(objects=objects)
 
+    async def get_by(
+        self, entity: _EntityBindKey[_O], **kwargs: Any
+    ) -> Optional[_O]:
+        r"""Return an instance based on the given attribute values, or
+        ``None`` if not found.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_asyncio.AsyncSession` class on
+            behalf of the :class:`_asyncio.scoping.async_scoped_session` class.
+
+        .. seealso::
+
+            :meth:`_orm.Session.get_by` - main documentation for get_by
+
+        .. versionadded:: 2.0.0rc1
+
+
+        """  # noqa: E501
+
+        return await self._proxied.get_by(entity, **kwargs)
+
     def get_bind(
         self,
         mapper: Optional[_EntityBindKey[_O]] = None,
@@ -906,6 +934,49 @@ class async_scoped_session(Generic[_AS]):
 
         return await self._proxied.invalidate()
 
+    def iter_batches(
+        self,
+        collection: Union[WriteOnlyCollection[_T], AppenderQuery[_T]],
+        size: int = 1000,
+        order_by: Optional[
+            Union[
+                _ColumnExpressionArgument[Any],
+                Sequence[_ColumnExpressionArgument[Any]],
+            ]
+        ] = None,
+        expunge: bool = True,
+    ) -> AsyncIterator[Sequence[_T]]:
+        r"""Iterate through the rows of a write only or dynamic collection in
+        batches, using keyset pagination.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_asyncio.AsyncSession` class on
+            behalf of the :class:`_asyncio.scoping.async_scoped_session` class.
+
+        E.g.::
+
+            async for batch in async_session.iter_batches(user.addresses):
+                for address in batch:
+                    print(address.email_address)
+
+        The parent object of the collection should belong to this
+        :class:`_asyncio.AsyncSession`.
+
+        .. versionadded:: 2.0.0rc1
+
+        .. seealso::
+
+            :meth:`_orm.WriteOnlyCollection.iter_batches` - main
+            documentation for iter_batches
+
+
+        """  # noqa: E501
+
+        return self._proxied.iter_batches(
+            collection, size=size, order_by=order_by, expunge=expunge
+        )
+
     async def merge(
         self,
         instance: _O,
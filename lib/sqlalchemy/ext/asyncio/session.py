@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 from typing import Any
+from typing import AsyncIterator
 from typing import Callable
 from typing import Dict
 from typing import Generic
@@ -51,6 +52,7 @@ if TYPE_CHECKING:
     from ...orm._typing import _IdentityKeyType
     from ...orm._typing import _O
     from ...orm._typing import OrmExecuteOptionsParameter
+    from ...orm.dynamic import AppenderQuery
     from ...orm.identity import IdentityMap
     from ...orm.interfaces import ORMOption
     from ...orm.session import _BindArguments
@@ -58,6 +60,8 @@ if TYPE_CHECKING:
     from ...orm.session import _PKIdentityArgument
     from ...orm.session import _SessionBind
     from ...orm.session import _SessionBindKey
+    from ...orm.writeonly import WriteOnlyCollection
+    from ...sql._typing import _ColumnExpressionArgument
     from ...sql._typing import _InfoType
     from ...sql.base import Executable
     from ...sql.elements import ClauseElement
@@ -466,6 +470,22 @@ class AsyncSession(ReversibleProxy[Session]):
         )
         return result_obj
 
+    async def get_by(
+        self, entity: _EntityBindKey[_O], **kwargs: Any
+    ) -> Optional[_O]:
+        """Return an instance based on the given attribute values, or
+        ``None`` if not found.
+
+        .. seealso::
+
+            :meth:`_orm.Session.get_by` - main documentation for get_by
+
+        .. versionadded:: 2.0.0rc1
+
+        """
+
+        return await greenlet_spawn(self.sync_session.get_by, entity, **kwargs)
+
     @overload
     async def stream(
         self,
@@ -578,6 +598,50 @@ class AsyncSession(ReversibleProxy[Session]):
         )
         return result.scalars()
 
+    async def iter_batches(
+        self,
+        collection: Union[WriteOnlyCollection[_T], AppenderQuery[_T]],
+        size: int = 1000,
+        order_by: Optional[
+            Union[
+                _ColumnExpressionArgument[Any],
+                Sequence[_ColumnExpressionArgument[Any]],
+            ]
+        ] = None,
+        expunge: bool = True,
+    ) -> AsyncIterator[Sequence[_T]]:
+        """Iterate through the rows of a write only or dynamic collection in
+        batches, using keyset pagination.
+
+        E.g.::
+
+            async for batch in async_session.iter_batches(user.addresses):
+                for address in batch:
+                    print(address.email_address)
+
+        The parent object of the collection should belong to this
+        :class:`_asyncio.AsyncSession`.
+
+        .. versionadded:: 2.0.0rc1
+
+        .. seealso::
+
+            :meth:`_orm.WriteOnlyCollection.iter_batches` - main
+            documentation for iter_batches
+
+        """
+        batches = await greenlet_spawn(
+            collection.iter_batches,
+            size=size,
+            order_by=order_by,
+            expunge=expunge,
+        )
+        while True:
+            batch = await greenlet_spawn(next, batches, None)
+            if batch is None:
+                return
+            yield batch
+
     async def delete(self, instance: object) -> None:
         """Mark an instance as deleted.
 
@@ -0,0 +1,448 @@
+# ext/configure_cache.py
+# Copyright (C) 2005-2022 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: https://www.opensource.org/licenses/mit-license.php
+
+"""Store the result of mapper configuration in a file, so that the
+configuration of the same mappings in later processes may be restored
+from it rather than being worked out again.
+
+When an application maps a large number of classes, the
+:meth:`_orm.registry.configure` step, which takes place when mappings are
+first used or :func:`_orm.configure_mappers` is called, spends much of its
+time resolving the string arguments given to :func:`_orm.relationship` and
+analyzing the foreign key relationships between tables in order to
+determine the join condition, direction and column pairs of each
+relationship.   The result of this analysis is the same every time the
+same mappings are configured, so for applications that start many
+processes, such as pools of worker processes or serverless functions, the
+:class:`.ConfigureCache` can store it in a file the first time the
+mappings are configured, and restore it in subsequent processes::
+
+    from sqlalchemy.ext.configure_cache import ConfigureCache
+
+    from myapp.models import Base
+
+    ConfigureCache("/var/cache/myapp/mappers.cache").configure(Base.registry)
+
+The cache file is validated against a hash that includes the source files
+of the modules containing the mapped classes and their base classes and
+mixins, as well as the callables passed to :func:`_orm.relationship`, the
+string arguments of each :func:`_orm.relationship` and the structure of
+the tables they're mapped to, so that a change to the mappings results in
+the mappings being configured in full again and the file being rewritten.
+Mappings which are built in ways that aren't reflected in the source of
+these modules, such as from configuration files, should pass a
+:paramref:`.ConfigureCache.key` which changes along with them.
+
+The parts of configuration which modify the mapped classes themselves,
+such as setting up attribute instrumentation and event listeners, take
+place within each process as usual.  Relationships which refer to objects
+that can't be identified by name in another process, such as those which
+join to an :func:`_orm.aliased` construct or a subquery, are configured in
+full each time.
+
+.. warning:: The cache file is loaded using :mod:`pickle`.  While it's
+   restricted to loading SQLAlchemy classes and SQL operators, the file
+   should be treated like source code, and must be located where only
+   trusted users can write to it.
+
+.. versionadded:: 2.0.0rc1
+
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import pickle
+import sys
+import tempfile
+from typing import Any
+from typing import Dict
+from typing import IO
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from .. import __version__
+from .. import util
+from ..orm import mapperlib
+from ..orm.decl_api import registry as _registry_cls
+from ..orm.mapper import Mapper
+from ..orm.relationships import RelationshipProperty
+from ..sql import operators
+from ..sql.annotation import Annotated
+from ..sql.elements import ColumnClause
+from ..sql.elements import ColumnElement
+from ..sql.schema import Column
+from ..sql.schema import MetaData
+from ..sql.schema import Table
+from ..sql.selectable import FromClause
+
+__all__ = ["ConfigureCache"]
+
+
+_CacheKeyType = Tuple[Mapper[Any], str]
+
+
+class _NotSerializable(Exception):
+    pass
+
+
+def _mapper_ident(mapper: Mapper[Any]) -> str:
+    cls = mapper.class_
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+class _Namespace:
+    """Mappers and tables by name, as used to refer to them within a
+    cache file.
+
+    Names are looked up first among the mappers and tables of the registry
+    being configured, then among those of all other registries.
+
+    """
+
+    def __init__(self, registry: _registry_cls) -> None:
+        self.mappers: Dict[str, Optional[Mapper[Any]]] = {}
+        self.tables: Dict[str, Optional[Table]] = {}
+
+        others = _Namespace.__new__(_Namespace)
+        others.mappers = {}
+        others.tables = {}
+
+        self._add_registry(registry)
+        for reg in mapperlib._all_registries():
+            if reg is not registry:
+                others._add_registry(reg)
+
+        for ident, mapper in others.mappers.items():
+            self.mappers.setdefault(ident, mapper)
+        for key, table in others.tables.items():
+            self.tables.setdefault(key, table)
+
+    def _add_registry(self, registry: _registry_cls) -> None:
+        metadatas: Set[MetaData] = {registry.metadata}
+        for mapper in registry.mappers:
+            if mapper.non_primary:
+                continue
+            ident = _mapper_ident(mapper)
+            # names which are ambiguous, such as those of classes created
+            # within a function more than once, can't be referred to
+            self.mappers[ident] = None if ident in self.mappers else mapper
+            metadatas.update(t.metadata for t in mapper.tables if t.metadata)
+
+        for metadata in metadatas:
+            for key, table in metadata.tables.items():
+                self.tables[key] = None if key in self.tables else table
+
+    def mapper_id(self, mapper: Mapper[Any]) -> Tuple[str, str]:
+        ident = _mapper_ident(mapper)
+        if self.mappers.get(ident) is not mapper:
+            raise _NotSerializable()
+        return ("mapper", ident)
+
+    def table_id(self, table: Table) -> Tuple[str, str]:
+        if self.tables.get(table.key) is not table:
+            raise _NotSerializable()
+        return ("table", table.key)
+
+    def column_id(self, column: Column[Any]) -> Tuple[str, str, str]:
+        table = column.table
+        if (
+            not isinstance(table, Table)
+            or table.c.get(column.key) is not column
+        ):
+            raise _NotSerializable()
+        return ("column", self.table_id(table)[1], column.key)
+
+    def load(self, pid: Tuple[str, ...]) -> Any:
+        kind = pid[0]
+        if kind == "mapper":
+            obj = self.mappers[pid[1]]
+        elif kind == "table":
+            obj = self.tables[pid[1]]
+        elif kind == "column":
+            table = self.tables[pid[1]]
+            obj = table.c[pid[2]] if table is not None else None
+        else:
+            obj = None
+        if obj is None:
+            raise pickle.UnpicklingError(f"can't locate {pid!r}")
+        return obj
+
+
+def _restore_annotated(cls: Any, element: Any) -> Annotated:
+    obj = cls.__new__(cls)
+    obj._Annotated__element = element
+    obj._hash = hash(element)
+    return obj  # type: ignore[no-any-return]
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, file: IO[bytes], namespace: _Namespace):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.namespace = namespace
+
+    def persistent_id(self, obj: Any) -> Any:
+        if isinstance(obj, Annotated):
+            # serialized by reducer_override()
+            return None
+        elif isinstance(obj, Mapper):
+            return self.namespace.mapper_id(obj)
+        elif isinstance(obj, Table):
+            return self.namespace.table_id(obj)
+        elif isinstance(obj, Column):
+            return self.namespace.column_id(obj)
+        elif isinstance(obj, FromClause) and not isinstance(
+            obj, ColumnElement
+        ):
+            # aliases, subqueries, joins etc. would be copied rather
+            # than referred to; SQL functions are both FROM clauses and
+            # column expressions, and are serialized normally
+            raise _NotSerializable()
+        else:
+            return None
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, Annotated) and not isinstance(obj, ColumnClause):
+            # Annotated.__reduce__() makes a new annotated copy of the
+            # original element, which for a clause that's had annotated
+            # columns placed inside of it would lose them; the state of the
+            # annotated object itself is kept instead
+            state = obj.__getstate__()
+            state.pop("_hash", None)
+            return (
+                _restore_annotated,
+                (type(obj), obj._Annotated__element),
+                state,
+            )
+        return NotImplemented
+
+
+_SAFE_BUILTINS = frozenset(
+    ["bytearray", "complex", "frozenset", "range", "set", "slice"]
+)
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file: IO[bytes], namespace: _Namespace):
+        super().__init__(file)
+        self.namespace = namespace
+
+    def persistent_load(self, pid: Any) -> Any:
+        return self.namespace.load(pid)
+
+    def find_class(self, module: str, name: str) -> Any:
+        # a cache file written by _Pickler refers only to SQLAlchemy
+        # classes, SQL operator functions and builtin types; functions
+        # in general, including those of SQLAlchemy itself, aren't
+        # loaded, as they may be used to run arbitrary code.  dotted
+        # names, which are resolved as attributes, aren't loaded either
+        if "." in name:
+            pass
+        elif module == "builtins":
+            if name in _SAFE_BUILTINS:
+                return super().find_class(module, name)
+        elif module in ("operator", "_operator"):
+            obj = super().find_class(module, name)
+            if getattr(operators, name, None) is obj:
+                return obj
+        elif module.startswith("sqlalchemy.") and not module.startswith(
+            "sqlalchemy.testing"
+        ):
+            obj = super().find_class(module, name)
+            if (
+                isinstance(obj, type)
+                or obj is _restore_annotated
+                or module == "sqlalchemy.sql.operators"
+            ):
+                return obj
+        raise pickle.UnpicklingError(
+            f"global '{module}.{name}' is not permitted in a configure "
+            "cache file"
+        )
+
+
+class ConfigureCache:
+    """Configure the mappers of a :class:`_orm.registry`, storing the
+    result in a file and restoring it from that file when present.
+
+    .. versionadded:: 2.0.0rc1
+
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        key: Optional[str] = None,
+    ):
+        """Construct a new :class:`.ConfigureCache`.
+
+        :param path: path of the cache file.  The file is created the first
+         time :meth:`.ConfigureCache.configure` is called, and is replaced
+         whenever the mappings it was created from have changed.  The path
+         must not be writable by untrusted users, as the file is loaded
+         using :mod:`pickle`.
+
+        :param key: optional string which is included in the hash used to
+         validate the cache file, for mappings which depend on something
+         other than the source of the modules in which classes, their bases
+         and the callables passed to relationships are defined.
+
+        """
+        self.path = os.fspath(path)
+        self.key = key
+
+    def configure(
+        self, registry: _registry_cls, cascade: bool = False
+    ) -> bool:
+        """Configure all as-yet unconfigured mappers in the given
+        :class:`_orm.registry`, as :meth:`_orm.registry.configure` does.
+
+        If the cache file is present and is valid for the current mappings,
+        relationships are configured using the results stored in the file.
+        Otherwise, the mappers are configured in full and the results are
+        stored in the file.
+
+        :param registry: the :class:`_orm.registry` to configure.
+
+        :param cascade: passed to :meth:`_orm.registry.configure`.
+
+        :return: True if the configuration was restored from the cache
+         file, False if the mappers were configured in full.
+
+        """
+        key = self._generate_key(registry)
+        namespace = _Namespace(registry)
+        state = self._load(key, namespace)
+
+        registry._configured_state_cache = state
+        try:
+            registry.configure(cascade=cascade)
+        finally:
+            registry._configured_state_cache = None
+
+        if state is None:
+            self._store(key, registry, namespace)
+            return False
+        else:
+            return True
+
+    def _generate_key(self, registry: _registry_cls) -> bytes:
+        hash_ = hashlib.sha256()
+        hash_.update(f"{__version__} {sys.version} {self.key}".encode())
+
+        # the source of the modules of each mapped class and its bases,
+        # which include mixins that may declare relationships, as well as
+        # of the modules of any callables passed to relationship(); string
+        # arguments are included directly
+        modules = set()
+        arguments = []
+        for mapper in registry.mappers:
+            modules.update(cls.__module__ for cls in mapper.class_.__mro__)
+            for prop in mapper._props.values():
+                if not isinstance(prop, RelationshipProperty):
+                    continue
+                values = [prop.argument, prop.backref]
+                values.extend(arg.argument for arg in prop._init_args)
+                while values:
+                    value = values.pop()
+                    if isinstance(value, str):
+                        arguments.append(
+                            f"{mapper.class_.__module__} "
+                            f"{mapper.class_.__qualname__} {prop.key} {value}"
+                        )
+                    elif isinstance(value, (tuple, list)):
+                        values.extend(value)
+                    elif isinstance(value, dict):
+                        values.extend(value.values())
+                    elif callable(value):
+                        module = getattr(value, "__module__", None)
+                        if module:
+                            modules.add(module)
+
+        for name in sorted(modules):
+            hash_.update(name.encode())
+            filename = getattr(sys.modules.get(name), "__file__", None)
+            if filename:
+                with open(filename, "rb") as file_:
+                    hash_.update(file_.read())
+        for argument in sorted(arguments):
+            hash_.update(argument.encode())
+
+        metadatas = {registry.metadata}
+        for mapper in registry.mappers:
+            metadatas.update(t.metadata for t in mapper.tables if t.metadata)
+        tables = sorted(
+            (
+                table
+                for metadata in metadatas
+                for table in metadata.tables.values()
+            ),
+            key=lambda table: table.key,
+        )
+        for table in tables:
+            hash_.update(table.key.encode())
+            for col in table.c:
+                fks = sorted(fk.target_fullname for fk in col.foreign_keys)
+                hash_.update(
+                    f"{col.key} {col.name} {col.type!r} "
+                    f"{col.primary_key} {fks}".encode()
+                )
+        return hash_.digest()
+
+    def _load(
+        self, key: bytes, namespace: _Namespace
+    ) -> Optional[Dict[_CacheKeyType, Tuple[Any, ...]]]:
+        try:
+            with open(self.path, "rb") as file_:
+                unpickler = _Unpickler(file_, namespace)
+                if unpickler.load() != key:
+                    return None
+                return unpickler.load()  # type: ignore[no-any-return]
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # a file that can't be read against the current mappings is
+            # replaced, the same as one that is out of date
+            return None
+
+    def _store(
+        self, key: bytes, registry: _registry_cls, namespace: _Namespace
+    ) -> None:
+        state = {}
+        for mapper in registry.mappers:
+            for prop in mapper._props.values():
+                if (
+                    not isinstance(prop, RelationshipProperty)
+                    or prop.parent is not mapper
+                ):
+                    continue
+                prop_state = prop._get_configured_state()
+                if prop_state is None:
+                    continue
+                try:
+                    _Pickler(io.BytesIO(), namespace).dump(prop_state)
+                except Exception:
+                    # relationship refers to something that can't be
+                    # serialized; it will be configured in full each time
+                    continue
+                state[(mapper, prop.key)] = prop_state
+
+        dirname = os.path.dirname(os.path.abspath(self.path))
+        try:
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=dirname, delete=False
+            ) as file_:
+                pickler = _Pickler(file_, namespace)
+                pickler.dump(key)
+                pickler.dump(state)
+            os.replace(file_.name, self.path)
+        except OSError as err:
+            util.warn(f"Could not write configure cache file: {err}")
@@ -0,0 +1,429 @@
+# ext/parallel_insert.py
+# Copyright (C) 2005-2022 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: https://www.opensource.org/licenses/mit-license.php
+
+"""Bulk INSERT of a large number of rows over several connections at once.
+
+The :func:`.parallel_insert` function accepts an :class:`_engine.Engine`, a
+:class:`_schema.Table` or ORM mapped class, and an iterable of parameter
+dictionaries.  The rows are consumed in batches which are distributed among
+a fixed number of worker threads, each of which checks out its own
+connection from the engine's connection pool and executes the batches it
+receives using the normal "insertmanyvalues" / :term:`executemany`
+machinery::
+
+    from sqlalchemy.ext.parallel_insert import parallel_insert
+
+    result = parallel_insert(
+        engine,
+        User,
+        ({"name": f"user {i}"} for i in range(1000000)),
+        concurrency=4,
+        return_primary_keys=True,
+    )
+
+    print(f"inserted {result.rowcount} rows")
+    print(f"first new primary key: {result.primary_keys[0]}")
+
+When an ORM mapped class is given, each batch is executed using an ORM
+bulk INSERT via :meth:`_orm.Session.execute`, so that parameter dictionaries
+are keyed to mapped attribute names and joined table inheritance mappings
+are supported, in the same way as :ref:`orm_queryguide_bulk_insert`.
+
+The :func:`.async_parallel_insert` function provides the same behavior for
+an :class:`_asyncio.AsyncEngine`, using one asyncio task per connection.
+
+Each worker connection runs within its own transaction.  The transactions
+are committed only once all batches have been executed successfully; if any
+batch fails, all worker transactions are rolled back and the error is
+raised.  As the final COMMIT of each transaction is a separate operation,
+the overall operation is **not** atomic in the way a single transaction is;
+a failure during the COMMIT step itself may leave some workers' rows
+committed.
+
+The pool used by the engine should allow at least ``concurrency``
+connections to be checked out at once.   Backends that lock the whole
+database for writes, such as SQLite, will not gain any benefit from this
+approach and should use a ``concurrency`` of ``1``, which executes all
+batches on a single connection in the calling thread.
+
+.. versionadded:: 2.0.0rc1
+
+"""
+from __future__ import annotations
+
+import contextlib
+import itertools
+import queue
+import threading
+import typing
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from .. import exc
+from .. import inspection
+from ..orm.session import Session
+from ..sql._dml_constructors import insert
+from ..sql.dml import Insert
+
+if typing.TYPE_CHECKING:
+    from .asyncio import AsyncConnection
+    from .asyncio import AsyncEngine
+    from ..engine import Connection
+    from ..engine import Engine
+    from ..engine.interfaces import CoreExecuteOptionsParameter
+    from ..orm._typing import _EntityType
+    from ..sql.schema import Table
+
+__all__ = ["parallel_insert", "async_parallel_insert", "ParallelInsertResult"]
+
+
+class ParallelInsertResult(NamedTuple):
+    """The result of :func:`.parallel_insert` or
+    :func:`.async_parallel_insert`."""
+
+    rowcount: int
+    """Total number of rows INSERTed, summing the
+    :attr:`_engine.CursorResult.rowcount` of each batch.
+
+    Where no row count is reported for a batch, such as for an ORM
+    bulk INSERT without RETURNING or a driver which reports ``-1``, the
+    number of rows in the batch is used."""
+
+    primary_keys: Optional[List[Tuple[Any, ...]]]
+    """Primary key tuples of the new rows, in the same order as the
+    rows were given, if ``return_primary_keys`` was passed; otherwise
+    ``None``."""
+
+
+_Batch = Tuple[int, List[Mapping[str, Any]]]
+
+
+def _insert_for_target(
+    target: Union[Table, _EntityType[Any]], return_primary_keys: bool
+) -> Tuple[Insert, bool]:
+    insp = inspection.inspect(target, raiseerr=False)
+    if insp is None:
+        raise exc.ArgumentError(
+            f"Table or mapped class expected for INSERT target; got {target!r}"
+        )
+
+    is_orm = bool(getattr(insp, "is_mapper", False))
+    if is_orm:
+        pk_cols = [
+            insp.get_property_by_column(col).class_attribute
+            for col in insp.primary_key
+        ]
+    elif getattr(insp, "is_selectable", False) and hasattr(
+        insp, "primary_key"
+    ):
+        pk_cols = list(insp.primary_key)
+    else:
+        raise exc.ArgumentError(
+            f"Table or mapped class expected for INSERT target; got {target!r}"
+        )
+
+    stmt = insert(target)
+    if return_primary_keys:
+        if not pk_cols:
+            raise exc.ArgumentError(
+                f"Can't return primary keys for {target!r}, which has "
+                "no primary key columns"
+            )
+        stmt = stmt.returning(*pk_cols)
+    return stmt, is_orm
+
+
+def _batches(
+    rows: Iterable[Mapping[str, Any]], batch_size: int
+) -> Iterator[_Batch]:
+    rows = iter(rows)
+    for index in itertools.count():
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            return
+        yield index, batch
+
+
+def _rowcount(
+    result: Any, params: List[Mapping[str, Any]], primary_keys: Any
+) -> int:
+    if primary_keys is not None:
+        return len(primary_keys)
+    rowcount = getattr(result, "rowcount", -1)
+    if rowcount is None or rowcount < 0:
+        return len(params)
+    return rowcount  # type: ignore[no-any-return]
+
+
+def _assemble_result(
+    rowcounts: List[int],
+    primary_keys: Dict[int, List[Tuple[Any, ...]]],
+    return_primary_keys: bool,
+) -> ParallelInsertResult:
+    if return_primary_keys:
+        return ParallelInsertResult(
+            sum(rowcounts),
+            [
+                pk
+                for index in sorted(primary_keys)
+                for pk in primary_keys[index]
+            ],
+        )
+    else:
+        return ParallelInsertResult(sum(rowcounts), None)
+
+
+def parallel_insert(
+    engine: Engine,
+    target: Union[Table, _EntityType[Any]],
+    rows: Iterable[Mapping[str, Any]],
+    *,
+    concurrency: int = 4,
+    batch_size: Optional[int] = None,
+    return_primary_keys: bool = False,
+    execution_options: Optional[CoreExecuteOptionsParameter] = None,
+) -> ParallelInsertResult:
+    """INSERT rows from an iterable, distributing batches among
+    several connections, each used by its own thread.
+
+    :param engine: the :class:`_engine.Engine` from which connections are
+     procured.
+
+    :param target: a :class:`_schema.Table` or ORM mapped class.
+
+    :param rows: an iterable of parameter dictionaries.  The iterable is
+     consumed lazily, so that no more than a few batches per worker are
+     held in memory at once.
+
+    :param concurrency: number of worker threads, each using its own
+     connection.  A value of ``1`` runs all batches in the calling
+     thread.
+
+    :param batch_size: number of rows passed to each individual
+     execution; defaults to the ``insertmanyvalues_page_size`` of the
+     engine's dialect.
+
+    :param return_primary_keys: if True, the INSERT includes RETURNING for
+     the primary key columns of the target, and the resulting primary keys
+     are returned in the same order as the given rows.  Requires a backend
+     that supports INSERT..RETURNING with executemany.
+
+    :param execution_options: optional execution options passed along to
+     each execution.
+
+    :return: a :class:`.ParallelInsertResult`
+
+    """
+    if concurrency < 1:
+        raise exc.ArgumentError("concurrency must be a positive integer")
+
+    stmt, is_orm = _insert_for_target(target, return_primary_keys)
+    batches = _batches(
+        rows, batch_size or engine.dialect.insertmanyvalues_page_size
+    )
+
+    rowcounts: List[int] = []
+    primary_keys: Dict[int, List[Tuple[Any, ...]]] = {}
+
+    def execute(executor: Union[Connection, Session], batch: _Batch) -> None:
+        index, params = batch
+        result = executor.execute(
+            stmt, params, execution_options=execution_options or {}
+        )
+        pks = None
+        if return_primary_keys:
+            pks = primary_keys[index] = [tuple(row) for row in result]
+        rowcounts.append(_rowcount(result, params, pks))
+
+    @contextlib.contextmanager
+    def executor_for(
+        connection: Connection,
+    ) -> Iterator[Union[Connection, Session]]:
+        if is_orm:
+            with Session(bind=connection) as session:
+                yield session
+        else:
+            yield connection
+
+    if concurrency == 1:
+        with engine.begin() as connection, executor_for(
+            connection
+        ) as executor:
+            for batch in batches:
+                execute(executor, batch)
+        return _assemble_result(rowcounts, primary_keys, return_primary_keys)
+
+    work: queue.Queue[Optional[_Batch]] = queue.Queue(maxsize=concurrency * 2)
+    errors: List[BaseException] = []
+    all_done = threading.Barrier(concurrency + 1)
+
+    def worker() -> None:
+        connection = None
+        try:
+            connection = engine.connect()
+            connection.begin()
+            with executor_for(connection) as executor:
+                while True:
+                    batch = work.get()
+                    if batch is None:
+                        break
+                    elif not errors:
+                        execute(executor, batch)
+        except BaseException as err:
+            errors.append(err)
+            # keep consuming so that the feeding thread isn't blocked
+            while work.get() is not None:
+                pass
+
+        try:
+            # wait until every worker has finished, then commit only if
+            # none of them failed
+            all_done.wait()
+            if connection is not None:
+                if not errors:
+                    connection.commit()
+                else:
+                    connection.rollback()
+        except BaseException as err:
+            errors.append(err)
+        finally:
+            if connection is not None:
+                connection.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    try:
+        for batch in batches:
+            if errors:
+                break
+            work.put(batch)
+    except BaseException as err:
+        # e.g. the rows iterable itself raised; roll back all workers
+        errors.append(err)
+    finally:
+        for thread in threads:
+            work.put(None)
+        all_done.wait()
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
+    return _assemble_result(rowcounts, primary_keys, return_primary_keys)
+
+
+async def async_parallel_insert(
+    engine: AsyncEngine,
+    target: Union[Table, _EntityType[Any]],
+    rows: Iterable[Mapping[str, Any]],
+    *,
+    concurrency: int = 4,
+    batch_size: Optional[int] = None,
+    return_primary_keys: bool = False,
+    execution_options: Optional[CoreExecuteOptionsParameter] = None,
+) -> ParallelInsertResult:
+    """INSERT rows from an iterable, distributing batches among
+    several connections of an :class:`_asyncio.AsyncEngine`, each used by
+    its own asyncio task.
+
+    Parameters are the same as those of :func:`.parallel_insert`.
+
+    """
+    import asyncio
+
+    from .asyncio import AsyncSession
+
+    if concurrency < 1:
+        raise exc.ArgumentError("concurrency must be a positive integer")
+
+    stmt, is_orm = _insert_for_target(target, return_primary_keys)
+    batches = _batches(
+        rows, batch_size or engine.dialect.insertmanyvalues_page_size
+    )
+
+    rowcounts: List[int] = []
+    primary_keys: Dict[int, List[Tuple[Any, ...]]] = {}
+    errors: List[BaseException] = []
+
+    async def execute(
+        executor: Union[AsyncConnection, AsyncSession], batch: _Batch
+    ) -> None:
+        index, params = batch
+        result = await executor.execute(
+            stmt, params, execution_options=execution_options or {}
+        )
+        pks = None
+        if return_primary_keys:
+            pks = primary_keys[index] = [tuple(row) for row in result]
+        rowcounts.append(_rowcount(result, params, pks))
+
+    work: asyncio.Queue[Optional[_Batch]] = asyncio.Queue(
+        maxsize=concurrency * 2
+    )
+
+    async def consume(executor: Union[AsyncConnection, AsyncSession]) -> None:
+        while True:
+            batch = await work.get()
+            if batch is None:
+                break
+            elif not errors:
+                await execute(executor, batch)
+
+    async def worker(connection: AsyncConnection) -> None:
+        try:
+            if is_orm:
+                async with AsyncSession(bind=connection) as session:
+                    await consume(session)
+            else:
+                await consume(connection)
+        except BaseException as err:
+            errors.append(err)
+            while await work.get() is not None:
+                pass
+
+    connections: List[AsyncConnection] = []
+    try:
+        for _ in range(concurrency):
+            connection = await engine.connect()
+            connections.append(connection)
+            await connection.begin()
+
+        tasks = [
+            asyncio.create_task(worker(connection))
+            for connection in connections
+        ]
+        try:
+            for batch in batches:
+                if errors:
+                    break
+                await work.put(batch)
+        except BaseException as err:
+            errors.append(err)
+        finally:
+            for task in tasks:
+                await work.put(None)
+            await asyncio.gather(*tasks)
+
+        if not errors:
+            for connection in connections:
+                await connection.commit()
+    finally:
+        for connection in connections:
+            await connection.close()
+
+    if errors:
+        raise errors[0]
+    return _assemble_result(rowcounts, primary_keys, return_primary_keys)
@@ -119,6 +119,8 @@ from .relationships import Relationship as Relationship
 from .relationships import RelationshipProperty as RelationshipProperty
 from .relationships import remote as remote
 from .scoping import scoped_session as scoped_session
+from .second_level_cache import CacheRegion as CacheRegion
+from .second_level_cache import SecondLevelCache as SecondLevelCache
 from .session import close_all_sessions as close_all_sessions
 from .session import make_transient as make_transient
 from .session import make_transient_to_detached as make_transient_to_detached
@@ -130,6 +132,7 @@ from .session import SessionTransaction as SessionTransaction
 from .session import SessionTransactionOrigin as SessionTransactionOrigin
 from .state import AttributeState as AttributeState
 from .state import InstanceState as InstanceState
+from .strategy_options import batchload as batchload
 from .strategy_options import contains_eager as contains_eager
 from .strategy_options import defaultload as defaultload
 from .strategy_options import defer as defer
@@ -146,6 +149,8 @@ from .strategy_options import subqueryload as subqueryload
 from .strategy_options import undefer as undefer
 from .strategy_options import undefer_group as undefer_group
 from .strategy_options import with_expression as with_expression
+from .unitofwork import FlushStats as FlushStats
+from .unitofwork import MapperFlushStats as MapperFlushStats
 from .unitofwork import UOWTransaction as UOWTransaction
 from .util import Bundle as Bundle
 from .util import CascadeOptions as CascadeOptions
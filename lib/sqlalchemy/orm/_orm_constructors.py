@@ -775,6 +775,8 @@ def relationship(
     info: Optional[_InfoType] = None,
     omit_join: Literal[None, False] = None,
     sync_backref: Optional[bool] = None,
+    selectin_chunk_size: Optional[Union[int, Literal["auto"]]] = None,
+    collection_tracking: Literal["snapshot", "changes"] = "snapshot",
     **kw: Any,
 ) -> Relationship[Any]:
     """Provide a relationship between two mapped classes.
@@ -994,6 +996,22 @@ def relationship(
         :ref:`custom_collections` - Introductory documentation and
         examples.
 
+    :param collection_tracking="snapshot":
+      Indicates how changes to a collection are tracked between flushes.
+      The default of ``"snapshot"`` copies the contents of a loaded
+      collection when it is first modified, and compares the collection
+      against this copy in order to produce its history.  When set to
+      ``"changes"``, no copy is made; instead, the objects appended to and
+      removed from the collection are recorded as they occur, so that
+      modifying a very large collection does not require copying it.
+
+      When using ``"changes"``, the same object should not be present in
+      a list-based collection more than once; appending an object that is
+      already present is recorded as an addition, in the same way as for
+      a :ref:`write only <write_only_relationship>` collection.
+
+      .. versionadded:: 2.0.0rc1
+
     :param comparator_factory:
       A class which extends :class:`.Relationship.Comparator`
       which provides custom SQL clause generation for comparison
@@ -1175,6 +1193,18 @@ def relationship(
         issues a JOIN to the immediate parent object, specifying primary
         key identifiers using an IN clause.
 
+      * ``batch`` - items should be loaded lazily when the property is
+        first accessed on any one of the objects loaded by the same result,
+        at which point the items are loaded for all of those objects at once,
+        using one or more SELECT statements that specify primary key
+        identifiers using an IN clause, in the same way as ``selectin``.
+
+        .. versionadded:: 2.0.0rc1
+
+        .. seealso::
+
+            :ref:`batch_loading`
+
       * ``noload`` - no loading should occur at any time.  The related
         collection will remain empty.   The ``noload`` strategy is not
         recommended for general use.  For a general use "never load"
@@ -1464,6 +1494,19 @@ def relationship(
 
           :ref:`relationship_primaryjoin`
 
+    :param selectin_chunk_size:
+      The number of parent primary key values to include in the IN clause
+      of each SELECT emitted by :ref:`selectin eager loading
+      <selectin_eager_loading>` for this relationship.  May be a positive
+      integer, or the string ``"auto"``, which sizes each SELECT from the
+      maximum number of bound parameters supported by the dialect in use
+      and the number of key columns being compared.  When left at its
+      default of ``None``, 500 values are included in each SELECT.  May be
+      overridden for a particular query using
+      :paramref:`_orm.selectinload.chunk_size`.
+
+      .. versionadded:: 2.0.0rc1
+
     :param single_parent:
       When True, installs a validator which will prevent objects
       from being associated with more than one parent at a time.
@@ -1633,6 +1676,8 @@ def relationship(
         info=info,
         omit_join=omit_join,
         sync_backref=sync_backref,
+        selectin_chunk_size=selectin_chunk_size,
+        collection_tracking=collection_tracking,
         **kw,
     )
 
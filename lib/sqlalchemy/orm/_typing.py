@@ -94,6 +94,8 @@ _ORMCOLEXPR = TypeVar("_ORMCOLEXPR", bound=ColumnElement[Any])
 
 class _OrmKnownExecutionOptions(_CoreKnownExecutionOptions, total=False):
     populate_existing: bool
+    readonly_entities: bool
+    concurrent_eager_loads: bool
     autoflush: bool
     synchronize_session: SynchronizeSessionArgument
     dml_strategy: DMLStrategyArgument
@@ -71,6 +71,7 @@ from .base import PassiveFlag
 from .base import RELATED_OBJECT_OK  # noqa
 from .base import SQL_OK  # noqa
 from .base import state_str
+from .state import CollectionChanges
 from .. import event
 from .. import exc
 from .. import inspection
@@ -527,12 +528,18 @@ class InstrumentedAttribute(QueryableAttribute[_T]):
         return super().__doc__
 
     def __set__(self, instance: object, value: Any) -> None:
-        self.impl.set(
-            instance_state(instance), instance_dict(instance), value, None
-        )
+        try:
+            state = instance_state(instance)
+        except AttributeError as err:
+            raise orm_exc.UnmappedInstanceError(instance) from err
+        self.impl.set(state, instance_dict(instance), value, None)
 
     def __delete__(self, instance: object) -> None:
-        self.impl.delete(instance_state(instance), instance_dict(instance))
+        try:
+            state = instance_state(instance)
+        except AttributeError as err:
+            raise orm_exc.UnmappedInstanceError(instance) from err
+        self.impl.delete(state, instance_dict(instance))
 
     @overload
     def __get__(self, instance: None, owner: Any) -> InstrumentedAttribute[_T]:
@@ -1597,6 +1604,12 @@ class CollectionAttributeImpl(HasCollectionAdapter, AttributeImpl):
     CollectionAdapter, a "view" onto that object that presents consistent bag
     semantics to the orm layer independent of the user data implementation.
 
+    When ``track_changes`` is set, the first modification of a loaded
+    collection places an empty :class:`.CollectionChanges` in
+    ``committed_state`` rather than a copy of the collection; append and
+    remove events are then recorded there, so that history does not need
+    to compare the collection against its committed contents.
+
     """
 
     uses_objects = True
@@ -1609,6 +1622,7 @@ class CollectionAttributeImpl(HasCollectionAdapter, AttributeImpl):
 
     __slots__ = (
         "copy",
+        "track_changes",
         "collection_factory",
         "_append_token",
         "_remove_token",
@@ -1626,6 +1640,7 @@ class CollectionAttributeImpl(HasCollectionAdapter, AttributeImpl):
         trackparent=False,
         copy_function=None,
         compare_function=None,
+        track_changes=False,
         **kwargs,
     ):
         super(CollectionAttributeImpl, self).__init__(
@@ -1638,9 +1653,12 @@ class CollectionAttributeImpl(HasCollectionAdapter, AttributeImpl):
             **kwargs,
         )
 
-        if copy_function is None:
+        if track_changes:
+            copy_function = self.__start_changes
+        elif copy_function is None:
             copy_function = self.__copy
         self.copy = copy_function
+        self.track_changes = track_changes
         self.collection_factory = typecallable
         self._append_token = AttributeEventToken(self, OP_APPEND)
         self._remove_token = AttributeEventToken(self, OP_REMOVE)
@@ -1662,6 +1680,19 @@ class CollectionAttributeImpl(HasCollectionAdapter, AttributeImpl):
     def __copy(self, item):
         return [y for y in collections.collection_adapter(item)]
 
+    def __start_changes(self, item):
+        return CollectionChanges()
+
+    def _record_change(
+        self, state: InstanceState[Any], value: Any, appended: bool
+    ) -> None:
+        changes = state.committed_state.get(self.key)
+        if isinstance(changes, CollectionChanges):
+            if appended:
+                changes.append(value)
+            else:
+                changes.remove(value)
+
     def get_history(
         self,
         state: InstanceState[Any],
@@ -1690,7 +1721,21 @@ class CollectionAttributeImpl(HasCollectionAdapter, AttributeImpl):
 
         if self.key in state.committed_state:
             original = state.committed_state[self.key]
-            if original is not NO_VALUE:
+            if isinstance(original, CollectionChanges):
+                added = original.added_items
+                current_states = [
+                    ((c is not None) and instance_state(c) or None, c)
+                    for c in current
+                ]
+                return (
+                    [(s, o) for s, o in current_states if o in added]
+                    + [(s, o) for s, o in current_states if o not in added]
+                    + [
+                        ((c is not None) and instance_state(c) or None, c)
+                        for c in original.deleted_items
+                    ]
+                )
+            elif original is not NO_VALUE:
                 current_states = [
                     ((c is not None) and instance_state(c) or None, c)
                     for c in current
@@ -1732,6 +1777,9 @@ class CollectionAttributeImpl(HasCollectionAdapter, AttributeImpl):
 
         state._modified_event(dict_, self, NO_VALUE, True)
 
+        if self.track_changes:
+            self._record_change(state, value, True)
+
         if self.trackparent and value is not None:
             self.sethasparent(instance_state(value), state, True)
 
@@ -1783,6 +1831,9 @@ class CollectionAttributeImpl(HasCollectionAdapter, AttributeImpl):
 
         state._modified_event(dict_, self, NO_VALUE, True)
 
+        if self.track_changes:
+            self._record_change(state, value, False)
+
     def delete(self, state: InstanceState[Any], dict_: _InstanceDict) -> None:
         if self.key not in dict_:
             return
@@ -2010,6 +2061,12 @@ class CollectionAttributeImpl(HasCollectionAdapter, AttributeImpl):
             for item in removed:
                 collection.remove_without_event(item)
 
+            if self.track_changes:
+                for item in added:
+                    self._record_change(state, item, True)
+                for item in removed:
+                    self._record_change(state, item, False)
+
         return user_data
 
     @overload
@@ -2459,6 +2516,13 @@ class History(NamedTuple):
             return cls(list(current), (), ())
         elif original is _NO_HISTORY:
             return cls((), list(current), ())
+        elif isinstance(original, CollectionChanges):
+            added = original.added_items
+            return cls(
+                list(added),
+                [o for o in current if o not in added],
+                list(original.deleted_items),
+            )
         else:
 
             current_states = [
@@ -14,6 +14,7 @@ specifically outside of the flush() process.
 
 from __future__ import annotations
 
+import itertools
 from typing import Any
 from typing import cast
 from typing import Dict
@@ -24,7 +25,6 @@ from typing import TYPE_CHECKING
 from typing import TypeVar
 from typing import Union
 
-from . import attributes
 from . import context
 from . import evaluator
 from . import exc as orm_exc
@@ -42,6 +42,7 @@ from ..engine import result as _result
 from ..sql import coercions
 from ..sql import dml
 from ..sql import expression
+from ..sql import operators
 from ..sql import roles
 from ..sql import select
 from ..sql import sqltypes
@@ -203,6 +204,92 @@ def _bulk_insert(
         return return_result
 
 
+def _bulk_load(
+    mapper: Mapper[_O],
+    mappings: Iterable[Dict[str, Any]],
+    session_transaction: SessionTransaction,
+    render_nulls: bool,
+    execution_options: Optional[OrmExecuteOptionsParameter] = None,
+) -> int:
+    base_mapper = mapper.base_mapper
+
+    if session_transaction.session.connection_callable:
+        raise NotImplementedError(
+            "connection_callable / per-instance sharding "
+            "not supported in bulk_load()"
+        )
+
+    connection = session_transaction.connection(base_mapper)
+    multiple_tables = mapper._multiple_persistence_tables
+
+    def copied_mappings(mappings):
+        for mapping in mappings:
+            mapping = dict(mapping)
+            _expand_composites(mapper, (mapping,))
+            yield mapping
+
+    if multiple_tables:
+        # the rows are loaded into each table in turn
+        mappings = list(copied_mappings(mappings))
+    else:
+        # the rows are streamed to Connection.bulk_load() as they're
+        # consumed from the given iterable
+        mappings = copied_mappings(mappings)
+
+    def records(table):
+        for (
+            state,
+            state_dict,
+            params,
+            mp,
+            conn,
+            value_params,
+            has_all_pks,
+            has_all_defaults,
+        ) in persistence._collect_insert_commands(
+            table,
+            ((None, mapping, mapper, connection) for mapping in mappings),
+            bulk=True,
+            return_defaults=multiple_tables,
+            render_nulls=render_nulls,
+        ):
+            if multiple_tables and not has_all_pks:
+                raise sa_exc.InvalidRequestError(
+                    "The 'bulk_load' ORM insert strategy requires primary "
+                    "key values to be present in each parameter set for "
+                    f"the multi-table mapper {mapper}"
+                )
+            if value_params or any(
+                isinstance(value, expression.ClauseElement)
+                or hasattr(value, "__clause_element__")
+                for value in params.values()
+            ):
+                raise sa_exc.InvalidRequestError(
+                    "The 'bulk_load' ORM insert strategy does not support "
+                    "SQL expression values; only literal values may be "
+                    "loaded"
+                )
+            yield params
+
+    # the total number of rows loaded into all tables
+    count = 0
+    for table, super_mapper in base_mapper._sorted_tables.items():
+        if not mapper.isa(super_mapper) or table not in mapper._pks_by_table:
+            continue
+
+        # rows are streamed to Connection.bulk_load() in runs which share
+        # the same set of keys; the polymorphic identity is present in
+        # the params for every table, so limit to the table's own columns
+        for keys, rows in itertools.groupby(records(table), key=frozenset):
+            count += connection.bulk_load(
+                table,
+                rows,
+                columns=[key for key in keys if key in table.c],
+                execution_options=execution_options,
+            )
+    return count
+
+
 @overload
 def _bulk_update(
     mapper: Mapper[Any],
@@ -554,6 +641,7 @@ class BulkUDCompileState(ORMDMLState):
         _subject_mapper: Optional[Mapper[Any]] = None
         _resolved_values = EMPTY_DICT
         _eval_condition = None
+        _eval_primary_keys = None
         _matched_rows = None
         _refresh_identity_token = None
 
@@ -714,6 +802,9 @@ class BulkUDCompileState(ORMDMLState):
         # individual ones we return here.
 
         update_options = execution_options["_sa_orm_update_options"]
+        if session.second_level_cache is not None:
+            cls._invalidate_second_level_cache(session, result, update_options)
+
         if update_options._dml_strategy == "orm":
             if update_options._synchronize_session == "evaluate":
                 cls._do_post_synchronize_evaluate(
@@ -825,6 +916,106 @@ class BulkUDCompileState(ORMDMLState):
         ]
         return [tuple(row[idx] for idx in primary_key_convert) for row in rows]
 
+    @classmethod
+    def _fetched_identity_keys(cls, result, update_options):
+        """Return the identity keys for the rows matched by
+        synchronize_session='fetch'.
+
+        Primary key rows are taken from RETURNING if it was used, else
+        from the SELECT emitted ahead of the statement.
+
+        """
+        target_mapper = update_options._subject_mapper
+        identity_class = target_mapper._identity_class
+        refresh_identity_token = update_options._refresh_identity_token
+
+        returned_defaults_rows = result.returned_defaults_rows
+        if returned_defaults_rows:
+            return [
+                (identity_class, tuple(pk), refresh_identity_token)
+                for pk in cls._interpret_returning_rows(
+                    target_mapper, returned_defaults_rows
+                )
+            ]
+        else:
+            return [
+                (identity_class, tuple(row[0:-1]), row[-1])
+                for row in update_options._matched_rows or ()
+                if refresh_identity_token is None
+                or row[-1] == refresh_identity_token
+            ]
+
+    @classmethod
+    def _fetched_objects(cls, session, result, update_options):
+        """Return (obj, state, dict) for objects in the identity map
+        matched by synchronize_session='fetch'.
+
+        """
+        get_state = session.identity_map.fast_get_state
+
+        matched_objects = []
+        for identity_key in cls._fetched_identity_keys(result, update_options):
+            state = get_state(identity_key)
+            if state is None:
+                continue
+            obj = state.obj()
+            if obj is not None:
+                matched_objects.append((obj, state, state.dict))
+        return matched_objects
+
+    @classmethod
+    def _invalidate_second_level_cache(cls, session, result, update_options):
+        """Remove the rows matched by the statement from the second level
+        cache, including those whose objects aren't present in the
+        session.
+
+        The matched rows are known only for synchronize_session='fetch';
+        otherwise all cached rows of the target mapper are invalidated.
+
+        """
+        target_mapper = update_options._subject_mapper
+        if session.second_level_cache._config_for(target_mapper) is None:
+            return
+
+        if (
+            update_options._dml_strategy == "orm"
+            and update_options._synchronize_session == "fetch"
+        ):
+            for identity_key in cls._fetched_identity_keys(
+                result, update_options
+            ):
+                session._invalidate_second_level_cache(
+                    target_mapper, identity_key
+                )
+        else:
+            session._invalidate_second_level_cache_mapper(target_mapper)
+
+    @classmethod
+    def _get_states_to_evaluate(cls, session, update_options):
+        """Return the states in the identity map which may be matched
+        by the criteria for synchronize_session='evaluate'.
+
+        When the criteria limit the primary key to specific values,
+        the states are located by identity key rather than by scanning
+        the whole identity map.
+
+        """
+        primary_keys = update_options._eval_primary_keys
+        if primary_keys is None:
+            return session.identity_map.all_states()
+
+        mapper = update_options._subject_mapper
+        identity_class = mapper._identity_class
+        identity_token = update_options._refresh_identity_token
+        get_state = session.identity_map.fast_get_state
+
+        states = []
+        for primary_key in primary_keys:
+            state = get_state((identity_class, primary_key, identity_token))
+            if state is not None:
+                states.append(state)
+        return states
+
     @classmethod
     def _get_matched_objects_on_criteria(cls, update_options, states):
         mapper = update_options._subject_mapper
@@ -865,11 +1056,7 @@ class BulkUDCompileState(ORMDMLState):
         return result
 
     @classmethod
-    def _eval_condition_from_statement(cls, update_options, statement):
-        mapper = update_options._subject_mapper
-        target_cls = mapper.class_
-
-        evaluator_compiler = evaluator.EvaluatorCompiler(target_cls)
+    def _criteria_from_statement(cls, mapper, statement):
         crit = ()
         if statement._where_criteria:
             crit += statement._where_criteria
@@ -882,6 +1069,135 @@ class BulkUDCompileState(ORMDMLState):
         if global_attributes:
             crit += cls._adjust_for_extra_criteria(global_attributes, mapper)
 
+        return crit
+
+    @classmethod
+    def _eval_primary_keys_from_statement(cls, update_options, statement):
+        """Return the set of primary key tuples to which the criteria of
+        the given statement are limited, or None.
+
+        A set is returned only if every primary key attribute is compared
+        against literal values at the top level of the criteria using
+        ``==``, or ``IN`` for at most one of them, or if a tuple of the
+        primary key attributes is compared using ``IN``.  The criteria
+        are still evaluated against each object so located.
+
+        """
+        mapper = update_options._subject_mapper
+        crit = cls._criteria_from_statement(mapper, statement)
+
+        pk_keys = [prop.key for prop in mapper._identity_key_props]
+
+        def pk_index(col):
+            if not isinstance(col, expression.ColumnElement):
+                return None
+            parentmapper = col._annotations.get("parentmapper", None)
+            if parentmapper is None or not mapper.isa(parentmapper):
+                return None
+            try:
+                key = parentmapper._columntoproperty[col].key
+            except orm_exc.UnmappedColumnError:
+                return None
+            if key not in pk_keys:
+                return None
+            return pk_keys.index(key)
+
+        def bind_value(elem):
+            if not isinstance(elem, expression.BindParameter):
+                return None
+            elif elem.callable:
+                return elem.callable()
+            else:
+                return elem.value
+
+        values_by_index = {}
+        tuples = None
+
+        stack = list(crit)
+        try:
+            while stack:
+                elem = stack.pop()
+                if isinstance(elem, expression.Grouping):
+                    stack.append(elem.element)
+                elif (
+                    isinstance(elem, expression.BooleanClauseList)
+                    and elem.operator is operators.and_
+                ):
+                    stack.extend(elem.clauses)
+                elif not isinstance(elem, expression.BinaryExpression):
+                    continue
+                elif elem.operator is operators.eq:
+                    left, right = elem.left, elem.right
+                    idx = pk_index(left)
+                    if idx is None:
+                        left, right = right, left
+                        idx = pk_index(left)
+                    value = bind_value(right)
+                    if idx is None or value is None:
+                        continue
+                    values = {value}
+                    if idx in values_by_index:
+                        values &= values_by_index[idx]
+                    values_by_index[idx] = values
+                elif elem.operator is operators.in_op:
+                    values = bind_value(elem.right)
+                    if not isinstance(values, (list, tuple, set)):
+                        continue
+                    left = elem.left
+                    if isinstance(left, expression.Grouping):
+                        left = left.element
+                    if isinstance(left, expression.Tuple):
+                        indexes = [pk_index(c) for c in left.clauses]
+                        if None in indexes or sorted(indexes) != list(
+                            range(len(pk_keys))
+                        ):
+                            continue
+                        values = {
+                            tuple(
+                                value[indexes.index(idx)]
+                                for idx in range(len(pk_keys))
+                            )
+                            for value in values
+                        }
+                        if tuples is not None:
+                            values &= tuples
+                        tuples = values
+                    else:
+                        idx = pk_index(left)
+                        if idx is None:
+                            continue
+                        values = set(values)
+                        if idx in values_by_index:
+                            values &= values_by_index[idx]
+                        values_by_index[idx] = values
+
+            if len(values_by_index) == len(pk_keys) and (
+                sum(len(values) > 1 for values in values_by_index.values())
+                <= 1
+            ):
+                primary_keys = set(
+                    itertools.product(
+                        *[values_by_index[idx] for idx in range(len(pk_keys))]
+                    )
+                )
+                if tuples is not None:
+                    primary_keys &= tuples
+            else:
+                primary_keys = tuples
+        except (TypeError, IndexError):
+            # unhashable values, or tuples of the wrong length
+            return None
+
+        return primary_keys
+
+    @classmethod
+    def _eval_condition_from_statement(cls, update_options, statement):
+        mapper = update_options._subject_mapper
+        target_cls = mapper.class_
+
+        evaluator_compiler = evaluator.EvaluatorCompiler(target_cls)
+        crit = cls._criteria_from_statement(mapper, statement)
+
         if crit:
             eval_condition = evaluator_compiler.process(*crit)
         else:
@@ -928,6 +1244,9 @@ class BulkUDCompileState(ORMDMLState):
         else:
             return update_options + {
                 "_eval_condition": eval_condition,
+                "_eval_primary_keys": cls._eval_primary_keys_from_statement(
+                    update_options, statement
+                ),
                 "_synchronize_session": "evaluate",
             }
 
@@ -966,6 +1285,9 @@ class BulkUDCompileState(ORMDMLState):
 
         return update_options + {
             "_eval_condition": eval_condition,
+            "_eval_primary_keys": cls._eval_primary_keys_from_statement(
+                update_options, statement
+            ),
         }
 
     @classmethod
@@ -1116,10 +1438,10 @@ class BulkORMInsert(ORMDMLState, InsertDMLState):
         if not params:
             if insert_options._dml_strategy == "auto":
                 insert_options += {"_dml_strategy": "orm"}
-            elif insert_options._dml_strategy == "bulk":
+            elif insert_options._dml_strategy in ("bulk", "bulk_load"):
                 raise sa_exc.InvalidRequestError(
-                    'Can\'t use "bulk" ORM insert strategy without '
-                    "passing separate parameters"
+                    f'Can\'t use "{insert_options._dml_strategy}" ORM '
+                    "insert strategy without passing separate parameters"
                 )
         else:
             if insert_options._dml_strategy == "auto":
@@ -1175,12 +1497,13 @@ class BulkORMInsert(ORMDMLState, InsertDMLState):
         if insert_options._dml_strategy not in (
             "raw",
             "bulk",
+            "bulk_load",
             "orm",
             "auto",
         ):
             raise sa_exc.ArgumentError(
                 "Valid strategies for ORM insert strategy "
-                "are 'raw', 'orm', 'bulk', 'auto"
+                "are 'raw', 'orm', 'bulk', 'bulk_load', 'auto"
             )
 
         result: _result.Result[Any]
@@ -1219,6 +1542,33 @@ class BulkORMInsert(ORMDMLState, InsertDMLState):
                 use_orm_insert_stmt=statement,
                 execution_options=execution_options,
             )
+        elif insert_options._dml_strategy == "bulk_load":
+            mapper = insert_options._subject_mapper
+
+            if (
+                statement._post_values_clause is not None
+                or statement._returning
+                or statement._values
+                or statement._multi_values
+            ):
+                raise sa_exc.InvalidRequestError(
+                    "The 'bulk_load' ORM insert strategy does not support "
+                    "RETURNING, VALUES or 'post values' clauses"
+                )
+
+            assert mapper is not None
+            assert session._transaction is not None
+            _bulk_load(
+                mapper,
+                cast(
+                    "Iterable[Dict[str, Any]]",
+                    [params] if isinstance(params, dict) else params,
+                ),
+                session._transaction,
+                render_nulls=insert_options._render_nulls,
+                execution_options=execution_options,
+            )
+            return _result.null_result()
         elif insert_options._dml_strategy == "orm":
             result = conn.execute(
                 statement, params or {}, execution_options=execution_options
@@ -1612,7 +1962,7 @@ class BulkORMUpdate(BulkUDCompileState, UpdateDMLState):
 
         matched_objects = cls._get_matched_objects_on_criteria(
             update_options,
-            session.identity_map.all_states(),
+            cls._get_states_to_evaluate(session, update_options),
         )
 
         cls._apply_update_set_values_to_objects(
@@ -1626,52 +1976,12 @@ class BulkORMUpdate(BulkUDCompileState, UpdateDMLState):
     def _do_post_synchronize_fetch(
         cls, session, statement, result, update_options
     ):
-        target_mapper = update_options._subject_mapper
-
-        returned_defaults_rows = result.returned_defaults_rows
-        if returned_defaults_rows:
-            pk_rows = cls._interpret_returning_rows(
-                target_mapper, returned_defaults_rows
-            )
-
-            matched_rows = [
-                tuple(row) + (update_options._refresh_identity_token,)
-                for row in pk_rows
-            ]
-        else:
-            matched_rows = update_options._matched_rows
-
-        objs = [
-            session.identity_map[identity_key]
-            for identity_key in [
-                target_mapper.identity_key_from_primary_key(
-                    list(primary_key),
-                    identity_token=identity_token,
-                )
-                for primary_key, identity_token in [
-                    (row[0:-1], row[-1]) for row in matched_rows
-                ]
-                if update_options._refresh_identity_token is None
-                or identity_token == update_options._refresh_identity_token
-            ]
-            if identity_key in session.identity_map
-        ]
-
-        if not objs:
+        matched_objects = cls._fetched_objects(session, result, update_options)
+        if not matched_objects:
             return
 
         cls._apply_update_set_values_to_objects(
-            session,
-            update_options,
-            statement,
-            [
-                (
-                    obj,
-                    attributes.instance_state(obj),
-                    attributes.instance_dict(obj),
-                )
-                for obj in objs
-            ],
+            session, update_options, statement, matched_objects
         )
 
     @classmethod
@@ -1884,7 +2194,7 @@ class BulkORMDelete(BulkUDCompileState, DeleteDMLState):
     ):
         matched_objects = cls._get_matched_objects_on_criteria(
             update_options,
-            session.identity_map.all_states(),
+            cls._get_states_to_evaluate(session, update_options),
         )
 
         to_delete = []
@@ -1902,37 +2212,8 @@ class BulkORMDelete(BulkUDCompileState, DeleteDMLState):
     def _do_post_synchronize_fetch(
         cls, session, statement, result, update_options
     ):
-        target_mapper = update_options._subject_mapper
-
-        returned_defaults_rows = result.returned_defaults_rows
-
-        if returned_defaults_rows:
-            pk_rows = cls._interpret_returning_rows(
-                target_mapper, returned_defaults_rows
-            )
-
-            matched_rows = [
-                tuple(row) + (update_options._refresh_identity_token,)
-                for row in pk_rows
-            ]
-        else:
-            matched_rows = update_options._matched_rows
-
-        for row in matched_rows:
-            primary_key = row[0:-1]
-            identity_token = row[-1]
-
-            # TODO: inline this and call remove_newly_deleted
-            # once
-            identity_key = target_mapper.identity_key_from_primary_key(
-                list(primary_key),
-                identity_token=identity_token,
+        matched_objects = cls._fetched_objects(session, result, update_options)
+        if matched_objects:
+            session._remove_newly_deleted(
+                [state for _, state, _ in matched_objects]
             )
-            if identity_key in session.identity_map:
-                session._remove_newly_deleted(
-                    [
-                        attributes.instance_state(
-                            session.identity_map[identity_key]
-                        )
-                    ]
-                )
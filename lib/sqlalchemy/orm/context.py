@@ -39,6 +39,7 @@ from .. import future
 from .. import inspect
 from .. import sql
 from .. import util
+from ..engine import Row
 from ..sql import coercions
 from ..sql import expression
 from ..sql import roles
@@ -55,7 +56,9 @@ from ..sql.base import Executable
 from ..sql.base import Generative
 from ..sql.base import Options
 from ..sql.dml import UpdateBase
+from ..sql.elements import _KeysetCriteria
 from ..sql.elements import GroupedElement
+from ..sql.elements import Label
 from ..sql.elements import TextClause
 from ..sql.selectable import LABEL_STYLE_DISAMBIGUATE_ONLY
 from ..sql.selectable import LABEL_STYLE_NONE
@@ -108,6 +111,8 @@ class QueryContext:
         "session",
         "autoflush",
         "populate_existing",
+        "readonly_entities",
+        "readonly_identity_map",
         "invoke_all_eagers",
         "version_check",
         "refresh_state",
@@ -130,6 +135,8 @@ class QueryContext:
     class default_load_options(Options):
         _only_return_tuples = False
         _populate_existing = False
+        _readonly_entities = False
+        _concurrent_eager_loads = False
         _version_check = False
         _invoke_all_eagers = True
         _autoflush = True
@@ -194,6 +201,25 @@ class QueryContext:
         self.yield_per = load_options._yield_per
         self.identity_token = load_options._refresh_identity_token
 
+        top_level_context = self.top_level_context
+        if load_options._readonly_entities or (
+            top_level_context is not None
+            and top_level_context.readonly_entities
+        ):
+            # objects are not placed in the Session's identity map; instead,
+            # the top level load and all of its eager loaders share a plain
+            # dictionary so that objects are still uniqued among rows
+            self.readonly_entities = True
+            self.readonly_identity_map = (
+                top_level_context.readonly_identity_map
+                if top_level_context is not None
+                and top_level_context.readonly_entities
+                else {}
+            )
+        else:
+            self.readonly_entities = False
+            self.readonly_identity_map = None
+
     def _get_top_level_context(self) -> QueryContext:
         return self.top_level_context or self
 
@@ -247,9 +273,15 @@ class AbstractORMCompileState(CompileState):
         bind_arguments,
         conn,
     ) -> Result:
-        result = conn.execute(
-            statement, params or {}, execution_options=execution_options
-        )
+        prefetched = execution_options.get("_sa_orm_prefetched_result", None)
+        if prefetched is not None and prefetched.statement is statement:
+            # the statement was already run on a separate connection by
+            # loading._run_post_loaders_concurrently()
+            result = prefetched.result
+        else:
+            result = conn.execute(
+                statement, params or {}, execution_options=execution_options
+            )
         return cls.orm_setup_cursor_result(
             session,
             statement,
@@ -374,6 +406,10 @@ class ORMCompileState(AbstractORMCompileState):
     def get_column_descriptions(cls, statement):
         return _column_descriptions(statement)
 
+    @classmethod
+    def get_keyset_bookmark(cls, statement, row):
+        return _keyset_bookmark(statement, row)
+
     @classmethod
     def orm_pre_session_exec(
         cls,
@@ -394,6 +430,8 @@ class ORMCompileState(AbstractORMCompileState):
             "_sa_orm_load_options",
             {
                 "populate_existing",
+                "readonly_entities",
+                "concurrent_eager_loads",
                 "autoflush",
                 "yield_per",
                 "sa_top_level_orm_context",
@@ -517,17 +555,33 @@ class ORMCompileState(AbstractORMCompileState):
             and ext_info.mapper.persist_selectable
             not in self._polymorphic_adapters
         ):
-            for mp in ext_info.mapper.iterate_to_root():
-                self._mapper_loads_polymorphically_with(
-                    mp,
-                    sql_util.ColumnAdapter(selectable, mp._equivalent_columns),
-                )
+            cache = ext_info.mapper.base_mapper._polymorphic_adapter_cache
+            key = (ext_info.mapper, selectable)
+            try:
+                adapters = cache[key]
+            except KeyError:
+                adapters = {}
+                for mp in ext_info.mapper.iterate_to_root():
+                    self._mapper_loads_polymorphically_with(
+                        mp,
+                        sql_util.ColumnAdapter(
+                            selectable, mp._equivalent_columns
+                        ),
+                        adapters,
+                    )
+                cache[key] = adapters
+
+            self._polymorphic_adapters.update(adapters)
 
-    def _mapper_loads_polymorphically_with(self, mapper, adapter):
+    def _mapper_loads_polymorphically_with(
+        self, mapper, adapter, polymorphic_adapters=None
+    ):
+        if polymorphic_adapters is None:
+            polymorphic_adapters = self._polymorphic_adapters
         for m2 in mapper._with_polymorphic_mappers or [mapper]:
-            self._polymorphic_adapters[m2] = adapter
+            polymorphic_adapters[m2] = adapter
             for m in m2.iterate_to_root():  # TODO: redundant ?
-                self._polymorphic_adapters[m.local_table] = adapter
+                polymorphic_adapters[m.local_table] = adapter
 
     @classmethod
     def _create_entities_collection(cls, query, legacy):
@@ -2316,6 +2370,52 @@ def _column_descriptions(
     return d
 
 
+def _keyset_bookmark(
+    query_or_select_stmt: Union[Query, Select],
+    row: Any,
+    legacy: bool = False,
+) -> Tuple[Any, ...]:
+    compile_state = ORMSelectCompileState._create_entities_collection(
+        query_or_select_stmt, legacy=legacy
+    )
+    if len(compile_state._entities) == 1 and not isinstance(row, Row):
+        row = (row,)
+
+    bookmark = []
+    for key, _, _ in _KeysetCriteria._keys_from_order_by(
+        query_or_select_stmt._order_by_clauses
+    ):
+        parententity = key._annotations.get("parententity", None)
+        for idx, ent in enumerate(compile_state._entities):
+            if isinstance(ent, _MapperEntity):
+                if parententity is not None:
+                    if not ent.corresponds_to(parententity):
+                        continue
+                    attr_key = key._annotations.get("proxy_key", None)
+                elif not ent.is_aliased_class:
+                    prop = ent.mapper._columntoproperty.get(key, None)
+                    attr_key = prop.key if prop is not None else None
+                else:
+                    continue
+                if attr_key is not None:
+                    bookmark.append(getattr(row[idx], attr_key))
+                    break
+            elif isinstance(ent, _ColumnEntity):
+                column = ent.column
+                if isinstance(column, Label):
+                    column = column.element
+                if column is key or column.compare(key):
+                    bookmark.append(row[idx])
+                    break
+        else:
+            raise sa_exc.InvalidRequestError(
+                "ORDER BY expression %s is not present in the columns "
+                "clause of the statement; can't produce a keyset "
+                "bookmark from a row" % (key,)
+            )
+    return tuple(bookmark)
+
+
 def _legacy_filter_by_entity_zero(
     query_or_augmented_select: Union[Query[Any], Select[Any]]
 ) -> Optional[_InternalEntityType[Any]]:
@@ -23,6 +23,7 @@ from typing import Mapping
 from typing import Optional
 from typing import overload
 from typing import Set
+from typing import Tuple
 from typing import Type
 from typing import TYPE_CHECKING
 from typing import TypeVar
@@ -926,12 +927,18 @@ class registry:
     _class_registry: clsregistry._ClsRegistryType
     _managers: weakref.WeakKeyDictionary[ClassManager[Any], Literal[True]]
     _non_primary_mappers: weakref.WeakKeyDictionary[Mapper[Any], Literal[True]]
+    _unconfigured_mappers: weakref.WeakKeyDictionary[
+        Mapper[Any], Literal[True]
+    ]
     metadata: MetaData
     constructor: CallableReference[Callable[..., None]]
     type_annotation_map: _MutableTypeAnnotationMapType
     _dependents: Set[_RegistryType]
     _dependencies: Set[_RegistryType]
     _new_mappers: bool
+    _configured_state_cache: Optional[
+        Dict[Tuple[Mapper[Any], str], Tuple[Any, ...]]
+    ]
 
     def __init__(
         self,
@@ -988,6 +995,7 @@ class registry:
         self._class_registry = class_registry
         self._managers = weakref.WeakKeyDictionary()
         self._non_primary_mappers = weakref.WeakKeyDictionary()
+        self._unconfigured_mappers = weakref.WeakKeyDictionary()
         self.metadata = lcl_metadata
         self.constructor = constructor
         self.type_annotation_map = {}
@@ -997,6 +1005,7 @@ class registry:
         self._dependencies = set()
 
         self._new_mappers = False
+        self._configured_state_cache = None
 
         with mapperlib._CONFIGURE_MUTEX:
             mapperlib._mapper_registries[self] = True
@@ -1034,6 +1043,7 @@ class registry:
 
     def _flag_new_mapper(self, mapper: Mapper[Any]) -> None:
         mapper._ready_for_configure = True
+        self._unconfigured_mappers[mapper] = True
         if self._new_mappers:
             return
 
@@ -1080,19 +1090,23 @@ class registry:
             todo.update(reg._dependencies.difference(done))
 
     def _mappers_to_configure(self) -> Iterator[Mapper[Any]]:
+        # mappers are tracked as they're flagged as new and discarded
+        # here once configured, so that configuring a few new mappers
+        # doesn't require a scan of every mapper in the registry
+        pending = []
+        for mapper in list(self._unconfigured_mappers):
+            if mapper.configured:
+                self._unconfigured_mappers.pop(mapper, None)
+            else:
+                pending.append(mapper)
+
         return itertools.chain(
             (
-                manager.mapper
-                for manager in list(self._managers)
-                if manager.is_mapped
-                and not manager.mapper.configured
-                and manager.mapper._ready_for_configure
-            ),
-            (
-                npm
-                for npm in list(self._non_primary_mappers)
-                if not npm.configured and npm._ready_for_configure
+                mapper
+                for mapper in pending
+                if not mapper.non_primary and not mapper.configured
             ),
+            (npm for npm in pending if npm.non_primary and not npm.configured),
         )
 
     def _add_non_primary_mapper(self, np_mapper: Mapper[Any]) -> None:
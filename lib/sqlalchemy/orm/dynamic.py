@@ -23,8 +23,11 @@ from __future__ import annotations
 from typing import Any
 from typing import Iterable
 from typing import Iterator
+from typing import Optional
+from typing import Sequence
 from typing import TYPE_CHECKING
 from typing import TypeVar
+from typing import Union
 
 from . import attributes
 from . import exc as orm_exc
@@ -41,6 +44,7 @@ from ..engine import result
 
 if TYPE_CHECKING:
     from .session import Session
+    from ..sql._typing import _ColumnExpressionArgument
 
 
 _T = TypeVar("_T", bound=Any)
@@ -177,6 +181,30 @@ class AppenderMixin(AbstractCollectionWriter[_T]):
         else:
             return self._generate(sess).count()
 
+    def iter_batches(
+        self,
+        size: int = 1000,
+        order_by: Optional[
+            Union[
+                _ColumnExpressionArgument[Any],
+                Sequence[_ColumnExpressionArgument[Any]],
+            ]
+        ] = None,
+        expunge: bool = True,
+    ) -> Iterator[Sequence[_T]]:
+        """Iterate through the rows of this :class:`_orm.AppenderQuery` in
+        batches, using keyset pagination.
+
+        .. versionadded:: 2.0.0rc1
+
+        .. seealso::
+
+            :meth:`_orm.WriteOnlyCollection.iter_batches` - main documentation
+            for iter_batches
+
+        """
+        return self._iter_batches_impl(self.session, size, order_by, expunge)
+
     def _generate(self, sess=None):
         # note we're returning an entirely new Query class instance
         # here without any assignment capabilities; the class of this
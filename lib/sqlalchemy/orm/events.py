@@ -1805,6 +1805,38 @@ class SessionEvents(event.Events[Session]):
 
         """
 
+    def after_flush_stats(self, session, flush_context, stats):
+        """Execute after flush has completed, receiving timings and
+        statement counts for the flush.
+
+        The event is invoked after :meth:`.SessionEvents.after_flush_postexec`.
+        Timings are only collected for a flush if there are listeners for
+        this event when the flush begins::
+
+            from sqlalchemy import event
+
+            @event.listens_for(Session, "after_flush_stats")
+            def log_flush(session, flush_context, stats):
+                if stats.total_time > 1:
+                    log.warning("slow flush: %s", stats)
+
+        :param session: The target :class:`.Session`.
+        :param flush_context: Internal :class:`.UOWTransaction` object
+         which handles the details of the flush.
+        :param stats: a :class:`.FlushStats` object, which provides the
+         time spent in each phase of the flush, as well as per-mapper
+         timings, row counts and statement counts via the
+         :class:`.MapperFlushStats` objects in
+         :attr:`.FlushStats.mappers`.
+
+        .. versionadded:: 2.0.0rc1
+
+        .. seealso::
+
+            :meth:`~.SessionEvents.after_flush_postexec`
+
+        """
+
     def after_begin(self, session, transaction, connection):
         """Execute after a transaction is begun on a connection
 
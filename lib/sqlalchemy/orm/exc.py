@@ -97,7 +97,10 @@ class UnmappedInstanceError(UnmappedError):
                     "Class %r is mapped, but this instance lacks "
                     "instrumentation.  This occurs when the instance "
                     "is created before sqlalchemy.orm.mapper(%s) "
-                    "was called." % (name, name)
+                    "was called, or when it was loaded using the "
+                    "'readonly_entities' execution option, which produces "
+                    "plain instances that can't be modified, inspected or "
+                    "added to a Session." % (name, name)
                 )
             except UnmappedClassError:
                 msg = f"Class '{_safe_cls_name(type(obj))}' is not mapped"
@@ -26,6 +26,7 @@ from .. import exc as sa_exc
 
 if TYPE_CHECKING:
     from ._typing import _IdentityKeyType
+    from .mapper import Mapper
     from .state import InstanceState
 
 
@@ -291,6 +292,143 @@ class WeakInstanceDict(IdentityMap):
                     self._manage_removed_state(state)
 
 
+class IndexedWeakInstanceDict(WeakInstanceDict):
+    """A :class:`.WeakInstanceDict` which additionally indexes the states
+    it contains on the values of selected attributes.
+
+    States are queued as they are added and are indexed upon the next
+    lookup, as a state added while loading a row is not yet populated
+    at that point.  Subsequent changes to the indexed attributes are
+    applied by an attribute "set" event.  An index entry is only used
+    if the state is still present and its current value matches; it is
+    otherwise disregarded.
+
+    """
+
+    _index_keys: Dict[Mapper[Any], Tuple[str, ...]]
+    _indexes: Dict[Tuple[Mapper[Any], str], Dict[Any, InstanceState[Any]]]
+    _index_entries: Dict[
+        InstanceState[Any], Dict[Tuple[Mapper[Any], str], Any]
+    ]
+    _unindexed: Dict[InstanceState[Any], None]
+
+    def __init__(self, index_keys: Dict[Mapper[Any], Tuple[str, ...]]):
+        super().__init__()
+        self._index_keys = index_keys
+        self._indexes = {
+            (mapper, key): {}
+            for mapper, keys in index_keys.items()
+            for key in keys
+        }
+        self._index_entries = {}
+        self._unindexed = {}
+
+    def _add_unpresent(
+        self, state: InstanceState[Any], key: _IdentityKeyType[Any]
+    ) -> None:
+        super()._add_unpresent(state, key)
+        self._unindexed[state] = None
+
+    def _manage_incoming_state(self, state: InstanceState[Any]) -> None:
+        super()._manage_incoming_state(state)
+        self._unindexed[state] = None
+
+    def _manage_removed_state(self, state: InstanceState[Any]) -> None:
+        super()._manage_removed_state(state)
+        self._remove_from_indexes(state)
+
+    def _fast_discard(self, state: InstanceState[Any]) -> None:
+        super()._fast_discard(state)
+        if not self.contains_state(state):
+            self._remove_from_indexes(state)
+
+    def _remove_from_indexes(self, state: InstanceState[Any]) -> None:
+        self._unindexed.pop(state, None)
+        for index_key, value in self._index_entries.pop(state, {}).items():
+            index = self._indexes[index_key]
+            if index.get(value) is state:
+                del index[value]
+
+    def _index_value(
+        self,
+        state: InstanceState[Any],
+        index_key: Tuple[Mapper[Any], str],
+        value: Any,
+    ) -> None:
+        index = self._indexes[index_key]
+        entries = self._index_entries.setdefault(state, {})
+        if index_key in entries:
+            previous = entries.pop(index_key)
+            if index.get(previous) is state:
+                del index[previous]
+        try:
+            index[value] = state
+        except TypeError:
+            # unhashable value; can't be indexed
+            return
+        entries[index_key] = value
+
+    def _index_states(self) -> None:
+        unindexed, self._unindexed = self._unindexed, {}
+        for state in unindexed:
+            dict_ = state.dict
+            for mapper in state.mapper.iterate_to_root():
+                for key in self._index_keys.get(mapper, ()):
+                    if key in dict_:
+                        self._index_value(state, (mapper, key), dict_[key])
+
+    def _index_key_for(
+        self, mapper: Mapper[Any], key: str
+    ) -> Optional[Tuple[Mapper[Any], str]]:
+        for base in mapper.iterate_to_root():
+            if key in self._index_keys.get(base, ()):
+                return (base, key)
+        return None
+
+    def _get_state_by_index(
+        self, mapper: Mapper[Any], key: str, value: Any
+    ) -> Optional[InstanceState[Any]]:
+        """Return the state of the given mapper whose indexed attribute
+        ``key`` has the given value, if present."""
+
+        index_key = self._index_key_for(mapper, key)
+        if index_key is None:
+            return None
+
+        if self._unindexed:
+            self._index_states()
+
+        try:
+            state = self._indexes[index_key].get(value)
+        except TypeError:
+            return None
+
+        if (
+            state is None
+            or not self.contains_state(state)
+            or not state.mapper.isa(mapper)
+            or key not in state.dict
+            or state.dict[key] != value
+        ):
+            return None
+        return state
+
+
+def _index_on_set(
+    state: InstanceState[Any], value: Any, oldvalue: Any, initiator: Any
+) -> None:
+    # attribute "set" listener for attributes which are indexed by
+    # an IndexedWeakInstanceDict
+    identity_map = state._instance_dict()
+    if (
+        isinstance(identity_map, IndexedWeakInstanceDict)
+        and state not in identity_map._unindexed
+    ):
+        index_key = identity_map._index_key_for(state.mapper, initiator.key)
+        if index_key is not None:
+            identity_map._index_value(state, index_key, value)
+
+
 def _killed(state: InstanceState[Any], key: _IdentityKeyType[Any]) -> NoReturn:
     # external function to avoid creating cycles when assigned to
     # the IdentityMap
@@ -17,6 +17,7 @@ as well as some of the attribute loading strategies.
 
 from __future__ import annotations
 
+import operator
 from typing import Any
 from typing import Dict
 from typing import Iterable
@@ -37,6 +38,7 @@ from .base import _RAISE_FOR_STATE
 from .base import _SET_DEFERRED_EXPIRED
 from .base import PassiveFlag
 from .context import FromStatement
+from .second_level_cache import _copy_mutable_values
 from .util import _none_set
 from .util import state_str
 from .. import exc as sa_exc
@@ -98,6 +100,8 @@ def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
         is_top_level = True
         context.post_load_paths = {}
 
+    concurrent_eager_loads = context.load_options._concurrent_eager_loads
+
     compile_state = context.compile_state
     filtered = compile_state._has_mapper_entities
     single_entity = (
@@ -213,8 +217,14 @@ def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
                 while context.post_load_paths:
                     post_loads = list(context.post_load_paths.items())
                     context.post_load_paths.clear()
-                    for path, post_load in post_loads:
-                        post_load.invoke(context, path)
+                    if concurrent_eager_loads:
+                        post_loaders = []
+                        for path, post_load in post_loads:
+                            post_load.invoke(context, path, post_loaders)
+                        _run_post_loaders_concurrently(context, post_loaders)
+                    else:
+                        for path, post_load in post_loads:
+                            post_load.invoke(context, path)
 
                 if yield_per:
                     context.post_load_paths.clear()
@@ -508,6 +518,25 @@ def load_on_pk_identity(
 
     """Load the given primary key identity from the database."""
 
+    if (
+        session.second_level_cache is not None
+        and primary_key_identity is not None
+        and refresh_state is None
+        and with_for_update is None
+        and only_load_props is None
+        and statement._for_update_arg is None
+        and not statement._with_options
+        and not statement._execution_options.get("populate_existing", False)
+        and not (load_options and load_options._populate_existing)
+    ):
+        mapper = statement._propagate_attrs["plugin_subject"]
+        if mapper.is_mapper and not mapper.always_refresh:
+            instance = _load_from_second_level_cache(
+                session, mapper, tuple(primary_key_identity), identity_token
+            )
+            if instance is not None:
+                return instance
+
     query = statement
     q = query._clone()
 
@@ -616,6 +645,66 @@ def load_on_pk_identity(
         return None
 
 
+def _load_from_second_level_cache(
+    session, mapper, primary_key_identity, identity_token
+):
+    """Establish a persistent instance in the given :class:`.Session` using
+    column values from its second level cache, returning None if not
+    present."""
+
+    second_level_cache = session.second_level_cache
+    config = second_level_cache._config_for(mapper)
+    if config is None:
+        return None
+
+    entry = second_level_cache._get(
+        config, mapper, primary_key_identity, identity_token
+    )
+    if entry is None:
+        return None
+
+    polymorphic_identity, values = entry
+    if polymorphic_identity is not None:
+        entry_mapper = mapper.polymorphic_map.get(polymorphic_identity)
+        if entry_mapper is None or not entry_mapper.isa(mapper):
+            return None
+    else:
+        entry_mapper = mapper
+
+    identitykey = (
+        mapper._identity_class,
+        primary_key_identity,
+        identity_token,
+    )
+    if identitykey in session.identity_map:
+        return None
+
+    manager = entry_mapper.class_manager
+    instance = manager.new_instance()
+    state = attributes.instance_state(instance)
+    dict_ = state.dict
+    dict_.update(_copy_mutable_values(values))
+    state.key = identitykey
+    state.identity_token = identity_token
+    state.session_id = session.hash_key
+    session.identity_map._add_unpresent(state, identitykey)
+
+    # attributes which weren't cached are loaded when accessed
+    unloaded = [
+        prop.key
+        for prop in entry_mapper.column_attrs
+        if not prop.deferred and prop.key not in dict_
+    ]
+    if unloaded:
+        state._expire_attributes(dict_, unloaded)
+
+    if manager.dispatch.load:
+        manager.dispatch.load(state, None)
+    if session.dispatch.loaded_as_persistent:
+        session.dispatch.loaded_as_persistent(session, state)
+    return instance
+
+
 def _set_get_options(
     compile_opt,
     load_opt,
@@ -661,7 +750,10 @@ def _setup_entity_query(
     **kw,
 ):
 
-    if with_polymorphic:
+    if (
+        with_polymorphic
+        and with_polymorphic != mapper._with_polymorphic_mappers
+    ):
         poly_properties = mapper._iterate_polymorphic_properties(
             with_polymorphic
         )
@@ -788,6 +880,19 @@ def _instance_processor(
         else:
             primary_key_getter = None
 
+        # positions of column values within each row for the "quick"
+        # populators, used to generate a specialized populate function
+        row_indexes = {}
+        metadata = result._metadata
+
+        def _index_getter(col):
+            index = metadata._index_for_key(col, False)
+            if index is None:
+                return None
+            getter = operator.itemgetter(index)
+            row_indexes[getter] = index
+            return getter
+
         getters = {
             "cached_populators": cached_populators,
             "todo": todo,
@@ -835,9 +940,9 @@ def _instance_processor(
 
                         adapted_col = adapter.columns[col]
                         if adapted_col is not None:
-                            getter = result._getter(adapted_col, False)
+                            getter = _index_getter(adapted_col)
                     if not getter:
-                        getter = result._getter(col, False)
+                        getter = _index_getter(col)
                     if getter:
                         cached_populators["quick"].append((prop.key, getter))
                     else:
@@ -859,6 +964,10 @@ def _instance_processor(
                 # with the context each time to work correctly.
                 todo.append(prop)
 
+        getters["populate_quick"] = _generate_populate_quick(
+            cached_populators, row_indexes
+        )
+
         path.set(compile_state.attributes, getter_key, getters)
 
     cached_populators = getters["cached_populators"]
@@ -869,6 +978,17 @@ def _instance_processor(
             context, query_entity, path, mapper, result, adapter, populators
         )
 
+    # the generated function covers the cached "quick" and "expire"
+    # populators only; if loader strategies for this load added more,
+    # use the general-purpose loops in _populate_full() instead
+    if len(populators["quick"]) == len(cached_populators["quick"]) and len(
+        populators["expire"]
+    ) == len(cached_populators["expire"]):
+        populate_quick = getters["populate_quick"]
+    else:
+        populate_quick = None
+    new_populators = populators["new"]
+
     propagated_loader_options = context.propagated_loader_options
     load_path = (
         context.compile_state.current_path + path
@@ -876,16 +996,40 @@ def _instance_processor(
         else path
     )
 
-    session_identity_map = context.session.identity_map
+    readonly_entities = context.readonly_entities
+    if readonly_entities:
+        # a plain dictionary of identity keys to instances, local to
+        # this load
+        session_identity_map = context.readonly_identity_map
+    else:
+        session_identity_map = context.session.identity_map
 
     populate_existing = context.populate_existing or mapper.always_refresh
     load_evt = bool(mapper.class_manager.dispatch.load)
     refresh_evt = bool(mapper.class_manager.dispatch.refresh)
-    persistent_evt = bool(context.session.dispatch.loaded_as_persistent)
+    persistent_evt = not readonly_entities and bool(
+        context.session.dispatch.loaded_as_persistent
+    )
     if persistent_evt:
         loaded_as_persistent = context.session.dispatch.loaded_as_persistent
+
+    # populate the second level cache, if any, unless the transaction
+    # may be reading rows that it has itself changed
+    second_level_cache = context.session.second_level_cache
+    if (
+        second_level_cache is not None
+        and not readonly_entities
+        and not only_load_props
+        and second_level_cache._config_for(mapper) is not None
+        and not context.session._flushed_in_transaction
+    ):
+        cache_from_state = second_level_cache._set_from_state
+    else:
+        cache_from_state = None
+
     instance_state = attributes.instance_state
     instance_dict = attributes.instance_dict
+    new_instance = mapper.class_manager.new_instance
     session_id = context.session.hash_key
     runid = context.runid
     identity_token = context.identity_token
@@ -976,7 +1120,10 @@ def _instance_processor(
 
             if instance is not None:
                 # existing instance
-                state = instance_state(instance)
+                if readonly_entities:
+                    state = _readonly_instance_state(instance, identitykey)
+                else:
+                    state = instance_state(instance)
                 dict_ = instance_dict(instance)
 
                 isnew = state.runid != runid
@@ -1000,16 +1147,20 @@ def _instance_processor(
                 currentload = True
                 loaded_instance = True
 
-                instance = mapper.class_manager.new_instance()
+                instance = new_instance()
 
                 dict_ = instance_dict(instance)
                 state = instance_state(instance)
                 state.key = identitykey
                 state.identity_token = identity_token
 
-                # attach instance to session.
-                state.session_id = session_id
-                session_identity_map._add_unpresent(state, identitykey)
+                if readonly_entities:
+                    # the instance remains detached
+                    session_identity_map[identitykey] = instance
+                else:
+                    # attach instance to session.
+                    state.session_id = session_id
+                    session_identity_map._add_unpresent(state, identitykey)
 
         effective_populate_existing = populate_existing
         if refresh_state is state:
@@ -1031,17 +1182,29 @@ def _instance_processor(
                 state.load_options = propagated_loader_options
                 state.load_path = load_path
 
-            _populate_full(
-                context,
-                row,
-                state,
-                dict_,
-                isnew,
-                load_path,
-                loaded_instance,
-                effective_populate_existing,
-                populators,
-            )
+            if (
+                isnew
+                and populate_quick is not None
+                and not effective_populate_existing
+            ):
+                # inlined form of _populate_full() for the first row
+                # with this identity, using the generated populate function
+                state.runid = runid
+                populate_quick(state, dict_, row)
+                for key, populator in new_populators:
+                    populator(state, dict_, row)
+            else:
+                _populate_full(
+                    context,
+                    row,
+                    state,
+                    dict_,
+                    isnew,
+                    load_path,
+                    loaded_instance,
+                    effective_populate_existing,
+                    populators,
+                )
 
             if isnew:
                 # state.runid should be equal to context.runid / runid
@@ -1067,12 +1230,17 @@ def _instance_processor(
                     if state.runid != runid:
                         _warn_for_runid_changed(state)
 
-                if effective_populate_existing or state.modified:
+                if not readonly_entities and (
+                    effective_populate_existing or state.modified
+                ):
                     if refresh_state and only_load_props:
                         state._commit(dict_, only_load_props)
                     else:
                         state._commit_all(dict_, session_identity_map)
 
+                if cache_from_state is not None:
+                    cache_from_state(state, dict_)
+
             if post_load:
                 post_load.add_state(state, True)
 
@@ -1113,6 +1281,37 @@ def _instance_processor(
 
         return instance
 
+    if (
+        readonly_entities
+        and populate_quick is not None
+        and refresh_state is None
+        and not load_evt
+        and not post_load
+        and not populators["new"]
+        and not populators["existing"]
+        and not populators["eager"]
+        and not any(set_callable for key, set_callable in populators["expire"])
+    ):
+        # nothing needs an InstanceState; produce plain instances of the
+        # class with only their __dict__ populated
+        class_ = mapper.class_
+        class_new = class_.__new__
+
+        def _instance(row):  # noqa: F811
+            identitykey = (
+                identity_class,
+                primary_key_getter(row),
+                identity_token,
+            )
+            instance = session_identity_map.get(identitykey)
+            if instance is None:
+                if is_not_primary_key(identitykey[1]):
+                    return None
+                instance = class_new(class_)
+                populate_quick(None, instance.__dict__, row)
+                session_identity_map[identitykey] = instance
+            return instance
+
     if mapper.polymorphic_map and not _polymorphic_from and not refresh_state:
         # if we are doing polymorphic, dispatch to a different _instance()
         # method specific to the subclass mapper
@@ -1142,6 +1341,21 @@ def _instance_processor(
     return _instance
 
 
+def _readonly_instance_state(instance, identitykey):
+    """Return the :class:`.InstanceState` for an instance present in
+    the identity map of a ``readonly_entities`` load, establishing a new
+    detached one if the instance was created without it."""
+
+    manager = attributes.manager_of_class(instance.__class__)
+    state = manager._new_state_if_none(instance)
+    if state:
+        state.key = identitykey
+        state.identity_token = identitykey[2]
+        return state
+    else:
+        return attributes.instance_state(instance)
+
+
 def _load_subclass_via_in(context, path, entity):
     mapper = entity.mapper
 
@@ -1163,20 +1377,40 @@ def _load_subclass_via_in(context, path, entity):
 
         if context.populate_existing:
             q2 = q2.execution_options(populate_existing=True)
+        if context.readonly_entities:
+            # locate the already-loaded instances within the same
+            # readonly identity map
+            q2 = q2.execution_options(
+                sa_top_level_orm_context=context._get_top_level_context()
+            )
 
-        context.session.execute(
-            q2,
-            dict(
-                primary_keys=[
-                    state.key[1][0] if zero_idx else state.key[1]
-                    for state, load_attrs in states
-                ]
-            ),
-        ).unique().scalars().all()
+        primary_keys = [
+            state.key[1][0] if zero_idx else state.key[1]
+            for state, load_attrs in states
+        ]
+        chunksize = _auto_chunksize(
+            context.session,
+            context.bind_arguments,
+            len(mapper.base_mapper.primary_key),
+        )
+        for offset in range(0, len(primary_keys), chunksize):
+            context.session.execute(
+                q2,
+                dict(primary_keys=primary_keys[offset : offset + chunksize]),
+            ).unique().scalars().all()
 
     return do_load
 
 
+def _auto_chunksize(session, bind_arguments, num_key_columns):
+    """Return the number of primary key values to include in each
+    SELECT..WHERE IN for a "selectin" load, based on the maximum number
+    of bound parameters for the dialect in use."""
+
+    dialect = session.get_bind(**bind_arguments).dialect
+    return max(1, dialect.insertmanyvalues_max_parameters // num_key_columns)
+
+
 def _populate_full(
     context,
     row,
@@ -1234,6 +1468,38 @@ def _populate_full(
             # populator(state, dict_, row, new_path=False)
 
 
+def _generate_populate_quick(populators, row_indexes):
+    """Generate a function that populates the ``__dict__`` of a newly
+    loaded instance from a row, given the "quick" and "expire" populators
+    established for a mapper and load path.
+
+    The function is equivalent to running the "quick" and "expire" loops
+    of :func:`._populate_full` for a non-"populate existing" load, with
+    the loops unrolled and each column value retrieved by position from
+    the row's tuple of values, rather than by calling a getter.
+
+    """
+    env = {}
+    lines = ["def populate_quick(state, dict_, row):", "    data = row._data"]
+    for key, getter in populators["quick"]:
+        if getter in row_indexes:
+            lines.append(f"    dict_[{key!r}] = data[{row_indexes[getter]}]")
+        else:
+            name = f"getter_{len(env)}"
+            env[name] = getter
+            lines.append(f"    dict_[{key!r}] = {name}(row)")
+
+    expired = tuple(
+        key for key, set_callable in populators["expire"] if set_callable
+    )
+    if expired:
+        lines.append(f"    state.expired_attributes.update({expired!r})")
+
+    return util.langhelpers._exec_code_in_env(
+        "\n".join(lines) + "\n", env, "populate_quick"
+    )
+
+
 def _populate_partial(
     context, row, state, dict_, isnew, load_path, unloaded, populators
 ):
@@ -1396,7 +1662,15 @@ class PostLoad:
         # the invocation level
         self.states[state] = overwrite
 
-    def invoke(self, context, path):
+    def invoke(self, context, path, post_loaders=None):
+        """Invoke the loaders for this path.
+
+        Loaders which emit their statements by returning a generator, see
+        :func:`._run_post_loader`, are appended to the given
+        ``post_loaders`` list, if present, rather than being run
+        immediately.
+
+        """
         if not self.states:
             return
         path = path_registry.PathRegistry.coerce(path)
@@ -1414,9 +1688,15 @@ class PostLoad:
                 if state.manager.mapper.isa(limit_to_mapper)
             ]
             if states:
-                loader(
+                post_loader = loader(
                     effective_context, path, states, self.load_keys, *arg, **kw
                 )
+                if post_loader is None:
+                    continue
+                elif post_loaders is not None:
+                    post_loaders.append(post_loader)
+                else:
+                    _run_post_loader(context.session, post_loader)
         self.states.clear()
 
     @classmethod
@@ -1451,6 +1731,198 @@ class PostLoad:
         )
 
 
+def _run_post_loader(session, post_loader):
+    """Run a "post load" generator, executing each statement it yields
+    on the given :class:`.Session` and sending back the :class:`.Result`.
+
+    The generator yields tuples of ``(statement, params,
+    execution_options)``; structuring a loader this way allows
+    :func:`._run_post_loaders_concurrently` to execute the statements of
+    several loaders at once.
+
+    """
+    try:
+        statement, params, execution_options = next(post_loader)
+        while True:
+            statement, params, execution_options = post_loader.send(
+                session.execute(
+                    statement, params, execution_options=execution_options
+                )
+            )
+    except StopIteration:
+        pass
+
+
+class _PrefetchedResult:
+    """A :class:`.CursorResult` for a statement, fully fetched on a
+    connection other than that of the :class:`.Session`.
+
+    Passed to :meth:`.Session.execute` within the
+    ``_sa_orm_prefetched_result`` execution option, where it's used in
+    place of executing the statement if the statement is unchanged.
+
+    """
+
+    __slots__ = ("statement", "result")
+
+    def __init__(self, statement, result):
+        self.statement = statement
+        self.result = result
+
+
+def _concurrent_bind(session, statements):
+    """Return the :class:`_engine.Engine` on which the given statements
+    may be run concurrently using separate connections, or None if they
+    should run serially on the :class:`.Session`.
+
+    """
+    from ..engine import Engine
+    from ..pool import AssertionPool
+    from ..pool import SingletonThreadPool
+    from ..pool import StaticPool
+
+    # rows that were flushed or changed by DML statements in the current
+    # transaction would not be visible to other connections
+    if session._flushed_in_transaction:
+        return None
+
+    # do_orm_execute hooks may replace the statements or supply results of
+    # their own, so the statements are run only by the Session itself
+    if session.dispatch.do_orm_execute:
+        return None
+
+    binds = set()
+    for statement in statements:
+        plugin_subject = statement._propagate_attrs.get("plugin_subject")
+        binds.add(
+            session.get_bind(
+                mapper=plugin_subject.mapper if plugin_subject else None,
+                clause=statement,
+            )
+        )
+    if len(binds) != 1:
+        return None
+    (bind,) = binds
+
+    if not isinstance(bind, Engine) or isinstance(
+        bind.pool, (AssertionPool, SingletonThreadPool, StaticPool)
+    ):
+        # there's no means of acquiring additional connections that
+        # refer to the same database
+        return None
+    return bind
+
+
+def _prefetch_on_connection(bind, snapshot_id, request):
+    statement, params, execution_options = request
+    with bind.connect() as connection:
+        if snapshot_id is not None:
+            bind.dialect.do_import_snapshot(connection, snapshot_id)
+        result = connection.execute(
+            statement, params, execution_options=execution_options
+        )
+        return _PrefetchedResult(
+            statement,
+            result._with_buffered_rows(list(result._raw_row_iterator())),
+        )
+
+
+def _prefetch_concurrently(session, bind, requests):
+    """Execute the given statements at once, each on a new connection
+    from the given :class:`_engine.Engine`, returning a
+    :class:`._PrefetchedResult` for each.
+
+    """
+    if bind.dialect.supports_exported_snapshots:
+        # have each connection see the same data as the transaction of
+        # the Session
+        snapshot_id = bind.dialect.do_export_snapshot(
+            session.connection(bind_arguments={"bind": bind})
+        )
+    else:
+        snapshot_id = None
+
+    if bind.dialect.is_async:
+        import asyncio
+
+        return util.await_only(
+            asyncio.gather(
+                *[
+                    util.greenlet_spawn(
+                        _prefetch_on_connection, bind, snapshot_id, request
+                    )
+                    for request in requests
+                ]
+            )
+        )
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+            return list(
+                executor.map(
+                    lambda request: _prefetch_on_connection(
+                        bind, snapshot_id, request
+                    ),
+                    requests,
+                )
+            )
+
+
+def _run_post_loaders_concurrently(context, post_loaders):
+    """Run several "post load" generators, executing the statements that
+    are pending for all of them at the same time using separate
+    connections, when the ``concurrent_eager_loads`` execution option is
+    in use.
+
+    Only the execution of each statement and the fetching of its rows
+    take place concurrently; the rows are then processed into objects
+    by the :class:`.Session` in the usual way, one loader at a time.
+
+    """
+    session = context.session
+
+    pending = []
+    for post_loader in post_loaders:
+        try:
+            pending.append((post_loader, next(post_loader)))
+        except StopIteration:
+            pass
+
+    while pending:
+        bind = (
+            _concurrent_bind(
+                session, [statement for _, (statement, _, _) in pending]
+            )
+            if len(pending) > 1
+            else None
+        )
+        if bind is None:
+            prefetched = [None] * len(pending)
+        else:
+            prefetched = _prefetch_concurrently(
+                session, bind, [request for _, request in pending]
+            )
+
+        next_pending = []
+        for (post_loader, request), prefetched_result in zip(
+            pending, prefetched
+        ):
+            statement, params, execution_options = request
+            if prefetched_result is not None:
+                execution_options = util.immutabledict(
+                    execution_options
+                ).union({"_sa_orm_prefetched_result": prefetched_result})
+            result = session.execute(
+                statement, params, execution_options=execution_options
+            )
+            try:
+                next_pending.append((post_loader, post_loader.send(result)))
+            except StopIteration:
+                pass
+        pending = next_pending
+
+
 def load_scalar_attributes(mapper, state, attribute_names, passive):
     """initiate a column-based attribute refresh operation."""
 
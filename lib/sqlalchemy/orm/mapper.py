@@ -232,6 +232,7 @@ class Mapper(
         passive_deletes: bool = False,
         confirm_deleted_rows: bool = True,
         eager_defaults: bool = False,
+        pad_updates: bool = False,
         legacy_is_orphan: bool = False,
         _compiled_cache_size: int = 100,
     ):
@@ -417,6 +418,40 @@ class Mapper(
             :ref:`relationship_aliased_class` - the new pattern that removes
             the need for the :paramref:`_orm.Mapper.non_primary` flag.
 
+        :param pad_updates: if True, the UPDATE statements emitted by the
+          flush process for objects which have different sets of modified
+          attributes are combined into a single :term:`executemany`
+          statement, by also including the current, unchanged values of
+          those columns which were modified on some objects but not others.
+          By default, a separate UPDATE statement is emitted for each
+          distinct set of modified columns, so that a flush of many objects
+          with differing modifications may emit as many statements as there
+          are objects.
+
+          Rows which can't be combined in this way continue to be UPDATEd
+          individually; these include rows which have SQL expressions
+          assigned, rows whose primary key is changing, rows for which a
+          column to be padded is not loaded, as well as all rows when
+          versioning via :paramref:`_orm.Mapper.version_id_col` or
+          :paramref:`_orm.Mapper.eager_defaults` for server-generated UPDATE
+          defaults are in use.   Columns which have an
+          :paramref:`_schema.Column.onupdate` or
+          :paramref:`_schema.Column.server_onupdate` default are never
+          padded, as re-sending their current value would prevent the
+          default from taking effect.
+
+          .. note:: Re-sending the unchanged value of a column overwrites
+             any change that was made to that column by a concurrent
+             transaction since the object was loaded, in the same way as
+             for the modified columns themselves.   Applications which rely
+             upon concurrent transactions modifying different columns of the
+             same row should not use this option.
+
+          The setting is taken from the base mapper of an inheritance
+          hierarchy.
+
+          .. versionadded:: 2.0.0rc1
+
         :param passive_deletes: Indicates DELETE behavior of foreign key
            columns when a joined-table inheritance entity is being deleted.
            Defaults to ``False`` for a base mapper; for an inheriting mapper,
@@ -746,6 +781,7 @@ class Mapper(
         self._delete_orphans = []
         self.batch = batch
         self.eager_defaults = eager_defaults
+        self.pad_updates = pad_updates
         self.column_prefix = column_prefix
 
         # interim - polymorphic_on is further refined in
@@ -862,6 +898,30 @@ class Mapper(
     _all_tables: Set[Table]
     _polymorphic_attr_key: Optional[str]
 
+    _equivalent_columns: _EquivalentColumnMap
+    """A map of all equivalent columns, based on the determination of
+    column pairs that are equated to one another based on inherit
+    condition.  This is designed to work with the queries that
+    util.polymorphic_union comes up with, which often don't include the
+    columns from the base table directly (including the subclass table
+    columns only).
+
+    The structure is a dictionary of columns mapped to sets of equivalent
+    columns, e.g.::
+
+        {
+            tablea.col1:
+                {tableb.col1, tablec.col1},
+            tablea.col2:
+                {tabled.col2}
+        }
+
+    The dictionary is shared among all mappers in an inheritance hierarchy,
+    in the same way as :attr:`_orm.Mapper.polymorphic_map`, and is added to
+    as each inheriting mapper is constructed.
+
+    """
+
     _pks_by_table: Dict[FromClause, OrderedSet[ColumnClause[Any]]]
     _cols_by_table: Dict[FromClause, OrderedSet[ColumnElement[Any]]]
 
@@ -1274,6 +1334,8 @@ class Mapper(
                 self.inherits.passive_deletes or self.passive_deletes
             )
             self._all_tables = self.inherits._all_tables
+            self._equivalent_columns = self.inherits._equivalent_columns
+            self._add_equivalent_columns()
 
             if self.polymorphic_identity is not None:
                 if self.polymorphic_identity in self.polymorphic_map:
@@ -1307,6 +1369,7 @@ class Mapper(
 
         else:
             self._all_tables = set()
+            self._equivalent_columns = {}
             self.base_mapper = self
             assert self.local_table is not None
             self.persist_selectable = self.local_table
@@ -1384,8 +1447,13 @@ class Mapper(
             if mapper.polymorphic_on is not None:
                 mapper._requires_row_aliasing = True
         self.batch = self.inherits.batch
+        for col, equivs in self._equivalent_columns.items():
+            self.inherits._equivalent_columns.setdefault(col, set()).update(
+                equivs
+            )
         for mp in self.self_and_descendants:
             mp.base_mapper = self.inherits.base_mapper
+            mp._equivalent_columns = self.inherits._equivalent_columns
         self.inherits._inheriting_mappers.append(self)
         self.passive_updates = self.inherits.passive_updates
         self._all_tables = self.inherits._all_tables
@@ -2772,6 +2840,26 @@ class Mapper(
         else:
             return None
 
+    @HasMemoized.memoized_attribute
+    def _polymorphic_adapter_cache(
+        self,
+    ) -> Dict[
+        Tuple[Mapper[Any], FromClause], Dict[Any, sql_util.ColumnAdapter]
+    ]:
+        """polymorphic adapters set up by ORM compile state for entities
+        against mappers in this mapper's hierarchy, keyed on the mapper and
+        the selectable being adapted to.
+
+        These depend only on the mapper and selectable, not on the loader
+        options or other elements of the statement being compiled, so are
+        shared among compilations of statements which differ only in
+        those, rather than being constructed for each one along with the
+        column translations they memoize.   Kept on the base mapper, so that
+        a change to any mapper in the hierarchy expires them.
+
+        """
+        return {}
+
     def _iterate_polymorphic_properties(self, mappers=None):
         """Return an iterator of MapperProperty objects which will render into
         a SELECT."""
@@ -3038,28 +3126,14 @@ class Mapper(
             util.column_dict(params),
         )
 
-    @HasMemoized.memoized_attribute
-    def _equivalent_columns(self) -> _EquivalentColumnMap:
-        """Create a map of all equivalent columns, based on
-        the determination of column pairs that are equated to
-        one another based on inherit condition.  This is designed
-        to work with the queries that util.polymorphic_union
-        comes up with, which often don't include the columns from
-        the base table directly (including the subclass table columns
-        only).
-
-        The resulting structure is a dictionary of columns mapped
-        to lists of equivalent columns, e.g.::
-
-            {
-                tablea.col1:
-                    {tableb.col1, tablec.col1},
-                tablea.col2:
-                    {tabled.col2}
-            }
+    def _add_equivalent_columns(self) -> None:
+        """Add the column pairs equated to one another within this mapper's
+        inherit condition to :attr:`_orm.Mapper._equivalent_columns`."""
 
-        """
-        result: _EquivalentColumnMap = {}
+        if self.inherit_condition is None:
+            return
+
+        result = self._equivalent_columns
 
         def visit_binary(binary):
             if binary.operator == operators.eq:
@@ -3072,13 +3146,7 @@ class Mapper(
                 else:
                     result[binary.right] = {binary.left}
 
-        for mapper in self.base_mapper.self_and_descendants:
-            if mapper.inherit_condition is not None:
-                visitors.traverse(
-                    mapper.inherit_condition, {}, {"binary": visit_binary}
-                )
-
-        return result
+        visitors.traverse(self.inherit_condition, {}, {"binary": visit_binary})
 
     def _is_userland_descriptor(self, assigned_name: str, obj: Any) -> bool:
         if isinstance(
@@ -4013,6 +4081,7 @@ def _dispose_registries(registries: Set[_RegistryType], cascade: bool) -> None:
                 reg._dispose_manager_and_mapper(manager)
 
         reg._non_primary_mappers.clear()
+        reg._unconfigured_mappers.clear()
         reg._dependents.clear()
         for dep in reg._dependencies:
             dep._dependents.discard(reg)
@@ -32,6 +32,7 @@ from .. import exc
 from .. import util
 from ..sql import visitors
 from ..sql.cache_key import HasCacheKey
+from ..sql.cache_key import StaticMemoizedHasCacheKey
 
 if TYPE_CHECKING:
     from ._typing import _InternalEntityType
@@ -85,7 +86,7 @@ _WILDCARD_TOKEN: _LiteralStar = "*"
 _DEFAULT_TOKEN = "_sa_default"
 
 
-class PathRegistry(HasCacheKey):
+class PathRegistry(StaticMemoizedHasCacheKey):
     """Represent query load paths and registry functions.
 
     Basically represents structures like:
@@ -109,9 +110,13 @@ class PathRegistry(HasCacheKey):
     are the exception rather than the rule, are generated on an
     as-needed basis.
 
+    The cache key of a path which doesn't include any aliased entities is
+    memoized, so that loader options which are constructed once and used
+    in many statements don't regenerate it each time.
+
     """
 
-    __slots__ = ()
+    __slots__ = ("_memoized_static_cache_key",)
 
     is_token = False
     is_root = False
@@ -152,6 +157,9 @@ class PathRegistry(HasCacheKey):
     def _path_for_compare(self) -> Optional[_PathRepresentation]:
         return self.path
 
+    def _has_static_cache_key(self) -> bool:
+        return not any(elem.is_aliased_class for elem in self.path)
+
     def set(self, attributes: Dict[Any, Any], key: Any, value: Any) -> None:
         log.debug("set '%s' on path '%s' to '%s'", key, self, value)
         attributes[(key, self.natural_path)] = value
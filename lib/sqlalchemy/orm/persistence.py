@@ -21,6 +21,7 @@ from itertools import chain
 from itertools import groupby
 from itertools import zip_longest
 import operator
+import time
 
 from . import attributes
 from . import exc as orm_exc
@@ -54,6 +55,10 @@ def save_obj(base_mapper, states, uowtransaction, single=False):
             save_obj(base_mapper, [state], uowtransaction, single=True)
         return
 
+    stats = uowtransaction.stats
+    if stats is not None:
+        start = time.perf_counter()
+
     states_to_update = []
     states_to_insert = []
 
@@ -73,6 +78,9 @@ def save_obj(base_mapper, states, uowtransaction, single=False):
         else:
             states_to_insert.append((state, dict_, mapper, connection))
 
+    if stats is not None:
+        stats._add_time("organize", start, base_mapper)
+
     for table, mapper in base_mapper._sorted_tables.items():
         if table not in mapper._pks_by_table:
             continue
@@ -81,6 +89,8 @@ def save_obj(base_mapper, states, uowtransaction, single=False):
         update = _collect_update_commands(
             uowtransaction, table, states_to_update
         )
+        if base_mapper.pad_updates:
+            update = _pad_update_commands(mapper, table, update)
 
         _emit_update_statements(
             base_mapper,
@@ -98,6 +108,9 @@ def save_obj(base_mapper, states, uowtransaction, single=False):
             insert,
         )
 
+    if stats is not None:
+        start = time.perf_counter()
+
     _finalize_insert_update_commands(
         base_mapper,
         uowtransaction,
@@ -119,6 +132,9 @@ def save_obj(base_mapper, states, uowtransaction, single=False):
         ),
     )
 
+    if stats is not None:
+        stats._add_time("finalize", start, base_mapper)
+
 
 def post_update(base_mapper, states, uowtransaction, post_update_cols):
     """Issue UPDATE statements on behalf of a relationship() which
@@ -126,10 +142,17 @@ def post_update(base_mapper, states, uowtransaction, post_update_cols):
 
     """
 
+    stats = uowtransaction.stats
+    if stats is not None:
+        start = time.perf_counter()
+
     states_to_update = list(
         _organize_states_for_post_update(base_mapper, states, uowtransaction)
     )
 
+    if stats is not None:
+        stats._add_time("organize", start, base_mapper)
+
     for table, mapper in base_mapper._sorted_tables.items():
         if table not in mapper._pks_by_table:
             continue
@@ -171,10 +194,17 @@ def delete_obj(base_mapper, states, uowtransaction):
 
     """
 
+    stats = uowtransaction.stats
+    if stats is not None:
+        start = time.perf_counter()
+
     states_to_delete = list(
         _organize_states_for_delete(base_mapper, states, uowtransaction)
     )
 
+    if stats is not None:
+        stats._add_time("organize", start, base_mapper)
+
     table_to_mapper = base_mapper._sorted_tables
 
     for table in reversed(list(table_to_mapper.keys())):
@@ -196,6 +226,9 @@ def delete_obj(base_mapper, states, uowtransaction):
             delete,
         )
 
+    if stats is not None:
+        start = time.perf_counter()
+
     for (
         state,
         state_dict,
@@ -205,6 +238,9 @@ def delete_obj(base_mapper, states, uowtransaction):
     ) in states_to_delete:
         mapper.dispatch.after_delete(mapper, connection, state)
 
+    if stats is not None:
+        stats._add_time("finalize", start, base_mapper)
+
 
 def _organize_states_for_save(base_mapper, states, uowtransaction):
     """Make an initial pass across a set of states for INSERT or
@@ -609,6 +645,70 @@ def _collect_update_commands(
                 )
 
 
+def _pad_update_commands(mapper, table, update):
+    """Add the current values of columns that are modified on some rows
+    but not others to the parameters of UPDATE commands collected by
+    _collect_update_commands(), so that _emit_update_statements() can
+    batch them into fewer executemany statements.
+
+    Used when the ``pad_updates`` mapper option is set.
+
+    """
+
+    update = list(update)
+    if mapper.version_id_col is not None or len(update) < 2:
+        return update
+
+    pks = mapper._pks_by_table[table]
+    pk_labels = {col._label for col in pks}
+
+    # columns which can't be padded; a record which modifies any of them
+    # is left as is
+    no_pad_keys = {col.key for col in pks}.union(
+        col.key
+        for col in table.c
+        if col.onupdate is not None or col.server_onupdate is not None
+    )
+
+    eligible = []
+    padded_keys = set()
+    for rec in update:
+        params = rec[2]
+        value_params, has_all_defaults, has_all_pks = rec[5:8]
+        if value_params or not has_all_defaults or not has_all_pks:
+            continue
+        keys = params.keys() - pk_labels
+        if not no_pad_keys.isdisjoint(keys):
+            continue
+        eligible.append((rec, keys))
+        padded_keys.update(keys)
+
+    if len(eligible) < 2:
+        return update
+
+    for rec, keys in eligible:
+        missing = padded_keys.difference(keys)
+        if not missing:
+            continue
+
+        state_dict, params, rec_mapper = rec[1:4]
+        columntoproperty = rec_mapper._columntoproperty
+        values = {}
+        for key in missing:
+            col = table.c[key]
+            if col not in columntoproperty:
+                break
+            propkey = columntoproperty[col].key
+            if propkey not in state_dict:
+                # not loaded; leave this row to be updated separately
+                break
+            values[key] = state_dict[propkey]
+        else:
+            params.update(values)
+
+    return update
+
+
 def _collect_post_update_commands(
     base_mapper, uowtransaction, table, states_to_update, post_update_cols
 ):
@@ -821,7 +921,10 @@ def _emit_update_statements(
                 has_all_defaults,
                 has_all_pks,
             ) in records:
-                c = connection.execute(
+                c = _execute_statement(
+                    uowtransaction,
+                    base_mapper,
+                    connection,
                     statement.values(value_params),
                     params,
                     execution_options=execution_options,
@@ -854,8 +957,13 @@ def _emit_update_statements(
                     has_all_defaults,
                     has_all_pks,
                 ) in records:
-                    c = connection.execute(
-                        statement, params, execution_options=execution_options
+                    c = _execute_statement(
+                        uowtransaction,
+                        base_mapper,
+                        connection,
+                        statement,
+                        params,
+                        execution_options=execution_options,
                     )
 
                     # TODO: why with bookkeeping=False?
@@ -880,8 +988,13 @@ def _emit_update_statements(
                     assert_singlerow and len(multiparams) == 1
                 )
 
-                c = connection.execute(
-                    statement, multiparams, execution_options=execution_options
+                c = _execute_statement(
+                    uowtransaction,
+                    base_mapper,
+                    connection,
+                    statement,
+                    multiparams,
+                    execution_options=execution_options,
                 )
 
                 rows += c.rowcount
@@ -1008,8 +1121,13 @@ def _emit_insert_statements(
             records = list(records)
             multiparams = [rec[2] for rec in records]
 
-            result = connection.execute(
-                statement, multiparams, execution_options=execution_options
+            result = _execute_statement(
+                uowtransaction,
+                base_mapper,
+                connection,
+                statement,
+                multiparams,
+                execution_options=execution_options,
             )
             if bookkeeping:
                 for (
@@ -1080,8 +1198,13 @@ def _emit_insert_statements(
             if do_executemany:
                 multiparams = [rec[2] for rec in records]
 
-                result = connection.execute(
-                    statement, multiparams, execution_options=execution_options
+                result = _execute_statement(
+                    uowtransaction,
+                    base_mapper,
+                    connection,
+                    statement,
+                    multiparams,
+                    execution_options=execution_options,
                 )
 
                 if use_orm_insert_stmt is not None:
@@ -1164,13 +1287,19 @@ def _emit_insert_statements(
                     has_all_defaults,
                 ) in records:
                     if value_params:
-                        result = connection.execute(
+                        result = _execute_statement(
+                            uowtransaction,
+                            base_mapper,
+                            connection,
                             statement.values(value_params),
                             params,
                             execution_options=execution_options,
                         )
                     else:
-                        result = connection.execute(
+                        result = _execute_statement(
+                            uowtransaction,
+                            base_mapper,
+                            connection,
                             statement,
                             params,
                             execution_options=execution_options,
@@ -1288,8 +1417,13 @@ def _emit_post_update_statements(
             check_rowcount = assert_singlerow
             for state, state_dict, mapper_rec, connection, params in records:
 
-                c = connection.execute(
-                    statement, params, execution_options=execution_options
+                c = _execute_statement(
+                    uowtransaction,
+                    base_mapper,
+                    connection,
+                    statement,
+                    params,
+                    execution_options=execution_options,
                 )
 
                 _postfetch_post_update(
@@ -1312,8 +1446,13 @@ def _emit_post_update_statements(
                 assert_singlerow and len(multiparams) == 1
             )
 
-            c = connection.execute(
-                statement, multiparams, execution_options=execution_options
+            c = _execute_statement(
+                uowtransaction,
+                base_mapper,
+                connection,
+                statement,
+                multiparams,
+                execution_options=execution_options,
             )
 
             rows += c.rowcount
@@ -1392,8 +1531,13 @@ def _emit_delete_statements(
                 # rows can be verified
                 for params in del_objects:
 
-                    c = connection.execute(
-                        statement, params, execution_options=execution_options
+                    c = _execute_statement(
+                        uowtransaction,
+                        base_mapper,
+                        connection,
+                        statement,
+                        params,
+                        execution_options=execution_options,
                     )
                     rows_matched += c.rowcount
             else:
@@ -1402,12 +1546,22 @@ def _emit_delete_statements(
                     "- versioning cannot be verified."
                     % connection.dialect.dialect_description
                 )
-                connection.execute(
-                    statement, del_objects, execution_options=execution_options
+                _execute_statement(
+                    uowtransaction,
+                    base_mapper,
+                    connection,
+                    statement,
+                    del_objects,
+                    execution_options=execution_options,
                 )
         else:
-            c = connection.execute(
-                statement, del_objects, execution_options=execution_options
+            c = _execute_statement(
+                uowtransaction,
+                base_mapper,
+                connection,
+                statement,
+                del_objects,
+                execution_options=execution_options,
             )
 
             if not need_version_id:
@@ -1524,6 +1678,10 @@ def _postfetch_post_update(
     if uowtransaction.is_deleted(state):
         return
 
+    stats = uowtransaction.stats
+    if stats is not None:
+        start = time.perf_counter()
+
     prefetch_cols = result.context.compiled.prefetch
     postfetch_cols = result.context.compiled.postfetch
 
@@ -1558,6 +1716,9 @@ def _postfetch_post_update(
             ],
         )
 
+    if stats is not None:
+        stats._add_time("postfetch", start, _mapper_for_table(mapper, table))
+
 
 def _postfetch(
     mapper,
@@ -1575,6 +1736,10 @@ def _postfetch(
     after an INSERT or UPDATE statement has proceeded for that
     state."""
 
+    stats = uowtransaction.stats
+    if stats is not None:
+        start = time.perf_counter()
+
     prefetch_cols = result.context.compiled.prefetch
     postfetch_cols = result.context.compiled.postfetch
     returning_cols = result.context.compiled.effective_returning
@@ -1655,6 +1820,33 @@ def _postfetch(
             mapper.passive_updates,
         )
 
+    if stats is not None:
+        stats._add_time("postfetch", start, _mapper_for_table(mapper, table))
+
+
+def _execute_statement(
+    uowtransaction, base_mapper, connection, statement, params, **kw
+):
+    """Execute a statement on behalf of _emit_*_statements(), recording
+    it for the after_flush_stats event if collected."""
+
+    if uowtransaction is None or uowtransaction.stats is None:
+        return connection.execute(statement, params, **kw)
+
+    start = time.perf_counter()
+    result = connection.execute(statement, params, **kw)
+    uowtransaction.stats._record_statement(
+        _mapper_for_table(base_mapper, statement.table), result, params, start
+    )
+    return result
+
+
+def _mapper_for_table(mapper, table):
+    """Return the mapper within the given mapper's hierarchy that
+    maps the given table, for the after_flush_stats event."""
+
+    return mapper.base_mapper._sorted_tables.get(table, mapper)
+
 
 def _postfetch_bulk_save(mapper, dict_, table):
     for m, equated_pairs in mapper._table_to_equated[table]:
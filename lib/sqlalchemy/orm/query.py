@@ -47,6 +47,7 @@ from ._typing import _O
 from .base import _assertions
 from .context import _column_descriptions
 from .context import _determine_last_joined_entity
+from .context import _keyset_bookmark
 from .context import _legacy_filter_by_entity_zero
 from .context import FromStatement
 from .context import ORMCompileState
@@ -80,6 +81,7 @@ from ..sql.base import _generative
 from ..sql.base import _NoArg
 from ..sql.base import Executable
 from ..sql.base import Generative
+from ..sql.elements import _KeysetCriteria
 from ..sql.elements import BooleanClauseList
 from ..sql.expression import Exists
 from ..sql.selectable import _MemoizedSelectEntities
@@ -1669,8 +1671,11 @@ class Query(
         max_row_buffer: int = ...,
         yield_per: int = ...,
         insertmanyvalues_page_size: int = ...,
+        insertmanyvalues_target_batch_time: float = ...,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
         populate_existing: bool = False,
+        readonly_entities: bool = False,
+        concurrent_eager_loads: bool = False,
         autoflush: bool = False,
         **opt: Any,
     ) -> SelfQuery:
@@ -1691,6 +1696,13 @@ class Query(
         ``populate_existing=True`` - equivalent to using
         :meth:`_orm.Query.populate_existing`
 
+        ``readonly_entities=True`` - load objects that are not added to the
+        :class:`_orm.Session`; see :ref:`orm_queryguide_readonly_entities`
+
+        ``concurrent_eager_loads=True`` - run the statements of sibling
+        "selectin" eager loaders at the same time on separate connections;
+        see :ref:`orm_queryguide_concurrent_eager_loads`
+
         ``autoflush=True|False`` - equivalent to using
         :meth:`_orm.Query.autoflush`
 
@@ -1863,6 +1875,66 @@ class Query(
             self._where_criteria += (crit,)
         return self
 
+    @_generative
+    @_assertions(_no_statement_condition)
+    def keyset_after(
+        self: SelfQuery, bookmark: Optional[Sequence[Any]]
+    ) -> SelfQuery:
+        """Apply criteria to a copy of this :class:`_query.Query` which
+        selects only those rows that follow the given bookmark, based on
+        the ORDER BY of the query.
+
+        e.g.::
+
+            q = session.query(User).order_by(User.name, User.id).limit(100)
+
+            bookmark = None
+            while True:
+                users = q.keyset_after(bookmark).all()
+                if not users:
+                    break
+                # ... work with users
+                bookmark = q.keyset_bookmark(users[-1])
+
+        Unlike :meth:`_query.Query.filter`, this method may be called after
+        :meth:`_query.Query.limit`, as the criteria are by definition
+        applied ahead of the LIMIT.
+
+        .. versionadded:: 2.0.0rc1
+
+        .. seealso::
+
+            :meth:`_sql.Select.keyset_after` - v2 equivalent method, which
+            includes a complete description of the criteria generated.
+
+            :meth:`_query.Query.keyset_bookmark`
+
+        """
+        if bookmark is not None:
+            self._where_criteria += (
+                _KeysetCriteria._construct(self._order_by_clauses, bookmark),
+            )
+        return self
+
+    def keyset_bookmark(self, row: Any) -> Tuple[Any, ...]:
+        """Return a bookmark for the given row, suitable for passing to
+        :meth:`_query.Query.keyset_after` in order to select the rows that
+        follow it.
+
+        The row is typically the last :class:`_engine.Row` or ORM object
+        returned by a page of results from this :class:`_query.Query`.
+        Each ORDER BY expression of the query must either be selected as a
+        column, or be a column attribute of a selected entity.
+
+        .. versionadded:: 2.0.0rc1
+
+        .. seealso::
+
+            :meth:`_sql.Select.keyset_bookmark` - v2 equivalent method.
+
+        """
+        return _keyset_bookmark(self, row, legacy=True)
+
     @util.memoized_property
     def _last_joined_entity(
         self,
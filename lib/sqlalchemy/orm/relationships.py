@@ -62,6 +62,7 @@ from .interfaces import RelationshipDirection
 from .interfaces import StrategizedProperty
 from .util import _orm_annotate
 from .util import _orm_deannotate
+from .util import _validate_chunk_size
 from .util import CascadeOptions
 from .. import exc as sa_exc
 from .. import Exists
@@ -145,6 +146,7 @@ _LazyLoadArgumentType = Literal[
     "joined",
     "selectin",
     "subquery",
+    "batch",
     "raise",
     "raise_on_sql",
     "noload",
@@ -387,6 +389,8 @@ class RelationshipProperty(
         info: Optional[_InfoType] = None,
         omit_join: Literal[None, False] = None,
         sync_backref: Optional[bool] = None,
+        selectin_chunk_size: Optional[Union[int, Literal["auto"]]] = None,
+        collection_tracking: Literal["snapshot", "changes"] = "snapshot",
         doc: Optional[str] = None,
         bake_queries: Literal[True] = True,
         cascade_backrefs: Literal[False] = False,
@@ -443,6 +447,17 @@ class RelationshipProperty(
         self._legacy_inactive_history_style = _legacy_inactive_history_style
 
         self.join_depth = join_depth
+
+        _validate_chunk_size(selectin_chunk_size, "selectin_chunk_size")
+        self.selectin_chunk_size = selectin_chunk_size
+
+        if collection_tracking not in ("snapshot", "changes"):
+            raise sa_exc.ArgumentError(
+                "collection_tracking must be one of 'snapshot' or "
+                "'changes'; got %r" % (collection_tracking,)
+            )
+        self.collection_tracking = collection_tracking
+
         if omit_join:
             util.warn(
                 "setting omit_join to True is not supported; selectin "
@@ -1615,10 +1630,12 @@ class RelationshipProperty(
 
     def do_init(self) -> None:
         self._check_conflicts()
-        self._process_dependent_arguments()
-        self._setup_entity()
+        configured_state = self._restore_configured_state()
+        if configured_state is None:
+            self._process_dependent_arguments()
+            self._setup_entity()
         self._setup_registry_dependencies()
-        self._setup_join_conditions()
+        self._setup_join_conditions(configured_state)
         self._check_cascade_settings(self._cascade)
         self._post_init()
         self._generate_backref()
@@ -1628,6 +1645,71 @@ class RelationshipProperty(
             "LazyLoader", self._get_strategy((("lazy", "select"),))
         )
 
+    def _restore_configured_state(self) -> Optional[Tuple[Any, ...]]:
+        """Restore the result of a previous configuration of this
+        relationship, if one is present in the configured state cache of
+        the parent registry.
+
+        Returns the state to be passed to :class:`.JoinCondition` in place
+        of join condition analysis, or None if there's no state to restore,
+        in which case nothing has been changed.
+
+        """
+        cache = self.parent.registry._configured_state_cache
+        if cache is None or self.parent.non_primary:
+            return None
+
+        state = cache.get((self.parent, self.key))
+        if state is None:
+            return None
+
+        (
+            entity,
+            secondary,
+            order_by,
+            foreign_keys,
+            remote_side,
+            join_state,
+        ) = state
+
+        # the target class is resolved as it would be normally; the state
+        # applies only if it was produced against the same target
+        self._setup_entity()
+        if self.entity is not entity:
+            return None
+
+        self._init_args.secondary.resolved = secondary
+        self.order_by = order_by
+        self._user_defined_foreign_keys = foreign_keys
+        self.remote_side = remote_side
+        return join_state
+
+    def _get_configured_state(self) -> Optional[Tuple[Any, ...]]:
+        """Return the result of the configuration of this relationship in a
+        form that may be passed to :meth:`._restore_configured_state` by a
+        later configuration of the same mappings, such as within another
+        process.
+
+        """
+        if self.parent.non_primary or not self.entity.is_mapper:
+            return None
+        jc = self._join_condition
+        return (
+            self.entity,
+            self._init_args.secondary.resolved,
+            self.order_by,
+            self._user_defined_foreign_keys,
+            jc._remote_side,
+            (
+                jc.primaryjoin,
+                jc.secondaryjoin,
+                jc.direction,
+                jc.local_remote_pairs,
+                jc.synchronize_pairs,
+                jc.secondary_synchronize_pairs,
+            ),
+        )
+
     def _setup_registry_dependencies(self) -> None:
         self.parent.mapper.registry._set_depends_on(
             self.entity.mapper.registry
@@ -1852,7 +1934,9 @@ class RelationshipProperty(
         self.entity = entity  # type: ignore
         self.target = self.entity.persist_selectable
 
-    def _setup_join_conditions(self) -> None:
+    def _setup_join_conditions(
+        self, configured_state: Optional[Tuple[Any, ...]] = None
+    ) -> None:
         self._join_condition = jc = JoinCondition(
             parent_persist_selectable=self.parent.persist_selectable,
             child_persist_selectable=self.entity.persist_selectable,
@@ -1870,6 +1954,7 @@ class RelationshipProperty(
             prop=self,
             support_sync=not self.viewonly,
             can_be_synced_fn=self._columns_are_mapped,
+            configured_state=configured_state,
         )
         self.primaryjoin = jc.primaryjoin
         self.secondaryjoin = jc.secondaryjoin
@@ -2259,6 +2344,7 @@ class JoinCondition:
         prop: RelationshipProperty[Any],
         support_sync: bool = True,
         can_be_synced_fn: Callable[..., bool] = lambda *c: True,
+        configured_state: Optional[Tuple[Any, ...]] = None,
     ):
 
         self.parent_persist_selectable = parent_persist_selectable
@@ -2278,20 +2364,32 @@ class JoinCondition:
         self.support_sync = support_sync
         self.can_be_synced_fn = can_be_synced_fn
 
-        self._determine_joins()
-        assert self.primaryjoin is not None
-
-        self._sanitize_joins()
-        self._annotate_fks()
-        self._annotate_remote()
-        self._annotate_local()
-        self._annotate_parentmapper()
-        self._setup_pairs()
-        self._check_foreign_cols(self.primaryjoin, True)
-        if self.secondaryjoin is not None:
-            self._check_foreign_cols(self.secondaryjoin, False)
-        self._determine_direction()
-        self._check_remote_side()
+        if configured_state is not None:
+            # annotated joins, direction and column pairs as determined
+            # by a previous configuration of the same mappings
+            (
+                self.primaryjoin,
+                self.secondaryjoin,
+                self.direction,
+                self.local_remote_pairs,
+                self.synchronize_pairs,
+                self.secondary_synchronize_pairs,
+            ) = configured_state
+        else:
+            self._determine_joins()
+            assert self.primaryjoin is not None
+
+            self._sanitize_joins()
+            self._annotate_fks()
+            self._annotate_remote()
+            self._annotate_local()
+            self._annotate_parentmapper()
+            self._setup_pairs()
+            self._check_foreign_cols(self.primaryjoin, True)
+            if self.secondaryjoin is not None:
+                self._check_foreign_cols(self.secondaryjoin, False)
+            self._determine_direction()
+            self._check_remote_side()
         self._log_joins()
 
     def _log_joins(self) -> None:
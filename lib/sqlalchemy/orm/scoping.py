@@ -109,6 +109,7 @@ __all__ = ["scoped_session"]
         "expunge_all",
         "flush",
         "get",
+        "get_by",
         "get_bind",
         "is_modified",
         "bulk_save_objects",
@@ -990,6 +991,44 @@ class scoped_session(Generic[_S]):
             execution_options=execution_options,
         )
 
+    def get_by(
+        self, entity: _EntityBindKey[_O], **kwargs: Any
+    ) -> Optional[_O]:
+        r"""Return an instance based on the given attribute values, or
+        ``None`` if not found.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_orm.Session` class on
+            behalf of the :class:`_orm.scoping.scoped_session` class.
+
+        E.g.::
+
+            some_user = session.get_by(User, email="ed@example.com")
+
+        If one of the given attributes is indexed for the given class, as
+        configured using :paramref:`_orm.Session.identity_map_indexes`, and
+        an object with matching values is present in the identity map, the
+        object is returned directly and no SQL is emitted.   Otherwise, a
+        SELECT is performed using the given values as criteria, in the
+        same way as ``select(entity).filter_by(**kwargs)``, which is
+        expected to match at most one row.
+
+        .. versionadded:: 2.0.0rc1
+
+        :param entity: a mapped class or :class:`.Mapper` indicating the
+         type of entity to be loaded.
+
+        :param \**kwargs: attribute names and values which the object
+         should have.
+
+        :return: The object instance, or ``None``.
+
+
+        """  # noqa: E501
+
+        return self._proxied.get_by(entity, **kwargs)
+
     def get_bind(
         self,
         mapper: Optional[_EntityBindKey[_O]] = None,
@@ -0,0 +1,371 @@
+# orm/second_level_cache.py
+# Copyright (C) 2005-2022 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: https://www.opensource.org/licenses/mit-license.php
+
+"""A cache of the column values of ORM objects, shared among
+:class:`.Session` objects.
+
+"""
+
+from __future__ import annotations
+
+import copy
+import datetime
+import decimal
+import time
+from typing import Any
+from typing import Dict
+from typing import Mapping
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+import uuid
+
+from .. import exc as sa_exc
+from .. import inspection
+from .. import util
+from ..sql.schema import Column
+from ..util.typing import Protocol
+
+if TYPE_CHECKING:
+    from ._typing import _IdentityKeyType
+    from .mapper import Mapper
+    from .state import InstanceState
+
+
+class _CacheRegionType(Protocol):
+    def get(self, key: str, expiration_time: Optional[float] = None) -> Any:
+        ...
+
+    def set(self, key: str, value: Any) -> None:
+        ...
+
+    def delete(self, key: str) -> None:
+        ...
+
+
+_CacheEntry = Tuple[Any, Dict[str, Any]]
+
+# types of values that are immutable, and may be shared among the cache
+# and any number of objects; values of other types, such as those of JSON,
+# ARRAY or PickleType columns, may be mutated in place and are copied
+_immutable_types = frozenset(
+    [
+        type(None),
+        bool,
+        int,
+        float,
+        str,
+        bytes,
+        decimal.Decimal,
+        datetime.datetime,
+        datetime.date,
+        datetime.time,
+        datetime.timedelta,
+        uuid.UUID,
+    ]
+)
+
+
+def _copy_mutable_values(values: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return a copy of the given dictionary of column values, where
+    values that may be mutated in place are copied as well, so that they
+    aren't shared between the cache and the objects of a
+    :class:`.Session`."""
+    return {
+        key: value if type(value) in _immutable_types else copy.deepcopy(value)
+        for key, value in values.items()
+    }
+
+
+class CacheRegion:
+    """An in-process storage area for a :class:`.SecondLevelCache`.
+
+    Entries are held in a least-recently-used dictionary of limited size.
+
+    Any object which provides the same :meth:`.CacheRegion.get`,
+    :meth:`.CacheRegion.set` and :meth:`.CacheRegion.delete` methods may be
+    used as a region in place of this one, such as a region from the
+    `dogpile.cache <https://dogpilecache.sqlalchemy.org>`_ library, which
+    allows entries to be stored in an external service such as memcached or
+    Redis.
+
+    .. versionadded:: 2.0.0rc1
+
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        """Construct a new :class:`.CacheRegion`.
+
+        :param maxsize: the number of entries beyond which the least
+         recently used entries are discarded.
+
+        """
+        self._data: util.LRUCache[str, Tuple[Any, float]] = util.LRUCache(
+            maxsize
+        )
+
+    def get(self, key: str, expiration_time: Optional[float] = None) -> Any:
+        """Return the value for the given key, or None if not present.
+
+        :param expiration_time: if present, a number of seconds after
+         which a stored value is treated as not present.
+
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, created = entry
+        if (
+            expiration_time is not None
+            and time.monotonic() - created > expiration_time
+        ):
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value for the given key."""
+        self._data[key] = (value, time.monotonic())
+
+    def delete(self, key: str) -> None:
+        """Remove the value for the given key, if present."""
+        self._data.pop(key, None)
+
+
+class _MapperCacheConfig(NamedTuple):
+    region: _CacheRegionType
+    expiration_time: Optional[float]
+    keys: Tuple[str, ...]
+
+
+class SecondLevelCache:
+    """A cache of the column values of ORM objects, keyed on
+    :term:`identity key`, which is shared among :class:`.Session` objects.
+
+    A :class:`.SecondLevelCache` is passed to the :class:`.Session` using
+    the :paramref:`.Session.second_level_cache` parameter; each mapped class
+    to be cached is then set up using :meth:`.SecondLevelCache.configure`::
+
+        from sqlalchemy.orm import CacheRegion
+        from sqlalchemy.orm import SecondLevelCache
+        from sqlalchemy.orm import sessionmaker
+
+        cache = SecondLevelCache(regions={"reference": CacheRegion()})
+        cache.configure(Country, region="reference", expiration_time=3600)
+        cache.configure(Currency, region="reference")
+
+        Session = sessionmaker(engine, second_level_cache=cache)
+
+    .. versionadded:: 2.0.0rc1
+
+    .. seealso::
+
+        :ref:`session_second_level_cache`
+
+    """
+
+    regions: Dict[str, _CacheRegionType]
+    """Dictionary of cache regions, keyed on name.
+
+    Includes a region named ``"default"``, which is a :class:`.CacheRegion`
+    unless one is passed explicitly.
+
+    """
+
+    def __init__(
+        self, regions: Optional[Mapping[str, _CacheRegionType]] = None
+    ):
+        """Construct a new :class:`.SecondLevelCache`.
+
+        :param regions: optional dictionary of region names to regions,
+         which may be :class:`.CacheRegion` objects or other objects that
+         provide the same methods.
+
+        """
+        self.regions = {"default": CacheRegion()}
+        if regions:
+            self.regions.update(regions)
+        self._configs: Dict[Mapper[Any], _MapperCacheConfig] = {}
+        self._resolved_configs: Dict[
+            Mapper[Any], Optional[_MapperCacheConfig]
+        ] = {}
+
+    def configure(
+        self,
+        entity: Any,
+        *,
+        region: str = "default",
+        expiration_time: Optional[float] = None,
+    ) -> None:
+        """Cache objects of the given mapped class, including those of its
+        subclasses.
+
+        :param entity: a mapped class or :class:`_orm.Mapper`.
+
+        :param region: name of the region in :attr:`.SecondLevelCache.regions`
+         in which to store entries.
+
+        :param expiration_time: optional number of seconds after which an
+         entry is no longer used.
+
+        """
+        mapper = inspection.inspect(entity)
+        if region not in self.regions:
+            raise sa_exc.ArgumentError(
+                f"No cache region named {region!r}; "
+                f"available regions are {sorted(self.regions)}"
+            )
+        self._configs[mapper] = _MapperCacheConfig(
+            self.regions[region], expiration_time, ()
+        )
+        self._resolved_configs.clear()
+
+    def generate_key(
+        self,
+        mapper: Mapper[Any],
+        primary_key_identity: Tuple[Any, ...],
+        identity_token: Any,
+    ) -> str:
+        """Return the string key under which the object of the given
+        identity is stored.
+
+        May be overridden by subclasses.
+
+        """
+        cls = mapper._identity_class
+        key = "%s.%s:%r" % (
+            cls.__module__,
+            cls.__qualname__,
+            primary_key_identity,
+        )
+        if identity_token is not None:
+            key += ":%s" % (identity_token,)
+        return key
+
+    def invalidate(
+        self,
+        entity: Any,
+        primary_key_identity: Any,
+        identity_token: Any = None,
+    ) -> None:
+        """Remove the object of the given mapped class and primary key from
+        the cache.
+
+        This may be used when rows have been changed by means other than
+        the flush process of a :class:`.Session` that uses this cache.
+
+        """
+        mapper = inspection.inspect(entity)
+        config = self._config_for(mapper)
+        if config is not None:
+            config.region.delete(
+                self._key(
+                    config,
+                    mapper,
+                    tuple(util.to_list(primary_key_identity)),
+                    identity_token,
+                )
+            )
+
+    def _config_for(self, mapper: Mapper[Any]) -> Optional[_MapperCacheConfig]:
+        try:
+            return self._resolved_configs[mapper]
+        except KeyError:
+            pass
+
+        for m in mapper.iterate_to_root():
+            if m in self._configs:
+                config = self._configs[m]
+                # cache only the attributes that are mapped to table
+                # columns; other column expressions are loaded as needed
+                config = config._replace(
+                    keys=tuple(
+                        prop.key
+                        for prop in mapper.column_attrs
+                        if isinstance(prop.columns[0], Column)
+                    )
+                )
+                break
+        else:
+            config = None
+        self._resolved_configs[mapper] = config
+        return config
+
+    def _generation_key(self, mapper: Mapper[Any]) -> str:
+        cls = mapper._identity_class
+        return "%s.%s:generation" % (cls.__module__, cls.__qualname__)
+
+    def _key(
+        self,
+        config: _MapperCacheConfig,
+        mapper: Mapper[Any],
+        primary_key_identity: Tuple[Any, ...],
+        identity_token: Any,
+    ) -> str:
+        key = self.generate_key(mapper, primary_key_identity, identity_token)
+
+        # entries stored before the class as a whole was last invalidated
+        # are no longer reachable once the generation changes
+        generation = config.region.get(self._generation_key(mapper))
+        if generation:
+            key += ":%s" % (generation,)
+        return key
+
+    def _get(
+        self,
+        config: _MapperCacheConfig,
+        mapper: Mapper[Any],
+        primary_key_identity: Tuple[Any, ...],
+        identity_token: Any,
+    ) -> Optional[_CacheEntry]:
+        entry = config.region.get(
+            self._key(config, mapper, primary_key_identity, identity_token),
+            expiration_time=config.expiration_time,
+        )
+        # regions may return a "no value" token which is false
+        # rather than None
+        return entry or None
+
+    def _set_from_state(
+        self, state: InstanceState[Any], dict_: Dict[str, Any]
+    ) -> None:
+        mapper = state.mapper
+        config = self._config_for(mapper)
+        if config is None:
+            return
+        key = state.key
+        assert key is not None
+        config.region.set(
+            self._key(config, mapper, key[1], key[2]),
+            (
+                mapper.polymorphic_identity
+                if mapper.polymorphic_on is not None
+                else None,
+                _copy_mutable_values(
+                    {k: dict_[k] for k in config.keys if k in dict_}
+                ),
+            ),
+        )
+
+    def _invalidate_key(
+        self,
+        mapper: Mapper[Any],
+        identity_key: Optional[_IdentityKeyType[Any]],
+    ) -> None:
+        """Remove the entry for the given identity key, or all entries
+        for the mapper's class hierarchy if the key is None."""
+
+        config = self._config_for(mapper)
+        if config is None:
+            return
+        elif identity_key is None:
+            config.region.set(self._generation_key(mapper), uuid.uuid4().hex)
+        else:
+            config.region.delete(
+                self._key(config, mapper, identity_key[1], identity_key[2])
+            )
@@ -66,6 +66,7 @@ from .state_changes import _StateChangeState
 from .state_changes import _StateChangeStates
 from .unitofwork import UOWTransaction
 from .. import engine
+from .. import event
 from .. import exc as sa_exc
 from .. import sql
 from .. import util
@@ -99,6 +100,7 @@ if typing.TYPE_CHECKING:
     from .mapper import Mapper
     from .path_registry import PathRegistry
     from .query import RowReturningQuery
+    from .second_level_cache import SecondLevelCache
     from ..engine import Result
     from ..engine import Row
     from ..engine import RowMapping
@@ -178,6 +180,39 @@ class _ConnectionCallableProto(Protocol):
         ...
 
 
+def _identity_map_index_keys(
+    identity_map_indexes: Dict[_EntityBindKey[Any], Sequence[str]]
+) -> Dict[Mapper[Any], Tuple[str, ...]]:
+    index_keys = {}
+    for entity, keys in identity_map_indexes.items():
+        mapper = _class_to_mapper(entity)
+        if isinstance(keys, str):
+            keys = (keys,)
+        for key in keys:
+            if key not in mapper.class_manager:
+                raise sa_exc.ArgumentError(
+                    "Can't index attribute %r of %s in the identity map; "
+                    "no such mapped attribute" % (key, mapper)
+                )
+            mapper._memo(
+                ("identity_map_index", key),
+                util.partial(_listen_for_index, mapper, key),
+            )
+        index_keys[mapper] = tuple(keys)
+    return index_keys
+
+
+def _listen_for_index(mapper: Mapper[Any], key: str) -> bool:
+    event.listen(
+        mapper.class_manager[key],
+        "set",
+        identity._index_on_set,
+        raw=True,
+        propagate=True,
+    )
+    return True
+
+
 def _state_session(state: InstanceState[Any]) -> Optional[Session]:
     """Given an :class:`.InstanceState`, return the :class:`.Session`
     associated, if any.
@@ -1188,6 +1223,15 @@ class SessionTransaction(_StateChange, TransactionalContext):
                 if should_commit:
                     trans.commit()
 
+            if self._parent is None and self.session.second_level_cache:
+                for (
+                    mapper,
+                    key,
+                ) in self.session._second_level_cache_invalidations:
+                    self.session.second_level_cache._invalidate_key(
+                        mapper, key
+                    )
+
             self._state = SessionTransactionState.COMMITTED
             self.session.dispatch.after_commit(self.session)
 
@@ -1282,6 +1326,8 @@ class SessionTransaction(_StateChange, TransactionalContext):
         self.session._transaction = self._parent
 
         if self._parent is None:
+            self.session._second_level_cache_invalidations.clear()
+            self.session._flushed_in_transaction = False
             for connection, transaction, should_commit, autoclose in set(
                 self._connections.values()
             ):
@@ -1356,6 +1402,13 @@ class Session(_SessionClassMethods, EventTarget):
     autoflush: bool
     expire_on_commit: bool
     enable_baked_queries: bool
+    second_level_cache: Optional[SecondLevelCache]
+    _second_level_cache_invalidations: Set[
+        Tuple[Mapper[Any], Optional[_IdentityKeyType[Any]]]
+    ]
+    _flushed_in_transaction: bool
+    identity_map_limit: Optional[int]
+    _identity_map_index_keys: Optional[Dict[Mapper[Any], Tuple[str, ...]]]
     twophase: bool
     _query_cls: Type[Query[Any]]
 
@@ -1371,6 +1424,11 @@ class Session(_SessionClassMethods, EventTarget):
         enable_baked_queries: bool = True,
         info: Optional[_InfoType] = None,
         query_cls: Optional[Type[Query[Any]]] = None,
+        second_level_cache: Optional[SecondLevelCache] = None,
+        identity_map_limit: Optional[int] = None,
+        identity_map_indexes: Optional[
+            Dict[_EntityBindKey[Any], Sequence[str]]
+        ] = None,
         autocommit: Literal[False] = False,
     ):
         r"""Construct a new Session.
@@ -1489,6 +1547,53 @@ class Session(_SessionClassMethods, EventTarget):
           objects, as returned by the :meth:`~.Session.query` method.
           Defaults to :class:`_query.Query`.
 
+        :param second_level_cache: optional :class:`.SecondLevelCache`
+          which is consulted by :meth:`_orm.Session.get` as well as by
+          many-to-one lazy loads before a SELECT is emitted, and which
+          is populated with the column values of objects loaded from the
+          database.  Entries are invalidated when the corresponding rows are
+          updated or deleted by a flush, as well as again when the
+          transaction is committed.
+
+          .. versionadded:: 2.0.0rc1
+
+          .. seealso::
+
+            :ref:`session_second_level_cache`
+
+        :param identity_map_limit: optional number of objects beyond which
+          :meth:`_orm.Session.add` should autoflush, counting both persistent
+          objects in the identity map and pending objects.   When
+          :meth:`_orm.Session.add` takes the number of objects beyond this
+          limit and :paramref:`_orm.Session.autoflush` is enabled, pending
+          changes are flushed, which releases the strong references the
+          :class:`.Session` maintains to pending and modified objects.
+          Objects which aren't otherwise referenced are then released by the
+          weak referencing identity map as usual.
+
+          No objects are expunged; objects referenced by the application,
+          including those of a result that's being iterated, remain in the
+          :class:`.Session`, so the number of objects may still exceed the
+          limit.   The parameter is therefore useful for a long-running
+          process, such as a batch job that adds or modifies a very large
+          number of objects within a single transaction without holding
+          onto them, to keep memory use bounded without the need to call
+          :meth:`_orm.Session.flush` explicitly.
+
+          .. versionadded:: 2.0.0rc1
+
+        :param identity_map_indexes: optional dictionary mapping mapped
+          classes to sequences of attribute names, such as a natural key or
+          an external identifier, on which objects of that class present in
+          the identity map should be indexed.   The index is consulted by
+          :meth:`_orm.Session.get_by`, which returns an object matching the
+          given attribute values without emitting SQL if one is present.
+          Indexed attributes are expected to be unique in the database.
+          The index is kept current as indexed attributes are
+          changed on objects in the identity map.
+
+          .. versionadded:: 2.0.0rc1
+
         :param twophase:  When ``True``, all transactions will be started as
             a "two phase" transaction, i.e. using the "two phase" semantics
             of the database in use along with an XID.  During a
@@ -1511,7 +1616,14 @@ class Session(_SessionClassMethods, EventTarget):
             raise sa_exc.ArgumentError(
                 "autocommit=True is no longer supported"
             )
-        self.identity_map = identity.WeakInstanceDict()
+
+        if identity_map_indexes:
+            self._identity_map_index_keys = _identity_map_index_keys(
+                identity_map_indexes
+            )
+        else:
+            self._identity_map_index_keys = None
+        self.identity_map = self._new_identity_map()
 
         if not future:
             raise sa_exc.ArgumentError(
@@ -1532,6 +1644,14 @@ class Session(_SessionClassMethods, EventTarget):
         self.autoflush = autoflush
         self.expire_on_commit = expire_on_commit
         self.enable_baked_queries = enable_baked_queries
+        self.second_level_cache = second_level_cache
+        self._second_level_cache_invalidations = set()
+
+        # set when rows are flushed or DML statements are executed;
+        # reset when the outermost transaction ends
+        self._flushed_in_transaction = False
+
+        self.identity_map_limit = identity_map_limit
 
         self.twophase = twophase
         self._query_cls = query_cls if query_cls else query.Query
@@ -1965,6 +2085,11 @@ class Session(_SessionClassMethods, EventTarget):
 
         conn = self._connection_for_bind(bind)
 
+        if statement.is_dml:
+            # as with a flush, the rows changed aren't visible to other
+            # connections nor to be placed in the second level cache
+            self._flushed_in_transaction = True
+
         if _scalar_result and not compile_state_cls:
             if TYPE_CHECKING:
                 params = cast(_CoreSingleExecuteParams, params)
@@ -1985,6 +2110,10 @@ class Session(_SessionClassMethods, EventTarget):
             result = conn.execute(
                 statement, params or {}, execution_options=execution_options
             )
+            if statement._is_text_clause and not result.returns_rows:
+                # a textual statement that's not a SELECT may have
+                # changed rows as well
+                self._flushed_in_transaction = True
 
         if _scalar_result:
             return result.scalar()
@@ -2281,12 +2410,20 @@ class Session(_SessionClassMethods, EventTarget):
 
         all_states = self.identity_map.all_states() + list(self._new)
         self.identity_map._kill()
-        self.identity_map = identity.WeakInstanceDict()
+        self.identity_map = self._new_identity_map()
         self._new = {}
         self._deleted = {}
 
         statelib.InstanceState._detach_states(all_states, self)
 
+    def _new_identity_map(self) -> IdentityMap:
+        if self._identity_map_index_keys:
+            return identity.IndexedWeakInstanceDict(
+                self._identity_map_index_keys
+            )
+        else:
+            return identity.WeakInstanceDict()
+
     def _add_bind(self, key: _SessionBindKey, bind: _SessionBind) -> None:
         try:
             insp = inspect(key)
@@ -2987,6 +3124,28 @@ class Session(_SessionClassMethods, EventTarget):
             states, self, to_transient=to_transient
         )
 
+    def _enforce_identity_map_limit(self) -> None:
+        """Autoflush if the number of objects in the session is beyond
+        :paramref:`_orm.Session.identity_map_limit`.
+
+        """
+        limit = self.identity_map_limit
+        assert limit is not None
+
+        if (
+            not self.autoflush
+            or self._flushing
+            or len(self.identity_map) + len(self._new) <= limit
+        ):
+            return
+
+        # flushing releases the strong references which the session
+        # holds to pending and modified objects; objects that aren't
+        # referenced elsewhere are then released by the weak referencing
+        # identity map
+        if self._new or self._deleted or self.identity_map._modified:
+            self.flush()
+
     def _register_persistent(self, states: Set[InstanceState[Any]]) -> None:
         """Register all persistent objects from a flush.
 
@@ -3038,6 +3197,8 @@ class Session(_SessionClassMethods, EventTarget):
                         orig_key,
                         instance_key,
                     )
+                    if self.second_level_cache is not None:
+                        self._invalidate_second_level_cache(mapper, state.key)
                     state.key = instance_key
 
                 # there can be an existing state in the identity map
@@ -3073,11 +3234,43 @@ class Session(_SessionClassMethods, EventTarget):
 
     def _register_altered(self, states: Iterable[InstanceState[Any]]) -> None:
         if self._transaction:
+            self._flushed_in_transaction = True
             for state in states:
                 if state in self._new:
                     self._transaction._new[state] = True
                 else:
                     self._transaction._dirty[state] = True
+                    if self.second_level_cache is not None:
+                        self._invalidate_second_level_cache(
+                            state.mapper, state.key
+                        )
+
+    def _invalidate_second_level_cache(
+        self, mapper: Mapper[Any], key: Optional[_IdentityKeyType[Any]]
+    ) -> None:
+        """Remove the given identity from the second level cache.
+
+        The key is removed again once the transaction is committed, as
+        another :class:`.Session` may have placed the previous version of
+        the row in the cache in the meantime.
+
+        """
+        assert self.second_level_cache is not None
+        if key is not None:
+            self.second_level_cache._invalidate_key(mapper, key)
+            self._second_level_cache_invalidations.add((mapper, key))
+
+    def _invalidate_second_level_cache_mapper(
+        self, mapper: Mapper[Any]
+    ) -> None:
+        """Remove all objects of the given mapper's class hierarchy from
+        the second level cache, such as when an UPDATE or DELETE statement
+        has affected rows whose primary keys aren't known.
+
+        """
+        assert self.second_level_cache is not None
+        self.second_level_cache._invalidate_key(mapper, None)
+        self._second_level_cache_invalidations.add((mapper, None))
 
     def _remove_newly_deleted(
         self, states: Iterable[InstanceState[Any]]
@@ -3086,6 +3279,10 @@ class Session(_SessionClassMethods, EventTarget):
         for state in states:
             if self._transaction:
                 self._transaction._deleted[state] = True
+                self._flushed_in_transaction = True
+
+            if self.second_level_cache is not None:
+                self._invalidate_second_level_cache(state.mapper, state.key)
 
             if persistent_to_deleted is not None:
                 # get a strong reference before we pop out of
@@ -3136,6 +3333,9 @@ class Session(_SessionClassMethods, EventTarget):
 
         self._save_or_update_state(state)
 
+        if self.identity_map_limit is not None:
+            self._enforce_identity_map_limit()
+
     def add_all(self, instances: Iterable[object]) -> None:
         """Add the given collection of instances to this :class:`_orm.Session`.
 
@@ -3354,6 +3554,74 @@ class Session(_SessionClassMethods, EventTarget):
             execution_options=execution_options,
         )
 
+    def get_by(
+        self, entity: _EntityBindKey[_O], **kwargs: Any
+    ) -> Optional[_O]:
+        r"""Return an instance based on the given attribute values, or
+        ``None`` if not found.
+
+        E.g.::
+
+            some_user = session.get_by(User, email="ed@example.com")
+
+        If one of the given attributes is indexed for the given class, as
+        configured using :paramref:`_orm.Session.identity_map_indexes`, and
+        an object with matching values is present in the identity map, the
+        object is returned directly and no SQL is emitted.   Otherwise, a
+        SELECT is performed using the given values as criteria, in the
+        same way as ``select(entity).filter_by(**kwargs)``, which is
+        expected to match at most one row.
+
+        .. versionadded:: 2.0.0rc1
+
+        :param entity: a mapped class or :class:`.Mapper` indicating the
+         type of entity to be loaded.
+
+        :param \**kwargs: attribute names and values which the object
+         should have.
+
+        :return: The object instance, or ``None``.
+
+        """
+        mapper: Optional[Mapper[_O]] = inspect(entity)
+
+        if mapper is None or not mapper.is_mapper:
+            raise sa_exc.ArgumentError(
+                "Expected mapped class or mapper, got: %r" % entity
+            )
+        if not kwargs:
+            raise sa_exc.ArgumentError(
+                "Session.get_by() requires at least one attribute value"
+            )
+
+        identity_map = self.identity_map
+        if isinstance(identity_map, identity.IndexedWeakInstanceDict):
+            for key, value in kwargs.items():
+                state = identity_map._get_state_by_index(mapper, key, value)
+                if state is None:
+                    continue
+                dict_ = state.dict
+                instance = state.obj()
+                if instance is not None and all(
+                    k in dict_ and dict_[k] == v for k, v in kwargs.items()
+                ):
+                    return instance
+                break
+
+        statement = sql.select(mapper).filter_by(**kwargs)
+        instance = self.execute(statement).scalars().one_or_none()
+
+        if instance is not None and isinstance(
+            identity_map, identity.IndexedWeakInstanceDict
+        ):
+            # the object may have been present with its indexed attributes
+            # expired or deferred, so index it again with its loaded values
+            state = attributes.instance_state(instance)
+            if identity_map.contains_state(state):
+                identity_map._unindexed[state] = None
+
+        return instance
+
     def _get_impl(
         self,
         entity: _EntityBindKey[_O],
@@ -4084,6 +4352,11 @@ class Session(_SessionClassMethods, EventTarget):
 
             self.dispatch.after_flush_postexec(self, flush_context)
 
+            stats = flush_context.stats
+            if stats is not None:
+                stats._finish()
+                self.dispatch.after_flush_stats(self, flush_context, stats)
+
             transaction.commit()
 
         except:
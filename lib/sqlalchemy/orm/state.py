@@ -1139,3 +1139,26 @@ class PendingCollection:
             self.added_items.remove(value)
         else:
             self.deleted_items.add(value)
+
+
+class CollectionChanges(PendingCollection):
+    """Records the items appended to and removed from a loaded collection.
+
+    Stored in :attr:`.InstanceState.committed_state` in place of a copy of
+    the committed collection for collection attributes configured with
+    ``collection_tracking="changes"``, so that the history of the
+    collection may be produced from the changes alone.
+
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "added_items": list(self.added_items),
+            "deleted_items": list(self.deleted_items),
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.added_items = util.OrderedIdentitySet(state["added_items"])
+        self.deleted_items = util.IdentitySet(state["deleted_items"])
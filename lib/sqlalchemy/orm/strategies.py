@@ -18,6 +18,7 @@ from typing import Any
 from typing import Dict
 from typing import Tuple
 from typing import TYPE_CHECKING
+import weakref
 
 from . import attributes
 from . import exc as orm_exc
@@ -79,6 +80,13 @@ def _register_attribute(
 
     uselist = useobject and prop.uselist
 
+    if (
+        uselist
+        and impl_class is None
+        and prop.collection_tracking == "changes"
+    ):
+        kw["track_changes"] = True
+
     if useobject and prop.single_parent:
         listen_hooks.append(single_parent_validator)
 
@@ -1779,6 +1787,8 @@ class SubqueryLoader(PostLoader):
 
             if self.load_options._populate_existing:
                 q = q.populate_existing()
+            if self.load_options._readonly_entities:
+                q = q.execution_options(readonly_entities=True)
             # to work with baked query, the parameters may have been
             # updated since this query was created, so take these into account
 
@@ -3009,6 +3019,101 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
         if load_only and self.key not in load_only:
             return
 
+        # a test which exercises what these comments talk about is
+        # test_selectin_relations.py -> test_twolevel_selectin_w_polymorphic
+        #
+        # effective_entity above is given to us in terms of the cached
+        # statement, namely this one:
+        orig_query = context.compile_state.select_statement
+
+        # the actual statement that was requested is this one:
+        #  context_query = context.query
+        #
+        # that's not the cached one, however.  So while it is of the identical
+        # structure, if it has entities like AliasedInsp, which we get from
+        # aliased() or with_polymorphic(), the AliasedInsp will likely be a
+        # different object identity each time, and will not match up
+        # hashing-wise to the corresponding AliasedInsp that's in the
+        # cached query, meaning it won't match on paths and loader lookups
+        # and loaders like this one will be skipped if it is used in options.
+        #
+        # as it turns out, standard loader options like selectinload(),
+        # lazyload() that have a path need
+        # to come from the cached query so that the AliasedInsp etc. objects
+        # that are in the query line up with the object that's in the path
+        # of the strategy object. however other options like
+        # with_loader_criteria() that doesn't have a path (has a fixed entity)
+        # and needs to have access to the latest closure state in order to
+        # be correct, we need to use the uncached one.
+        #
+        # as of #8399 we let the loader option itself figure out what it
+        # wants to do given cached and uncached version of itself.
+
+        effective_path = path[self.parent_property]
+
+        if orig_query is context.query:
+            new_options = orig_query._with_options
+        else:
+            cached_options = orig_query._with_options
+            uncached_options = context.query._with_options
+
+            # propagate compile state options from the original query,
+            # updating their "extra_criteria" as necessary.
+            # note this will create a different cache key than
+            # "orig" options if extra_criteria is present, because the copy
+            # of extra_criteria will have different boundparam than that of
+            # the QueryableAttribute in the path
+            new_options = [
+                orig_opt._adapt_cached_option_to_uncached_option(
+                    context, uncached_opt
+                )
+                for orig_opt, uncached_opt in zip(
+                    cached_options, uncached_options
+                )
+            ]
+
+        if loadopt and loadopt._extra_criteria:
+            new_options += (
+                orm_util.LoaderCriteriaOption(
+                    effective_entity,
+                    loadopt._generate_extra_criteria(context),
+                ),
+            )
+
+        if recursion_depth is not None:
+            effective_path = effective_path._truncate_recursive()
+
+        return self._load_for_states(
+            context.session,
+            context.bind_arguments,
+            states,
+            effective_entity,
+            effective_path,
+            new_options,
+            loadopt,
+            context.populate_existing,
+            execution_options,
+        )
+
+    def _load_for_states(
+        self,
+        session,
+        bind_arguments,
+        states,
+        effective_entity,
+        effective_path,
+        options,
+        loadopt,
+        populate_existing,
+        execution_options,
+    ):
+        """Return a generator which loads this relationship for the
+        given ``(state, overwrite)`` tuples.
+
+        The statements are run by loading.PostLoad, see
+        loading._run_post_loader().
+
+        """
         query_info = self._query_info
 
         if query_info.load_only_child:
@@ -3102,74 +3207,10 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
 
         q = q.filter(in_expr.in_(sql.bindparam("primary_keys")))
 
-        # a test which exercises what these comments talk about is
-        # test_selectin_relations.py -> test_twolevel_selectin_w_polymorphic
-        #
-        # effective_entity above is given to us in terms of the cached
-        # statement, namely this one:
-        orig_query = context.compile_state.select_statement
-
-        # the actual statement that was requested is this one:
-        #  context_query = context.query
-        #
-        # that's not the cached one, however.  So while it is of the identical
-        # structure, if it has entities like AliasedInsp, which we get from
-        # aliased() or with_polymorphic(), the AliasedInsp will likely be a
-        # different object identity each time, and will not match up
-        # hashing-wise to the corresponding AliasedInsp that's in the
-        # cached query, meaning it won't match on paths and loader lookups
-        # and loaders like this one will be skipped if it is used in options.
-        #
-        # as it turns out, standard loader options like selectinload(),
-        # lazyload() that have a path need
-        # to come from the cached query so that the AliasedInsp etc. objects
-        # that are in the query line up with the object that's in the path
-        # of the strategy object. however other options like
-        # with_loader_criteria() that doesn't have a path (has a fixed entity)
-        # and needs to have access to the latest closure state in order to
-        # be correct, we need to use the uncached one.
-        #
-        # as of #8399 we let the loader option itself figure out what it
-        # wants to do given cached and uncached version of itself.
-
-        effective_path = path[self.parent_property]
-
-        if orig_query is context.query:
-            new_options = orig_query._with_options
-        else:
-            cached_options = orig_query._with_options
-            uncached_options = context.query._with_options
-
-            # propagate compile state options from the original query,
-            # updating their "extra_criteria" as necessary.
-            # note this will create a different cache key than
-            # "orig" options if extra_criteria is present, because the copy
-            # of extra_criteria will have different boundparam than that of
-            # the QueryableAttribute in the path
-            new_options = [
-                orig_opt._adapt_cached_option_to_uncached_option(
-                    context, uncached_opt
-                )
-                for orig_opt, uncached_opt in zip(
-                    cached_options, uncached_options
-                )
-            ]
-
-        if loadopt and loadopt._extra_criteria:
-            new_options += (
-                orm_util.LoaderCriteriaOption(
-                    effective_entity,
-                    loadopt._generate_extra_criteria(context),
-                ),
-            )
-
-        if recursion_depth is not None:
-            effective_path = effective_path._truncate_recursive()
-
-        q = q.options(*new_options)
+        q = q.options(*options)
 
         q = q._update_compile_options({"_current_path": effective_path})
-        if context.populate_existing:
+        if populate_existing:
             q = q.execution_options(populate_existing=True)
 
         if self.parent_property.order_by:
@@ -3192,19 +3233,41 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                     _setup_outermost_orderby, self.parent_property
                 )
 
+        chunksize = self._chunksize_for_load(
+            session, bind_arguments, loadopt, pk_cols
+        )
+
         if query_info.load_only_child:
-            self._load_via_child(
+            return self._load_via_child(
                 our_states,
                 none_states,
                 query_info,
                 q,
-                context,
                 execution_options,
+                chunksize,
             )
         else:
-            self._load_via_parent(
-                our_states, query_info, q, context, execution_options
+            return self._load_via_parent(
+                our_states,
+                query_info,
+                q,
+                execution_options,
+                chunksize,
+            )
+
+    def _chunksize_for_load(self, session, bind_arguments, loadopt, pk_cols):
+        chunksize = self.parent_property.selectin_chunk_size
+        if loadopt:
+            chunksize = loadopt.local_opts.get("chunk_size") or chunksize
+
+        if chunksize is None:
+            return self._chunksize
+        elif chunksize == "auto":
+            return loading._auto_chunksize(
+                session, bind_arguments, len(pk_cols)
             )
+        else:
+            return chunksize
 
     def _load_via_child(
         self,
@@ -3212,29 +3275,26 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
         none_states,
         query_info,
         q,
-        context,
         execution_options,
+        chunksize,
     ):
         uselist = self.uselist
 
         # this sort is really for the benefit of the unit tests
         our_keys = sorted(our_states)
         while our_keys:
-            chunk = our_keys[0 : self._chunksize]
-            our_keys = our_keys[self._chunksize :]
-            data = {
-                k: v
-                for k, v in context.session.execute(
-                    q,
-                    params={
-                        "primary_keys": [
-                            key[0] if query_info.zero_idx else key
-                            for key in chunk
-                        ]
-                    },
-                    execution_options=execution_options,
-                ).unique()
-            }
+            chunk = our_keys[0:chunksize]
+            our_keys = our_keys[chunksize:]
+            result = yield (
+                q,
+                {
+                    "primary_keys": [
+                        key[0] if query_info.zero_idx else key for key in chunk
+                    ]
+                },
+                execution_options,
+            )
+            data = {k: v for k, v in result.unique()}
 
             for key in chunk:
                 # for a real foreign key and no concurrent changes to the
@@ -3262,29 +3322,28 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
             state.get_impl(self.key).set_committed_value(state, dict_, None)
 
     def _load_via_parent(
-        self, our_states, query_info, q, context, execution_options
+        self, our_states, query_info, q, execution_options, chunksize
     ):
         uselist = self.uselist
         _empty_result = () if uselist else None
 
         while our_states:
-            chunk = our_states[0 : self._chunksize]
-            our_states = our_states[self._chunksize :]
+            chunk = our_states[0:chunksize]
+            our_states = our_states[chunksize:]
 
             primary_keys = [
                 key[0] if query_info.zero_idx else key
                 for key, state, state_dict, overwrite in chunk
             ]
 
+            result = yield (
+                q,
+                {"primary_keys": primary_keys},
+                execution_options,
+            )
+
             data = collections.defaultdict(list)
-            for k, v in itertools.groupby(
-                context.session.execute(
-                    q,
-                    params={"primary_keys": primary_keys},
-                    execution_options=execution_options,
-                ).unique(),
-                lambda x: x[0],
-            ):
+            for k, v in itertools.groupby(result.unique(), lambda x: x[0]):
                 data[k].extend(vv[1] for vv in v)
 
             for key, state, state_dict, overwrite in chunk:
@@ -3312,6 +3371,165 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                     )
 
 
+@log.class_logger
+@relationships.RelationshipProperty.strategy_for(lazy="batch")
+class BatchLoader(PostLoader):
+    """Provide loading behavior for a :class:`.Relationship`
+    with "lazy='batch'", that is loads when first accessed, for all the
+    objects that were loaded in the same result at once.
+
+    The related objects are loaded using the same SELECT..IN statements
+    as those of :class:`.SelectInLoader`.
+
+    """
+
+    __slots__ = ()
+
+    def init_class_attribute(self, mapper):
+        self.parent_property._get_strategy(
+            (("lazy", "select"),)
+        ).init_class_attribute(mapper)
+
+    def create_row_processor(
+        self,
+        context,
+        query_entity,
+        path,
+        loadopt,
+        mapper,
+        result,
+        adapter,
+        populators,
+    ):
+        if not self.parent.class_manager[self.key].impl.supports_population:
+            raise sa_exc.InvalidRequestError(
+                "'%s' does not support object "
+                "population - batch loading cannot be applied." % self
+            )
+
+        key = self.key
+
+        # one loader callable is shared by all the objects loaded from
+        # this result, and keeps track of them
+        batch = LoadBatchAttribute(
+            key,
+            self,
+            loadopt,
+            loadopt._generate_extra_criteria(context)
+            if loadopt and loadopt._extra_criteria
+            else None,
+        )
+        batch_states = batch.states
+        set_lazy_callable = InstanceState._instance_level_callable_processor(
+            mapper.class_manager, batch, key
+        )
+
+        def set_batch_callable(state, dict_, row):
+            batch_states[state] = True
+            set_lazy_callable(state, dict_, row)
+
+        populators["new"].append((key, set_batch_callable))
+
+    def _load_for_state(self, state, passive, batch):
+        lazyloader = self.parent_property._get_strategy((("lazy", "select"),))
+        key = self.key
+        session = _state_session(state)
+
+        if (
+            session is not None
+            and state.key is not None
+            and passive & PASSIVE_OFF == PASSIVE_OFF
+        ):
+            states = [(state, False)]
+            for sibling in batch.states.keys():
+                if (
+                    sibling is not state
+                    and sibling.session_id == state.session_id
+                    and sibling.key is not None
+                    and sibling.callables.get(key) is batch
+                    and sibling.obj() is not None
+                ):
+                    states.append((sibling, False))
+            batch.states.clear()
+        else:
+            states = None
+
+        if not states or len(states) == 1:
+            # nothing to batch; load as "lazy='select'" would, which
+            # takes care of the identity map as well as non-persistent
+            # and passive cases
+            return lazyloader._load_for_state(
+                state,
+                passive,
+                loadopt=batch.loadopt,
+                extra_criteria=batch.extra_criteria,
+            )
+
+        if state.load_options:
+            effective_path = state.load_path[self.parent_property]
+            options = state.load_options
+        else:
+            effective_path = state.mapper._path_registry[self.parent_property]
+            options = ()
+
+        if batch.extra_criteria:
+            options += (
+                orm_util.LoaderCriteriaOption(
+                    self.entity, batch.extra_criteria
+                ),
+            )
+
+        if passive & attributes.NO_AUTOFLUSH:
+            execution_options = util.immutabledict({"autoflush": False})
+        else:
+            execution_options = util.EMPTY_DICT
+
+        selectin_loader = self.parent_property._get_strategy(
+            (("lazy", "selectin"),)
+        )
+        loading._run_post_loader(
+            session,
+            selectin_loader._load_for_states(
+                session,
+                {"mapper": self.parent},
+                states,
+                self.entity,
+                effective_path,
+                options,
+                batch.loadopt,
+                False,
+                execution_options,
+            ),
+        )
+        return LoaderCallableStatus.ATTR_WAS_SET
+
+
+class LoadBatchAttribute(LoadLazyAttribute):
+    """Loader callable used by :class:`.BatchLoader`, which is shared
+    among all the objects loaded from one result.
+
+    When serialized, the object no longer refers to the other objects in
+    the result, and loads in the same way as :class:`.LazyLoader`.
+
+    """
+
+    def __init__(self, key, initiating_strategy, loadopt, extra_criteria):
+        super().__init__(key, initiating_strategy, loadopt, extra_criteria)
+        self.states = weakref.WeakKeyDictionary()
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.states = weakref.WeakKeyDictionary()
+
+    def __call__(self, state, passive=attributes.PASSIVE_OFF):
+        key = self.key
+        instance_mapper = state.manager.mapper
+        prop = instance_mapper._props[key]
+        strategy = prop._get_strategy(self.strategy_key)
+
+        return strategy._load_for_state(state, passive, self)
+
+
 def single_parent_validator(desc, prop):
     def _do_check(state, value, oldvalue, initiator):
         if value is not None and initiator.key == prop.key:
@@ -369,6 +369,7 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
         self: Self_AbstractLoad,
         attr: _AttrType,
         recursion_depth: Optional[int] = None,
+        chunk_size: Optional[Union[int, Literal["auto"]]] = None,
     ) -> Self_AbstractLoad:
         """Indicate that the given attribute should be loaded using
         SELECT IN eager loading.
@@ -406,6 +407,16 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
          .. versionadded:: 2.0 added
             :paramref:`_orm.selectinload.recursion_depth`
 
+        :param chunk_size: optional; the number of parent primary key values
+         to include in the IN clause of each SELECT.  May be a positive
+         integer, or the string ``"auto"``, which sizes each SELECT from the
+         maximum number of bound parameters supported by the dialect in use
+         and the number of key columns.  Overrides the
+         :paramref:`_orm.relationship.selectin_chunk_size` setting of the
+         relationship; when neither is given, defaults to 500.
+
+         .. versionadded:: 2.0.0rc1
+
 
         .. seealso::
 
@@ -414,10 +425,14 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
             :ref:`selectin_eager_loading`
 
         """
+        orm_util._validate_chunk_size(chunk_size, "chunk_size")
         return self._set_relationship_strategy(
             attr,
             {"lazy": "selectin"},
-            opts={"recursion_depth": recursion_depth},
+            opts={
+                "recursion_depth": recursion_depth,
+                "chunk_size": chunk_size,
+            },
         )
 
     def lazyload(
@@ -438,6 +453,40 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
         """
         return self._set_relationship_strategy(attr, {"lazy": "select"})
 
+    def batchload(
+        self: Self_AbstractLoad,
+        attr: _AttrType,
+        chunk_size: Optional[Union[int, Literal["auto"]]] = None,
+    ) -> Self_AbstractLoad:
+        """Indicate that the given attribute should be loaded using "batch"
+        loading.
+
+        Like "lazy" loading, the attribute is loaded when first accessed;
+        however the attribute is loaded at that point for all of the objects
+        which were loaded by the same result, using the same SELECT IN
+        statement as that of :func:`_orm.selectinload`.
+
+        This function is part of the :class:`_orm.Load` interface and supports
+        both method-chained and standalone operation.
+
+        :param chunk_size: optional; the number of parent primary key values
+         to include in the IN clause of each SELECT, in the same way as
+         :paramref:`_orm.selectinload.chunk_size`.
+
+        .. versionadded:: 2.0.0rc1
+
+        .. seealso::
+
+            :ref:`loading_toplevel`
+
+            :ref:`batch_loading`
+
+        """
+        orm_util._validate_chunk_size(chunk_size, "chunk_size")
+        return self._set_relationship_strategy(
+            attr, {"lazy": "batch"}, opts={"chunk_size": chunk_size}
+        )
+
     def immediateload(
         self: Self_AbstractLoad,
         attr: _AttrType,
@@ -1007,7 +1056,7 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
 SelfLoad = TypeVar("SelfLoad", bound="Load")
 
 
-class Load(_AbstractLoad):
+class Load(cache_key.StaticMemoizedHasCacheKey, _AbstractLoad):
     """Represents loader options which modify the state of a
     ORM-enabled :class:`_sql.Select` or a legacy :class:`_query.Query` in
     order to affect how various mapped attributes are loaded.
@@ -1027,6 +1076,7 @@ class Load(_AbstractLoad):
     __slots__ = (
         "path",
         "context",
+        "_memoized_static_cache_key",
     )
 
     _traverse_internals = [
@@ -1053,6 +1103,11 @@ class Load(_AbstractLoad):
     def __str__(self) -> str:
         return f"Load({self.path[0]})"
 
+    def _has_static_cache_key(self) -> bool:
+        return self.path._get_static_cache_key() is not None and all(
+            elem._get_static_cache_key() is not None for elem in self.context
+        )
+
     @classmethod
     def _construct_for_existing_path(cls, path: PathRegistry) -> Load:
         load = cls.__new__(cls)
@@ -1519,7 +1574,9 @@ class _WildcardLoad(_AbstractLoad):
 
 
 class _LoadElement(
-    cache_key.HasCacheKey, traversals.HasShallowCopy, visitors.Traversible
+    cache_key.StaticMemoizedHasCacheKey,
+    traversals.HasShallowCopy,
+    visitors.Traversible,
 ):
     """represents strategy information to select for a LoaderStrategy
     and pass options to it.
@@ -1539,6 +1596,7 @@ class _LoadElement(
         "local_opts",
         "_extra_criteria",
         "_reconcile_to_other",
+        "_memoized_static_cache_key",
     )
     __visit_name__ = "load_element"
 
@@ -1577,6 +1635,16 @@ class _LoadElement(
     def is_opts_only(self) -> bool:
         return bool(self.local_opts and self.strategy is None)
 
+    def _has_static_cache_key(self) -> bool:
+        return (
+            not self._extra_criteria
+            and self.path._get_static_cache_key() is not None
+            and not any(
+                isinstance(value, cache_key.HasCacheKey)
+                for value in self.local_opts.values()
+            )
+        )
+
     def _clone(self, **kw: Any) -> _LoadElement:
         cls = self.__class__
         s = cls.__new__(cls)
@@ -1878,6 +1946,17 @@ class _AttributeStrategyLoad(_LoadElement):
     is_class_strategy = False
     is_token_strategy = False
 
+    def _has_static_cache_key(self) -> bool:
+        return (
+            super()._has_static_cache_key()
+            and (self._of_type is None or not self._of_type.is_aliased_class)
+            and (
+                self._path_with_polymorphic_path is None
+                or self._path_with_polymorphic_path._get_static_cache_key()
+                is not None
+            )
+        )
+
     def _init_path(self, path, attr, wildcard_key, attr_group, raiseerr):
         assert attr is not None
         self._of_type = None
@@ -2411,10 +2490,15 @@ def subqueryload(*keys: _AttrType) -> _AbstractLoad:
 
 @loader_unbound_fn
 def selectinload(
-    *keys: _AttrType, recursion_depth: Optional[int] = None
+    *keys: _AttrType,
+    recursion_depth: Optional[int] = None,
+    chunk_size: Optional[Union[int, Literal["auto"]]] = None,
 ) -> _AbstractLoad:
     return _generate_from_keys(
-        Load.selectinload, keys, False, {"recursion_depth": recursion_depth}
+        Load.selectinload,
+        keys,
+        False,
+        {"recursion_depth": recursion_depth, "chunk_size": chunk_size},
     )
 
 
@@ -2423,6 +2507,16 @@ def lazyload(*keys: _AttrType) -> _AbstractLoad:
     return _generate_from_keys(Load.lazyload, keys, False, {})
 
 
+@loader_unbound_fn
+def batchload(
+    *keys: _AttrType,
+    chunk_size: Optional[Union[int, Literal["auto"]]] = None,
+) -> _AbstractLoad:
+    return _generate_from_keys(
+        Load.batchload, keys, False, {"chunk_size": chunk_size}
+    )
+
+
 @loader_unbound_fn
 def immediateload(
     *keys: _AttrType, recursion_depth: Optional[int] = None
@@ -17,6 +17,7 @@ organizes them in order of dependency, and executes.
 
 from __future__ import annotations
 
+import time
 from typing import Any
 from typing import Dict
 from typing import Optional
@@ -28,6 +29,7 @@ from . import exc as orm_exc
 from . import util as orm_util
 from .. import event
 from .. import util
+from ..engine.interfaces import ExecuteStyle
 from ..util import topological
 
 
@@ -155,6 +157,167 @@ def track_cascade_events(descriptor, prop):
     )
 
 
+class MapperFlushStats:
+    """Timings and counts for one mapper within a flush.
+
+    Part of the :class:`.FlushStats` collection passed to the
+    :meth:`.SessionEvents.after_flush_stats` event.
+
+    .. versionadded:: 2.0.0rc1
+
+    """
+
+    __slots__ = ("phases", "rows", "statements")
+
+    phases: Dict[str, float]
+    """Dictionary of phase names to the number of seconds spent in that
+    phase for this mapper hierarchy.
+
+    Phases include ``"organize"``, where objects are sorted and assigned
+    connections, ``"dependencies"``, where relationships are processed,
+    ``"execute"``, where INSERT, UPDATE and DELETE statements are
+    executed, ``"postfetch"``, where newly generated column values are
+    applied to objects, and ``"finalize"``, where ``after_insert`` and
+    ``after_update`` events are invoked and eager defaults loaded.
+    Phases which didn't occur are not present.
+
+    The ``"execute"`` and ``"postfetch"`` phases are recorded for the
+    mapper whose table the statement refers to, so that for a joined
+    inheritance hierarchy, the statements for each table are recorded
+    separately.  The ``"organize"`` and ``"finalize"`` phases, which
+    process the objects of an inheritance hierarchy together, are
+    recorded for the base mapper of the hierarchy.
+
+    """
+
+    rows: Dict[str, int]
+    """Dictionary of ``"insert"``, ``"update"`` and ``"delete"`` to the
+    number of parameter sets sent for statements of that kind against the
+    mapper's table."""
+
+    statements: Dict[str, int]
+    """Dictionary of ``"execute"``, ``"executemany"`` and
+    ``"insertmanyvalues"`` to the number of statements invoked in that
+    style."""
+
+    def __init__(self):
+        self.phases = util.defaultdict(float)
+        self.rows = util.defaultdict(int)
+        self.statements = util.defaultdict(int)
+
+    def __repr__(self):
+        return "%s(phases=%r, rows=%r, statements=%r)" % (
+            self.__class__.__name__,
+            dict(self.phases),
+            dict(self.rows),
+            dict(self.statements),
+        )
+
+
+class FlushStats:
+    """Timings and counts collected for a single flush.
+
+    This object is passed to the :meth:`.SessionEvents.after_flush_stats`
+    event, and is only collected if that event has listeners.
+
+    .. versionadded:: 2.0.0rc1
+
+    """
+
+    __slots__ = ("total_time", "phases", "mappers", "_start")
+
+    total_time: float
+    """Number of seconds spent in the flush."""
+
+    phases: Dict[str, float]
+    """Dictionary of phase names to the number of seconds spent in that
+    phase of the flush as a whole.
+
+    Phases include ``"presort"``, where objects affected by cascades and
+    relationships are gathered, ``"sort"``, where units of work are
+    sorted by dependency, ``"process"``, where units of work are carried
+    out, and ``"finalize"``, where objects are marked as persistent and
+    clean.  The time recorded for each mapper in
+    :attr:`.FlushStats.mappers` is part of the ``"process"`` phase.
+
+    """
+
+    mappers: Dict[Mapper[Any], MapperFlushStats]
+    """Dictionary of mappers to :class:`.MapperFlushStats` objects for
+    each mapper that took part in the flush.
+
+    For an inheritance hierarchy, this includes the base mapper as well as
+    each mapper with its own table to which statements were emitted.
+
+    """
+
+    def __init__(self):
+        self.total_time = 0.0
+        self.phases = util.defaultdict(float)
+        self.mappers = util.PopulateDict(lambda mapper: MapperFlushStats())
+        self._start = time.perf_counter()
+
+    @property
+    def rows(self) -> Dict[str, int]:
+        """Total number of parameter sets sent, keyed on ``"insert"``,
+        ``"update"`` and ``"delete"``."""
+        return self._total("rows")
+
+    @property
+    def statements(self) -> Dict[str, int]:
+        """Total number of statements invoked, keyed on ``"execute"``,
+        ``"executemany"`` and ``"insertmanyvalues"``."""
+        return self._total("statements")
+
+    def _total(self, attrname):
+        total = util.defaultdict(int)
+        for mapper_stats in self.mappers.values():
+            for key, value in getattr(mapper_stats, attrname).items():
+                total[key] += value
+        return total
+
+    def _add_time(self, phase, start, mapper=None):
+        now = time.perf_counter()
+        if mapper is None:
+            self.phases[phase] += now - start
+        else:
+            self.mappers[mapper].phases[phase] += now - start
+        return now
+
+    def _record_statement(self, mapper, result, params, start):
+        mapper_stats = self.mappers[mapper]
+        mapper_stats.phases["execute"] += time.perf_counter() - start
+
+        context = result.context
+        if context.execute_style is ExecuteStyle.INSERTMANYVALUES:
+            mapper_stats.statements["insertmanyvalues"] += 1
+        elif context.execute_style is ExecuteStyle.EXECUTEMANY:
+            mapper_stats.statements["executemany"] += 1
+        else:
+            mapper_stats.statements["execute"] += 1
+
+        if context.isinsert:
+            kind = "insert"
+        elif context.isupdate:
+            kind = "update"
+        else:
+            kind = "delete"
+        mapper_stats.rows[kind] += (
+            len(params) if isinstance(params, list) else 1
+        )
+
+    def _finish(self):
+        self.total_time = time.perf_counter() - self._start
+
+    def __repr__(self):
+        return "%s(total_time=%r, phases=%r, mappers=%r)" % (
+            self.__class__.__name__,
+            self.total_time,
+            dict(self.phases),
+            dict(self.mappers),
+        )
+
+
 class UOWTransaction:
     session: Session
     transaction: SessionTransaction
@@ -207,6 +370,12 @@ class UOWTransaction:
         # columns which should be included in the update.
         self.post_update_states = util.defaultdict(lambda: (set(), set()))
 
+        # timings and counts for the after_flush_stats event, collected
+        # only if there are listeners
+        self.stats = (
+            FlushStats() if session.dispatch.after_flush_stats else None
+        )
+
     @property
     def has_work(self):
         return bool(self.states)
@@ -392,6 +561,10 @@ class UOWTransaction:
         well as dependency pairs for this UOWTransaction.
 
         """
+        stats = self.stats
+        if stats is not None:
+            start = time.perf_counter()
+
         # execute presort_actions, until all states
         # have been processed.   a presort_action might
         # add new states to the uow.
@@ -403,6 +576,9 @@ class UOWTransaction:
             if not ret:
                 break
 
+        if stats is not None:
+            start = stats._add_time("presort", start)
+
         # see if the graph of mapper dependencies has cycles.
         self.cycles = cycles = topological.find_cycles(
             self.dependencies, list(self.postsort_actions.values())
@@ -435,13 +611,21 @@ class UOWTransaction:
                     for dep in convert[edge[1]]:
                         self.dependencies.add((edge[0], dep))
 
-        return set(
+        postsort_actions = set(
             [a for a in self.postsort_actions.values() if not a.disabled]
         ).difference(cycles)
 
+        if stats is not None:
+            stats._add_time("sort", start)
+        return postsort_actions
+
     def execute(self) -> None:
         postsort_actions = self._generate_actions()
 
+        stats = self.stats
+        if stats is not None:
+            start = time.perf_counter()
+
         postsort_actions = sorted(
             postsort_actions,
             key=lambda item: item.sort_key,
@@ -453,19 +637,33 @@ class UOWTransaction:
         # print "\nsort:", list(sort)
         # print "\nCOUNT OF POSTSORT ACTIONS", len(postsort_actions)
 
-        # execute
         if self.cycles:
-            for subset in topological.sort_as_subsets(
+            sorted_actions = topological.sort_as_subsets(
                 self.dependencies, postsort_actions
-            ):
+            )
+        else:
+            sorted_actions = topological.sort(
+                self.dependencies, postsort_actions
+            )
+
+        if stats is not None:
+            sorted_actions = list(sorted_actions)
+            start = stats._add_time("sort", start)
+
+        # execute
+        if self.cycles:
+            for subset in sorted_actions:
                 set_ = set(subset)
                 while set_:
                     n = set_.pop()
                     n.execute_aggregate(self, set_)
         else:
-            for rec in topological.sort(self.dependencies, postsort_actions):
+            for rec in sorted_actions:
                 rec.execute(self)
 
+        if stats is not None:
+            stats._add_time("process", start)
+
     def finalize_flush_changes(self) -> None:
         """Mark processed objects as clean / deleted after a successful
         flush().
@@ -477,6 +675,10 @@ class UOWTransaction:
         if not self.states:
             return
 
+        stats = self.stats
+        if stats is not None:
+            start = time.perf_counter()
+
         states = set(self.states)
         isdel = set(
             s for (s, (isdelete, listonly)) in self.states.items() if isdelete
@@ -487,6 +689,9 @@ class UOWTransaction:
         if other:
             self.session._register_persistent(other)
 
+        if stats is not None:
+            stats._add_time("finalize", start)
+
 
 class IterateMappersMixin:
 
@@ -586,12 +791,21 @@ class ProcessAll(IterateMappersMixin, PostSortRec):
         )
 
     def execute(self, uow):
+        stats = uow.stats
+        if stats is not None:
+            start = time.perf_counter()
+
         states = self._elements(uow)
         if self.isdelete:
             self.dependency_processor.process_deletes(uow, states)
         else:
             self.dependency_processor.process_saves(uow, states)
 
+        if stats is not None:
+            stats._add_time(
+                "dependencies", start, self.dependency_processor.parent
+            )
+
     def per_state_flush_actions(self, uow):
         # this is handled by SaveUpdateAll and DeleteAll,
         # since a ProcessAll should unconditionally be pulled
@@ -715,6 +929,10 @@ class ProcessState(PostSortRec):
         self.state = state
 
     def execute_aggregate(self, uow, recs):
+        stats = uow.stats
+        if stats is not None:
+            start = time.perf_counter()
+
         cls_ = self.__class__
         dependency_processor = self.dependency_processor
         isdelete = self.isdelete
@@ -732,6 +950,9 @@ class ProcessState(PostSortRec):
         else:
             dependency_processor.process_saves(uow, states)
 
+        if stats is not None:
+            stats._add_time("dependencies", start, dependency_processor.parent)
+
     def __repr__(self):
         return "%s(%s, %s, delete=%s)" % (
             self.__class__.__name__,
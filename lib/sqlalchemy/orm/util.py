@@ -1350,6 +1350,17 @@ class LoaderCriteriaOption(CriteriaOption):
 inspection._inspects(AliasedClass)(lambda target: target._aliased_insp)
 
 
+def _validate_chunk_size(
+    chunk_size: Optional[Union[int, Literal["auto"]]], argname: str
+) -> None:
+    if chunk_size is not None and chunk_size != "auto":
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise sa_exc.ArgumentError(
+                f"{argname} must be a positive integer or the string "
+                f"'auto'; got {chunk_size!r}"
+            )
+
+
 @inspection._inspects(type)
 def _inspect_mc(
     class_: Type[_O],
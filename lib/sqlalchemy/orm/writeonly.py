@@ -23,9 +23,13 @@ from __future__ import annotations
 from typing import Any
 from typing import Generic
 from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import NoReturn
 from typing import Optional
 from typing import overload
+from typing import Sequence
+from typing import Set
 from typing import Tuple
 from typing import TYPE_CHECKING
 from typing import TypeVar
@@ -33,18 +37,23 @@ from typing import Union
 
 from sqlalchemy.sql import bindparam
 from . import attributes
+from . import exc as orm_exc
 from . import interfaces
 from . import relationships
 from . import strategies
+from .base import instance_str
 from .base import object_mapper
 from .base import PassiveFlag
 from .relationships import RelationshipDirection
+from .. import event
 from .. import exc
 from .. import inspect
 from .. import log
 from .. import util
+from ..sql import coercions
 from ..sql import delete
 from ..sql import insert
+from ..sql import roles
 from ..sql import select
 from ..sql import update
 from ..sql.dml import Delete
@@ -58,7 +67,10 @@ if TYPE_CHECKING:
     from .attributes import AttributeEventToken
     from .attributes import CollectionAdapter
     from .base import LoaderCallableStatus
+    from .session import Session
     from .state import InstanceState
+    from ..sql._typing import _ColumnExpressionArgument
+    from ..sql.elements import ColumnElement
     from ..sql.selectable import Select
 
 
@@ -492,6 +504,126 @@ class AbstractCollectionWriter(Generic[_T]):
             None,
         )
 
+    def _iter_batches_impl(
+        self,
+        session: Optional[Session],
+        size: int,
+        order_by: Optional[
+            Union[
+                _ColumnExpressionArgument[Any],
+                Sequence[_ColumnExpressionArgument[Any]],
+            ]
+        ],
+        expunge: bool,
+    ) -> Iterator[Sequence[_T]]:
+        if not isinstance(size, int) or size < 1:
+            raise exc.ArgumentError(
+                "size must be a positive integer; got %r" % (size,)
+            )
+
+        if session is None:
+            # parent is not persistent; the collection consists only of
+            # pending items
+            items = list(
+                self.attr._get_collection_history(
+                    attributes.instance_state(self.instance),
+                    PassiveFlag.PASSIVE_NO_INITIALIZE,
+                ).added_items
+            )
+            return iter(
+                [items[idx : idx + size] for idx in range(0, len(items), size)]
+            )
+
+        mapper = self.attr.target_mapper
+        keys: List[ColumnElement[Any]]
+        if order_by is None:
+            # ordering by primary key; the values to continue from are
+            # taken from the identity key of the last object in each batch
+            keys = list(mapper.primary_key)
+            stmt = select(mapper)
+        else:
+            keys = [
+                coercions.expect(roles.ExpressionElementRole, key)
+                for key in util.to_list(order_by)
+            ]
+            stmt = select(mapper, *keys)
+
+        stmt = stmt.where(*self._where_criteria)
+        if self._from_obj:
+            stmt = stmt.select_from(*self._from_obj)
+        stmt = stmt.order_by(*keys).limit(size)
+
+        return self._iter_batches(
+            session, stmt, order_by is None, size, expunge
+        )
+
+    def _iter_batches(
+        self,
+        session: Session,
+        stmt: Select[Any],
+        by_identity: bool,
+        size: int,
+        expunge: bool,
+    ) -> Iterator[Sequence[_T]]:
+        parent_state = attributes.instance_state(self.instance)
+        last = None
+        identity_map = session.identity_map
+
+        # objects that are already present when their batch is loaded,
+        # such as those loaded and held by the application, are never
+        # expunged; the objects newly loaded by each batch are tracked
+        # using the loaded_as_persistent event
+        loaded: Set[InstanceState[Any]] = set()
+
+        def track_loaded(session: Session, instance: object) -> None:
+            loaded.add(attributes.instance_state(instance))
+
+        if expunge:
+            event.listen(session, "loaded_as_persistent", track_loaded)
+        try:
+            while True:
+                result = session.execute(stmt.keyset_after(last))
+
+                batch: Sequence[_T]
+                if by_identity:
+                    batch = result.scalars().all()
+                    if not batch:
+                        return
+                    last = attributes.instance_state(batch[-1]).key[1]
+                else:
+                    rows = result.all()
+                    if not rows:
+                        return
+                    batch = [row[0] for row in rows]
+                    last = tuple(rows[-1])[1:]
+                    del rows
+
+                yield batch
+
+                if expunge:
+                    deleted = session._deleted
+                    session._expunge_states(
+                        [
+                            state
+                            for state in (
+                                attributes.instance_state(obj) for obj in batch
+                            )
+                            if state in loaded
+                            and state is not parent_state
+                            and not state.modified
+                            and state not in deleted
+                            and identity_map.contains_state(state)
+                        ]
+                    )
+                    loaded.clear()
+
+                if len(batch) < size:
+                    return
+                del batch
+        finally:
+            if expunge:
+                event.remove(session, "loaded_as_persistent", track_loaded)
+
 
 class WriteOnlyCollection(AbstractCollectionWriter[_T]):
     """Write-only collection which can synchronize changes into the
@@ -537,6 +669,68 @@ class WriteOnlyCollection(AbstractCollectionWriter[_T]):
             stmt = stmt.order_by(*self._order_by_clauses)
         return stmt
 
+    def iter_batches(
+        self,
+        size: int = 1000,
+        order_by: Optional[
+            Union[
+                _ColumnExpressionArgument[Any],
+                Sequence[_ColumnExpressionArgument[Any]],
+            ]
+        ] = None,
+        expunge: bool = True,
+    ) -> Iterator[Sequence[_T]]:
+        """Iterate through the rows of this
+        :class:`_orm.WriteOnlyCollection` in batches, using keyset
+        pagination.
+
+        Each batch is loaded by a SELECT that is limited to ``size`` rows
+        and ordered by the given columns, where every SELECT after the first
+        includes criteria that selects only those rows which come after the
+        last row of the previous batch, e.g. ``WHERE id > :last_id``.  Unlike
+        OFFSET pagination, the cost of each SELECT does not grow as the
+        iteration proceeds.  The SELECT statements are emitted using the
+        :class:`_orm.Session` to which the parent object belongs.
+
+        E.g.::
+
+            for batch in user.addresses.iter_batches(size=500):
+                for address in batch:
+                    print(address.email_address)
+
+        :param size: the maximum number of objects in each batch.
+
+        :param order_by: a column or sequence of columns by which the
+         collection is ordered.  The columns must together identify a row
+         uniquely, and are compared in ascending order.  Defaults to the
+         primary key columns of the related class.  Any
+         :paramref:`_orm.relationship.order_by` configured for the
+         relationship is not used.
+
+        :param expunge: when ``True``, the default, objects from the
+         previous batch that have no pending changes are expunged from the
+         :class:`_orm.Session` before the next batch is loaded, so that
+         memory use remains constant no matter how large the collection is.
+         Objects which were already present in the :class:`_orm.Session`
+         before their batch was loaded are not expunged.  Set to ``False``
+         to leave these objects in the :class:`_orm.Session`.
+
+        .. versionadded:: 2.0.0rc1
+
+        .. seealso::
+
+            :meth:`_asyncio.AsyncSession.iter_batches` - asyncio version
+
+        """
+        session = attributes.instance_state(self.instance).session
+        if session is None:
+            raise orm_exc.DetachedInstanceError(
+                "Parent instance %s is not bound to a Session; "
+                "can't iterate through attribute '%s'"
+                % (instance_str(self.instance), self.attr.key)
+            )
+        return self._iter_batches_impl(session, size, order_by, expunge)
+
     def insert(self) -> Insert[_T]:
         """For one-to-many collections, produce a :class:`_dml.Insert` which
         will insert new rows in terms of this this instance-local
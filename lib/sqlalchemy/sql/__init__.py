@@ -97,6 +97,8 @@ from .expression import union as union
 from .expression import union_all as union_all
 from .expression import Update as Update
 from .expression import update as update
+from .expression import Upsert as Upsert
+from .expression import upsert as upsert
 from .expression import Values as Values
 from .expression import values as values
 from .expression import within_group as within_group
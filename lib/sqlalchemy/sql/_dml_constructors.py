@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING
 from .dml import Delete
 from .dml import Insert
 from .dml import Update
+from .dml import Upsert
 
 if TYPE_CHECKING:
     from ._typing import _DMLTableArgument
@@ -138,3 +139,58 @@ def delete(table: _DMLTableArgument) -> Delete:
 
     """
     return Delete(table)
+
+
+def upsert(table: _DMLTableArgument) -> Upsert:
+    r"""Construct an :class:`.Upsert` object.
+
+    An "upsert" INSERTs rows, and for each row that conflicts with an
+    existing row on the primary key of the table (or other unique columns
+    established using :meth:`.Upsert.index_elements`), UPDATEs the existing
+    row with the newly proposed values instead.  E.g.::
+
+        from sqlalchemy import upsert
+
+        with engine.begin() as conn:
+            conn.execute(
+                upsert(user_table),
+                [
+                    {"id": 1, "name": "spongebob"},
+                    {"id": 2, "name": "sandy"},
+                ],
+            )
+
+    The statement is rendered by each dialect using its own syntax; this
+    includes ``INSERT .. ON CONFLICT .. DO UPDATE`` for PostgreSQL and
+    SQLite, ``INSERT .. ON DUPLICATE KEY UPDATE`` for MySQL and MariaDB, and
+    ``MERGE`` for SQL Server.  Dialects without upsert support raise
+    :class:`.CompileError`.
+
+    When executed with a list of parameter dictionaries, the statement is
+    always batched using :ref:`engine_insertmanyvalues` where the dialect
+    supports it, so that each page of rows is sent in one round trip.  As
+    PostgreSQL and SQL Server don't allow a single statement to affect the
+    same row twice, each page should not contain more than one row for
+    the same key.
+
+    :meth:`.Insert.returning` may be used to return the primary keys or
+    other columns of the inserted or updated rows, for those backends which
+    support RETURNING.
+
+    An ORM entity may be passed as well, in which case the statement may
+    be executed with :meth:`_orm.Session.execute` using the same
+    parameter forms as :ref:`orm_queryguide_bulk_insert`.
+
+    :param table: :class:`_schema.Table` or ORM entity which is the subject
+     of the upsert.
+
+    .. versionadded:: 2.0.0rc1
+
+    .. seealso::
+
+        :meth:`.Upsert.index_elements`
+
+        :meth:`.Upsert.update_columns`
+
+    """
+    return Upsert(table)
@@ -17,4 +17,4 @@ from __future__ import annotations
 from ..util.typing import Literal
 
 SynchronizeSessionArgument = Literal[False, "auto", "evaluate", "fetch"]
-DMLStrategyArgument = Literal["bulk", "raw", "orm", "auto"]
+DMLStrategyArgument = Literal["bulk", "bulk_load", "raw", "orm", "auto"]
@@ -405,6 +405,59 @@ class SlotsMemoizedHasCacheKey(HasCacheKey, util.MemoizedSlots):
         return HasCacheKey._generate_cache_key(self)
 
 
+class StaticMemoizedHasCacheKey(HasCacheKey):
+    """Memoize the cache key of an immutable object which doesn't contain
+    any bound parameters or anonymously named elements, and therefore
+    produces the same key wherever it appears.
+
+    The portion of the key following the object's own anonymous id is
+    generated once against a private anon_map and stored in the
+    ``_memoized_static_cache_key`` attribute, which subclasses supply
+    a slot for.  Subclasses implement :meth:`._has_static_cache_key` to
+    indicate if this applies, checking the static keys of the
+    objects they contain using :meth:`._get_static_cache_key`;
+    objects for which it returns False generate their key in full each
+    time.
+
+    """
+
+    __slots__ = ()
+
+    _memoized_static_cache_key: Optional[Tuple[Any, ...]]
+
+    def _has_static_cache_key(self) -> bool:
+        raise NotImplementedError()
+
+    def _get_static_cache_key(self) -> Optional[Tuple[Any, ...]]:
+        try:
+            return self._memoized_static_cache_key
+        except AttributeError:
+            pass
+
+        static_key = None
+        if self._has_static_cache_key():
+            _anon_map = anon_map()
+            key = HasCacheKey._gen_cache_key(self, _anon_map, [])
+            if key is not None and NO_CACHE not in _anon_map:
+                static_key = key[1:]
+
+        self._memoized_static_cache_key = static_key
+        return static_key
+
+    def _gen_cache_key(
+        self, anon_map: anon_map, bindparams: List[BindParameter[Any]]
+    ) -> Optional[Tuple[Any, ...]]:
+        static_key = self._get_static_cache_key()
+        if static_key is None:
+            return HasCacheKey._gen_cache_key(self, anon_map, bindparams)
+
+        id_, found = anon_map.get_anon(self)
+        if found:
+            return (id_, self.__class__)
+        else:
+            return (id_,) + static_key
+
+
 class CacheKey(NamedTuple):
     """The key used to identify a SQL statement construct in the
     SQL compilation cache.
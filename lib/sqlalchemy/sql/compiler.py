@@ -90,6 +90,7 @@ if typing.TYPE_CHECKING:
     from .ddl import ExecutableDDLElement
     from .dml import Insert
     from .dml import UpdateBase
+    from .dml import UpsertClause
     from .dml import ValuesBase
     from .elements import _truncated_label
     from .elements import BindParameter
@@ -389,6 +390,7 @@ class _CompilerStackEntry(_BaseCompilerStackEntry, total=False):
     need_result_map_for_compound: bool
     select_0: ReturnsRows
     insert_from_select: Select[Any]
+    insert_columns: List[ColumnClause[Any]]
 
 
 class ExpandedState(NamedTuple):
@@ -1795,6 +1797,15 @@ class SQLCompiler(Compiled):
         """
         return ""
 
+    def visit_keyset_criteria(self, criteria, **kw):
+        if (
+            criteria.row_value is not None
+            and self.dialect.supports_row_value_comparison
+        ):
+            return criteria.row_value._compiler_dispatch(self, **kw)
+        else:
+            return criteria.expanded._compiler_dispatch(self, **kw)
+
     def visit_grouping(self, grouping, asfrom=False, **kwargs):
         return "(" + grouping.element._compiler_dispatch(self, **kwargs) + ")"
 
@@ -4606,6 +4617,9 @@ class SQLCompiler(Compiled):
                 self.dialect.use_insertmanyvalues_wo_returning
                 or self.implicit_returning
                 or self._result_columns
+                # an upsert is always batched, as DBAPI executemany()
+                # implementations don't generally optimize for it
+                or statement._is_upsert
             )
         )
 
@@ -4638,6 +4652,7 @@ class SQLCompiler(Compiled):
                     generic_setinputsizes,
                     batchnum,
                     lenparams,
+                    1,
                 )
             return
         else:
@@ -4657,13 +4672,14 @@ class SQLCompiler(Compiled):
             num_params_outside_of_batch = (
                 total_num_of_params - num_params_per_batch
             )
-            batch_size = min(
-                batch_size,
-                (
-                    (max_params - num_params_outside_of_batch)
-                    // num_params_per_batch
-                ),
+            max_batch_size = max(
+                1,
+                (max_params - num_params_outside_of_batch)
+                // num_params_per_batch,
             )
+            batch_size = min(batch_size, max_batch_size)
+        else:
+            max_batch_size = None
 
         batches = list(parameters)
 
@@ -4789,15 +4805,30 @@ class SQLCompiler(Compiled):
                     ", ".join(replaced_values_clauses),
                 )
 
-            yield (
+            new_batch_size = yield (
                 replaced_statement,
                 replaced_parameters,
                 processed_setinputsizes,
                 batchnum,
                 total_batches,
+                len(batch),
             )
             batchnum += 1
 
+            if new_batch_size and new_batch_size != batch_size:
+                # caller has requested a different size for subsequent
+                # batches, e.g. for adaptive page sizing; stay within
+                # the parameter limit of the dialect
+                if max_batch_size is not None:
+                    new_batch_size = min(new_batch_size, max_batch_size)
+                batch_size = new_batch_size
+                total_batches = (
+                    batchnum
+                    - 1
+                    + len(batches) // batch_size
+                    + (1 if len(batches) % batch_size else 0)
+                )
+
     def visit_insert(self, insert_stmt, **kw):
 
         compile_state = insert_stmt._compile_state_factory(
@@ -4842,6 +4873,11 @@ class SQLCompiler(Compiled):
 
         crud_params_single = crud_params_struct.single_params
 
+        if insert_stmt._is_upsert:
+            self.stack[-1]["insert_columns"] = [
+                col for col, _, _, _ in crud_params_single
+            ]
+
         if (
             not crud_params_single
             and not self.dialect.supports_default_values
@@ -5011,6 +5047,71 @@ class SQLCompiler(Compiled):
 
         return text
 
+    def visit_upsert_clause(self, clause, **kw):
+        raise exc.CompileError(
+            f"The '{self.dialect.name}' dialect does not support UPSERT"
+        )
+
+    def _upsert_targets(
+        self, clause: UpsertClause
+    ) -> Tuple[Sequence[ColumnElement[Any]], List[ColumnClause[Any]]]:
+        """Return the conflict target elements and the columns to be
+        updated for an :class:`.UpsertClause` within the current INSERT.
+
+        """
+        entry = self.stack[-1]
+        table = entry["selectable"].table  # type: ignore[attr-defined]
+
+        index_elements = clause.index_elements or tuple(table.primary_key)
+        if not index_elements:
+            raise exc.CompileError(
+                f"Can't render UPSERT for table {table.description!r}, which "
+                "has no primary key; use Upsert.index_elements() to "
+                "establish the conflict target"
+            )
+
+        if clause.update_all:
+            index_keys = {
+                elem.key
+                for elem in index_elements
+                if isinstance(elem, elements.ColumnClause)
+            }
+            update_columns = [
+                col
+                for col in entry["insert_columns"]
+                if col.key not in index_keys
+            ]
+        else:
+            update_columns = list(clause.update_columns)  # type: ignore
+
+        return index_elements, update_columns
+
+    def _render_upsert_on_conflict(self, clause, **kw):
+        """Render an :class:`.UpsertClause` as ``ON CONFLICT``, for those
+        dialects which use that syntax."""
+
+        index_elements, update_columns = self._upsert_targets(clause)
+
+        target_text = ", ".join(
+            self.preparer.quote(elem.name)
+            if isinstance(elem, elements.ColumnClause)
+            else self.process(elem, include_table=False, use_schema=False)
+            for elem in index_elements
+        )
+
+        if not update_columns:
+            return "ON CONFLICT (%s) DO NOTHING" % target_text
+
+        return "ON CONFLICT (%s) DO UPDATE SET %s" % (
+            target_text,
+            ", ".join(
+                "%s = excluded.%s" % (name, name)
+                for name in (
+                    self.preparer.quote(col.name) for col in update_columns
+                )
+            ),
+        )
+
     def update_limit_clause(self, update_stmt):
         """Provide a hook for MySQL to add LIMIT to the UPDATE"""
         return None
@@ -5337,6 +5438,9 @@ class StrSQLCompiler(SQLCompiler):
     def visit_sequence(self, seq, **kw):
         return "<next sequence value: %s>" % self.preparer.format_sequence(seq)
 
+    def visit_upsert_clause(self, clause, **kw):
+        return self._render_upsert_on_conflict(clause, **kw)
+
     def returning_clause(
         self,
         stmt: UpdateBase,
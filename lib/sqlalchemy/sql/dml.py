@@ -5,8 +5,8 @@
 # This module is part of SQLAlchemy and is released under
 # the MIT License: https://www.opensource.org/licenses/mit-license.php
 """
-Provide :class:`_expression.Insert`, :class:`_expression.Update` and
-:class:`_expression.Delete`.
+Provide :class:`_expression.Insert`, :class:`_expression.Update`,
+:class:`_expression.Delete` and :class:`.Upsert`.
 
 """
 from __future__ import annotations
@@ -1153,6 +1153,8 @@ class Insert(ValuesBase):
 
     is_insert = True
 
+    _is_upsert = False
+
     table: TableClause
 
     _traverse_internals = (
@@ -1378,6 +1380,117 @@ class ReturningInsert(Insert, TypedReturnsRows[_TP]):
     """
 
 
+class UpsertClause(ClauseElement):
+    """Represent the conflict handling portion of an :class:`.Upsert`
+    construct.
+
+    Rendered by each dialect using its own syntax, such as ``ON CONFLICT``
+    or ``ON DUPLICATE KEY UPDATE``.
+
+    .. versionadded:: 2.0.0rc1
+
+    """
+
+    __visit_name__ = "upsert_clause"
+
+    _traverse_internals = [
+        ("index_elements", InternalTraversal.dp_clauseelement_tuple),
+        ("update_columns", InternalTraversal.dp_clauseelement_tuple),
+        ("update_all", InternalTraversal.dp_boolean),
+    ]
+
+    def __init__(
+        self,
+        index_elements: Tuple[ColumnElement[Any], ...] = (),
+        update_columns: Optional[Tuple[ColumnElement[Any], ...]] = None,
+    ):
+        self.index_elements = index_elements
+        self.update_all = update_columns is None
+        self.update_columns = update_columns or ()
+
+
+SelfUpsert = typing.TypeVar("SelfUpsert", bound="Upsert")
+
+
+class Upsert(Insert):
+    """Represent a backend-agnostic "upsert", an INSERT which updates the
+    existing row when a row with the same key is already present.
+
+    The :class:`.Upsert` object is created using the :func:`_sql.upsert`
+    function.
+
+    .. versionadded:: 2.0.0rc1
+
+    """
+
+    inherit_cache = True
+
+    _is_upsert = True
+
+    def __init__(self, table: _DMLTableArgument):
+        super().__init__(table)
+        self._post_values_clause = UpsertClause()
+
+    def _coerce_upsert_column(
+        self, element: Union[str, _DMLColumnArgument], role: Any
+    ) -> ColumnElement[Any]:
+        if isinstance(element, str):
+            try:
+                return self.table.c[element]
+            except KeyError as ke:
+                raise exc.ArgumentError(
+                    f"Table {self.table.description!r} has no column "
+                    f"{element!r}"
+                ) from ke
+        return coercions.expect(role, element)
+
+    @_generative
+    def index_elements(
+        self: SelfUpsert, *elements: Union[str, _ColumnExpressionArgument[Any]]
+    ) -> SelfUpsert:
+        """Establish the columns or expressions of the unique constraint or
+        index which determines whether a row conflicts with an existing row.
+
+        Defaults to the primary key of the table.  Not used by the MySQL /
+        MariaDB dialects, where any unique constraint of the table may
+        produce a conflict.
+
+        """
+        assert isinstance(self._post_values_clause, UpsertClause)
+        self._post_values_clause = UpsertClause(
+            tuple(
+                self._coerce_upsert_column(elem, roles.ExpressionElementRole)
+                for elem in elements
+            ),
+            None
+            if self._post_values_clause.update_all
+            else self._post_values_clause.update_columns,
+        )
+        return self
+
+    @_generative
+    def update_columns(
+        self: SelfUpsert, *columns: Union[str, _DMLColumnArgument]
+    ) -> SelfUpsert:
+        """Establish the columns which are updated with the newly
+        proposed values when a row conflicts with an existing row.
+
+        Defaults to all columns present in the INSERT which are not part of
+        :meth:`.Upsert.index_elements`.  Calling this method with no
+        arguments indicates that conflicting rows are left unchanged.
+
+        """
+        assert isinstance(self._post_values_clause, UpsertClause)
+        self._post_values_clause = UpsertClause(
+            self._post_values_clause.index_elements,
+            tuple(
+                self._coerce_upsert_column(col, roles.DMLColumnRole)
+                for col in columns
+            ),
+        )
+        return self
+
+
 SelfDMLWhereBase = typing.TypeVar("SelfDMLWhereBase", bound="DMLWhereBase")
 
 
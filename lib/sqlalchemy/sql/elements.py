@@ -3895,6 +3895,189 @@ class Grouping(GroupedElement, ColumnElement[_T]):
         self.type = state["type"]
 
 
+class _KeysetCriteria(ColumnElement[bool]):
+    """Represent the criteria which selects the rows that follow a keyset
+    pagination bookmark, given the ORDER BY of a statement.
+
+    Two equivalent forms of the criteria are stored; a row value comparison
+    such as ``(a, b) > (:a_1, :b_1)``, which is present only if all ORDER BY
+    expressions are in the same direction and don't specify NULLS FIRST /
+    NULLS LAST, and an expanded form that uses individual comparisons.  The
+    compiler renders the row value comparison for dialects that support it.
+
+    """
+
+    __visit_name__ = "keyset_criteria"
+
+    _is_implicitly_boolean = True
+
+    _traverse_internals: _TraverseInternalsType = [
+        ("row_value", InternalTraversal.dp_clauseelement),
+        ("expanded", InternalTraversal.dp_clauseelement),
+    ]
+
+    row_value: Optional[ColumnElement[bool]]
+    expanded: ColumnElement[bool]
+
+    def __init__(
+        self,
+        row_value: Optional[ColumnElement[bool]],
+        expanded: ColumnElement[bool],
+    ):
+        self.row_value = row_value
+        self.expanded = expanded
+
+    @util.memoized_property
+    def type(self):
+        return type_api.BOOLEANTYPE
+
+    @util.ro_non_memoized_property
+    def _from_objects(self) -> List[FromClause]:
+        return self.expanded._from_objects
+
+    def self_group(
+        self, against: Optional[OperatorType] = None
+    ) -> ColumnElement[Any]:
+        if against in (None, operators.and_, operators._asbool):
+            return self
+        else:
+            return Grouping(self)
+
+    def _negate(self) -> ColumnElement[Any]:
+        return UnaryExpression(
+            Grouping(self),
+            operator=operators.inv,
+            wraps_column_expression=True,
+        )
+
+    @classmethod
+    def _keys_from_order_by(
+        cls, order_by: Sequence[ColumnElement[Any]]
+    ) -> List[typing_Tuple[ColumnElement[Any], bool, Optional[bool]]]:
+        """Return a tuple of ``(expression, descending, nulls_first)`` for
+        each element of the given ORDER BY clauses.
+
+        """
+        if not order_by:
+            raise exc.InvalidRequestError(
+                "Keyset pagination requires that the statement is ordered; "
+                "call order_by() with expressions that uniquely identify "
+                "each row first"
+            )
+
+        keys = []
+        for clause in order_by:
+            element = clause
+            descending = False
+            nulls_first = None
+            while True:
+                if isinstance(
+                    element, UnaryExpression
+                ) and element.modifier in (
+                    operators.asc_op,
+                    operators.desc_op,
+                ):
+                    descending = element.modifier is operators.desc_op
+                elif isinstance(
+                    element, UnaryExpression
+                ) and element.modifier in (
+                    operators.nulls_first_op,
+                    operators.nulls_last_op,
+                ):
+                    nulls_first = element.modifier is operators.nulls_first_op
+                elif not isinstance(element, (_label_reference, Label)):
+                    break
+                element = element.element
+
+            if isinstance(element, (_textual_label_reference, TextClause)):
+                raise exc.InvalidRequestError(
+                    "Can't use textual ORDER BY expression %r for keyset "
+                    "pagination; use column expressions in order_by()"
+                    % (str(element),)
+                )
+            keys.append((element, descending, nulls_first))
+        return keys
+
+    @classmethod
+    def _construct(
+        cls, order_by: Sequence[ColumnElement[Any]], bookmark: Sequence[Any]
+    ) -> ColumnElement[bool]:
+        keys = cls._keys_from_order_by(order_by)
+
+        if len(bookmark) != len(keys):
+            raise exc.ArgumentError(
+                "Keyset bookmark has %d values; expected one value for each "
+                "of the %d ORDER BY expressions of the statement"
+                % (len(bookmark), len(keys))
+            )
+
+        # for each key, criteria for rows that come after the bookmark
+        # value, and criteria for rows that are equal to it
+        after_criteria: List[Optional[ColumnElement[bool]]] = []
+        equal_criteria: List[ColumnElement[bool]] = []
+        binds = []
+        for (key, descending, nulls_first), value in zip(keys, bookmark):
+            if value is None:
+                if nulls_first is None:
+                    raise exc.ArgumentError(
+                        "Keyset bookmark value for ORDER BY expression %s "
+                        "is None; use nulls_first() or nulls_last() in the "
+                        "ORDER BY of expressions that may be NULL" % (key,)
+                    )
+                equal_criteria.append(key.is_(None))
+                # NULLs that sort first are followed by all non-NULL
+                # values; NULLs that sort last are followed by nothing
+                after_criteria.append(
+                    key.is_not(None) if nulls_first else None
+                )
+                continue
+
+            op = operators.lt if descending else operators.gt
+            bind = key._bind_param(op, value)
+            binds.append(bind)
+
+            after = op(key, bind)
+            if nulls_first is False:
+                after = or_(after, key.is_(None))
+            after_criteria.append(after)
+            equal_criteria.append(key == bind)
+
+        # produce "a > :a OR (a = :a AND (b > :b OR (b = :b AND ...)))"
+        expanded = after_criteria[-1]
+        for after, equal in zip(
+            reversed(after_criteria[:-1]), reversed(equal_criteria[:-1])
+        ):
+            if expanded is None:
+                expanded = after
+            elif after is None:
+                expanded = and_(equal, expanded)
+            else:
+                expanded = or_(after, and_(equal, expanded))
+
+        if expanded is None:
+            return False_._instance()
+
+        key, descending, nulls_first = keys[0]
+        if len(keys) == 1:
+            return expanded
+        elif nulls_first is None:
+            # lead with "a >= :a", which allows the first ORDER BY
+            # expression to be used for an index range scan
+            op = operators.le if descending else operators.ge
+            expanded = and_(op(key, binds[0]), expanded)
+
+        if all(
+            key_descending is descending and key_nulls_first is None
+            for _, key_descending, key_nulls_first in keys
+        ):
+            op = operators.lt if descending else operators.gt
+            row_value = op(Tuple(*[key for key, _, _ in keys]), Tuple(*binds))
+        else:
+            row_value = None
+
+        return cls(row_value, expanded.self_group(against=operators.and_))
+
+
 class _OverRange(IntEnum):
     RANGE_UNBOUNDED = 0
     RANGE_CURRENT = 1
@@ -16,6 +16,7 @@ from __future__ import annotations
 from ._dml_constructors import delete as delete
 from ._dml_constructors import insert as insert
 from ._dml_constructors import update as update
+from ._dml_constructors import upsert as upsert
 from ._elements_constructors import all_ as all_
 from ._elements_constructors import and_ as and_
 from ._elements_constructors import any_ as any_
@@ -69,6 +70,8 @@ from .dml import Delete as Delete
 from .dml import Insert as Insert
 from .dml import Update as Update
 from .dml import UpdateBase as UpdateBase
+from .dml import Upsert as Upsert
+from .dml import UpsertClause as UpsertClause
 from .dml import ValuesBase as ValuesBase
 from .elements import _truncated_label as _truncated_label
 from .elements import BinaryExpression as BinaryExpression
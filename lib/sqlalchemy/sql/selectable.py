@@ -78,6 +78,7 @@ from .base import HasMemoized
 from .base import Immutable
 from .coercions import _document_text_coercion
 from .elements import _anonymous_label
+from .elements import _KeysetCriteria
 from .elements import BindParameter
 from .elements import BooleanClauseList
 from .elements import ClauseElement
@@ -86,6 +87,7 @@ from .elements import ColumnClause
 from .elements import ColumnElement
 from .elements import DQLDMLClauseElement
 from .elements import GroupedElement
+from .elements import Label
 from .elements import literal_column
 from .elements import TableValuedColumn
 from .elements import UnaryExpression
@@ -132,7 +134,6 @@ if TYPE_CHECKING:
     from .dml import Insert
     from .dml import Update
     from .elements import KeyedColumnElement
-    from .elements import Label
     from .elements import NamedColumn
     from .elements import TextClause
     from .functions import Function
@@ -4472,6 +4473,36 @@ class SelectState(util.MemoizedSlots, CompileState):
             )
         ]
 
+    @classmethod
+    @util.preload_module("sqlalchemy.engine.row")
+    def get_keyset_bookmark(
+        cls, statement: Select[Any], row: Any
+    ) -> Tuple[Any, ...]:
+        columns = [
+            col.element if isinstance(col, Label) else col
+            for col in statement._all_selected_columns
+        ]
+        if len(columns) == 1 and not isinstance(
+            row, util.preloaded.engine_row.Row
+        ):
+            row = (row,)
+
+        bookmark = []
+        for key, _, _ in _KeysetCriteria._keys_from_order_by(
+            statement._order_by_clauses
+        ):
+            for idx, col in enumerate(columns):
+                if col is key or col.compare(key):
+                    bookmark.append(row[idx])
+                    break
+            else:
+                raise exc.InvalidRequestError(
+                    "ORDER BY expression %s is not present in the columns "
+                    "clause of the statement; can't produce a keyset "
+                    "bookmark from a row" % (key,)
+                )
+        return tuple(bookmark)
+
     @classmethod
     def from_statement(
         cls, statement: Select[Any], from_statement: ExecutableReturnsRows
@@ -5917,6 +5948,90 @@ class Select(
             self._where_criteria += (where_criteria,)
         return self
 
+    @_generative
+    def keyset_after(
+        self: SelfSelect, bookmark: Optional[Sequence[Any]]
+    ) -> SelfSelect:
+        """Return a new :func:`_expression.select` construct which selects
+        only those rows that follow the given bookmark, based on the ORDER
+        BY of the statement.
+
+        This method supports "keyset pagination", also known as "seek
+        pagination", where each page of results is selected by applying
+        criteria against the last row of the previous page, rather than by
+        skipping over a number of rows using OFFSET.  Given a set of
+        ORDER BY expressions which together uniquely identify each row,
+        each page can be located using an index, regardless of how far into
+        the result the page is::
+
+            stmt = (
+                select(user_table)
+                .order_by(user_table.c.name, user_table.c.id)
+                .limit(100)
+            )
+
+            bookmark = None
+            while True:
+                rows = connection.execute(stmt.keyset_after(bookmark)).all()
+                if not rows:
+                    break
+                # ... work with rows
+                bookmark = stmt.keyset_bookmark(rows[-1])
+
+        The :meth:`_sql.Select.order_by` method must be called before this
+        one, and the bookmark must be a sequence with one value for each
+        ORDER BY expression, as returned by
+        :meth:`_sql.Select.keyset_bookmark`.  A bookmark of ``None`` returns
+        the statement unchanged, which selects the first page.
+
+        The criteria take into account expressions which are ordered
+        using :meth:`_sql.ColumnElement.desc`.  On backends which support
+        it, such as PostgreSQL, MySQL and SQLite, the criteria are rendered
+        as a single row value comparison such as
+        ``(name, id) > (:name_1, :id_1)`` when all expressions are in the
+        same direction; otherwise individual comparisons are rendered.
+        Expressions which may contain NULL must make use of
+        :meth:`_sql.ColumnElement.nulls_first` or
+        :meth:`_sql.ColumnElement.nulls_last` in the ORDER BY, so that the
+        position of NULL values is known; a bookmark value of ``None`` for
+        any other expression raises :class:`.ArgumentError`.
+
+        .. versionadded:: 2.0.0rc1
+
+        .. seealso::
+
+            :meth:`_sql.Select.keyset_bookmark`
+
+        """
+        if bookmark is not None:
+            self._where_criteria += (
+                _KeysetCriteria._construct(self._order_by_clauses, bookmark),
+            )
+        return self
+
+    def keyset_bookmark(self, row: Any) -> Tuple[Any, ...]:
+        """Return a bookmark for the given row, suitable for passing to
+        :meth:`_sql.Select.keyset_after` in order to select the rows that
+        follow it.
+
+        The row is typically the last :class:`_engine.Row` of a page of
+        results returned by this statement.  The bookmark is a tuple
+        containing the values of the row which correspond to each ORDER BY
+        expression of the statement; each of these expressions must be
+        present in the columns clause.  When the statement selects a single
+        column or ORM entity, the row may also be the single value or object
+        itself, such as those returned by :meth:`_engine.Result.scalars`.
+
+        .. versionadded:: 2.0.0rc1
+
+        .. seealso::
+
+            :meth:`_sql.Select.keyset_after`
+
+        """
+        meth = SelectState.get_plugin_class(self).get_keyset_bookmark
+        return meth(self, row)
+
     @_generative
     def having(
         self: SelfSelect, *having: _ColumnExpressionArgument[bool]
@@ -56,7 +56,6 @@ from .. import event
 from .. import exc
 from .. import inspection
 from .. import util
-from ..engine import processors
 from ..util import langhelpers
 from ..util import OrderedDict
 from ..util.typing import Literal
@@ -546,13 +545,17 @@ class Numeric(HasExpressionLookup, TypeEngine[_N]):
         else:
             return float
 
+    @util.preload_module("sqlalchemy.engine.processors")
     def bind_processor(self, dialect):
+        processors = util.preloaded.engine_processors
         if dialect.supports_native_decimal:
             return None
         else:
             return processors.to_float
 
+    @util.preload_module("sqlalchemy.engine.processors")
     def result_processor(self, dialect, coltype):
+        processors = util.preloaded.engine_processors
         if self.asdecimal:
             if dialect.supports_native_decimal:
                 # we're a "numeric", DBAPI will give us Decimal directly
@@ -676,7 +679,9 @@ class Float(Numeric[_N]):
         self.asdecimal = asdecimal
         self.decimal_return_scale = decimal_return_scale
 
+    @util.preload_module("sqlalchemy.engine.processors")
     def result_processor(self, dialect, coltype):
+        processors = util.preloaded.engine_processors
         if self.asdecimal:
             return processors.to_decimal_processor_factory(
                 decimal.Decimal, self._effective_decimal_return_scale
@@ -1926,7 +1931,9 @@ class Boolean(SchemaType, Emulated, TypeEngine[bool]):
 
         return process
 
+    @util.preload_module("sqlalchemy.engine.processors")
     def result_processor(self, dialect, coltype):
+        processors = util.preloaded.engine_processors
         if dialect.supports_native_boolean:
             return None
         else:
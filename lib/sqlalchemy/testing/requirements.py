@@ -410,6 +410,13 @@ class SuiteRequirements(Requirements):
             "%(database)s %(does_support)s 'UPDATE ... RETURNING'",
         )
 
+    @property
+    def upsert(self):
+        """target platform supports rendering of the :func:`_sql.upsert`
+        construct."""
+
+        return exclusions.closed()
+
     @property
     def insert_executemany_returning(self):
         """target platform supports RETURNING when INSERT is used with
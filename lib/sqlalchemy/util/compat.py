@@ -96,12 +96,6 @@ def inspect_getfullargspec(func: Callable[..., Any]) -> FullArgSpec:
     )
 
 
-if typing.TYPE_CHECKING or py38:
-    from importlib import metadata as importlib_metadata
-else:
-    import importlib_metadata  # noqa
-
-
 if typing.TYPE_CHECKING or py39:
     # pep 584 dict union
     dict_union = operator.or_  # noqa
@@ -137,6 +131,13 @@ else:
 
 
 def importlib_metadata_get(group):
+    # importlib.metadata is imported only when entry points are looked up,
+    # as it takes a significant portion of the time to import sqlalchemy
+    if typing.TYPE_CHECKING or py38:
+        from importlib import metadata as importlib_metadata
+    else:
+        import importlib_metadata  # noqa
+
     ep = importlib_metadata.entry_points()
     if not typing.TYPE_CHECKING and hasattr(ep, "select"):
         return ep.select(group=group)
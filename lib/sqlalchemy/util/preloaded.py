@@ -26,8 +26,10 @@ if TYPE_CHECKING:
     from sqlalchemy import orm as _orm
     from sqlalchemy.engine import cursor as _engine_cursor
     from sqlalchemy.engine import default as _engine_default
+    from sqlalchemy.engine import processors as _engine_processors
     from sqlalchemy.engine import reflection as _engine_reflection
     from sqlalchemy.engine import result as _engine_result
+    from sqlalchemy.engine import row as _engine_row
     from sqlalchemy.engine import url as _engine_url
     from sqlalchemy.orm import base as _orm_base
     from sqlalchemy.orm import clsregistry as _orm_clsregistry
@@ -59,8 +61,10 @@ if TYPE_CHECKING:
     dialects = _dialects
     engine_cursor = _engine_cursor
     engine_default = _engine_default
+    engine_processors = _engine_processors
     engine_reflection = _engine_reflection
     engine_result = _engine_result
+    engine_row = _engine_row
     engine_url = _engine_url
     orm_clsregistry = _orm_clsregistry
     orm_base = _orm_base
@@ -137,6 +141,22 @@ class _ModuleRegistry:
                 __import__(module, globals(), locals())
                 self.__dict__[key] = globals()[key] = sys.modules[module]
 
+    def _import_key(self, key: str) -> Any:
+        """Resolve the single registered module with the given key, which
+        belongs to a package that hasn't imported its registered modules
+        yet.
+        """
+        for module in list(self.module_registry):
+            if self.prefix:
+                module_key = module.split(self.prefix)[-1].replace(".", "_")
+            else:
+                module_key = module
+            if module_key == key:
+                __import__(module, globals(), locals())
+                self.__dict__[key] = globals()[key] = sys.modules[module]
+                return self.__dict__[key]
+        raise AttributeError(key)
+
 
 _reg = _ModuleRegistry()
 preload_module = _reg.preload_module
@@ -146,3 +166,12 @@ import_prefix = _reg.import_prefix
 # if TYPE_CHECKING:
 #    def __getattr__(key: str) -> ModuleType:
 #        ...
+
+if not TYPE_CHECKING:
+
+    def __getattr__(key: str) -> Any:
+        # the "sqlalchemy" package imports the engine package on first
+        # use, so modules that "sqlalchemy.sql" registers from it are
+        # imported when first accessed, if the engine package hasn't
+        # imported them already
+        return _reg._import_key(key)
@@ -12,8 +12,10 @@ from __future__ import annotations
 from typing import Any
 from typing import Collection
 from typing import DefaultDict
+from typing import Dict
 from typing import Iterable
 from typing import Iterator
+from typing import List
 from typing import Sequence
 from typing import Set
 from typing import Tuple
@@ -30,31 +32,77 @@ __all__ = ["sort", "sort_as_subsets", "find_cycles"]
 def sort_as_subsets(
     tuples: Collection[Tuple[_T, _T]], allitems: Collection[_T]
 ) -> Iterator[Sequence[_T]]:
+    """sort the given list of items by dependency, yielding successive
+    lists of items which have no dependencies on each other.
+
+    Each item is placed in the first list that follows all of the lists
+    containing the items it depends upon; within each list, items are in
+    the order of "allitems".
+
+    The sort uses an adjacency index and an in-degree count for each item,
+    so that it runs in time proportional to the number of items plus the
+    number of dependencies.
+
+    """
 
     edges: DefaultDict[_T, Set[_T]] = util.defaultdict(set)
     for parent, child in tuples:
         edges[child].add(parent)
 
     todo = list(allitems)
-    todo_set = set(allitems)
-
-    while todo_set:
-        output = []
-        for node in todo:
-            if todo_set.isdisjoint(edges[node]):
-                output.append(node)
-
+    depth = dict.fromkeys(todo, 0)
+
+    # index the dependencies among "allitems" by parent, and count the
+    # number of unsorted parents of each item
+    children: DefaultDict[_T, List[_T]] = util.defaultdict(list)
+    indegree: Dict[_T, int] = {}
+    for child, parents in edges.items():
+        if child not in depth:
+            continue
+        count = 0
+        for parent in parents:
+            if parent in depth:
+                children[parent].append(child)
+                count += 1
+        if count:
+            indegree[child] = count
+
+    ready = [node for node in depth if node not in indegree]
+    max_depth = 0
+    while ready:
+        node = ready.pop()
+        child_depth = depth[node] + 1
+        for child in children.get(node, ()):
+            if depth[child] < child_depth:
+                depth[child] = child_depth
+                if child_depth > max_depth:
+                    max_depth = child_depth
+            indegree[child] -= 1
+            if not indegree[child]:
+                ready.append(child)
+
+    # items that are still waiting on parents are part of, or depend
+    # upon, a cycle
+    subsets: List[List[_T]] = [[] for _ in range(max_depth + 1)]
+    cyclical = False
+    for node in todo:
+        if indegree.get(node):
+            cyclical = True
+        else:
+            subsets[depth[node]].append(node)
+
+    for output in subsets:
         if not output:
-            raise CircularDependencyError(
-                "Circular dependency detected.",
-                find_cycles(tuples, allitems),
-                _gen_edges(edges),
-            )
-
-        todo_set.difference_update(output)
-        todo = [t for t in todo if t in todo_set]
+            break
         yield output
 
+    if cyclical:
+        raise CircularDependencyError(
+            "Circular dependency detected.",
+            find_cycles(tuples, allitems),
+            _gen_edges(edges),
+        )
+
 
 def sort(
     tuples: Collection[Tuple[_T, _T]],
@@ -79,42 +127,66 @@ def sort(
 def find_cycles(
     tuples: Iterable[Tuple[_T, _T]], allitems: Iterable[_T]
 ) -> Set[_T]:
-    # adapted from:
-    # https://neopythonic.blogspot.com/2009/01/detecting-cycles-in-directed-graph.html
+    """return the set of items which are involved in cycles.
+
+    Uses Tarjan's strongly connected components algorithm; an item is
+    part of a cycle if its component has more than one member, or if it
+    depends upon itself.
+
+    """
 
     edges: DefaultDict[_T, Set[_T]] = util.defaultdict(set)
     for parent, child in tuples:
         edges[parent].add(child)
-    nodes_to_test = set(edges)
 
     output = set()
 
-    # we'd like to find all nodes that are
-    # involved in cycles, so we do the full
-    # pass through the whole thing for each
-    # node in the original list.
+    index: Dict[_T, int] = {}
+    lowlink: Dict[_T, int] = {}
+    stack: List[_T] = []
+    on_stack: Set[_T] = set()
 
     # we can go just through parent edge nodes.
     # if a node is only a child and never a parent,
     # by definition it can't be part of a cycle.  same
     # if it's not in the edges at all.
-    for node in nodes_to_test:
-        stack = [node]
-        todo = nodes_to_test.difference(stack)
-        while stack:
-            top = stack[-1]
-            for node in edges[top]:
-                if node in stack:
-                    cyc = stack[stack.index(node) :]
-                    todo.difference_update(cyc)
-                    output.update(cyc)
-
-                if node in todo:
-                    stack.append(node)
-                    todo.remove(node)
+    for root in list(edges):
+        if root in index:
+            continue
+
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(edges[root]))]
+
+        while work:
+            node, targets = work[-1]
+            for target in targets:
+                if target not in index:
+                    index[target] = lowlink[target] = len(index)
+                    stack.append(target)
+                    on_stack.add(target)
+                    work.append((target, iter(edges.get(target, ()))))
                     break
+                elif target in on_stack and index[target] < lowlink[node]:
+                    lowlink[node] = index[target]
             else:
-                node = stack.pop()
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        component.append(member)
+                        if member is node:
+                            break
+                    if len(component) > 1 or node in edges[node]:
+                        output.update(component)
     return output
 
 
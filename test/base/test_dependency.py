@@ -204,6 +204,28 @@ class DependencySortTest(fixtures.TestBase):
         tuples = [(i, i + 1) for i in range(0, 1500, 2)]
         self.assert_sort(tuples)
 
+    def test_large_chain_sort_as_subsets(self):
+        tuples = [(i, i + 1) for i in range(20000)]
+        allitems = list(reversed(range(20001)))
+        eq_(
+            list(topological.sort_as_subsets(tuples, allitems)),
+            [[i] for i in range(20001)],
+        )
+
+    def test_sort_as_subsets_order(self):
+        tuples = [("a", "c"), ("b", "c"), ("c", "d"), ("a", "d")]
+        allitems = ["e", "d", "c", "b", "a"]
+        eq_(
+            list(topological.sort_as_subsets(tuples, allitems)),
+            [["e", "b", "a"], ["c"], ["d"]],
+        )
+
+    def test_sort_as_subsets_cycle_after_subsets(self):
+        tuples = [("a", "b"), ("b", "c"), ("c", "b"), ("c", "d")]
+        gen = topological.sort_as_subsets(tuples, ["a", "b", "c", "d"])
+        eq_(next(gen), ["a"])
+        assert_raises(exc.CircularDependencyError, next, gen)
+
     def test_ticket_1380(self):
 
         # ticket:1380 regression: would raise a KeyError
@@ -369,3 +391,17 @@ class DependencySortTest(fixtures.TestBase):
                 ]
             ),
         )
+
+    def test_find_cycles_self_referential(self):
+        tuples = [("node1", "node1"), ("node1", "node2"), ("node2", "node3")]
+        eq_(
+            topological.find_cycles(tuples, ["node1", "node2", "node3"]),
+            {"node1"},
+        )
+
+    def test_find_cycles_large_chain(self):
+        tuples = [(i, i + 1) for i in range(20000)] + [(20000, 10000)]
+        eq_(
+            topological.find_cycles(tuples, list(range(20001))),
+            set(range(10000, 20001)),
+        )
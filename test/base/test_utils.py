@@ -2,10 +2,13 @@
 
 import copy
 import inspect
+import os
 from pathlib import Path
 import pickle
+import subprocess
 import sys
 
+import sqlalchemy
 from sqlalchemy import exc
 from sqlalchemy import sql
 from sqlalchemy import testing
@@ -24,6 +27,7 @@ from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
 from sqlalchemy.testing import ne_
+from sqlalchemy.testing import not_in
 from sqlalchemy.testing.util import gc_collect
 from sqlalchemy.testing.util import picklers
 from sqlalchemy.util import classproperty
@@ -3384,6 +3388,78 @@ class TestModuleRegistry(fixtures.TestBase):
                 if mod is not None:
                     sys.modules[name] = mod
 
+    def test_module_loaded_on_access(self):
+        to_restore = sys.modules.pop("wsgiref.simple_server", None)
+        preloaded.preload_module("wsgiref.simple_server")
+        try:
+            is_true("wsgiref.simple_server" not in sys.modules)
+            is_(
+                preloaded.wsgiref_simple_server,
+                sys.modules["wsgiref.simple_server"],
+            )
+        finally:
+            preloaded._reg.module_registry.discard("wsgiref.simple_server")
+            preloaded._reg.__dict__.pop("wsgiref_simple_server", None)
+            vars(preloaded).pop("wsgiref_simple_server", None)
+            if to_restore is not None:
+                sys.modules["wsgiref.simple_server"] = to_restore
+
+    def test_unregistered_module(self):
+        is_false(hasattr(preloaded, "wsgiref_handlers"))
+
+
+class LazyImportTest(fixtures.TestBase):
+    def _imported_modules(self, statement):
+        lib = str(Path(sqlalchemy.__file__).parent.parent)
+        code = (
+            f"import sys; {statement}; "
+            "print(' '.join(m for m in sys.modules))"
+        )
+        return subprocess.run(
+            [sys.executable, "-c", code],
+            env=dict(os.environ, PYTHONPATH=lib),
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+
+    def test_import_sqlalchemy(self):
+        modules = self._imported_modules("import sqlalchemy")
+        in_("sqlalchemy.sql.schema", modules)
+        for name in (
+            "sqlalchemy.engine",
+            "sqlalchemy.pool",
+            "sqlalchemy.orm",
+            "importlib.metadata",
+        ):
+            not_in(name, modules)
+
+    def test_lazy_names(self):
+        modules = self._imported_modules(
+            "import sqlalchemy; "
+            "assert sqlalchemy.create_engine is "
+            "sqlalchemy.engine.create_engine; "
+            "assert sqlalchemy.SingleonThreadPool is "
+            "sqlalchemy.pool.SingletonThreadPool; "
+            "assert 'Engine' in dir(sqlalchemy)"
+        )
+        in_("sqlalchemy.engine.default", modules)
+
+    def test_import_star(self):
+        modules = self._imported_modules(
+            "from sqlalchemy import *; "
+            "assert create_engine is sys.modules['sqlalchemy'].create_engine; "
+            "assert QueuePool and select and util"
+        )
+        in_("sqlalchemy.engine.default", modules)
+
+    def test_no_attribute(self):
+        with expect_raises_message(
+            AttributeError,
+            "module 'sqlalchemy' has no attribute 'nonexistent'",
+        ):
+            sqlalchemy.nonexistent
+
 
 class MethodOveriddenTest(fixtures.TestBase):
     def test_subclass_overrides_cls_given(self):
@@ -50,6 +50,7 @@ from sqlalchemy import TIMESTAMP
 from sqlalchemy import types as sqltypes
 from sqlalchemy import Unicode
 from sqlalchemy import UnicodeText
+from sqlalchemy import upsert
 from sqlalchemy import VARCHAR
 from sqlalchemy.dialects.mysql import base as mysql
 from sqlalchemy.dialects.mysql import insert
@@ -1162,6 +1163,87 @@ class InsertOnDuplicateTest(fixtures.TestBase, AssertsCompiledSQL):
             },
         )
 
+    def _dialect(self, server_version_info, is_mariadb=False):
+        dialect = mysql.dialect(is_mariadb=is_mariadb)
+        dialect.server_version_info = server_version_info
+        return dialect
+
+    @testing.combinations(
+        ((8, 0, 19), False, False),
+        ((8, 0, 20), False, True),
+        ((10, 6, 0), True, False),
+        (None, False, False),
+        argnames="server_version_info, is_mariadb, uses_alias",
+    )
+    def test_row_alias_by_server_version(
+        self, server_version_info, is_mariadb, uses_alias
+    ):
+        stmt = insert(self.table).values(id=1, bar="ab")
+        stmt = stmt.on_duplicate_key_update(
+            bar=stmt.inserted.bar,
+            baz=func.coalesce(stmt.inserted.baz, "default"),
+        )
+        if uses_alias:
+            expected_sql = (
+                "INSERT INTO foos (id, bar) VALUES (%s, %s) AS new "
+                "ON DUPLICATE KEY UPDATE bar = new.bar, "
+                "baz = coalesce(new.baz, %s)"
+            )
+        else:
+            expected_sql = (
+                "INSERT INTO foos (id, bar) VALUES (%s, %s) "
+                "ON DUPLICATE KEY UPDATE bar = VALUES(bar), "
+                "baz = coalesce(VALUES(baz), %s)"
+            )
+        self.assert_compile(
+            stmt,
+            expected_sql,
+            dialect=self._dialect(server_version_info, is_mariadb),
+        )
+
+    def test_row_alias_table_named_new(self):
+        new = Table(
+            "new",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("bar", String(10)),
+        )
+        stmt = insert(new).values(id=1, bar="ab")
+        stmt = stmt.on_duplicate_key_update(bar=stmt.inserted.bar)
+        self.assert_compile(
+            stmt,
+            "INSERT INTO new (id, bar) VALUES (%s, %s) AS new_1 "
+            "ON DUPLICATE KEY UPDATE bar = new_1.bar",
+            dialect=self._dialect((8, 0, 20)),
+        )
+
+    def test_no_row_alias_from_select(self):
+        stmt = insert(self.table).from_select(
+            ["id", "bar"], select(self.table.c.id, self.table.c.bar)
+        )
+        stmt = stmt.on_duplicate_key_update(bar=stmt.inserted.bar)
+        self.assert_compile(
+            stmt,
+            "INSERT INTO foos (id, bar) SELECT foos.id, foos.bar "
+            "FROM foos ON DUPLICATE KEY UPDATE bar = VALUES(bar)",
+            dialect=self._dialect((8, 0, 20)),
+        )
+
+    @testing.combinations(
+        ((8, 0, 19), "bar = VALUES(bar), baz = VALUES(baz)"),
+        ((8, 0, 20), "bar = new.bar, baz = new.baz"),
+        argnames="server_version_info, expected_set",
+    )
+    def test_upsert(self, server_version_info, expected_set):
+        alias_text = "AS new " if server_version_info >= (8, 0, 20) else ""
+        self.assert_compile(
+            upsert(self.table),
+            "INSERT INTO foos (id, bar, baz) VALUES (%s, %s, %s) "
+            f"{alias_text}ON DUPLICATE KEY UPDATE {expected_set}",
+            params={"id": None, "bar": None, "baz": None},
+            dialect=self._dialect(server_version_info),
+        )
+
 
 class RegexpCommon(testing.AssertsCompiledSQL):
     def setup_test(self):
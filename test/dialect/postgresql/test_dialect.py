@@ -61,6 +61,23 @@ from sqlalchemy.testing.assertions import ne_
 class DialectTest(fixtures.TestBase):
     """python-side dialect tests."""
 
+    def test_psycopg_bulk_load_statement(self):
+        dialect = psycopg_dialect.dialect()
+        t = Table(
+            "some table",
+            MetaData(),
+            Column("id", Integer),
+            Column("Data", String),
+        )
+        eq_(
+            dialect._bulk_load_statement(t, list(t.c), None),
+            'COPY "some table" (id, "Data") FROM STDIN',
+        )
+        eq_(
+            dialect._bulk_load_statement(t, [t.c.Data], "Other"),
+            'COPY "Other"."some table" ("Data") FROM STDIN',
+        )
+
     def test_range_constructor(self):
         """test kwonly argments in the range constructor, as we had
         to do dataclasses backwards compat operations"""
@@ -568,6 +585,58 @@ class ExecutemanyFlagOptionsTest(fixtures.TablesTest):
             )
 
 
+class BulkLoadTest(fixtures.TablesTest):
+    __only_on__ = ("postgresql+psycopg", "postgresql+asyncpg")
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "bulk_load",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+            Column("json", JSONB),
+            Column("ts", DateTime),
+        )
+
+    def test_native_bulk_load(self, connection):
+        table = self.tables.bulk_load
+        is_true(connection.dialect.supports_bulk_load)
+
+        ts = datetime.datetime(2022, 10, 15, 12, 30, 0)
+        with mock.patch.object(
+            connection.dialect,
+            "do_bulk_load",
+            wraps=connection.dialect.do_bulk_load,
+        ) as do_bulk_load:
+            count = connection.bulk_load(
+                table,
+                (
+                    {"id": i, "data": "d%d" % i, "json": {"x": i}, "ts": ts}
+                    for i in range(1, 1001)
+                ),
+            )
+        eq_(count, 1000)
+        eq_(do_bulk_load.call_count, 1)
+
+        eq_(
+            connection.execute(
+                select(table)
+                .where(table.c.id.in_([1, 1000]))
+                .order_by(table.c.id)
+            ).all(),
+            [(1, "d1", {"x": 1}, ts), (1000, "d1000", {"x": 1000}, ts)],
+        )
+
+    def test_native_bulk_load_error(self, connection):
+        table = self.tables.bulk_load
+        with expect_raises(exc.IntegrityError):
+            connection.bulk_load(
+                table, [{"id": 1, "data": "d1"}, {"id": 1, "data": "d2"}]
+            )
+
+
 class MiscBackendTest(
     fixtures.TestBase, AssertsExecutionResults, AssertsCompiledSQL
 ):
@@ -597,6 +666,24 @@ class MiscBackendTest(
             ".".join(str(x) for x in v)
         )
 
+    @testing.requires.independent_connections
+    def test_export_import_snapshot(self, metadata):
+        t = Table("t", metadata, Column("x", Integer))
+        metadata.create_all(testing.db)
+
+        with testing.db.begin() as conn:
+            conn.execute(t.insert(), {"x": 1})
+
+        with testing.db.connect() as exporting:
+            snapshot_id = testing.db.dialect.do_export_snapshot(exporting)
+
+            with testing.db.begin() as conn:
+                conn.execute(t.insert(), {"x": 2})
+
+            with testing.db.connect() as conn:
+                testing.db.dialect.do_import_snapshot(conn, snapshot_id)
+                eq_(conn.scalars(select(t.c.x)).all(), [1])
+
     @testing.only_on("postgresql+psycopg")
     def test_psycopg_version(self):
         v = testing.db.dialect.psycopg_version
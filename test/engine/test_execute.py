@@ -1032,6 +1032,133 @@ class ConvenienceExecuteTest(fixtures.TablesTest):
         self._assert_fn(5, value=8)
 
 
+class BulkLoadTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "bulk_load",
+            metadata,
+            Column("id", Integer, primary_key=True, autoincrement=False),
+            Column("data", String(50)),
+            Column("x", Integer, server_default="5"),
+        )
+
+    def _assert_data(self, connection, expected):
+        table = self.tables.bulk_load
+        eq_(
+            connection.execute(
+                select(table.c.id, table.c.data, table.c.x).order_by(
+                    table.c.id
+                )
+            ).all(),
+            expected,
+        )
+
+    def test_bulk_load(self, connection):
+        table = self.tables.bulk_load
+        count = connection.bulk_load(
+            table,
+            ({"id": i, "data": "d%d" % i, "x": i * 2} for i in range(1, 51)),
+        )
+        eq_(count, 50)
+        self._assert_data(
+            connection, [(i, "d%d" % i, i * 2) for i in range(1, 51)]
+        )
+
+    def test_bulk_load_columns(self, connection):
+        """given columns are loaded; extra keys are ignored and omitted
+        columns receive their server default"""
+
+        table = self.tables.bulk_load
+        count = connection.bulk_load(
+            table,
+            ({"id": i, "data": "d%d" % i, "x": i} for i in range(1, 11)),
+            columns=["id", "data"],
+        )
+        eq_(count, 10)
+        self._assert_data(
+            connection, [(i, "d%d" % i, 5) for i in range(1, 11)]
+        )
+
+    def test_bulk_load_type_processing(self, connection, metadata):
+        class Upper(TypeDecorator):
+            impl = String(50)
+            cache_ok = True
+
+            def process_bind_param(self, value, dialect):
+                return value.upper()
+
+        table = Table(
+            "bulk_load_types",
+            metadata,
+            Column("id", Integer, primary_key=True, autoincrement=False),
+            Column("data", Upper),
+        )
+        table.create(connection)
+
+        connection.bulk_load(
+            table, [{"id": 1, "data": "one"}, {"id": 2, "data": "two"}]
+        )
+        eq_(
+            connection.execute(
+                select(text("data")).select_from(table).order_by(text("id"))
+            ).all(),
+            [("ONE",), ("TWO",)],
+        )
+
+    def test_bulk_load_empty(self, connection):
+        eq_(connection.bulk_load(self.tables.bulk_load, iter([])), 0)
+        self._assert_data(connection, [])
+
+    def test_bulk_load_no_column(self, connection):
+        with expect_raises_message(
+            tsa.exc.ArgumentError,
+            "Table 'bulk_load' has no column 'nonexistent'",
+        ):
+            connection.bulk_load(
+                self.tables.bulk_load, [{"id": 1, "nonexistent": 5}]
+            )
+
+    def test_bulk_load_uses_driver(self):
+        """dialects with a native bulk load facility receive processed
+        row tuples within a transaction"""
+
+        table = self.tables.bulk_load
+        received = []
+
+        def do_bulk_load(dbapi_connection, table, columns, rows, schema):
+            received.append(([c.name for c in columns], list(rows), schema))
+
+        eng = engines.testing_engine()
+        with mock.patch.object(
+            eng.dialect, "supports_bulk_load", True
+        ), mock.patch.object(
+            eng.dialect, "do_bulk_load", do_bulk_load
+        ), eng.connect() as conn:
+            count = conn.bulk_load(
+                table,
+                ({"id": i, "data": "d%d" % i} for i in range(1, 4)),
+                execution_options={
+                    "schema_translate_map": {None: "some_schema"}
+                },
+            )
+            is_true(conn.in_transaction())
+
+        eq_(count, 3)
+        eq_(
+            received,
+            [
+                (
+                    ["id", "data"],
+                    [(1, "d1"), (2, "d2"), (3, "d3")],
+                    "some_schema",
+                )
+            ],
+        )
+
+
 class CompiledCacheTest(fixtures.TestBase):
     __backend__ = True
 
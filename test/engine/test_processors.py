@@ -8,6 +8,7 @@ from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
 from sqlalchemy.util import immutabledict
 
 
@@ -203,6 +204,13 @@ class _DistillArgsTest(fixtures.TestBase):
             [MappingProxyType({"foo": "bar"})],
         )
 
+    def test_distill_20_iterator(self):
+        it = iter([{"a": 1}, {"a": 2}])
+        is_(self.module._distill_params_20(it), it)
+
+        gen = ({"a": i} for i in range(2))
+        is_(self.module._distill_params_20(gen), gen)
+
     def test_distill_20_error(self):
         with expect_raises_message(
             exc.ArgumentError, "mapping or list expected for parameters"
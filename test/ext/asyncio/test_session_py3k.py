@@ -163,6 +163,23 @@ class AsyncSessionQueryTest(AsyncFixture):
         u3 = await async_session.get(User, 12)
         is_(u3, None)
 
+    @async_test
+    async def test_get_by(self, async_engine):
+        User = self.classes.User
+
+        async_session = AsyncSession(
+            async_engine, identity_map_indexes={User: ["name"]}
+        )
+
+        u1 = await async_session.get_by(User, name="jack")
+        eq_(u1.id, 7)
+
+        u2 = await async_session.get_by(User, name="jack")
+        is_(u1, u2)
+
+        u3 = await async_session.get_by(User, name="nonexistent")
+        is_(u3, None)
+
     @async_test
     async def test_get_loader_options(self, async_session):
         User = self.classes.User
@@ -744,6 +761,36 @@ class AsyncORMBehaviorsTest(AsyncFixture):
                 1,
             )
 
+    @testing.combinations("write_only", "dynamic", argnames="lazy")
+    @async_test
+    async def test_iter_batches(self, async_session, registry, lazy):
+        @registry.mapped
+        class A:
+            __tablename__ = "a"
+
+            id = Column(Integer, primary_key=True)
+            bs = relationship("B", lazy=lazy)
+
+        @registry.mapped
+        class B:
+            __tablename__ = "b"
+            id = Column(Integer, primary_key=True)
+            a_id = Column(ForeignKey("a.id"))
+
+        async with async_session.bind.begin() as conn:
+            await conn.run_sync(registry.metadata.create_all)
+
+        a1 = A(id=1)
+        async_session.add(a1)
+        a1.bs.add_all([B(id=i) for i in range(1, 6)])
+        await async_session.commit()
+
+        a1 = await async_session.get(A, 1)
+        batches = []
+        async for batch in async_session.iter_batches(a1.bs, size=2):
+            batches.append([b.id for b in batch])
+        eq_(batches, [[1, 2], [3, 4], [5]])
+
 
 class AsyncEventTest(AsyncFixture):
     """The engine events all run in their normal synchronous context.
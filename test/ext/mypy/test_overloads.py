@@ -15,6 +15,7 @@ engine_execution_options = {
     "logging_token": "str",
     "isolation_level": "IsolationLevel",
     "insertmanyvalues_page_size": "int",
+    "insertmanyvalues_target_batch_time": "float",
     "schema_translate_map": "Optional[SchemaTranslateMapType]",
     "opt": "Any",
 }
@@ -29,6 +30,8 @@ core_execution_options = {
 orm_dql_execution_options = {
     **core_execution_options,
     "populate_existing": "bool",
+    "readonly_entities": "bool",
+    "concurrent_eager_loads": "bool",
     "autoflush": "bool",
 }
 
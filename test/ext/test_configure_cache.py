@@ -0,0 +1,359 @@
+import importlib
+import io
+import os
+import pickle
+import sys
+import tempfile
+
+import sqlalchemy
+from sqlalchemy import Column
+from sqlalchemy import ForeignKey
+from sqlalchemy import func
+from sqlalchemy import Integer
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import testing
+from sqlalchemy.ext import configure_cache
+from sqlalchemy.ext.configure_cache import ConfigureCache
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm import backref
+from sqlalchemy.orm import clear_mappers
+from sqlalchemy.orm import foreign
+from sqlalchemy.orm import registry
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import remote
+from sqlalchemy.orm.relationships import JoinCondition
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_raises_message
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_false
+from sqlalchemy.testing import is_true
+from sqlalchemy.testing import mock
+from sqlalchemy.testing.util import gc_collect
+from sqlalchemy.util import langhelpers
+
+
+class ConfigureCacheTest(fixtures.TestBase):
+    def setup_test(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "mappers.cache")
+
+    def teardown_test(self):
+        clear_mappers()
+        self.dir.cleanup()
+
+    def _mappings(self, extra_column=False):
+        """Generate a new set of mappings, which are the same each time
+        this is called, as though within a new process."""
+
+        reg = registry()
+        Base = reg.generate_base()
+
+        atob = Table(
+            "atob",
+            reg.metadata,
+            Column("a_id", ForeignKey("a.id"), primary_key=True),
+            Column("b_id", ForeignKey("b.id"), primary_key=True),
+        )
+
+        class A(Base):
+            __tablename__ = "a"
+
+            id = Column(Integer, primary_key=True)
+            parent_id = Column(ForeignKey("a.id"))
+            type = Column(String(20))
+            name = Column(String(50))
+            if extra_column:
+                data = Column(String(50))
+
+            children = relationship(
+                "A", backref=backref("parent", remote_side="A.id")
+            )
+            bs = relationship("B", secondary="atob", backref="as_")
+            name_bs = relationship(
+                "B",
+                primaryjoin=lambda: func.lower(A.name)
+                == foreign(remote(func.lower(B.name))),
+                viewonly=True,
+            )
+
+            __mapper_args__ = {
+                "polymorphic_on": type,
+                "polymorphic_identity": "a",
+            }
+
+        class ASub(A):
+            __tablename__ = "asub"
+
+            id = Column(ForeignKey("a.id"), primary_key=True)
+            c_id = Column(ForeignKey("c.id"))
+
+            c = relationship("C", back_populates="asubs")
+
+            __mapper_args__ = {"polymorphic_identity": "asub"}
+
+        class B(Base):
+            __tablename__ = "b"
+
+            id = Column(Integer, primary_key=True)
+            name = Column(String(50))
+
+        class C(Base):
+            __tablename__ = "c"
+
+            id = Column(Integer, primary_key=True)
+
+            asubs = relationship(ASub, back_populates="c", order_by=ASub.id)
+
+        return reg, atob, A, ASub, B, C
+
+    def _new_process(self):
+        clear_mappers()
+        gc_collect()
+
+    def _relationships(self, reg):
+        return {
+            (mapper.class_.__name__, prop.key): prop
+            for mapper in reg.mappers
+            for prop in mapper.relationships
+            if prop.parent is mapper
+        }
+
+    def _join(self, prop):
+        target = aliased(prop.entity, name="target")
+        return select(prop.parent).join(
+            getattr(prop.parent.class_, prop.key).of_type(target)
+        )
+
+    def _assert_same_configuration(self, expected, reg):
+        actual = self._relationships(reg)
+        eq_(set(actual), set(expected))
+        for key, prop in actual.items():
+            expected_prop = expected[key]
+            eq_(str(prop.primaryjoin), expected_prop["primaryjoin"])
+            eq_(str(prop.secondaryjoin), expected_prop["secondaryjoin"])
+            is_(prop.direction, expected_prop["direction"])
+            eq_(prop.order_by is False, expected_prop["order_by"])
+            eq_(
+                [(str(l), str(r)) for l, r in prop.local_remote_pairs],
+                expected_prop["local_remote_pairs"],
+            )
+            eq_(
+                [(str(l), str(r)) for l, r in prop.synchronize_pairs],
+                expected_prop["synchronize_pairs"],
+            )
+            eq_(str(self._join(prop).compile()), expected_prop["join"])
+
+    def _configuration(self, reg):
+        return {
+            key: {
+                "primaryjoin": str(prop.primaryjoin),
+                "secondaryjoin": str(prop.secondaryjoin),
+                "direction": prop.direction,
+                "order_by": prop.order_by is False,
+                "local_remote_pairs": [
+                    (str(l), str(r)) for l, r in prop.local_remote_pairs
+                ],
+                "synchronize_pairs": [
+                    (str(l), str(r)) for l, r in prop.synchronize_pairs
+                ],
+                "join": str(self._join(prop).compile()),
+            }
+            for key, prop in self._relationships(reg).items()
+        }
+
+    def test_restore(self):
+        reg = self._mappings()[0]
+        is_false(ConfigureCache(self.path).configure(reg))
+        is_true(os.path.exists(self.path))
+        expected = self._configuration(reg)
+
+        self._new_process()
+
+        reg = self._mappings()[0]
+        cache = ConfigureCache(self.path)
+        is_true(cache.configure(reg))
+        self._assert_same_configuration(expected, reg)
+
+    def test_restored_state_used(self):
+        reg = self._mappings()[0]
+        ConfigureCache(self.path).configure(reg)
+
+        self._new_process()
+
+        reg, atob, A, ASub, B, C = self._mappings()
+        with mock.patch.object(
+            JoinCondition, "_determine_joins", side_effect=AssertionError
+        ):
+            is_true(ConfigureCache(self.path).configure(reg))
+
+        # the restored join conditions refer to the new tables
+        is_(A.bs.property.secondary, atob)
+        is_(A.bs.property.primaryjoin.left.table, A.__table__)
+        is_(C.asubs.property.primaryjoin.right.table, ASub.__table__)
+        eq_(C.asubs.property.order_by, (ASub.__table__.c.id,))
+
+    def test_mappings_changed(self):
+        reg = self._mappings()[0]
+        is_false(ConfigureCache(self.path).configure(reg))
+
+        self._new_process()
+
+        reg = self._mappings(extra_column=True)[0]
+        is_false(ConfigureCache(self.path).configure(reg))
+        expected = self._configuration(reg)
+
+        self._new_process()
+
+        # the file was rewritten for the new mappings
+        reg = self._mappings(extra_column=True)[0]
+        is_true(ConfigureCache(self.path).configure(reg))
+        self._assert_same_configuration(expected, reg)
+
+    def test_key_changed(self):
+        reg = self._mappings()[0]
+        is_false(ConfigureCache(self.path, key="one").configure(reg))
+
+        self._new_process()
+
+        reg = self._mappings()[0]
+        is_false(ConfigureCache(self.path, key="two").configure(reg))
+
+        self._new_process()
+
+        reg = self._mappings()[0]
+        is_true(ConfigureCache(self.path, key="two").configure(reg))
+
+    def test_invalid_file(self):
+        with open(self.path, "wb") as file_:
+            file_.write(b"not a cache file")
+
+        reg = self._mappings()[0]
+        is_false(ConfigureCache(self.path).configure(reg))
+        expected = self._configuration(reg)
+
+        self._new_process()
+
+        reg = self._mappings()[0]
+        is_true(ConfigureCache(self.path).configure(reg))
+        self._assert_same_configuration(expected, reg)
+
+    @testing.combinations(
+        (exec, "builtins"),
+        (langhelpers._exec_code_in_env, "sqlalchemy.util.langhelpers"),
+        argnames="fn, module",
+    )
+    def test_untrusted_globals_not_loaded(self, fn, module):
+        code = "import sqlalchemy; sqlalchemy._cc_test_loaded = True"
+
+        class Untrusted:
+            def __reduce__(self):
+                if fn is exec:
+                    return (fn, (code,))
+                else:
+                    return (fn, (code, {}, "sqlalchemy"))
+
+        with open(self.path, "wb") as file_:
+            pickle.dump(Untrusted(), file_)
+
+        reg = self._mappings()[0]
+        is_false(ConfigureCache(self.path).configure(reg))
+        is_false(hasattr(sqlalchemy, "_cc_test_loaded"))
+
+        self._new_process()
+
+        # the file was replaced
+        reg = self._mappings()[0]
+        is_true(ConfigureCache(self.path).configure(reg))
+
+        unpickler = configure_cache._Unpickler(
+            io.BytesIO(pickle.dumps(Untrusted())), mock.Mock()
+        )
+        with expect_raises_message(
+            pickle.UnpicklingError,
+            f"global '{module}.{fn.__name__}' is not permitted",
+        ):
+            unpickler.load()
+
+    def test_unserializable_relationship(self):
+        reg, atob, A, ASub, B, C = self._mappings()
+
+        b_alias = aliased(B, select(B).where(B.id > 5).subquery())
+
+        A.high_bs = relationship(
+            b_alias, primaryjoin=A.id == foreign(b_alias.id), viewonly=True
+        )
+
+        ConfigureCache(self.path).configure(reg)
+        expected = self._configuration(reg)
+
+        self._new_process()
+
+        reg, atob, A, ASub, B, C = self._mappings()
+        b_alias = aliased(B, select(B).where(B.id > 5).subquery())
+        A.high_bs = relationship(
+            b_alias, primaryjoin=A.id == foreign(b_alias.id), viewonly=True
+        )
+
+        # the other relationships are restored; the relationship to the
+        # aliased class is configured in full
+        is_true(ConfigureCache(self.path).configure(reg))
+        self._assert_same_configuration(expected, reg)
+        is_(A.high_bs.property.entity, b_alias._aliased_insp)
+
+    def _mixin_mappings(self, primaryjoin):
+        """Generate mappings where a relationship is declared by a mixin
+        in a separate module, written with the given primaryjoin."""
+
+        with open(os.path.join(self.dir.name, "cc_mixin.py"), "w") as file_:
+            file_.write(
+                "from sqlalchemy.orm import declared_attr\n"
+                "from sqlalchemy.orm import relationship\n"
+                "\n"
+                "\n"
+                "class HasBs:\n"
+                "    @declared_attr\n"
+                "    def bs(cls):\n"
+                "        return relationship(\n"
+                "            'B',\n"
+                f"            primaryjoin={primaryjoin!r},\n"
+                "            viewonly=True,\n"
+                "        )\n"
+            )
+
+        sys.modules.pop("cc_mixin", None)
+        with mock.patch.object(sys, "dont_write_bytecode", True):
+            mixin = importlib.import_module("cc_mixin")
+
+        reg = registry()
+        Base = reg.generate_base()
+
+        class A(mixin.HasBs, Base):
+            __tablename__ = "a"
+
+            id = Column(Integer, primary_key=True)
+            b_id = Column(Integer)
+
+        class B(Base):
+            __tablename__ = "b"
+
+            id = Column(Integer, primary_key=True)
+
+        return reg, A
+
+    def test_mixin_changed(self):
+        sys.path.insert(0, self.dir.name)
+        try:
+            reg, A = self._mixin_mappings("A.id == foreign(B.id)")
+            is_false(ConfigureCache(self.path).configure(reg))
+
+            self._new_process()
+
+            reg, A = self._mixin_mappings("A.b_id == foreign(B.id)")
+            is_false(ConfigureCache(self.path).configure(reg))
+            eq_(str(A.bs.property.primaryjoin), "a.b_id = b.id")
+        finally:
+            sys.path.remove(self.dir.name)
+            sys.modules.pop("cc_mixin", None)
@@ -0,0 +1,226 @@
+from sqlalchemy import Column
+from sqlalchemy import exc
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import testing
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.ext.parallel_insert import parallel_insert
+from sqlalchemy.orm import Session
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_raises_message
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import mock
+from sqlalchemy.testing.fixtures import fixture_session
+
+
+class ParallelInsertTest(fixtures.DeclarativeMappedTest):
+    __backend__ = True
+
+    @classmethod
+    def setup_classes(cls):
+        Base = cls.DeclarativeBasic
+
+        class A(Base):
+            __tablename__ = "a"
+
+            id = Column(Integer, primary_key=True)
+            data = Column(String(50))
+            type = Column(String(20))
+
+            __mapper_args__ = {
+                "polymorphic_on": type,
+                "polymorphic_identity": "a",
+            }
+
+        class B(A):
+            __tablename__ = "b"
+
+            id = Column(ForeignKey("a.id"), primary_key=True)
+            b_data = Column(String(50))
+
+            __mapper_args__ = {"polymorphic_identity": "b"}
+
+    def _rows(self, num, fail_at=None):
+        for i in range(num):
+            if i == fail_at:
+                raise ValueError("rows failed")
+            yield {"data": "d%d" % i}
+
+    def _assert_data(self, num):
+        a = self.classes.A.__table__
+        with testing.db.connect() as conn:
+            eq_(
+                conn.scalars(select(a.c.data).order_by(a.c.id)).all(),
+                ["d%d" % i for i in range(num)],
+            )
+
+    def test_bad_concurrency(self):
+        with expect_raises_message(
+            exc.ArgumentError, "concurrency must be a positive integer"
+        ):
+            parallel_insert(
+                testing.db, self.classes.A.__table__, [], concurrency=0
+            )
+
+    def test_bad_target(self):
+        with expect_raises_message(
+            exc.ArgumentError,
+            "Table or mapped class expected for INSERT target; got 5",
+        ):
+            parallel_insert(testing.db, 5, [])
+
+    def test_core_single_connection(self):
+        result = parallel_insert(
+            testing.db,
+            self.classes.A.__table__,
+            self._rows(95),
+            concurrency=1,
+            batch_size=10,
+        )
+        eq_(result.rowcount, 95)
+        is_(result.primary_keys, None)
+        self._assert_data(95)
+
+    def test_rowcount_from_results(self):
+        with mock.patch.object(
+            CursorResult,
+            "rowcount",
+            new_callable=mock.PropertyMock,
+            return_value=7,
+        ):
+            result = parallel_insert(
+                testing.db,
+                self.classes.A.__table__,
+                self._rows(95),
+                concurrency=1,
+                batch_size=10,
+            )
+
+        # the rowcount reported for each of the ten batches
+        eq_(result.rowcount, 70)
+
+    def test_orm_session_closed(self):
+        A = self.classes.A
+
+        with mock.patch.object(
+            Session, "close", autospec=True, side_effect=Session.close
+        ) as close:
+            result = parallel_insert(
+                testing.db, A, self._rows(25), concurrency=1, batch_size=10
+            )
+        eq_(result.rowcount, 25)
+        eq_(close.call_count, 1)
+        self._assert_data(25)
+
+    @testing.requires.insert_executemany_returning
+    def test_core_return_primary_keys(self):
+        result = parallel_insert(
+            testing.db,
+            self.classes.A.__table__,
+            self._rows(95),
+            concurrency=1,
+            batch_size=10,
+            return_primary_keys=True,
+        )
+        eq_(result.rowcount, 95)
+
+        a = self.classes.A.__table__
+        with testing.db.connect() as conn:
+            eq_(
+                result.primary_keys,
+                [tuple(row) for row in conn.execute(select(a.c.id))],
+            )
+
+    @testing.requires.insert_executemany_returning
+    def test_orm_return_primary_keys(self):
+        B = self.classes.B
+
+        result = parallel_insert(
+            testing.db,
+            B,
+            ({"data": "d%d" % i, "b_data": "b%d" % i} for i in range(25)),
+            concurrency=1,
+            batch_size=10,
+            return_primary_keys=True,
+        )
+        eq_(result.rowcount, 25)
+        eq_(len(result.primary_keys), 25)
+
+        sess = fixture_session()
+        eq_(
+            [
+                (b.id, b.data, b.b_data)
+                for b in sess.scalars(select(B).order_by(B.id))
+            ],
+            [
+                (pk, "d%d" % i, "b%d" % i)
+                for i, (pk,) in enumerate(result.primary_keys)
+            ],
+        )
+
+    def test_single_connection_rollback(self):
+        with expect_raises_message(ValueError, "rows failed"):
+            parallel_insert(
+                testing.db,
+                self.classes.A.__table__,
+                self._rows(95, fail_at=50),
+                concurrency=1,
+                batch_size=10,
+            )
+        self._assert_data(0)
+
+    @testing.requires.independent_connections
+    @testing.skip_if("sqlite", "database-level write lock")
+    def test_threaded(self):
+        result = parallel_insert(
+            testing.db,
+            self.classes.A.__table__,
+            self._rows(95),
+            concurrency=3,
+            batch_size=10,
+        )
+        eq_(result.rowcount, 95)
+
+        a = self.classes.A.__table__
+        with testing.db.connect() as conn:
+            eq_(
+                set(conn.scalars(select(a.c.data))),
+                {"d%d" % i for i in range(95)},
+            )
+
+    @testing.requires.independent_connections
+    @testing.requires.insert_executemany_returning
+    @testing.skip_if("sqlite", "database-level write lock")
+    def test_threaded_return_primary_keys(self):
+        result = parallel_insert(
+            testing.db,
+            self.classes.A.__table__,
+            self._rows(95),
+            concurrency=3,
+            batch_size=10,
+            return_primary_keys=True,
+        )
+
+        a = self.classes.A.__table__
+        with testing.db.connect() as conn:
+            data_by_pk = dict(conn.execute(select(a.c.id, a.c.data)).all())
+        eq_(
+            [data_by_pk[pk] for pk, in result.primary_keys],
+            ["d%d" % i for i in range(95)],
+        )
+
+    @testing.requires.independent_connections
+    @testing.skip_if("sqlite", "database-level write lock")
+    def test_threaded_rollback(self):
+        with expect_raises_message(ValueError, "rows failed"):
+            parallel_insert(
+                testing.db,
+                self.classes.A.__table__,
+                self._rows(95, fail_at=50),
+                concurrency=3,
+                batch_size=10,
+            )
+        self._assert_data(0)
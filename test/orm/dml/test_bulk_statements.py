@@ -16,10 +16,13 @@ from sqlalchemy import select
 from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy import update
+from sqlalchemy import upsert
 from sqlalchemy.orm import aliased
+from sqlalchemy.orm import bulk_persistence
 from sqlalchemy.orm import load_only
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import Session
 from sqlalchemy.testing import config
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises_message
@@ -1114,6 +1117,258 @@ class BulkDMLReturningConcreteInhTest(
             }
 
 
+class BulkLoadStrategyTest(fixtures.DeclarativeMappedTest):
+    __backend__ = True
+
+    @classmethod
+    def setup_classes(cls):
+        decl_base = cls.DeclarativeBasic
+
+        class A(fixtures.ComparableEntity, decl_base):
+            __tablename__ = "a"
+            id: Mapped[int] = mapped_column(primary_key=True)
+            type: Mapped[str]
+            data: Mapped[str]
+            x: Mapped[Optional[int]] = mapped_column("xcol")
+
+            __mapper_args__ = {
+                "polymorphic_identity": "a",
+                "polymorphic_on": "type",
+            }
+
+        class B(A):
+            __tablename__ = "b"
+            id: Mapped[int] = mapped_column(
+                ForeignKey("a.id"), primary_key=True
+            )
+            bd: Mapped[str]
+
+            __mapper_args__ = {"polymorphic_identity": "b"}
+
+    def test_bulk_load(self):
+        A = self.classes.A
+
+        s = fixture_session()
+        s.execute(
+            insert(A).execution_options(dml_strategy="bulk_load"),
+            [
+                {"id": 1, "data": "d1", "x": 5},
+                {"id": 2, "data": "d2", "x": 6},
+                {"id": 3, "data": "d3"},
+            ],
+        )
+        eq_(
+            s.scalars(select(A).order_by(A.id)).all(),
+            [
+                A(id=1, type="a", data="d1", x=5),
+                A(id=2, type="a", data="d2", x=6),
+                A(id=3, type="a", data="d3", x=None),
+            ],
+        )
+
+    def test_bulk_load_iterator(self):
+        A = self.classes.A
+
+        s = fixture_session()
+        consumed = []
+
+        def mappings():
+            for i in range(1, 4):
+                consumed.append(i)
+                yield {"id": i, "data": f"d{i}"}
+
+        s.execute(
+            insert(A).execution_options(dml_strategy="bulk_load"),
+            mappings(),
+        )
+        eq_(consumed, [1, 2, 3])
+        eq_(
+            s.scalars(select(A).order_by(A.id)).all(),
+            [
+                A(id=1, type="a", data="d1", x=None),
+                A(id=2, type="a", data="d2", x=None),
+                A(id=3, type="a", data="d3", x=None),
+            ],
+        )
+
+    def test_bulk_load_no_sql_expressions(self):
+        A = self.classes.A
+
+        s = fixture_session()
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "The 'bulk_load' ORM insert strategy does not support SQL "
+            "expression values",
+        ):
+            s.execute(
+                insert(A).execution_options(dml_strategy="bulk_load"),
+                [
+                    {"id": 1, "data": "d1"},
+                    {"id": 2, "data": func.lower("D2")},
+                ],
+            )
+
+    def test_bulk_load_joined_inh(self):
+        B = self.classes.B
+
+        s = fixture_session()
+        s.execute(
+            insert(B).execution_options(dml_strategy="bulk_load"),
+            [
+                {"id": 1, "data": "d1", "bd": "bd1"},
+                {"id": 2, "data": "d2", "bd": "bd2"},
+            ],
+        )
+        eq_(
+            s.scalars(select(B).order_by(B.id)).all(),
+            [
+                B(id=1, type="b", data="d1", bd="bd1"),
+                B(id=2, type="b", data="d2", bd="bd2"),
+            ],
+        )
+
+    def test_bulk_load_joined_inh_count(self):
+        B = self.classes.B
+
+        s = fixture_session()
+        s.connection()
+        count = bulk_persistence._bulk_load(
+            inspect(B),
+            iter(
+                [
+                    {"id": 1, "data": "d1", "bd": "bd1"},
+                    {"id": 2, "data": "d2", "x": 5, "bd": "bd2"},
+                    {"id": 3, "data": "d3", "bd": "bd3"},
+                ]
+            ),
+            s._transaction,
+            render_nulls=False,
+        )
+
+        # three rows each for "a" and "b", the former in three groups of
+        # distinct keys
+        eq_(count, 6)
+        eq_(s.scalar(select(func.count()).select_from(B)), 3)
+
+    def test_bulk_load_joined_inh_needs_pks(self):
+        B = self.classes.B
+
+        s = fixture_session()
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "The 'bulk_load' ORM insert strategy requires primary key "
+            "values",
+        ):
+            s.execute(
+                insert(B).execution_options(dml_strategy="bulk_load"),
+                [{"data": "d1", "bd": "bd1"}],
+            )
+
+    def test_bulk_load_no_params(self):
+        A = self.classes.A
+
+        s = fixture_session()
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            'Can\'t use "bulk_load" ORM insert strategy without passing '
+            "separate parameters",
+        ):
+            s.execute(
+                insert(A)
+                .values(id=1, data="d1")
+                .execution_options(dml_strategy="bulk_load")
+            )
+
+    def test_bulk_load_no_returning(self):
+        A = self.classes.A
+
+        s = fixture_session()
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "The 'bulk_load' ORM insert strategy does not support RETURNING",
+        ):
+            s.execute(
+                insert(A)
+                .returning(A.id)
+                .execution_options(dml_strategy="bulk_load"),
+                [{"id": 1, "data": "d1"}],
+            )
+
+
+class UpsertTest(fixtures.DeclarativeMappedTest):
+    __requires__ = ("upsert",)
+    __backend__ = True
+
+    @classmethod
+    def setup_classes(cls):
+        decl_base = cls.DeclarativeBasic
+
+        class User(fixtures.ComparableEntity, decl_base):
+            __tablename__ = "users"
+            id: Mapped[int] = mapped_column(primary_key=True)
+            name: Mapped[str]
+            x: Mapped[Optional[int]] = mapped_column("xcol")
+
+    @classmethod
+    def insert_data(cls, connection):
+        User = cls.classes.User
+
+        s = Session(connection)
+        s.add_all([User(id=1, name="u1", x=1), User(id=2, name="u2", x=2)])
+        s.flush()
+
+    def test_upsert(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        s.execute(
+            upsert(User),
+            [
+                {"id": 2, "name": "new u2", "x": 5},
+                {"id": 3, "name": "u3", "x": 3},
+            ],
+        )
+        eq_(
+            s.scalars(select(User).order_by(User.id)).all(),
+            [
+                User(id=1, name="u1", x=1),
+                User(id=2, name="new u2", x=5),
+                User(id=3, name="u3", x=3),
+            ],
+        )
+
+    def test_upsert_update_columns(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        s.execute(
+            upsert(User).update_columns(User.x),
+            [
+                {"id": 2, "name": "new u2", "x": 5},
+                {"id": 3, "name": "u3", "x": 3},
+            ],
+        )
+        eq_(
+            s.scalars(select(User).order_by(User.id)).all(),
+            [
+                User(id=1, name="u1", x=1),
+                User(id=2, name="u2", x=5),
+                User(id=3, name="u3", x=3),
+            ],
+        )
+
+    @testing.requires.insert_executemany_returning
+    def test_upsert_returning_pks(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        ids = s.scalars(
+            upsert(User).returning(User.id),
+            [{"id": i, "name": "u%d" % i} for i in range(1, 5)],
+        ).all()
+        eq_(sorted(ids), [1, 2, 3, 4])
+
+
 class CTETest(fixtures.DeclarativeMappedTest):
     __requires__ = ("insert_returning", "ctes_on_dml")
     __backend__ = True
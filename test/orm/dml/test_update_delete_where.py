@@ -36,6 +36,7 @@ from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import in_
+from sqlalchemy.testing import mock
 from sqlalchemy.testing import not_in
 from sqlalchemy.testing.assertions import expect_raises_message
 from sqlalchemy.testing.assertsql import CompiledSQL
@@ -1760,6 +1761,78 @@ class UpdateDeleteTest(fixtures.MappedTest):
 
         assert john not in sess
 
+    @testing.combinations(
+        ("eq", "update"),
+        ("in", "update"),
+        ("in_and", "update"),
+        ("eq", "delete"),
+        ("in", "delete"),
+        ("in_and", "delete"),
+        argnames="criteria, stmt_type",
+    )
+    def test_evaluate_primary_key_criteria(self, criteria, stmt_type):
+        """criteria against the primary key locate objects by identity
+        key rather than scanning the identity map"""
+
+        User = self.classes.User
+
+        sess = fixture_session()
+        john, jack, jill, jane = sess.query(User).order_by(User.id).all()
+
+        if criteria == "eq":
+            crit = (User.id == 2,)
+            matched = {jack}
+        elif criteria == "in":
+            crit = (User.id.in_([1, 3, 5]),)
+            matched = {john, jill}
+        elif criteria == "in_and":
+            crit = (User.id.in_([1, 3]), User.name == "john")
+            matched = {john}
+
+        if stmt_type == "update":
+            stmt = update(User).where(*crit).values(age=10)
+        else:
+            stmt = delete(User).where(*crit)
+
+        with mock.patch.object(
+            sess.identity_map,
+            "all_states",
+            mock.Mock(side_effect=AssertionError("identity map scanned")),
+        ):
+            sess.execute(
+                stmt, execution_options={"synchronize_session": "evaluate"}
+            )
+
+        for user in (john, jack, jill, jane):
+            if stmt_type == "delete":
+                eq_(user in sess, user not in matched)
+            elif user in matched:
+                eq_(user.age, 10)
+            else:
+                assert user.age != 10
+
+    @testing.combinations("update", "delete", argnames="stmt_type")
+    def test_fetch_multiple_rows(self, stmt_type):
+        User = self.classes.User
+
+        sess = fixture_session()
+        john, jack, jill, jane = sess.query(User).order_by(User.id).all()
+
+        if stmt_type == "update":
+            stmt = update(User).where(User.age > 26).values(age=10)
+        else:
+            stmt = delete(User).where(User.age > 26)
+
+        sess.execute(stmt, execution_options={"synchronize_session": "fetch"})
+
+        if stmt_type == "update":
+            eq_([john.age, jack.age, jill.age, jane.age], [25, 10, 10, 10])
+        else:
+            eq_(
+                [u in sess for u in (john, jack, jill, jane)],
+                [True, False, False, False],
+            )
+
     def test_update_unordered_dict(self):
         User = self.classes.User
         session = fixture_session()
@@ -7,14 +7,17 @@ from sqlalchemy import testing
 from sqlalchemy import true
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm import defaultload
+from sqlalchemy.orm import defer
 from sqlalchemy.orm import join
 from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import subqueryload
 from sqlalchemy.orm import with_parent
 from sqlalchemy.orm import with_polymorphic
+from sqlalchemy.orm.context import ORMSelectCompileState
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import eq_
+from sqlalchemy.testing import is_
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.fixtures import fixture_session
 from ._poly_fixtures import _Polymorphic
@@ -50,6 +53,39 @@ class _PolymorphicTestBase:
             cls.tables.machines,
         )
 
+    def test_polymorphic_adapters_shared_among_options(self):
+        """the polymorphic adapters set up for an entity depend only on its
+        mapper and selectable, so are shared among statements which differ
+        only in their loader options."""
+
+        def polymorphic_adapters(*opts):
+            stmt = select(Person).options(*opts)
+            return ORMSelectCompileState.create_for_statement(
+                stmt, None
+            )._polymorphic_adapters
+
+        default = polymorphic_adapters()
+        for opts in [
+            (joinedload(Person.paperwork),),
+            (selectinload(Person.paperwork), defer(Person.name)),
+        ]:
+            adapters = polymorphic_adapters(*opts)
+            eq_(set(adapters), set(default))
+            for key, adapter in default.items():
+                is_(adapters[key], adapter)
+
+        sess = fixture_session()
+        eq_(
+            sess.scalars(
+                select(Person)
+                .options(joinedload(Person.paperwork))
+                .order_by(Person.person_id)
+            )
+            .unique()
+            .all(),
+            all_employees,
+        )
+
     @classmethod
     def insert_data(cls, connection):
         super(_PolymorphicTestBase, cls).insert_data(connection)
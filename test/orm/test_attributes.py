@@ -1736,10 +1736,15 @@ class PendingBackrefTest(fixtures.ORMTest):
 
 
 class HistoryTest(fixtures.TestBase):
+    track_changes = False
+
     def _fixture(self, uselist, useobject, active_history, **kw):
         class Foo(fixtures.BasicEntity):
             pass
 
+        if uselist and self.track_changes:
+            kw["track_changes"] = True
+
         instrumentation.register_class(Foo)
         _register_attribute(
             Foo,
@@ -1767,6 +1772,7 @@ class HistoryTest(fixtures.TestBase):
             uselist=uselist,
             useobject=True,
             active_history=active_history,
+            track_changes=uselist and self.track_changes,
         )
         return Foo, Bar
 
@@ -2886,6 +2892,13 @@ class HistoryTest(fixtures.TestBase):
         )
 
 
+class ChangesHistoryTest(HistoryTest):
+    """Run the history tests against collections that record changes
+    rather than copying the committed collection."""
+
+    track_changes = True
+
+
 class LazyloadHistoryTest(fixtures.TestBase):
     def test_lazy_backref_collections(self):
         # TODO: break into individual tests
@@ -0,0 +1,241 @@
+"""tests for the "batch" relationship loader strategy"""
+
+from sqlalchemy import exc
+from sqlalchemy import select
+from sqlalchemy import testing
+from sqlalchemy.orm import batchload
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import relationship
+from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import is_
+from sqlalchemy.testing.assertsql import CompiledSQL
+from sqlalchemy.testing.fixtures import fixture_session
+from test.orm import _fixtures
+
+
+class BatchLoadOptionTest(_fixtures.FixtureTest):
+    run_inserts = "once"
+    run_setup_mappers = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def test_one_to_many(self):
+        User, Address = self.classes("User", "Address")
+        sess = fixture_session()
+
+        users = sess.scalars(
+            select(User).options(batchload(User.addresses)).order_by(User.id)
+        ).all()
+
+        def go():
+            eq_(users, self.static.user_address_result)
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL(
+                "SELECT addresses.user_id AS addresses_user_id, "
+                "addresses.id AS addresses_id, addresses.email_address "
+                "AS addresses_email_address FROM addresses "
+                "WHERE addresses.user_id IN "
+                "(__[POSTCOMPILE_primary_keys]) ORDER BY addresses.id",
+                [{"primary_keys": [7, 8, 9, 10]}],
+            ),
+        )
+
+    def test_many_to_one(self):
+        User, Address = self.classes("User", "Address")
+        sess = fixture_session()
+
+        addresses = sess.scalars(
+            select(Address).options(batchload(Address.user))
+        ).all()
+
+        def go():
+            eq_(
+                [(a.id, a.user.id) for a in addresses],
+                [(1, 7), (2, 8), (3, 8), (4, 8), (5, 9)],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_chunk_size(self):
+        User = self.classes.User
+        sess = fixture_session()
+
+        users = sess.scalars(
+            select(User).options(batchload(User.addresses, chunk_size=3))
+        ).all()
+
+        def go():
+            for u in users:
+                u.addresses
+
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_separate_results(self):
+        User = self.classes.User
+        sess = fixture_session()
+
+        stmt = select(User).options(batchload(User.addresses))
+        u7 = sess.scalars(stmt.where(User.id == 7)).one()
+        others = sess.scalars(stmt.where(User.id != 7)).all()
+
+        def go():
+            eq_([a.id for a in u7.addresses], [1])
+
+        # a single object loads in the same way as a lazy load
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL(
+                "SELECT addresses.id AS addresses_id, "
+                "addresses.user_id AS addresses_user_id, "
+                "addresses.email_address AS addresses_email_address "
+                "FROM addresses WHERE :param_1 = addresses.user_id "
+                "ORDER BY addresses.id",
+                [{"param_1": 7}],
+            ),
+        )
+
+        def go():
+            for u in others:
+                u.addresses
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_many_to_one_identity_map(self):
+        User, Address = self.classes("User", "Address")
+        sess = fixture_session()
+
+        u8 = sess.get(User, 8)
+        a2 = sess.scalars(
+            select(Address)
+            .options(batchload(Address.user))
+            .where(Address.id == 2)
+        ).one()
+
+        # a single object uses the identity map as a lazy load would
+        is_(self.assert_sql_count(testing.db, lambda: a2.user, 0), u8)
+
+    def test_already_loaded_siblings(self):
+        User, Address = self.classes("User", "Address")
+        sess = fixture_session()
+
+        addresses = sess.scalars(
+            select(Address)
+            .options(batchload(Address.user))
+            .order_by(Address.id)
+        ).all()
+        u10 = sess.get(User, 10)
+        addresses[1].user = u10
+
+        eq_(addresses[0].user.id, 7)
+        is_(addresses[1].user, u10)
+        eq_(addresses[2].user.id, 8)
+
+    def test_expunged_siblings(self):
+        User = self.classes.User
+        sess = fixture_session()
+
+        users = sess.scalars(
+            select(User).options(batchload(User.addresses)).order_by(User.id)
+        ).all()
+        sess.expunge(users[1])
+
+        self.assert_sql_count(testing.db, lambda: users[0].addresses, 1)
+        assert "addresses" in users[2].__dict__
+        assert "addresses" not in users[1].__dict__
+
+    def test_sub_options(self):
+        User, Address = self.classes("User", "Address")
+        sess = fixture_session()
+
+        users = sess.scalars(
+            select(User).options(
+                batchload(User.addresses).joinedload(Address.dingaling)
+            )
+        ).all()
+
+        def go():
+            for u in users:
+                for a in u.addresses:
+                    a.dingaling
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_invalid_chunk_size(self):
+        User = self.classes.User
+        assert_raises_message(
+            exc.ArgumentError,
+            "chunk_size must be a positive integer or the string 'auto'",
+            batchload,
+            User.addresses,
+            chunk_size=0,
+        )
+
+
+class BatchLoadMappingTest(_fixtures.FixtureTest):
+    run_inserts = "once"
+    run_deletes = None
+
+    def test_mapping(self):
+        User, users = self.classes.User, self.tables.users
+        Address, addresses = self.classes.Address, self.tables.addresses
+
+        self.mapper_registry.map_imperatively(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address,
+                    lazy="batch",
+                    backref="user",
+                    order_by=addresses.c.id,
+                )
+            },
+        )
+        self.mapper_registry.map_imperatively(Address, addresses)
+        sess = fixture_session()
+
+        users = sess.scalars(select(User).order_by(User.id)).all()
+
+        def go():
+            eq_(users, self.static.user_address_result)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_overridden_by_option(self):
+        User, users = self.classes.User, self.tables.users
+        Address, addresses = self.classes.Address, self.tables.addresses
+
+        self.mapper_registry.map_imperatively(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address, lazy="batch", order_by=addresses.c.id
+                )
+            },
+        )
+        self.mapper_registry.map_imperatively(Address, addresses)
+        sess = fixture_session()
+
+        users = (
+            sess.scalars(
+                select(User)
+                .options(joinedload(User.addresses))
+                .order_by(User.id)
+            )
+            .unique()
+            .all()
+        )
+
+        def go():
+            eq_(users, self.static.user_address_result)
+
+        self.assert_sql_count(testing.db, go, 0)
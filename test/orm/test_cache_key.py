@@ -41,6 +41,8 @@ from sqlalchemy.testing import AssertsCompiledSQL
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import int_within_variance
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not
 from sqlalchemy.testing import ne_
 from sqlalchemy.testing.fixtures import DeclarativeMappedTest
 from sqlalchemy.testing.fixtures import fixture_session
@@ -307,6 +309,60 @@ class CacheKeyTest(fixtures.CacheKeyFixture, _fixtures.FixtureTest):
             compare_values=True,
         )
 
+    def test_reused_option_cache_key_memoized(self):
+        User, Order, Item = self.classes("User", "Order", "Item")
+
+        def option():
+            return (
+                selectinload(User.orders)
+                .selectinload(Order.items)
+                .defer(Item.description)
+            )
+
+        opt = option()
+        stmt = select(User).where(User.id == 5)
+        ck1 = stmt.options(opt)._generate_cache_key()
+        is_not(opt._memoized_static_cache_key, None)
+        for elem in opt.context:
+            is_not(elem._memoized_static_cache_key, None)
+
+        ck2 = stmt.options(opt)._generate_cache_key()
+        ck3 = stmt.options(option())._generate_cache_key()
+        eq_(ck1.key, ck2.key)
+        eq_(ck1.key, ck3.key)
+        eq_(len(ck1.bindparams), 1)
+
+        ne_(
+            ck1.key,
+            stmt.options(selectinload(User.orders).selectinload(Order.items))
+            ._generate_cache_key()
+            .key,
+        )
+
+    def test_option_cache_key_not_memoized(self):
+        User, Address, Order = self.classes("User", "Address", "Order")
+
+        ua = aliased(User)
+        for opt in [
+            joinedload(User.orders.and_(Order.id == 5)),
+            joinedload(User.addresses.of_type(aliased(Address))),
+            Load(ua).defer(ua.name),
+        ]:
+            ck1 = opt._generate_cache_key()
+            is_(opt._memoized_static_cache_key, None)
+
+            ck2 = opt._generate_cache_key()
+            eq_(ck1, ck2)
+
+        opt = joinedload(User.orders.and_(Order.id == 5))
+        ck = select(User).options(opt)._generate_cache_key()
+        eq_([b.value for b in ck.bindparams], [5])
+
+        opt = joinedload(User.orders.and_(Order.id == 7))
+        ck2 = select(User).options(opt)._generate_cache_key()
+        eq_(ck.key, ck2.key)
+        eq_([b.value for b in ck2.bindparams], [7])
+
     def test_selects_w_orm_joins(self):
 
         User, Address, Keyword, Order, Item = self.classes(
@@ -26,8 +26,11 @@ from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import AssertsCompiledSQL
 from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_raises
 from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_false
+from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.assertsql import Conditional
 from sqlalchemy.testing.fixtures import fixture_session
@@ -1022,6 +1025,210 @@ class WriteOnlyTest(
         )
 
 
+class _IterBatchesTests:
+    def test_iter_batches(self, user_address_fixture):
+        User, Address = user_address_fixture()
+
+        sess = fixture_session()
+        u = sess.get(User, 8)
+
+        batches = u.addresses.iter_batches(size=2)
+
+        def go():
+            eq_([a.id for a in next(batches)], [2, 3])
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL(
+                "SELECT addresses.id, addresses.user_id, "
+                "addresses.email_address FROM addresses "
+                "WHERE :param_1 = addresses.user_id "
+                "ORDER BY addresses.id LIMIT :param_2",
+                [{"param_1": 8, "param_2": 2}],
+            ),
+        )
+
+        def go():
+            eq_([a.id for a in next(batches)], [4])
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL(
+                "SELECT addresses.id, addresses.user_id, "
+                "addresses.email_address FROM addresses "
+                "WHERE :param_1 = addresses.user_id "
+                "AND addresses.id > :id_1 "
+                "ORDER BY addresses.id LIMIT :param_2",
+                [{"param_1": 8, "id_1": 3, "param_2": 2}],
+            ),
+        )
+
+        with expect_raises(StopIteration):
+            next(batches)
+
+    def test_iter_batches_order_by(self, user_address_fixture):
+        User, Address = user_address_fixture()
+
+        sess = fixture_session()
+        u = sess.get(User, 9)
+        u.addresses.add(Address(id=6, email_address="fred@fred.com"))
+        u.addresses.add(Address(id=7, email_address="fred@aaa.com"))
+        sess.flush()
+
+        eq_(
+            [
+                [a.id for a in batch]
+                for batch in u.addresses.iter_batches(
+                    size=2, order_by=[Address.email_address, Address.id]
+                )
+            ],
+            [[7, 5], [6]],
+        )
+
+    def test_iter_batches_expunge(self, user_address_fixture):
+        User, Address = user_address_fixture()
+
+        sess = fixture_session()
+        u = sess.get(User, 8)
+
+        batches = u.addresses.iter_batches(size=2)
+        a2, a3 = next(batches)
+        a2.email_address = "modified"
+        (a4,) = next(batches)
+
+        assert u in sess
+        assert a2 in sess
+        assert a3 not in sess
+        assert a4 in sess
+
+        with expect_raises(StopIteration):
+            next(batches)
+        assert a4 not in sess
+
+    def test_iter_batches_expunge_held_objects(self, user_address_fixture):
+        User, Address = user_address_fixture()
+
+        sess = fixture_session()
+        u = sess.get(User, 8)
+        held = sess.get(Address, 3)
+
+        batches = u.addresses.iter_batches(size=2)
+        eq_([a.id for a in next(batches)], [2, 3])
+
+        # loaded by the application before the second batch is loaded
+        held_during = sess.get(Address, 4)
+        eq_(next(batches), [held_during])
+        with expect_raises(StopIteration):
+            next(batches)
+
+        # objects that were in the session before their batch was loaded
+        # are not expunged
+        assert held in sess
+        assert held_during in sess
+
+        held.email_address = "modified"
+        sess.commit()
+        eq_(
+            sess.scalar(select(Address.email_address).where(Address.id == 3)),
+            "modified",
+        )
+
+    def test_iter_batches_expunge_no_identity_map_scan(
+        self, user_address_fixture
+    ):
+        User, Address = user_address_fixture()
+
+        sess = fixture_session()
+        u = sess.get(User, 8)
+
+        with mock.patch.object(
+            sess.identity_map,
+            "all_states",
+            mock.Mock(side_effect=AssertionError("identity map scanned")),
+        ):
+            eq_(
+                [
+                    [a.id for a in batch]
+                    for batch in u.addresses.iter_batches(size=2)
+                ],
+                [[2, 3], [4]],
+            )
+
+        # the listener used to track loaded objects is removed
+        is_false(sess.dispatch.loaded_as_persistent)
+        eq_(list(sess.identity_map.keys()), [sess.identity_key(instance=u)])
+
+    def test_iter_batches_no_expunge(self, user_address_fixture):
+        User, Address = user_address_fixture()
+
+        sess = fixture_session()
+        u = sess.get(User, 8)
+
+        addresses = [
+            a
+            for batch in u.addresses.iter_batches(size=2, expunge=False)
+            for a in batch
+        ]
+        eq_([a.id for a in addresses], [2, 3, 4])
+        for a in addresses:
+            assert a in sess
+
+    def test_iter_batches_invalid_size(self, user_address_fixture):
+        User, Address = user_address_fixture()
+
+        sess = fixture_session()
+        u = sess.get(User, 8)
+
+        with expect_raises_message(
+            exc.ArgumentError, "size must be a positive integer; got 0"
+        ):
+            u.addresses.iter_batches(size=0)
+
+
+class DynamicIterBatchesTest(
+    _DynamicFixture,
+    _IterBatchesTests,
+    _fixtures.FixtureTest,
+    testing.AssertsExecutionResults,
+):
+    def test_iter_batches_transient(self, user_address_fixture):
+        User, Address = user_address_fixture()
+
+        u = User(
+            addresses=[Address(email_address="a%d" % i) for i in range(3)]
+        )
+        eq_(
+            [
+                [a.email_address for a in batch]
+                for batch in u.addresses.iter_batches(size=2)
+            ],
+            [["a0", "a1"], ["a2"]],
+        )
+
+
+class WriteOnlyIterBatchesTest(
+    _WriteOnlyFixture,
+    _IterBatchesTests,
+    _fixtures.FixtureTest,
+    testing.AssertsExecutionResults,
+):
+    def test_iter_batches_detached(self, user_address_fixture):
+        User, Address = user_address_fixture()
+
+        sess = fixture_session()
+        u = sess.get(User, 8)
+        sess.expunge(u)
+
+        with expect_raises_message(
+            orm_exc.DetachedInstanceError,
+            "Parent instance .* is not bound to a Session; can't iterate "
+            "through attribute 'addresses'",
+        ):
+            u.addresses.iter_batches()
+
+
 class _UOWTests:
     run_inserts = None
 
@@ -2720,6 +2720,171 @@ class SessionEventsTest(_RemoveListeners, _fixtures.FixtureTest):
         assert "name" not in u1.__dict__
 
 
+class FlushStatsEventTest(_RemoveListeners, _fixtures.FixtureTest):
+    run_inserts = None
+
+    def _stats_fixture(self):
+        User, users = self.classes.User, self.tables.users
+        Address, addresses = self.classes.Address, self.tables.addresses
+
+        self.mapper_registry.map_imperatively(
+            User, users, properties={"addresses": relationship(Address)}
+        )
+        self.mapper_registry.map_imperatively(Address, addresses)
+
+        sess = fixture_session()
+        canary = []
+
+        @event.listens_for(sess, "after_flush_stats")
+        def after_flush_stats(session, flush_context, stats):
+            canary.append(stats)
+
+        return sess, canary
+
+    def test_not_collected_without_listener(self):
+        User, users = self.classes.User, self.tables.users
+        self.mapper_registry.map_imperatively(User, users)
+
+        sess = fixture_session()
+        canary = Mock()
+        event.listen(
+            sess,
+            "after_flush",
+            lambda session, flush_context: canary(flush_context.stats),
+        )
+        sess.add(User(id=1, name="u1"))
+        sess.flush()
+        eq_(canary.mock_calls, [call(None)])
+
+    def test_event_order(self):
+        User, users = self.classes.User, self.tables.users
+        self.mapper_registry.map_imperatively(User, users)
+
+        sess = fixture_session()
+        canary = Mock()
+        event.listen(sess, "after_flush_postexec", canary.postexec)
+        event.listen(sess, "after_flush_stats", canary.stats)
+
+        sess.add(User(id=1, name="u1"))
+        sess.flush()
+        eq_(
+            canary.mock_calls,
+            [call.postexec(sess, ANY), call.stats(sess, ANY, ANY)],
+        )
+
+    def test_counts(self):
+        User, Address = self.classes("User", "Address")
+        sess, canary = self._stats_fixture()
+
+        u1 = User(
+            id=1,
+            name="u1",
+            addresses=[
+                Address(id=1, email_address="a1"),
+                Address(id=2, email_address="a2"),
+            ],
+        )
+        u2 = User(id=2, name="u2")
+        sess.add_all([u1, u2])
+        sess.flush()
+
+        u1.name = "u1new"
+        sess.delete(u2)
+        sess.flush()
+
+        stats1, stats2 = canary
+        user_mapper, address_mapper = (
+            inspect(User).base_mapper,
+            inspect(Address).base_mapper,
+        )
+
+        eq_(set(stats1.mappers), {user_mapper, address_mapper})
+        eq_(dict(stats1.mappers[user_mapper].rows), {"insert": 2})
+        eq_(dict(stats1.mappers[user_mapper].statements), {"executemany": 1})
+        eq_(dict(stats1.mappers[address_mapper].rows), {"insert": 2})
+        eq_(dict(stats1.rows), {"insert": 4})
+        eq_(dict(stats1.statements), {"executemany": 2})
+
+        eq_(dict(stats2.mappers[user_mapper].rows), {"update": 1, "delete": 1})
+        eq_(dict(stats2.statements), {"execute": 2})
+
+    def test_phases(self):
+        User, Address = self.classes("User", "Address")
+        sess, canary = self._stats_fixture()
+
+        sess.add(
+            User(
+                id=1, name="u1", addresses=[Address(id=1, email_address="a1")]
+            )
+        )
+        sess.flush()
+
+        (stats,) = canary
+        eq_(set(stats.phases), {"presort", "sort", "process", "finalize"})
+        user_stats = stats.mappers[inspect(User).base_mapper]
+        eq_(
+            set(user_stats.phases),
+            {"organize", "dependencies", "execute", "postfetch", "finalize"},
+        )
+        assert stats.total_time >= sum(stats.phases.values())
+        assert stats.phases["process"] >= sum(user_stats.phases.values())
+
+
+class FlushStatsInheritanceTest(
+    _RemoveListeners, fixtures.DeclarativeMappedTest
+):
+    @classmethod
+    def setup_classes(cls):
+        Base = cls.DeclarativeBasic
+
+        class A(Base):
+            __tablename__ = "a"
+
+            id = Column(Integer, primary_key=True)
+            data = Column(String(50))
+            type = Column(String(20))
+
+            __mapper_args__ = {
+                "polymorphic_on": type,
+                "polymorphic_identity": "a",
+            }
+
+        class B(A):
+            __tablename__ = "b"
+
+            id = Column(ForeignKey("a.id"), primary_key=True)
+            b_data = Column(String(50))
+
+            __mapper_args__ = {"polymorphic_identity": "b"}
+
+    def test_joined_inheritance_counts(self):
+        A, B = self.classes("A", "B")
+
+        sess = fixture_session()
+        canary = []
+
+        @event.listens_for(sess, "after_flush_stats")
+        def after_flush_stats(session, flush_context, stats):
+            canary.append(stats)
+
+        sess.add_all([A(id=1), B(id=2), B(id=3)])
+        sess.flush()
+
+        (stats,) = canary
+        a_mapper, b_mapper = inspect(A), inspect(B)
+
+        # statements are recorded for the mapper of each table
+        eq_(set(stats.mappers), {a_mapper, b_mapper})
+        eq_(dict(stats.mappers[a_mapper].rows), {"insert": 3})
+        eq_(dict(stats.mappers[b_mapper].rows), {"insert": 2})
+        eq_(dict(stats.rows), {"insert": 5})
+
+        # organizing the hierarchy is recorded for the base mapper
+        assert "organize" in stats.mappers[a_mapper].phases
+        assert "organize" not in stats.mappers[b_mapper].phases
+        assert "execute" in stats.mappers[b_mapper].phases
+
+
 class SessionLifecycleEventsTest(_RemoveListeners, _fixtures.FixtureTest):
     run_inserts = None
 
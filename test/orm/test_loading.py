@@ -1,11 +1,21 @@
+import operator
+
 from sqlalchemy import exc
+from sqlalchemy import inspect
 from sqlalchemy import literal
 from sqlalchemy import literal_column
 from sqlalchemy import select
 from sqlalchemy import testing
 from sqlalchemy import text
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm import defer
+from sqlalchemy.orm import exc as orm_exc
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import loading
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import subqueryload
+from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertions import assert_raises
@@ -143,6 +153,58 @@ class InstanceProcessorTest(_fixtures.FixtureTest):
 
         self.assert_sql_count(testing.db, go, 1)
 
+    def test_generate_populate_quick(self):
+        getter = operator.itemgetter(1)
+        other_getter = mock.Mock(return_value="other")
+
+        populate_quick = loading._generate_populate_quick(
+            {
+                "quick": [("a", getter), ("b", other_getter)],
+                "expire": [("c", True), ("d", False)],
+            },
+            {getter: 1},
+        )
+
+        state = mock.Mock(expired_attributes=set())
+        row = mock.Mock(_data=("x", "y"))
+        dict_ = {}
+        populate_quick(state, dict_, row)
+
+        eq_(dict_, {"a": "y", "b": "other"})
+        eq_(state.expired_attributes, {"c"})
+        eq_(other_getter.mock_calls, [mock.call(row)])
+
+    @testing.combinations(
+        (False, False), (True, False), (False, True), argnames="alias, defer_"
+    )
+    def test_populate_quick_load(self, alias, defer_):
+        User = self.classes.User
+        users = self.tables.users
+
+        self.mapper_registry.map_imperatively(User, users)
+
+        s = fixture_session()
+        entity = aliased(User) if alias else User
+        stmt = select(entity).order_by(entity.id)
+        if defer_:
+            stmt = stmt.options(defer(entity.name))
+
+        for _ in range(2):
+            s.expunge_all()
+            result = s.scalars(stmt).all()
+            eq_(
+                [(u.id, u.__dict__.get("name")) for u in result],
+                [
+                    (7, None if defer_ else "jack"),
+                    (8, None if defer_ else "ed"),
+                    (9, None if defer_ else "fred"),
+                    (10, None if defer_ else "chuck"),
+                ],
+            )
+
+        if defer_:
+            eq_(result[0].name, "jack")
+
 
 class InstancesTest(_fixtures.FixtureTest):
     run_setup_mappers = "once"
@@ -199,6 +261,149 @@ class InstancesTest(_fixtures.FixtureTest):
         )
 
 
+class ReadonlyEntitiesTest(_fixtures.FixtureTest):
+    run_setup_mappers = "once"
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def test_plain_instances(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        users = s.scalars(
+            select(User)
+            .order_by(User.id)
+            .execution_options(readonly_entities=True)
+        ).all()
+
+        eq_(
+            [(u.id, u.name) for u in users],
+            [(7, "jack"), (8, "ed"), (9, "fred"), (10, "chuck")],
+        )
+        eq_(len(s.identity_map), 0)
+        for u in users:
+            is_(inspect(u, raiseerr=False), None)
+
+    def test_plain_instances_not_modifiable(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        user = s.scalars(
+            select(User)
+            .filter_by(id=7)
+            .execution_options(readonly_entities=True)
+        ).one()
+
+        for fn in (
+            lambda: setattr(user, "name", "new name"),
+            lambda: delattr(user, "name"),
+            lambda: user.addresses,
+            lambda: s.add(user),
+        ):
+            with expect_raises_message(
+                orm_exc.UnmappedInstanceError,
+                "loaded using the 'readonly_entities' execution option",
+            ):
+                fn()
+
+        with expect_raises_message(
+            exc.NoInspectionAvailable, "No inspection system"
+        ):
+            inspect(user)
+        eq_(user.name, "jack")
+
+    def test_plain_instances_uniqued(self):
+        User, Address = self.classes("User", "Address")
+
+        s = fixture_session()
+        rows = s.execute(
+            select(User, Address)
+            .join(User.addresses)
+            .order_by(Address.id)
+            .execution_options(readonly_entities=True)
+        ).all()
+
+        eq_(len(rows), 5)
+        is_(rows[1][0], rows[2][0])
+        eq_(len(s.identity_map), 0)
+
+    @testing.combinations(joinedload, selectinload, subqueryload)
+    def test_eager_load(self, loader):
+        User = self.classes.User
+
+        s = fixture_session()
+        users = (
+            s.scalars(
+                select(User)
+                .order_by(User.id)
+                .options(loader(User.addresses))
+                .execution_options(readonly_entities=True)
+            )
+            .unique()
+            .all()
+        )
+
+        def go():
+            eq_(
+                [(u.id, [a.id for a in u.addresses]) for u in users],
+                [(7, [1]), (8, [2, 3, 4]), (9, [5]), (10, [])],
+            )
+
+        self.assert_sql_count(testing.db, go, 0)
+
+        eq_(len(s.identity_map), 0)
+        is_true(inspect(users[0]).detached)
+
+    def test_state_established_for_plain_instance(self):
+        User, Address = self.classes("User", "Address")
+
+        s = fixture_session()
+        rows = s.execute(
+            select(Address, User)
+            .join(Address.user)
+            .order_by(Address.id)
+            .options(joinedload(Address.user), selectinload(User.orders))
+            .execution_options(readonly_entities=True)
+        ).all()
+
+        def go():
+            for address, user in rows:
+                is_(address.user, user)
+            eq_(
+                [(user.id, [o.id for o in user.orders]) for _, user in rows],
+                [
+                    (7, [1, 3, 5]),
+                    (8, []),
+                    (8, []),
+                    (8, []),
+                    (9, [2, 4]),
+                ],
+            )
+
+        self.assert_sql_count(testing.db, go, 0)
+        eq_(inspect(rows[0][1]).key[1], (7,))
+
+    def test_no_lazyload(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        user = s.scalars(
+            select(User)
+            .filter_by(id=7)
+            .options(selectinload(User.orders))
+            .execution_options(readonly_entities=True)
+        ).one()
+
+        with expect_raises_message(
+            orm_exc.DetachedInstanceError, "lazy load operation"
+        ):
+            user.addresses
+
+
 class MergeResultTest(_fixtures.FixtureTest):
     run_setup_mappers = "once"
     run_inserts = "once"
@@ -414,6 +414,65 @@ class MapperTest(_fixtures.FixtureTest, AssertsCompiledSQL):
         assert User.addresses
         assert m.registry._new_mappers is False
 
+    def test_mappers_to_configure_only_new(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        mp = self.mapper(User, users)
+        eq_(list(mp.registry._mappers_to_configure()), [mp])
+        configure_mappers()
+        eq_(list(mp.registry._mappers_to_configure()), [])
+        eq_(list(mp.registry._unconfigured_mappers), [])
+
+        m = self.mapper(Address, addresses)
+        eq_(list(mp.registry._mappers_to_configure()), [m])
+        configure_mappers()
+        assert m.configured
+        eq_(list(mp.registry._mappers_to_configure()), [])
+        eq_(list(mp.registry._unconfigured_mappers), [])
+
+    def test_equivalent_columns_shared_in_hierarchy(self):
+        metadata = MetaData()
+        a = Table("a", metadata, Column("id", Integer, primary_key=True))
+        b = Table(
+            "b",
+            metadata,
+            Column("id", Integer, ForeignKey("a.id"), primary_key=True),
+        )
+        c = Table(
+            "c",
+            metadata,
+            Column("id", Integer, ForeignKey("b.id"), primary_key=True),
+        )
+
+        class A:
+            pass
+
+        class B(A):
+            pass
+
+        class C(B):
+            pass
+
+        am = self.mapper(A, a)
+        bm = self.mapper(B, b, inherits=A)
+        configure_mappers()
+        is_(bm._equivalent_columns, am._equivalent_columns)
+        eq_(am._equivalent_columns, {a.c.id: {b.c.id}, b.c.id: {a.c.id}})
+
+        # a mapper added to the hierarchy later on adds to the map
+        # seen by the existing mappers
+        cm = self.mapper(C, c, inherits=B)
+        is_(cm._equivalent_columns, am._equivalent_columns)
+        eq_(
+            bm._equivalent_columns,
+            {a.c.id: {b.c.id}, b.c.id: {a.c.id, c.c.id}, c.c.id: {b.c.id}},
+        )
+
     def test_configure_on_session(self):
         User, users = self.classes.User, self.tables.users
 
@@ -255,6 +255,36 @@ class PickleTest(fixtures.MappedTest):
         sess.add(u2)
         assert u2.addresses
 
+    def test_instance_batch_relation_loaders(self):
+        users, addresses = (self.tables.users, self.tables.addresses)
+
+        self.mapper_registry.map_imperatively(
+            User,
+            users,
+            properties={"addresses": relationship(Address, lazy="batch")},
+        )
+        self.mapper_registry.map_imperatively(Address, addresses)
+
+        sess = fixture_session()
+        sess.add_all(
+            [
+                User(
+                    name="ed", addresses=[Address(email_address="ed@bar.com")]
+                ),
+                User(name="jack"),
+            ]
+        )
+        sess.commit()
+        sess.close()
+
+        u1, u2 = sess.query(User).order_by(User.name).all()
+        u1, u2 = pickle.loads(pickle.dumps([u1, u2]))
+
+        sess = fixture_session()
+        sess.add_all([u1, u2])
+        eq_(len(u1.addresses), 1)
+        eq_(u2.addresses, [])
+
     def test_lazyload_extra_criteria_not_supported(self):
         users, addresses = (self.tables.users, self.tables.addresses)
 
@@ -313,6 +343,50 @@ class PickleTest(fixtures.MappedTest):
         u2.addresses.append(Address())
         eq_(len(u2.addresses), 2)
 
+    def test_collection_changes_pickle(self):
+        users, addresses = (self.tables.users, self.tables.addresses)
+
+        self.mapper_registry.map_imperatively(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address,
+                    collection_tracking="changes",
+                    order_by=addresses.c.id,
+                )
+            },
+        )
+        self.mapper_registry.map_imperatively(Address, addresses)
+
+        sess = fixture_session()
+        u1 = User(
+            name="ed",
+            addresses=[Address(email_address="a%d" % i) for i in range(3)],
+        )
+        sess.add(u1)
+        sess.commit()
+
+        u1.addresses.remove(u1.addresses[0])
+        u1.addresses.append(Address(email_address="a3"))
+        sess.expunge_all()
+
+        u2 = pickle.loads(pickle.dumps(u1))
+        eq_(
+            [
+                [a.email_address for a in coll]
+                for coll in attributes.get_history(u2, "addresses")
+            ],
+            [["a3"], ["a1", "a2"], ["a0"]],
+        )
+
+        sess.add(u2)
+        sess.commit()
+        eq_(
+            [a.email_address for a in u2.addresses],
+            ["a1", "a2", "a3"],
+        )
+
     def test_invalidated_flag_deepcopy(self):
         users, addresses = (self.tables.users, self.tables.addresses)
 
@@ -3093,6 +3093,117 @@ class SliceTest(QueryTest):
         )
 
 
+class KeysetPaginationTest(QueryTest, AssertsCompiledSQL):
+    __dialect__ = "default"
+
+    def _pages(self, execute, stmt, size=2):
+        pages = []
+        bookmark = None
+        paged = stmt.limit(size)
+        while True:
+            rows = execute(paged.keyset_after(bookmark))
+            if not rows:
+                break
+            pages.append(rows)
+            bookmark = paged.keyset_bookmark(rows[-1])
+        return pages
+
+    def test_entity(self):
+        Address = self.classes.Address
+
+        sess = fixture_session()
+        stmt = select(Address).order_by(
+            Address.email_address.desc(), Address.id
+        )
+
+        pages = self._pages(lambda stmt: sess.scalars(stmt).all(), stmt)
+        eq_(
+            [[a.id for a in page] for page in pages],
+            [[1, 5], [2, 4], [3]],
+        )
+
+    def test_entity_table_column(self):
+        User = self.classes.User
+        users = self.tables.users
+
+        sess = fixture_session()
+        stmt = select(User).order_by(users.c.name)
+        eq_(stmt.keyset_bookmark(sess.get(User, 8)), ("ed",))
+
+    def test_aliased_entity(self):
+        User = self.classes.User
+
+        ua = aliased(User)
+        sess = fixture_session()
+        stmt = select(User, ua).where(ua.id == User.id).order_by(ua.id.desc())
+
+        pages = self._pages(lambda stmt: sess.execute(stmt).all(), stmt)
+        eq_(
+            [[u.id for u, _ in page] for page in pages],
+            [[10, 9], [8, 7]],
+        )
+
+        u1 = sess.get(User, 7)
+        with expect_raises_message(
+            sa_exc.InvalidRequestError,
+            "ORDER BY expression .*id is not present in the columns "
+            "clause of the statement",
+        ):
+            select(User).order_by(ua.id).keyset_bookmark(u1)
+
+    def test_columns(self):
+        User, Address = self.classes("User", "Address")
+
+        sess = fixture_session()
+        stmt = (
+            select(User.name, Address.id)
+            .join(User.addresses)
+            .order_by(User.name, Address.id.desc())
+        )
+
+        pages = self._pages(lambda stmt: sess.execute(stmt).all(), stmt)
+        eq_(
+            pages,
+            [
+                [("ed", 4), ("ed", 3)],
+                [("ed", 2), ("fred", 5)],
+                [("jack", 1)],
+            ],
+        )
+
+    def test_legacy_query(self):
+        User = self.classes.User
+
+        sess = fixture_session()
+        q = sess.query(User).order_by(User.name.desc(), User.id)
+
+        pages = self._pages(lambda q: q.all(), q, size=3)
+        eq_(
+            [[u.name for u in page] for page in pages],
+            [["jack", "fred", "ed"], ["chuck"]],
+        )
+
+    def test_legacy_query_compile(self):
+        User = self.classes.User
+
+        sess = fixture_session()
+        q = (
+            sess.query(User.id)
+            .order_by(User.name, User.id)
+            .limit(5)
+            .keyset_after(("ed", 8))
+        )
+        self.assert_compile(
+            q,
+            "SELECT users.id AS users_id FROM users "
+            "WHERE users.name >= :name_1 AND "
+            "(users.name > :name_1 OR users.name = :name_1 "
+            "AND users.id > :id_1) ORDER BY users.name, users.id "
+            "LIMIT :param_1",
+            checkparams={"name_1": "ed", "id_1": 8, "param_1": 5},
+        )
+
+
 class FilterTest(QueryTest, AssertsCompiledSQL):
     __dialect__ = "default"
 
@@ -31,6 +31,7 @@ from sqlalchemy.orm import subqueryload
 from sqlalchemy.orm import synonym
 from sqlalchemy.orm.interfaces import MANYTOONE
 from sqlalchemy.orm.interfaces import ONETOMANY
+from sqlalchemy.orm.state import CollectionChanges
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import assert_warns_message
@@ -5670,6 +5671,129 @@ class ActiveHistoryFlagTest(_fixtures.FixtureTest):
         self._test_attribute(o1, "composite", MyComposite("bar", 1))
 
 
+class CollectionTrackingTest(_fixtures.FixtureTest):
+    run_inserts = None
+
+    def _o2m_fixture(self, collection_tracking):
+        Address, addresses, users, User = (
+            self.classes.Address,
+            self.tables.addresses,
+            self.tables.users,
+            self.classes.User,
+        )
+
+        self.mapper_registry.map_imperatively(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address,
+                    collection_tracking=collection_tracking,
+                    order_by=addresses.c.id,
+                )
+            },
+        )
+        self.mapper_registry.map_imperatively(Address, addresses)
+
+        sess = fixture_session()
+        u1 = User(
+            name="u1",
+            addresses=[Address(email_address="a%d" % i) for i in range(1, 5)],
+        )
+        sess.add(u1)
+        sess.commit()
+        return sess, u1
+
+    @testing.combinations(("snapshot",), ("changes",), argnames="tracking")
+    def test_one_to_many_history(self, tracking):
+        Address = self.classes.Address
+
+        sess, u1 = self._o2m_fixture(tracking)
+        a1, a2, a3, a4 = u1.addresses
+
+        a5 = Address(email_address="a5")
+        u1.addresses.append(a5)
+        u1.addresses.remove(a2)
+        u1.addresses.append(a2)
+        u1.addresses.remove(a3)
+
+        if tracking == "changes":
+            is_(
+                type(inspect(u1).committed_state["addresses"]),
+                CollectionChanges,
+            )
+        else:
+            is_(type(inspect(u1).committed_state["addresses"]), list)
+
+        eq_(
+            attributes.get_history(u1, "addresses"),
+            ([a5], [a1, a4, a2], [a3]),
+        )
+
+        sess.commit()
+        eq_(
+            [a.email_address for a in u1.addresses],
+            ["a1", "a2", "a4", "a5"],
+        )
+        is_(a3.user_id, None)
+
+    @testing.combinations(("snapshot",), ("changes",), argnames="tracking")
+    def test_many_to_many_flush(self, tracking):
+        Item, items, Keyword, keywords, item_keywords = (
+            self.classes.Item,
+            self.tables.items,
+            self.classes.Keyword,
+            self.tables.keywords,
+            self.tables.item_keywords,
+        )
+
+        self.mapper_registry.map_imperatively(
+            Item,
+            items,
+            properties={
+                "keywords": relationship(
+                    Keyword,
+                    secondary=item_keywords,
+                    collection_tracking=tracking,
+                    collection_class=set,
+                )
+            },
+        )
+        self.mapper_registry.map_imperatively(Keyword, keywords)
+
+        sess = fixture_session()
+        k1, k2, k3 = (Keyword(name="k%d" % i) for i in range(1, 4))
+        i1 = Item(description="i1", keywords={k1, k2})
+        sess.add(i1)
+        sess.commit()
+
+        i1.keywords.discard(k1)
+        i1.keywords.add(k3)
+        i1.keywords.add(k2)
+        eq_(
+            attributes.get_history(i1, "keywords"),
+            ([k3], [k2], [k1]),
+        )
+        sess.commit()
+
+        eq_(
+            sess.execute(
+                select(item_keywords.c.keyword_id).order_by(
+                    item_keywords.c.keyword_id
+                )
+            ).all(),
+            [(k2.id,), (k3.id,)],
+        )
+
+    def test_invalid_argument(self):
+        with expect_raises_message(
+            exc.ArgumentError,
+            "collection_tracking must be one of 'snapshot' or 'changes'; "
+            "got 'copy'",
+        ):
+            relationship("Address", collection_tracking="copy")
+
+
 class InactiveHistoryNoRaiseTest(_fixtures.FixtureTest):
     run_inserts = None
 
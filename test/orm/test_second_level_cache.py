@@ -0,0 +1,493 @@
+from sqlalchemy import Column
+from sqlalchemy import delete
+from sqlalchemy import event
+from sqlalchemy import exc
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import PickleType
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import testing
+from sqlalchemy import update
+from sqlalchemy.orm import CacheRegion
+from sqlalchemy.orm import defer
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import SecondLevelCache
+from sqlalchemy.orm import Session
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_raises_message
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not
+from sqlalchemy.testing import mock
+from sqlalchemy.testing.fixtures import fixture_session
+from . import _fixtures
+
+
+class SecondLevelCacheTest(_fixtures.FixtureTest):
+    @classmethod
+    def setup_mappers(cls):
+        User, users = cls.classes.User, cls.tables.users
+        Address, addresses = cls.classes.Address, cls.tables.addresses
+
+        cls.mapper_registry.map_imperatively(User, users)
+        cls.mapper_registry.map_imperatively(
+            Address, addresses, properties={"user": relationship(User)}
+        )
+
+    def _cache(self, **kw):
+        cache = SecondLevelCache()
+        cache.configure(self.classes.User, **kw)
+        return cache
+
+    def test_get(self):
+        User = self.classes.User
+        cache = self._cache()
+
+        sess = fixture_session(second_level_cache=cache)
+        u1 = sess.get(User, 7)
+        eq_(u1, User(id=7, name="jack"))
+
+        sess = fixture_session(second_level_cache=cache)
+        u2 = self.assert_sql_count(testing.db, lambda: sess.get(User, 7), 0)
+        eq_(u2, User(id=7, name="jack"))
+        is_(sess.get(User, 7), u2)
+        eq_(list(sess.identity_map.keys()), [(User, (7,), None)])
+
+    def test_get_not_configured(self):
+        User, Address = self.classes("User", "Address")
+        cache = self._cache()
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.get(Address, 1)
+
+        sess = fixture_session(second_level_cache=cache)
+        self.assert_sql_count(testing.db, lambda: sess.get(Address, 1), 1)
+
+    def test_populated_from_query(self):
+        User = self.classes.User
+        cache = self._cache()
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.scalars(select(User)).all()
+
+        sess = fixture_session(second_level_cache=cache)
+
+        def go():
+            eq_(
+                [sess.get(User, id_) for id_ in (7, 8, 9, 10)],
+                self.static.user_result,
+            )
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_deferred_columns_not_cached(self):
+        User = self.classes.User
+        cache = self._cache()
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.scalars(select(User).options(defer(User.name))).all()
+
+        sess = fixture_session(second_level_cache=cache)
+        u1 = self.assert_sql_count(testing.db, lambda: sess.get(User, 7), 0)
+        assert "name" not in u1.__dict__
+        eq_(self.assert_sql_count(testing.db, lambda: u1.name, 1), "jack")
+
+    def test_many_to_one_lazyload(self):
+        User, Address = self.classes("User", "Address")
+        cache = self._cache()
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.get(User, 8)
+
+        sess = fixture_session(second_level_cache=cache)
+        addresses = sess.scalars(
+            select(Address).where(Address.user_id == 8)
+        ).all()
+
+        def go():
+            for a in addresses:
+                eq_(a.user, User(id=8, name="ed"))
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_events(self):
+        User = self.classes.User
+        cache = self._cache()
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.get(User, 7)
+
+        sess = fixture_session(second_level_cache=cache)
+        canary = mock.Mock()
+        event.listen(User, "load", canary.load)
+        event.listen(sess, "loaded_as_persistent", canary.loaded_as_persistent)
+
+        u1 = sess.get(User, 7)
+        eq_(
+            canary.mock_calls,
+            [
+                mock.call.load(u1, None),
+                mock.call.loaded_as_persistent(sess, u1),
+            ],
+        )
+
+    def test_options_bypass_cache(self):
+        User = self.classes.User
+        cache = self._cache()
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.get(User, 7)
+
+        sess = fixture_session(second_level_cache=cache)
+        self.assert_sql_count(
+            testing.db,
+            lambda: sess.get(User, 7, populate_existing=True),
+            1,
+        )
+
+        sess = fixture_session(second_level_cache=cache)
+        self.assert_sql_count(
+            testing.db,
+            lambda: sess.get(User, 7, options=[defer(User.name)]),
+            1,
+        )
+
+    def test_invalidate_on_update(self):
+        User = self.classes.User
+        cache = self._cache()
+
+        sess = fixture_session(second_level_cache=cache)
+        u1 = sess.get(User, 7)
+        u1.name = "jack2"
+        sess.flush()
+
+        key = cache.generate_key(User.__mapper__, (7,), None)
+        is_(cache.regions["default"].get(key), None)
+
+        # another session places the row as of before the commit into
+        # the cache
+        cache.regions["default"].set(key, (None, {"id": 7, "name": "jack"}))
+        sess.commit()
+
+        sess = fixture_session(second_level_cache=cache)
+        eq_(
+            self.assert_sql_count(
+                testing.db, lambda: sess.get(User, 7), 1
+            ).name,
+            "jack2",
+        )
+
+    def test_invalidate_on_delete(self):
+        User = self.classes.User
+        cache = self._cache()
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.delete(sess.get(User, 10))
+        sess.commit()
+
+        sess = fixture_session(second_level_cache=cache)
+        is_(
+            self.assert_sql_count(testing.db, lambda: sess.get(User, 10), 1),
+            None,
+        )
+
+    def test_invalidate_on_synchronized_bulk_update(self):
+        User = self.classes.User
+        cache = self._cache()
+
+        sess = fixture_session(second_level_cache=cache)
+        u1 = sess.get(User, 7)
+        sess.execute(
+            update(User).where(User.id == 7).values(name="jack2"),
+            execution_options={"synchronize_session": "evaluate"},
+        )
+        eq_(u1.name, "jack2")
+        sess.commit()
+
+        sess = fixture_session(second_level_cache=cache)
+        eq_(sess.get(User, 7).name, "jack2")
+
+    @testing.combinations(False, "evaluate", "fetch", argnames="sync")
+    def test_invalidate_on_bulk_update_unloaded(self, sync):
+        User = self.classes.User
+        cache = self._cache()
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.scalars(select(User)).all()
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.execute(
+            update(User).where(User.id == 7).values(name="jack2"),
+            execution_options={"synchronize_session": sync},
+        )
+        sess.commit()
+
+        sess = fixture_session(second_level_cache=cache)
+        eq_(sess.get(User, 7).name, "jack2")
+        self.assert_sql_count(
+            testing.db,
+            lambda: sess.get(User, 8),
+            # rows matched by synchronize_session='fetch' are known,
+            # so other rows remain cached
+            0 if sync == "fetch" else 1,
+        )
+
+    @testing.combinations(False, "evaluate", "fetch", argnames="sync")
+    def test_invalidate_on_bulk_delete_unloaded(self, sync):
+        User = self.classes.User
+        cache = self._cache()
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.get(User, 10)
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.execute(
+            delete(User).where(User.id == 10),
+            execution_options={"synchronize_session": sync},
+        )
+        sess.commit()
+
+        sess = fixture_session(second_level_cache=cache)
+        is_(sess.get(User, 10), None)
+
+    def test_invalidate_on_bulk_update_by_primary_key(self):
+        User = self.classes.User
+        cache = self._cache()
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.get(User, 7)
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.execute(update(User), [{"id": 7, "name": "jack2"}])
+        sess.commit()
+
+        sess = fixture_session(second_level_cache=cache)
+        eq_(sess.get(User, 7).name, "jack2")
+
+    @testing.requires.independent_connections
+    def test_invalidate_on_bulk_update_commit(self):
+        User = self.classes.User
+        cache = self._cache()
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.get(User, 7)
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.execute(
+            update(User).where(User.id == 7).values(name="jack2"),
+            execution_options={"synchronize_session": False},
+        )
+
+        # another session caches the row while the UPDATE is
+        # in progress; it's invalidated again on commit
+        sess2 = fixture_session(second_level_cache=cache)
+        sess2.get(User, 7)
+        sess2.close()
+        sess.commit()
+
+        sess = fixture_session(second_level_cache=cache)
+        eq_(sess.get(User, 7).name, "jack2")
+
+    def test_explicit_invalidate(self):
+        User = self.classes.User
+        cache = self._cache()
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.get(User, 7)
+
+        cache.invalidate(User, 7)
+        sess = fixture_session(second_level_cache=cache)
+        self.assert_sql_count(testing.db, lambda: sess.get(User, 7), 1)
+
+    def test_no_populate_with_flushed_changes(self):
+        User = self.classes.User
+        cache = self._cache()
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.get(User, 7).name = "jack2"
+        sess.flush()
+        sess.get(User, 8)
+        sess.rollback()
+
+        sess = fixture_session(second_level_cache=cache)
+        eq_(
+            self.assert_sql_count(
+                testing.db, lambda: sess.get(User, 7), 1
+            ).name,
+            "jack",
+        )
+        self.assert_sql_count(testing.db, lambda: sess.get(User, 8), 1)
+
+    def test_expiration_time(self):
+        User = self.classes.User
+        cache = self._cache(expiration_time=10)
+
+        with mock.patch(
+            "sqlalchemy.orm.second_level_cache.time.monotonic",
+            return_value=100,
+        ):
+            sess = fixture_session(second_level_cache=cache)
+            sess.get(User, 7)
+
+        with mock.patch(
+            "sqlalchemy.orm.second_level_cache.time.monotonic",
+            return_value=105,
+        ):
+            sess = fixture_session(second_level_cache=cache)
+            self.assert_sql_count(testing.db, lambda: sess.get(User, 7), 0)
+
+        with mock.patch(
+            "sqlalchemy.orm.second_level_cache.time.monotonic",
+            return_value=111,
+        ):
+            sess = fixture_session(second_level_cache=cache)
+            self.assert_sql_count(testing.db, lambda: sess.get(User, 7), 1)
+
+    def test_region(self):
+        User = self.classes.User
+        region = CacheRegion(maxsize=10)
+        cache = SecondLevelCache(regions={"users": region})
+        cache.configure(User, region="users")
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.get(User, 7)
+
+        eq_(
+            region.get(cache.generate_key(User.__mapper__, (7,), None)),
+            (None, {"id": 7, "name": "jack"}),
+        )
+        eq_(cache.regions["default"]._data, {})
+
+    def test_unknown_region(self):
+        cache = SecondLevelCache()
+        with expect_raises_message(
+            exc.ArgumentError, "No cache region named 'foo'"
+        ):
+            cache.configure(self.classes.User, region="foo")
+
+
+class PolymorphicSecondLevelCacheTest(fixtures.DeclarativeMappedTest):
+    @classmethod
+    def setup_classes(cls):
+        Base = cls.DeclarativeBasic
+
+        class A(Base):
+            __tablename__ = "a"
+
+            id = Column(Integer, primary_key=True)
+            data = Column(String(50))
+            type = Column(String(20))
+
+            __mapper_args__ = {
+                "polymorphic_on": type,
+                "polymorphic_identity": "a",
+            }
+
+        class B(A):
+            __tablename__ = "b"
+
+            id = Column(ForeignKey("a.id"), primary_key=True)
+            b_data = Column(String(50))
+
+            __mapper_args__ = {"polymorphic_identity": "b"}
+
+        class C(A):
+            __mapper_args__ = {"polymorphic_identity": "c"}
+
+    @classmethod
+    def insert_data(cls, connection):
+        A, B, C = cls.classes("A", "B", "C")
+        with Session(connection) as sess:
+            sess.add_all(
+                [A(id=1, data="a1"), B(id=2, data="a2", b_data="b2"), C(id=3)]
+            )
+            sess.commit()
+
+    def test_subclass_from_base_get(self):
+        A, B = self.classes("A", "B")
+        cache = SecondLevelCache()
+        cache.configure(A)
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.scalars(select(A).order_by(A.id)).all()
+
+        sess = fixture_session(second_level_cache=cache)
+        b = self.assert_sql_count(testing.db, lambda: sess.get(A, 2), 0)
+        is_(type(b), B)
+        eq_((b.id, b.data), (2, "a2"))
+
+        # b_data wasn't loaded by the polymorphic query
+        eq_(self.assert_sql_count(testing.db, lambda: b.b_data, 1), "b2")
+
+    def test_invalidate_on_subclass_bulk_update(self):
+        A, C = self.classes("A", "C")
+        cache = SecondLevelCache()
+        cache.configure(A)
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.scalars(select(A).order_by(A.id)).all()
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.execute(
+            update(C).where(C.id == 3).values(data="c3"),
+            execution_options={"synchronize_session": False},
+        )
+        sess.commit()
+
+        sess = fixture_session(second_level_cache=cache)
+        eq_(sess.get(A, 3).data, "c3")
+
+    def test_wrong_subclass(self):
+        A, B, C = self.classes("A", "B", "C")
+        cache = SecondLevelCache()
+        cache.configure(A)
+
+        sess = fixture_session(second_level_cache=cache)
+        sess.get(A, 3)
+
+        sess = fixture_session(second_level_cache=cache)
+        is_(self.assert_sql_count(testing.db, lambda: sess.get(B, 3), 1), None)
+        is_not(sess.get(C, 3), None)
+
+
+class MutableValueSecondLevelCacheTest(fixtures.DeclarativeMappedTest):
+    @classmethod
+    def setup_classes(cls):
+        Base = cls.DeclarativeBasic
+
+        class A(Base):
+            __tablename__ = "a"
+
+            id = Column(Integer, primary_key=True)
+            data = Column(PickleType)
+
+    @classmethod
+    def insert_data(cls, connection):
+        A = cls.classes.A
+        with Session(connection) as sess:
+            sess.add(A(id=1, data=[1, 2]))
+            sess.commit()
+
+    def test_values_not_shared(self):
+        A = self.classes.A
+        cache = SecondLevelCache()
+        cache.configure(A)
+
+        sess = fixture_session(second_level_cache=cache)
+        a1 = sess.get(A, 1)
+
+        # mutating the object that populated the cache
+        a1.data.append(3)
+
+        sess2 = fixture_session(second_level_cache=cache)
+        a2 = self.assert_sql_count(testing.db, lambda: sess2.get(A, 1), 0)
+        eq_(a2.data, [1, 2])
+
+        # mutating an object loaded from the cache
+        a2.data.append(4)
+
+        sess3 = fixture_session(second_level_cache=cache)
+        a3 = self.assert_sql_count(testing.db, lambda: sess3.get(A, 1), 0)
+        eq_(a3.data, [1, 2])
+        is_not(a3.data, a2.data)
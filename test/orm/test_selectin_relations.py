@@ -1,11 +1,15 @@
 import sqlalchemy as sa
 from sqlalchemy import bindparam
+from sqlalchemy import event
+from sqlalchemy import exc
 from sqlalchemy import ForeignKey
 from sqlalchemy import ForeignKeyConstraint
 from sqlalchemy import Integer
 from sqlalchemy import select
 from sqlalchemy import String
 from sqlalchemy import testing
+from sqlalchemy import text
+from sqlalchemy import update
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm import clear_mappers
 from sqlalchemy.orm import defaultload
@@ -17,10 +21,12 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import subqueryload
 from sqlalchemy.orm import undefer
+from sqlalchemy.orm import with_loader_criteria
 from sqlalchemy.orm import with_polymorphic
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import assert_warns
 from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_not
@@ -1667,6 +1673,166 @@ class LoadOnExistingTest(_fixtures.FixtureTest):
         assert "items" in u1.orders[0].__dict__
 
 
+class ConcurrentEagerLoadsTest(_fixtures.FixtureTest):
+    """test the concurrent_eager_loads execution option."""
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    @testing.fixture
+    def statement_connections(self):
+        connections = []
+
+        def before_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            connections.append((statement.split()[1], conn))
+
+        event.listen(
+            testing.db, "before_cursor_execute", before_cursor_execute
+        )
+        yield connections
+        event.remove(
+            testing.db, "before_cursor_execute", before_cursor_execute
+        )
+
+    def _load_users(self, sess):
+        User, Order = self.classes("User", "Order")
+
+        return sess.scalars(
+            select(User)
+            .options(
+                selectinload(User.addresses),
+                selectinload(User.orders).selectinload(Order.items),
+            )
+            .order_by(User.id)
+            .execution_options(concurrent_eager_loads=True)
+        ).all()
+
+    def test_load(self):
+        sess = fixture_session()
+
+        def go():
+            eq_(self._load_users(sess), self.static.user_all_result)
+
+        self.assert_sql_count(testing.db, go, 4)
+
+    @testing.requires.concurrent_eager_loads
+    def test_sibling_loads_use_separate_connections(
+        self, statement_connections
+    ):
+        sess = fixture_session()
+
+        eq_(self._load_users(sess), self.static.user_all_result)
+
+        (
+            (_, users_conn),
+            (_, first_conn),
+            (_, second_conn),
+            (_, items_conn),
+        ) = statement_connections
+
+        eq_(
+            sorted(column for column, _ in statement_connections[1:3]),
+            ["addresses.user_id", "orders.user_id"],
+        )
+        is_not(first_conn, users_conn)
+        is_not(second_conn, users_conn)
+        is_not(first_conn, second_conn)
+
+        # a single loader runs on the Session's connection
+        is_(items_conn, users_conn)
+
+    def test_flushed_changes_load_on_session_connection(
+        self, statement_connections
+    ):
+        User, Address = self.classes("User", "Address")
+
+        sess = fixture_session()
+        user = sess.get(User, 7)
+        user.addresses.append(Address(email_address="new"))
+        sess.flush()
+        sess.expire_all()
+
+        users = self._load_users(sess)
+        eq_(
+            [address.email_address for address in users[0].addresses],
+            ["jack@bean.com", "new"],
+        )
+
+        users_conn = statement_connections[0][1]
+        for column, conn in statement_connections[-4:]:
+            is_(conn, users_conn)
+
+    @testing.combinations("orm", "core", "text", argnames="kind")
+    def test_dml_loads_on_session_connection(
+        self, statement_connections, kind
+    ):
+        Address = self.classes.Address
+        addresses = self.tables.addresses
+
+        sess = fixture_session()
+        if kind == "orm":
+            stmt = (
+                update(Address)
+                .where(Address.id == 1)
+                .values(email_address="changed")
+            )
+        elif kind == "core":
+            stmt = (
+                addresses.update()
+                .where(addresses.c.id == 1)
+                .values(email_address="changed")
+            )
+        else:
+            stmt = text(
+                "UPDATE addresses SET email_address='changed' WHERE id=1"
+            )
+        sess.execute(stmt)
+
+        users = self._load_users(sess)
+        eq_(
+            [address.email_address for address in users[0].addresses],
+            ["changed"],
+        )
+
+        users_conn = statement_connections[-4][1]
+        for column, conn in statement_connections[-4:]:
+            is_(conn, users_conn)
+
+    def test_do_orm_execute_loads_on_session_connection(
+        self, statement_connections
+    ):
+        Address = self.classes.Address
+
+        sess = fixture_session()
+
+        loaded = []
+
+        @event.listens_for(sess, "do_orm_execute")
+        def do_orm_execute(orm_execute_state):
+            if orm_execute_state.is_relationship_load:
+                loaded.append(orm_execute_state.loader_strategy_path[-1].key)
+            orm_execute_state.statement = orm_execute_state.statement.options(
+                with_loader_criteria(
+                    Address, Address.email_address != "jack@bean.com"
+                )
+            )
+
+        users = self._load_users(sess)
+        eq_(users[0].addresses, [])
+        eq_(
+            [address.email_address for address in users[1].addresses],
+            ["ed@wood.com", "ed@bettyboop.com", "ed@lala.com"],
+        )
+        eq_(sorted(loaded), ["addresses", "items", "orders"])
+
+        users_conn = statement_connections[0][1]
+        for column, conn in statement_connections:
+            is_(conn, users_conn)
+
+
 class OrderBySecondaryTest(fixtures.MappedTest):
     @classmethod
     def define_tables(cls, metadata):
@@ -2423,6 +2589,97 @@ class ChunkingTest(fixtures.DeclarativeMappedTest):
             ),
         )
 
+    def _assert_chunks(self, go, chunks):
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL("SELECT a.id AS a_id FROM a ORDER BY a.id", {}),
+            *[
+                CompiledSQL(
+                    "SELECT b.a_id AS b_a_id, b.id AS b_id "
+                    "FROM b WHERE b.a_id IN "
+                    "(__[POSTCOMPILE_primary_keys]) ORDER BY b.id",
+                    {"primary_keys": list(chunk)},
+                )
+                for chunk in chunks
+            ],
+        )
+
+    def test_chunk_size_option(self):
+        A = self.classes.A
+
+        session = fixture_session()
+
+        def go():
+            q = (
+                session.query(A)
+                .options(selectinload(A.bs, chunk_size=47))
+                .order_by(A.id)
+            )
+            for a in q:
+                a.bs
+
+        self._assert_chunks(go, [range(1, 48), range(48, 95), range(95, 101)])
+
+    @testing.combinations(True, False, argnames="use_option")
+    def test_chunk_size_relationship(self, use_option):
+        A = self.classes.A
+
+        session = fixture_session()
+
+        def go():
+            with mock.patch.object(A.bs.property, "selectin_chunk_size", 60):
+                q = session.query(A).order_by(A.id)
+                if use_option:
+                    q = q.options(selectinload(A.bs, chunk_size=30))
+                else:
+                    q = q.options(selectinload(A.bs))
+                for a in q:
+                    a.bs
+
+        if use_option:
+            chunks = [range(1, 31), range(31, 61), range(61, 91)]
+            chunks.append(range(91, 101))
+        else:
+            chunks = [range(1, 61), range(61, 101)]
+        self._assert_chunks(go, chunks)
+
+    def test_chunk_size_auto(self):
+        A = self.classes.A
+
+        session = fixture_session()
+
+        def go():
+            with mock.patch.object(
+                testing.db.dialect, "insertmanyvalues_max_parameters", 40
+            ):
+                q = (
+                    session.query(A)
+                    .options(selectinload(A.bs, chunk_size="auto"))
+                    .order_by(A.id)
+                )
+                for a in q:
+                    a.bs
+
+        self._assert_chunks(go, [range(1, 41), range(41, 81), range(81, 101)])
+
+    @testing.combinations(0, -5, 5.5, "some size", argnames="value")
+    def test_chunk_size_invalid(self, value):
+        A = self.classes.A
+
+        with expect_raises_message(
+            exc.ArgumentError,
+            "chunk_size must be a positive integer or the string 'auto'",
+        ):
+            selectinload(A.bs, chunk_size=value)
+
+        with expect_raises_message(
+            exc.ArgumentError,
+            "selectin_chunk_size must be a positive integer or the "
+            "string 'auto'",
+        ):
+            relationship("B", selectin_chunk_size=value)
+
     @testing.requires.independent_cursors
     def test_yield_per(self):
         # the docs make a lot of guarantees about yield_per
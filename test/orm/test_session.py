@@ -18,11 +18,13 @@ from sqlalchemy.orm import attributes
 from sqlalchemy.orm import backref
 from sqlalchemy.orm import close_all_sessions
 from sqlalchemy.orm import exc as orm_exc
+from sqlalchemy.orm import identity
 from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import make_transient
 from sqlalchemy.orm import make_transient_to_detached
 from sqlalchemy.orm import object_session
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm import was_deleted
@@ -1867,6 +1869,287 @@ class WeakIdentityMapTest(_fixtures.FixtureTest):
         assert not sess.identity_map.contains_state(u2._sa_instance_state)
 
 
+class IdentityMapLimitTest(_fixtures.FixtureTest):
+    run_inserts = None
+
+    def _fixture(self, limit, **kw):
+        User, users = self.classes.User, self.tables.users
+        Address, addresses = self.classes.Address, self.tables.addresses
+
+        self.mapper_registry.map_imperatively(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address, backref="user", order_by=addresses.c.id
+                )
+            },
+        )
+        self.mapper_registry.map_imperatively(Address, addresses)
+        return fixture_session(identity_map_limit=limit, **kw)
+
+    def _count(self, sess):
+        return len(sess.identity_map) + len(sess._new)
+
+    def test_add_flushes(self):
+        User = self.classes.User
+        sess = self._fixture(8)
+
+        for i in range(1, 11):
+            sess.add(User(id=i, name="u%d" % i))
+            assert self._count(sess) <= 8
+
+        # adding the ninth object flushed all nine, which aren't
+        # referenced elsewhere and were released from the session
+        eq_(len(sess._new), 1)
+        eq_(len(sess.identity_map), 0)
+
+        sess.commit()
+        eq_(sess.scalar(select(sa.func.count(User.id))), 10)
+
+    def test_add_referenced_objects_remain(self):
+        User = self.classes.User
+        sess = self._fixture(8)
+
+        users = [User(id=i, name="u%d" % i) for i in range(1, 11)]
+        for user in users:
+            sess.add(user)
+
+        # objects that are still referenced remain in the session
+        eq_(
+            [inspect(u).persistent for u in users],
+            [True] * 10,
+        )
+
+        for user in users:
+            user.name = "%s modified" % user.name
+        sess.commit()
+
+        eq_(
+            sess.scalars(select(User.name).order_by(User.id)).all(),
+            ["u%d modified" % i for i in range(1, 11)],
+        )
+
+    def test_no_autoflush(self):
+        User = self.classes.User
+        sess = self._fixture(8, autoflush=False)
+
+        for i in range(1, 11):
+            sess.add(User(id=i, name="u%d" % i))
+
+        # nothing was flushed
+        eq_(len(sess._new), 10)
+
+    def test_modify_query_larger_than_limit(self):
+        User = self.classes.User
+        sess = self._fixture(20)
+        sess.add_all([User(id=i, name="u%d" % i) for i in range(1, 51)])
+        sess.commit()
+
+        users = sess.scalars(select(User).order_by(User.id)).all()
+        eq_(len(users), 50)
+        is_true(all(u in sess for u in users))
+
+        for user in users:
+            user.name = "%s modified" % user.name
+
+        # an add() beyond the limit flushes, and expunges nothing
+        sess.add(User(id=51, name="u51"))
+        is_true(all(u in sess for u in users))
+        sess.commit()
+
+        eq_(
+            sess.scalars(select(User.name).order_by(User.id)).all(),
+            ["u%d modified" % i for i in range(1, 51)] + ["u51"],
+        )
+
+    def test_modify_yield_per_stream(self):
+        User, Address = self.classes("User", "Address")
+        sess = self._fixture(20)
+        sess.add_all(
+            [
+                User(
+                    id=i,
+                    name="u%d" % i,
+                    addresses=[
+                        Address(id=i * 10 + j, email_address="a%d" % j)
+                        for j in range(3)
+                    ],
+                )
+                for i in range(1, 41)
+            ]
+        )
+        sess.commit()
+
+        result = sess.scalars(
+            select(User)
+            .options(selectinload(User.addresses))
+            .order_by(User.id)
+            .execution_options(yield_per=8)
+        )
+        for user in result:
+            # related objects loaded by the selectinload are present
+            # for each batch
+            eq_(
+                [a.id for a in user.__dict__["addresses"]],
+                [user.id * 10 + j for j in range(3)],
+            )
+            user.name = "%s modified" % user.name
+            sess.add(Address(id=1000 + user.id, email_address="new"))
+
+        sess.commit()
+
+        eq_(
+            sess.scalars(select(User.name).order_by(User.id)).all(),
+            ["u%d modified" % i for i in range(1, 41)],
+        )
+        eq_(
+            sess.scalar(
+                select(sa.func.count(Address.id)).where(
+                    Address.email_address == "new"
+                )
+            ),
+            40,
+        )
+
+
+class IdentityMapIndexTest(_fixtures.FixtureTest):
+    run_inserts = "each"
+
+    def _fixture(self):
+        User, users = self.classes.User, self.tables.users
+
+        self.mapper_registry.map_imperatively(User, users)
+        return fixture_session(identity_map_indexes={User: ["name"]})
+
+    def test_get_by_uses_index(self):
+        User = self.classes.User
+        sess = self._fixture()
+
+        users = sess.scalars(select(User).order_by(User.id)).all()
+
+        def go():
+            is_(sess.get_by(User, name="ed"), users[1])
+            is_(sess.get_by(User, name="ed", id=8), users[1])
+
+        self.assert_sql_count(testing.db, go, 0)
+
+        def go():
+            is_(sess.get_by(User, name="ed", id=7), None)
+            is_(sess.get_by(User, name="nonexistent"), None)
+
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_get_by_loads_and_indexes(self):
+        User = self.classes.User
+        sess = self._fixture()
+
+        def go():
+            return sess.get_by(User, name="fred")
+
+        u1 = self.assert_sql_count(testing.db, go, 1)
+        eq_(u1.id, 9)
+
+        u2 = self.assert_sql_count(testing.db, go, 0)
+        is_(u2, u1)
+
+    def test_get_by_unindexed_attribute(self):
+        User = self.classes.User
+        sess = self._fixture()
+
+        u1 = sess.get(User, 7)
+
+        def go():
+            is_(sess.get_by(User, id=7), u1)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_index_follows_attribute_set(self):
+        User = self.classes.User
+        sess = self._fixture()
+
+        u1 = sess.get(User, 7)
+        u1.name = "jack2"
+
+        def go():
+            is_(sess.get_by(User, name="jack2"), u1)
+
+        self.assert_sql_count(testing.db, go, 0)
+
+        # autoflushes, then no longer finds the object
+        is_(sess.get_by(User, name="jack"), None)
+
+    def test_index_expired(self):
+        User = self.classes.User
+        sess = self._fixture()
+
+        u1 = sess.get(User, 7)
+        sess.commit()
+
+        def go():
+            is_(sess.get_by(User, name="jack"), u1)
+
+        self.assert_sql_count(testing.db, go, 1)
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_index_removed_states(self):
+        User = self.classes.User
+        sess = self._fixture()
+
+        u1, u2 = sess.scalars(select(User).where(User.id.in_([7, 8]))).all()
+        sess.get_by(User, name="jack")
+        sess.expunge(u1)
+        sess.delete(u2)
+        sess.flush()
+
+        eq_(sess.identity_map._indexes, {(inspect(User), "name"): {}})
+
+        def go():
+            u3 = sess.get_by(User, name="jack")
+            is_not(u3, u1)
+            eq_(u3.id, 7)
+            is_(sess.get_by(User, name="ed"), None)
+
+        self.assert_sql_count(testing.db, go, 2)
+
+        sess.expunge_all()
+        is_true(
+            isinstance(sess.identity_map, identity.IndexedWeakInstanceDict)
+        )
+
+    def test_pending_indexed_on_flush(self):
+        User = self.classes.User
+        sess = self._fixture()
+
+        u1 = User(id=12, name="newuser")
+        sess.add(u1)
+        sess.flush()
+
+        def go():
+            is_(sess.get_by(User, name="newuser"), u1)
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_get_by_no_index(self):
+        User, users = self.classes.User, self.tables.users
+
+        self.mapper_registry.map_imperatively(User, users)
+        sess = fixture_session()
+
+        u1 = sess.get(User, 7)
+        is_(sess.get_by(User, name="jack"), u1)
+
+    def test_bad_attribute(self):
+        User, users = self.classes.User, self.tables.users
+
+        self.mapper_registry.map_imperatively(User, users)
+        with expect_raises_message(
+            sa.exc.ArgumentError,
+            "Can't index attribute 'nonexistent' of Mapper",
+        ):
+            fixture_session(identity_map_indexes={User: ["nonexistent"]})
+
+
 class IsModifiedTest(_fixtures.FixtureTest):
     run_inserts = None
 
@@ -2061,7 +2344,14 @@ class SessionInterface(fixtures.MappedTest):
     def _public_session_methods(self):
         Session = sa.orm.session.Session
 
-        blocklist = {"begin", "query", "bind_mapper", "get", "bind_table"}
+        blocklist = {
+            "begin",
+            "query",
+            "bind_mapper",
+            "get",
+            "get_by",
+            "bind_table",
+        }
         specials = {"__iter__", "__contains__"}
         ok = set()
         for name in dir(Session):
@@ -2145,6 +2145,177 @@ class BatchInsertsTest(fixtures.MappedTest, testing.AssertsExecutionResults):
         )
 
 
+class PadUpdatesTest(fixtures.MappedTest, testing.AssertsExecutionResults):
+    run_inserts = "each"
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "t",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("a", String(50)),
+            Column("b", String(50)),
+            Column("c", String(50)),
+            Column("upd", Integer, onupdate=5),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class T(cls.Basic):
+            pass
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.t.insert(),
+            [
+                {"id": i, "a": "a%d" % i, "b": "b%d" % i, "c": "c%d" % i}
+                for i in range(1, 5)
+            ],
+        )
+
+    def _fixture(self, pad_updates=True):
+        T, t = self.classes.T, self.tables.t
+        self.mapper_registry.map_imperatively(T, t, pad_updates=pad_updates)
+        sess = fixture_session()
+        return sess, sess.scalars(select(T).order_by(T.id)).all()
+
+    def test_padded(self):
+        sess, (t1, t2, t3, t4) = self._fixture()
+        t1.a = "a1new"
+        t2.b = "b2new"
+        t3.a = "a3new"
+        t3.b = "b3new"
+        t4.c = "c4new"
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t SET a=:a, b=:b, c=:c, upd=:upd WHERE t.id = :t_id",
+                [
+                    {"a": "a1new", "b": "b1", "c": "c1", "t_id": 1},
+                    {"a": "a2", "b": "b2new", "c": "c2", "t_id": 2},
+                    {
+                        "a": "a3new",
+                        "b": "b3new",
+                        "c": "c3",
+                        "t_id": 3,
+                    },
+                    {"a": "a4", "b": "b4", "c": "c4new", "t_id": 4},
+                ],
+            ),
+        )
+        sess.expire_all()
+        eq_(
+            [(t.a, t.b, t.c, t.upd) for t in (t1, t2, t3, t4)],
+            [
+                ("a1new", "b1", "c1", 5),
+                ("a2", "b2new", "c2", 5),
+                ("a3new", "b3new", "c3", 5),
+                ("a4", "b4", "c4new", 5),
+            ],
+        )
+
+    def test_not_padded(self):
+        sess, (t1, t2, t3, t4) = self._fixture(pad_updates=False)
+        t1.a = "a1new"
+        t2.b = "b2new"
+        t3.a = "a3new"
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t SET a=:a, upd=:upd WHERE t.id = :t_id",
+                [{"a": "a1new", "t_id": 1}],
+            ),
+            CompiledSQL(
+                "UPDATE t SET b=:b, upd=:upd WHERE t.id = :t_id",
+                [{"b": "b2new", "t_id": 2}],
+            ),
+            CompiledSQL(
+                "UPDATE t SET a=:a, upd=:upd WHERE t.id = :t_id",
+                [{"a": "a3new", "t_id": 3}],
+            ),
+        )
+
+    def test_onupdate_column_not_padded(self):
+        sess, (t1, t2, t3, t4) = self._fixture()
+        t1.a = "a1new"
+        t2.upd = 10
+        t3.b = "b3new"
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t SET a=:a, b=:b, upd=:upd WHERE t.id = :t_id",
+                [{"a": "a1new", "b": "b1", "t_id": 1}],
+            ),
+            CompiledSQL(
+                "UPDATE t SET upd=:upd WHERE t.id = :t_id",
+                [{"upd": 10, "t_id": 2}],
+            ),
+            CompiledSQL(
+                "UPDATE t SET a=:a, b=:b, upd=:upd WHERE t.id = :t_id",
+                [{"a": "a3", "b": "b3new", "t_id": 3}],
+            ),
+        )
+        eq_(t2.upd, 10)
+
+    def test_unloaded_column_not_padded(self):
+        sess, (t1, t2, t3, t4) = self._fixture()
+        sess.expire(t2, ["a"])
+        t1.a = "a1new"
+        t2.b = "b2new"
+        t3.b = "b3new"
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t SET a=:a, b=:b, upd=:upd WHERE t.id = :t_id",
+                [{"a": "a1new", "b": "b1", "t_id": 1}],
+            ),
+            CompiledSQL(
+                "UPDATE t SET b=:b, upd=:upd WHERE t.id = :t_id",
+                [{"b": "b2new", "t_id": 2}],
+            ),
+            CompiledSQL(
+                "UPDATE t SET a=:a, b=:b, upd=:upd WHERE t.id = :t_id",
+                [{"a": "a3", "b": "b3new", "t_id": 3}],
+            ),
+        )
+        eq_(t2.a, "a2")
+
+    def test_sql_expression_not_padded(self):
+        sess, (t1, t2, t3, t4) = self._fixture()
+        t1.a = "a1new"
+        t2.b = func.lower("B2NEW")
+        t3.b = "b3new"
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t SET a=:a, b=:b, upd=:upd WHERE t.id = :t_id",
+                [{"a": "a1new", "b": "b1", "t_id": 1}],
+            ),
+            CompiledSQL(
+                "UPDATE t SET b=lower(:lower_1), upd=:upd "
+                "WHERE t.id = :t_id",
+                [{"lower_1": "B2NEW", "t_id": 2}],
+            ),
+            CompiledSQL(
+                "UPDATE t SET a=:a, b=:b, upd=:upd WHERE t.id = :t_id",
+                [{"a": "a3", "b": "b3new", "t_id": 3}],
+            ),
+        )
+        eq_(t2.b, "b2new")
+
+
 class LoadersUsingCommittedTest(UOWTest):
 
     """Test that events which occur within a flush()
@@ -0,0 +1,93 @@
+"""Measure the time taken to import SQLAlchemy, as paid by every process
+that uses it, such as command line tools and serverless functions.
+
+Each statement is run a number of times, each within a new interpreter,
+and the fastest and median times are reported along with the number of
+SQLAlchemy modules the statement imported.  Pass ``--compare`` with the
+path of another SQLAlchemy ``lib`` directory, such as that of an earlier
+checkout, to report the same measurements for it alongside.
+
+"""
+from argparse import ArgumentDefaultsHelpFormatter
+from argparse import ArgumentParser
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import sqlalchemy",
+    "from sqlalchemy import Column, Integer, MetaData, Table",
+    "from sqlalchemy import select, table, column; "
+    "str(select(table('t', column('x'))))",
+    "from sqlalchemy import create_engine",
+    "import sqlalchemy.orm",
+]
+
+MEASURE = """
+import json, sys, time
+start = time.perf_counter()
+exec(sys.argv[1])
+elapsed = time.perf_counter() - start
+print(json.dumps([
+    elapsed,
+    len([m for m in sys.modules if m.split(".")[0] == "sqlalchemy"]),
+]))
+"""
+
+
+def measure(lib, statement, runs):
+    env = dict(os.environ, PYTHONPATH=lib)
+    times = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", MEASURE, statement],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        elapsed, modules = json.loads(output)
+        times.append(elapsed * 1000)
+    return min(times), statistics.median(times), modules
+
+
+def main(args):
+    libs = [("current", args.lib)]
+    if args.compare:
+        libs.append(("compare", args.compare))
+
+    for statement in STATEMENTS:
+        print(statement)
+        for name, lib in libs:
+            fastest, median, modules = measure(lib, statement, args.runs)
+            print(
+                f"    {name:8} fastest {fastest:7.1f} ms  "
+                f"median {median:7.1f} ms  {modules:4} modules"
+            )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(formatter_class=ArgumentDefaultsHelpFormatter)
+    parser.add_argument(
+        "--runs",
+        help="Number of new interpreters to time each statement in.",
+        type=int,
+        default=10,
+    )
+    parser.add_argument(
+        "--lib",
+        help="Directory containing the sqlalchemy package to measure.",
+        default=os.path.join(
+            os.path.dirname(__file__), os.pardir, os.pardir, "lib"
+        ),
+    )
+    parser.add_argument(
+        "--compare",
+        help="Directory containing another sqlalchemy package to measure "
+        "alongside the first.",
+    )
+
+    args = parser.parse_args()
+    main(args)
@@ -0,0 +1,167 @@
+"""Measure the time taken to declare and configure a large number of
+mapped classes, as occurs at application startup with a large schema.
+
+Mapped classes are generated in groups: the first class of each group
+is the base of a joined inheritance hierarchy which the other classes of
+the group inherit from, and which refers to a single "hub" class.  Every
+class also refers to the previously generated class.  All relationships
+are many-to-one with a one-to-many backref.
+
+"""
+from argparse import ArgumentDefaultsHelpFormatter
+from argparse import ArgumentParser
+from contextlib import contextmanager
+import cProfile
+from pprint import pprint
+import pstats
+import time
+
+import sqlalchemy as sa
+from sqlalchemy.ext.configure_cache import ConfigureCache
+from sqlalchemy.orm import registry
+from sqlalchemy.orm import relationship
+
+
+def generate_classes(reg, class_number, group_size, configure_each):
+    Base = reg.generate_base()
+
+    class Hub(Base):
+        __tablename__ = "hub"
+
+        id = sa.Column(sa.Integer, primary_key=True)
+        data = sa.Column(sa.String(50))
+
+    classes = [Hub]
+    group_base = None
+    for num in range(class_number):
+        name = f"Class{num}"
+        attrs = {
+            "__tablename__": f"table_{num}",
+            f"data_{num}": sa.Column(sa.String(50)),
+        }
+        if num % group_size == 0:
+            bases = (Base,)
+            attrs["id"] = sa.Column(sa.Integer, primary_key=True)
+            attrs["type"] = sa.Column(sa.String(50))
+            attrs["hub_id"] = sa.Column(sa.ForeignKey("hub.id"))
+            attrs["hub"] = relationship(Hub, backref=f"class_{num}_collection")
+            attrs["__mapper_args__"] = {
+                "polymorphic_on": attrs["type"],
+                "polymorphic_identity": name,
+            }
+        else:
+            bases = (group_base,)
+            attrs["id"] = sa.Column(
+                sa.ForeignKey(f"{group_base.__tablename__}.id"),
+                primary_key=True,
+            )
+            attrs["__mapper_args__"] = {
+                "polymorphic_identity": name,
+                "inherit_condition": attrs["id"] == group_base.id,
+            }
+
+        if num:
+            previous = classes[-1]
+            attrs[f"previous_{num}_id"] = sa.Column(
+                sa.ForeignKey(f"{previous.__tablename__}.id")
+            )
+            attrs[f"previous_{num}"] = relationship(
+                previous,
+                primaryjoin=(
+                    f"{name}.previous_{num}_id == {previous.__name__}.id"
+                ),
+                foreign_keys=f"{name}.previous_{num}_id",
+                backref=f"next_{num}",
+            )
+
+        cls = type(name, bases, attrs)
+        if num % group_size == 0:
+            group_base = cls
+        classes.append(cls)
+
+        if configure_each:
+            reg.configure()
+
+    return classes
+
+
+def main(args):
+    timing = timer()
+    reg = registry()
+
+    with timing("declare"):
+        classes = generate_classes(
+            reg, args.class_number, args.group_size, args.configure_each
+        )
+
+    if args.profile:
+        profile = cProfile.Profile()
+        profile.enable()
+    with timing("configure"):
+        if args.cache:
+            restored = ConfigureCache(args.cache).configure(reg)
+        else:
+            restored = False
+            reg.configure()
+    if args.profile:
+        profile.disable()
+        pstats.Stats(profile).sort_stats("cumulative").print_stats(30)
+
+    with timing("first-compile"):
+        for cls in classes:
+            sa.select(cls).compile()
+
+    print(f"Mapped {len(classes)} classes")
+    if args.cache:
+        print(f"Configuration restored from {args.cache}: {restored}")
+    pprint(timing.timing, sort_dicts=False)
+
+
+def timer():
+    timing = {}
+
+    @contextmanager
+    def track_time(name):
+        s = time.perf_counter()
+        yield
+        timing[name] = time.perf_counter() - s
+
+    track_time.timing = timing
+    return track_time
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(formatter_class=ArgumentDefaultsHelpFormatter)
+    parser.add_argument(
+        "--class-number",
+        help="Number of mapped classes to generate.",
+        type=int,
+        default=2000,
+    )
+    parser.add_argument(
+        "--group-size",
+        help="Number of classes in each inheritance hierarchy.",
+        type=int,
+        default=50,
+    )
+    parser.add_argument(
+        "--configure-each",
+        help="Configure the registry after each class is declared, as "
+        "occurs when mappings are used while modules are still being "
+        "imported.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--cache",
+        help="Path of a file in which to store the configuration with "
+        "sqlalchemy.ext.configure_cache; run twice to use the stored "
+        "configuration.",
+    )
+    parser.add_argument(
+        "--profile",
+        help="Print a profile of the configure step",
+        action="store_true",
+    )
+
+    args = parser.parse_args()
+    main(args)
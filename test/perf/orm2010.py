@@ -51,6 +51,16 @@ class Grunt(Employee):
     __mapper_args__ = {"polymorphic_identity": "grunt"}
 
 
+class Node(Base):
+    __tablename__ = "node"
+
+    id = Column(Integer, primary_key=True)
+    parent_id = Column(Integer, ForeignKey("node.id"))
+    name = Column(String(100), nullable=False)
+
+    children = relationship("Node")
+
+
 if os.path.exists("orm2010.db"):
     os.remove("orm2010.db")
 # use a file based database so that cursor.execute() has some
@@ -122,7 +132,51 @@ def runit_query_runs(status, factor=1, query_runs=5):
         sess.close()  # close out the session
 
 
-def run_with_profile(runsnake=False, dump=False):
+def runit_tree_persist(status, factor=1):
+    """Flush self-referential trees; the dependency between rows of the
+    same table requires that the unit of work sort individual objects
+    rather than mappers.
+
+    """
+    # a wide tree, ten children per node, four levels deep
+    num_nodes = 0
+    root = Node(name="wide root")
+    level = [root]
+    for depth in range(4):
+        next_level = []
+        for parent in level:
+            for i in range(10):
+                node = Node(name="Node %d" % num_nodes)
+                parent.children.append(node)
+                next_level.append(node)
+                num_nodes += 1
+        level = next_level
+
+    sess.add(root)
+    sess.flush()
+    status("Flushed a tree of %d nodes" % num_nodes)
+
+    # a single deep chain of nodes
+    num_nodes = 100 * factor
+    chain = [Node(name="deep root")]
+    for i in range(num_nodes):
+        child = Node(name="Node %d" % i)
+        chain[-1].children.append(child)
+        chain.append(child)
+
+    sess.add(chain[0])
+    sess.flush()
+    status("Flushed a chain of %d nodes" % num_nodes)
+
+    for node in chain:
+        sess.delete(node)
+    sess.flush()
+    status("Deleted the chain of %d nodes" % num_nodes)
+
+    sess.commit()
+
+
+def run_with_profile(runsnake=False, dump=False, tree=False):
     import cProfile
     import pstats
 
@@ -136,7 +190,9 @@ def run_with_profile(runsnake=False, dump=False):
 
     cProfile.runctx(
         # "runit_persist(status)",
-        "runit_persist(status); runit_query_runs(status)",
+        "runit_tree_persist(status)"
+        if tree
+        else "runit_persist(status); runit_query_runs(status)",
         globals(),
         locals(),
         filename,
@@ -173,7 +229,7 @@ def run_with_profile(runsnake=False, dump=False):
         os.system("runsnake %s" % filename)
 
 
-def run_with_time(factor):
+def run_with_time(factor, tree=False):
     import time
 
     now = time.time()
@@ -181,6 +237,11 @@ def run_with_time(factor):
     def status(msg):
         print("%d - %s" % (time.time() - now, msg))
 
+    if tree:
+        runit_tree_persist(status, factor)
+        print("Total time: %d" % (time.time() - now))
+        return
+
     runit_persist(status, factor)
 
     print("Total time: %d" % (time.time() - now))
@@ -216,11 +277,19 @@ if __name__ == "__main__":
         help="scale factor, a multiple of how many records to work with.  "
         "defaults to 10",
     )
+    parser.add_argument(
+        "--tree",
+        action="store_true",
+        help="flush self-referential trees rather than the "
+        "employee / boss hierarchy",
+    )
     args = parser.parse_args()
 
     args.profile = args.profile or args.dump or args.runsnake
 
     if args.profile:
-        run_with_profile(runsnake=args.runsnake, dump=args.dump)
+        run_with_profile(
+            runsnake=args.runsnake, dump=args.dump, tree=args.tree
+        )
     else:
-        run_with_time(args.factor)
+        run_with_time(args.factor, tree=args.tree)
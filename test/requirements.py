@@ -387,6 +387,29 @@ class DefaultRequirements(SuiteRequirements):
             ]
         )
 
+    @property
+    def concurrent_eager_loads(self):
+        """Target's connection pool provides additional connections to the
+        same database, which are used by the concurrent_eager_loads ORM
+        execution option.
+
+        Unlike independent_connections, includes file-based SQLite
+        databases, as the connections only read rows.
+        """
+
+        return skip_if(
+            self._sqlite_memory_db,
+            "independent connections disabled "
+            "when :memory: connections are used",
+        ) + skip_if(
+            exclude(
+                "mssql",
+                "<",
+                (9, 0, 0),
+                "SQL Server 2005+ is required for independent connections",
+            )
+        )
+
     @property
     def memory_process_intensive(self):
         """Driver is able to handle the memory tests which run in a subprocess
@@ -908,6 +931,12 @@ class DefaultRequirements(SuiteRequirements):
         # waiting on https://jira.mariadb.org/browse/CONPY-152
         return skip_if(["mariadb+mariadbconnector"]) + self.empty_inserts
 
+    @property
+    def upsert(self):
+        return only_on(
+            ["postgresql", "sqlite>=3.24.0", "mysql", "mariadb", "mssql"]
+        )
+
     @property
     def provisioned_upsert(self):
         """backend includes upsert() in its provisioning.py"""
@@ -27,6 +27,7 @@ from sqlalchemy import tuple_
 from sqlalchemy import TypeDecorator
 from sqlalchemy import union
 from sqlalchemy import union_all
+from sqlalchemy import upsert
 from sqlalchemy import values
 from sqlalchemy.dialects import mysql
 from sqlalchemy.dialects import postgresql
@@ -42,6 +43,7 @@ from sqlalchemy.sql import True_
 from sqlalchemy.sql import type_coerce
 from sqlalchemy.sql import visitors
 from sqlalchemy.sql.base import HasCacheKey
+from sqlalchemy.sql.elements import _KeysetCriteria
 from sqlalchemy.sql.elements import _label_reference
 from sqlalchemy.sql.elements import _textual_label_reference
 from sqlalchemy.sql.elements import Annotated
@@ -188,6 +190,17 @@ class CoreFixtures:
             _label_reference(table_a.c.a.asc()),
         ),
         lambda: (_textual_label_reference("a"), _textual_label_reference("b")),
+        lambda: (
+            _KeysetCriteria._construct((table_a.c.a, table_a.c.b), (1, 2)),
+            _KeysetCriteria._construct((table_a.c.a, table_a.c.b), (1, 3)),
+            _KeysetCriteria._construct(
+                (table_a.c.a, table_a.c.b.desc()), (1, 2)
+            ),
+            _KeysetCriteria._construct(
+                (table_a.c.a, table_a.c.b.nulls_last()), (1, None)
+            ),
+            _KeysetCriteria._construct((table_a.c.b, table_a.c.a), (1, 2)),
+        ),
         lambda: (
             text("select a, b from table").columns(a=Integer, b=String),
             text("select a, b, c from table").columns(
@@ -565,6 +578,13 @@ class CoreFixtures:
             ._annotate({"nocache": True}),
             table_b.insert().values(a=7, b=10),
             table_b.insert().values(a=5, b=10).inline(),
+            upsert(table_b),
+            upsert(table_b).values(a=5, b=10),
+            upsert(table_b).index_elements(table_b.c.a),
+            upsert(table_b).index_elements(table_b.c.b),
+            upsert(table_b).update_columns(table_b.c.b),
+            upsert(table_b).update_columns(),
+            upsert(table_b).returning(table_b.c.a),
             table_b.insert()
             .values([{"a": 5, "b": 10}, {"a": 8, "b": 12}])
             ._annotate({"nocache": True}),
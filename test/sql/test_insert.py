@@ -18,6 +18,7 @@ from sqlalchemy import Table
 from sqlalchemy import table
 from sqlalchemy import testing
 from sqlalchemy import text
+from sqlalchemy import upsert
 from sqlalchemy.dialects import mysql
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects import sqlite
@@ -1889,3 +1890,185 @@ class MultirowTest(_InsertTestBase, fixtures.TablesTest, AssertsCompiledSQL):
             "SQL expression is required",
             table.insert().values(values).compile,
         )
+
+
+class UpsertTest(_InsertTestBase, fixtures.TablesTest, AssertsCompiledSQL):
+    __dialect__ = "default"
+
+    def test_not_supported(self):
+        table = self.tables.myothertable
+
+        assert_raises_message(
+            exc.CompileError,
+            "The 'default' dialect does not support UPSERT",
+            upsert(table).values(otherid=1, othername="foo").compile,
+            dialect=default.DefaultDialect(),
+        )
+
+    def test_no_primary_key(self):
+        table = self.tables.mytable
+
+        assert_raises_message(
+            exc.CompileError,
+            "Can't render UPSERT for table 'mytable', which has no "
+            "primary key",
+            upsert(table).values(myid=1).compile,
+            dialect=postgresql.dialect(),
+        )
+
+    def test_str(self):
+        table = self.tables.myothertable
+
+        eq_(
+            str(upsert(table).values(otherid=1, othername="foo")),
+            "INSERT INTO myothertable (otherid, othername) "
+            "VALUES (:otherid, :othername) "
+            "ON CONFLICT (otherid) DO UPDATE SET othername = "
+            "excluded.othername",
+        )
+
+    @testing.combinations(
+        (
+            "postgresql",
+            "INSERT INTO myothertable (otherid, othername) "
+            "VALUES (%(otherid)s, %(othername)s) "
+            "ON CONFLICT (otherid) DO UPDATE SET othername = "
+            "excluded.othername",
+        ),
+        (
+            "sqlite",
+            "INSERT INTO myothertable (otherid, othername) VALUES (?, ?) "
+            "ON CONFLICT (otherid) DO UPDATE SET othername = "
+            "excluded.othername",
+        ),
+        (
+            "mysql",
+            "INSERT INTO myothertable (otherid, othername) VALUES (%s, %s) "
+            "ON DUPLICATE KEY UPDATE othername = VALUES(othername)",
+        ),
+        (
+            "mssql",
+            "MERGE INTO myothertable WITH (HOLDLOCK) "
+            "USING (VALUES (:otherid, :othername)) "
+            "AS excluded (otherid, othername) "
+            "ON myothertable.otherid = excluded.otherid "
+            "WHEN MATCHED THEN UPDATE SET othername = excluded.othername "
+            "WHEN NOT MATCHED THEN INSERT (otherid, othername) "
+            "VALUES (excluded.otherid, excluded.othername);",
+        ),
+        argnames="dialect, expected",
+    )
+    def test_dialects(self, dialect, expected):
+        table = self.tables.myothertable
+
+        self.assert_compile(
+            upsert(table),
+            expected,
+            params={"otherid": None, "othername": None},
+            dialect=dialect,
+        )
+
+    @testing.combinations(
+        (
+            "postgresql",
+            "INSERT INTO mytable (myid, name, description) "
+            "VALUES (%(myid)s, %(name)s, %(description)s) "
+            "ON CONFLICT (myid, name) DO UPDATE SET description = "
+            "excluded.description",
+        ),
+        (
+            "mssql",
+            "MERGE INTO mytable WITH (HOLDLOCK) "
+            "USING (VALUES (:myid, :name, :description)) "
+            "AS excluded (myid, name, description) "
+            "ON mytable.myid = excluded.myid AND mytable.name = excluded.name "
+            "WHEN MATCHED THEN UPDATE SET description = excluded.description "
+            "WHEN NOT MATCHED THEN INSERT (myid, name, description) "
+            "VALUES (excluded.myid, excluded.name, excluded.description);",
+        ),
+        argnames="dialect, expected",
+    )
+    def test_index_elements(self, dialect, expected):
+        table = self.tables.mytable
+
+        self.assert_compile(
+            upsert(table).index_elements(table.c.myid, "name"),
+            expected,
+            params={"myid": None, "name": None, "description": None},
+            dialect=dialect,
+        )
+
+    @testing.combinations(
+        (
+            "postgresql",
+            "INSERT INTO mytable (myid, name, description) "
+            "VALUES (%(myid)s, %(name)s, %(description)s) "
+            "ON CONFLICT (myid) DO UPDATE SET name = excluded.name",
+        ),
+        (
+            "mysql",
+            "INSERT INTO mytable (myid, name, description) "
+            "VALUES (%s, %s, %s) "
+            "ON DUPLICATE KEY UPDATE name = VALUES(name)",
+        ),
+        argnames="dialect, expected",
+    )
+    def test_update_columns(self, dialect, expected):
+        table = self.tables.mytable
+
+        self.assert_compile(
+            upsert(table)
+            .index_elements(ORMExpr(table.c.myid))
+            .update_columns(ORMExpr(table.c.name)),
+            expected,
+            params={"myid": None, "name": None, "description": None},
+            dialect=dialect,
+        )
+
+    @testing.combinations(
+        (
+            "postgresql",
+            "INSERT INTO myothertable (otherid, othername) "
+            "VALUES (%(otherid)s, %(othername)s) "
+            "ON CONFLICT (otherid) DO NOTHING RETURNING myothertable.otherid",
+        ),
+        (
+            "mysql",
+            "INSERT INTO myothertable (otherid, othername) VALUES (%s, %s) "
+            "ON DUPLICATE KEY UPDATE otherid = otherid",
+        ),
+        (
+            "mssql",
+            "MERGE INTO myothertable WITH (HOLDLOCK) "
+            "USING (VALUES (:otherid, :othername)) "
+            "AS excluded (otherid, othername) "
+            "ON myothertable.otherid = excluded.otherid "
+            "WHEN NOT MATCHED THEN INSERT (otherid, othername) "
+            "VALUES (excluded.otherid, excluded.othername) "
+            "OUTPUT inserted.otherid;",
+        ),
+        argnames="dialect, expected",
+    )
+    def test_no_update_columns(self, dialect, expected):
+        table = self.tables.myothertable
+
+        stmt = upsert(table).update_columns()
+        if dialect != "mysql":
+            stmt = stmt.returning(table.c.otherid)
+
+        self.assert_compile(
+            stmt,
+            expected,
+            params={"otherid": None, "othername": None},
+            dialect=dialect,
+        )
+
+    def test_bad_column(self):
+        table = self.tables.myothertable
+
+        assert_raises_message(
+            exc.ArgumentError,
+            "Table 'myothertable' has no column 'nonexistent'",
+            upsert(table).update_columns,
+            "nonexistent",
+        )
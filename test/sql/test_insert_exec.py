@@ -14,6 +14,7 @@ from sqlalchemy import Sequence
 from sqlalchemy import sql
 from sqlalchemy import String
 from sqlalchemy import testing
+from sqlalchemy import upsert
 from sqlalchemy import VARCHAR
 from sqlalchemy.engine import cursor as _cursor
 from sqlalchemy.testing import assert_raises_message
@@ -22,6 +23,7 @@ from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.provision import normalize_sequence
 from sqlalchemy.testing.schema import Column
@@ -1051,3 +1053,271 @@ class InsertManyValuesTest(fixtures.RemovesEvents, fixtures.TablesTest):
                 "INSERT..RETURNING when executemany",
             ):
                 conn.execute(stmt.returning(t.c.id), data)
+
+    def test_iterator_params(self, connection):
+        t = self.tables.data
+
+        totalnum = 1275
+        insert_count = 0
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def go(conn, cursor, statement, parameters, context, executemany):
+            nonlocal insert_count
+            if statement.startswith("INSERT"):
+                insert_count += 1
+
+        conn = connection.execution_options(insertmanyvalues_page_size=100)
+        result = conn.execute(
+            t.insert(),
+            ({"x": "x%d" % i, "y": "y%d" % i} for i in range(totalnum)),
+        )
+        if testing.db.dialect.supports_sane_multi_rowcount:
+            eq_(result.rowcount, totalnum)
+        assert insert_count >= 13
+
+        eq_(connection.scalar(select(func.count()).select_from(t)), totalnum)
+
+    def test_iterator_params_returning(self, connection):
+        t = self.tables.data
+
+        conn = connection.execution_options(insertmanyvalues_page_size=100)
+        data = [{"x": "x%d" % i, "y": "y%d" % i} for i in range(1, 327)]
+        result = conn.execute(t.insert().returning(t.c.x, t.c.y), iter(data))
+        eq_(result.keys(), ["x", "y"])
+        eq_(result.mappings().all(), data)
+
+    def test_iterator_params_returning_streamed(self, connection):
+        t = self.tables.data
+
+        conn = connection.execution_options(
+            insertmanyvalues_page_size=100, yield_per=100
+        )
+        data = [{"x": "x%d" % i, "y": "y%d" % i} for i in range(1, 327)]
+        result = conn.execute(t.insert().returning(t.c.x, t.c.y), iter(data))
+
+        # only the first page has been INSERTed so far
+        eq_(connection.scalar(select(func.count()).select_from(t)), 100)
+
+        eq_(result.mappings().all(), data)
+        eq_(connection.scalar(select(func.count()).select_from(t)), 326)
+
+    @testing.combinations(True, False, argnames="stream")
+    def test_iterator_params_returning_cursor_result(self, connection, stream):
+        t = self.tables.data
+
+        conn = connection.execution_options(insertmanyvalues_page_size=100)
+        if stream:
+            conn = conn.execution_options(yield_per=50)
+        data = [{"x": "x%d" % i, "y": "y%d" % i} for i in range(1, 327)]
+        result = conn.execute(t.insert().returning(t.c.x), iter(data))
+
+        is_true(isinstance(result, _cursor.CursorResult))
+        is_true(result.is_insert)
+        is_(result.returned_defaults_rows, None)
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "Can't call inserted_primary_key when returning\\(\\) is used.",
+        ):
+            result.inserted_primary_key_rows
+
+        eq_(result.scalars().all(), [d["x"] for d in data])
+        if testing.db.dialect.supports_sane_rowcount_returning:
+            eq_(result.rowcount, 326)
+
+    def test_iterator_params_return_defaults(self, connection):
+        t = self.tables.data
+
+        conn = connection.execution_options(insertmanyvalues_page_size=100)
+        data = [
+            {"id": i, "x": "x%d" % i, "y": "y%d" % i} for i in range(1, 327)
+        ]
+        result = conn.execute(t.insert().return_defaults(t.c.z), iter(data))
+
+        is_true(isinstance(result, _cursor.CursorResult))
+        eq_(
+            [tuple(row) for row in result.inserted_primary_key_rows],
+            [(i,) for i in range(1, 327)],
+        )
+        eq_([row.z for row in result.returned_defaults_rows], [5] * 326)
+        if testing.db.dialect.supports_sane_rowcount_returning:
+            eq_(result.rowcount, 326)
+
+    def test_iterator_params_not_insert(self, connection):
+        t = self.tables.data
+
+        with expect_raises_message(
+            exc.ArgumentError,
+            "An iterator of parameter sets may only be used with an "
+            "INSERT statement",
+        ):
+            connection.execute(t.update(), iter([{"x": "x1"}]))
+
+    @testing.combinations(
+        ("fast", 0.001, [100, 200, 400, 500, 75]),
+        ("slow", 4.0, [100, 50, 25, 12, 6, 3, 1, 1, 1, 1]),
+        argnames="speed, elapsed, expected",
+        id_="saa",
+    )
+    def test_adaptive_page_size(self, connection, speed, elapsed, expected):
+        t = self.tables.data
+
+        conn = connection.execution_options(
+            insertmanyvalues_page_size=100,
+            insertmanyvalues_target_batch_time=2.0,
+        )
+        if speed == "fast":
+            # leave room in the parameter limit for 500 rows per batch
+            totalnum = 1275
+            max_params = 1000
+        else:
+            totalnum = 200
+            max_params = None
+
+        times = itertools.count(0, elapsed)
+        with mock.patch(
+            "sqlalchemy.engine.default.perf_counter",
+            lambda: next(times),
+        ), mock.patch.object(
+            conn.dialect, "insertmanyvalues_max_parameters", max_params
+        ):
+            result = conn.execute(
+                t.insert().returning(t.c.id),
+                [{"x": "x%d" % i, "y": "y%d" % i} for i in range(totalnum)],
+            )
+        eq_(len(result.all()), totalnum)
+        eq_(result.context.insertmanyvalues_batch_sizes[0:10], expected)
+        eq_(sum(result.context.insertmanyvalues_batch_sizes), totalnum)
+
+    def test_fixed_page_size_reported(self, connection):
+        t = self.tables.data
+
+        conn = connection.execution_options(insertmanyvalues_page_size=100)
+        result = conn.execute(
+            t.insert().returning(t.c.id),
+            [{"x": "x%d" % i, "y": "y%d" % i} for i in range(250)],
+        )
+        eq_(result.context.insertmanyvalues_batch_sizes, [100, 100, 50])
+
+
+class UpsertExecTest(fixtures.TablesTest):
+    __backend__ = True
+    __requires__ = ("upsert",)
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "upsert_data",
+            metadata,
+            Column("id", Integer, primary_key=True, autoincrement=False),
+            Column("x", String(50)),
+            Column("y", String(50)),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.upsert_data.insert(),
+            [{"id": i, "x": "x%d" % i, "y": "y%d" % i} for i in range(1, 6)],
+        )
+
+    def _assert_data(self, connection, expected):
+        t = self.tables.upsert_data
+        eq_(
+            connection.execute(
+                select(t.c.id, t.c.x, t.c.y).order_by(t.c.id)
+            ).all(),
+            expected,
+        )
+
+    def test_upsert_single(self, connection):
+        t = self.tables.upsert_data
+
+        connection.execute(upsert(t), {"id": 2, "x": "new x2", "y": "new y2"})
+        connection.execute(upsert(t), {"id": 6, "x": "x6", "y": "y6"})
+
+        self._assert_data(
+            connection,
+            [
+                (1, "x1", "y1"),
+                (2, "new x2", "new y2"),
+                (3, "x3", "y3"),
+                (4, "x4", "y4"),
+                (5, "x5", "y5"),
+                (6, "x6", "y6"),
+            ],
+        )
+
+    @testing.requires.insertmanyvalues
+    def test_upsert_batched(self, connection):
+        t = self.tables.upsert_data
+
+        statements = []
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def go(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        conn = connection.execution_options(insertmanyvalues_page_size=10)
+        conn.execute(
+            upsert(t),
+            [{"id": i, "x": "new x%d" % i} for i in range(4, 29)],
+        )
+        eq_(len(statements), 3)
+
+        self._assert_data(
+            connection,
+            [(i, "x%d" % i, "y%d" % i) for i in range(1, 4)]
+            + [(4, "new x4", "y4"), (5, "new x5", "y5")]
+            + [(i, "new x%d" % i, None) for i in range(6, 29)],
+        )
+
+    def test_upsert_update_columns(self, connection):
+        t = self.tables.upsert_data
+
+        connection.execute(
+            upsert(t).update_columns(t.c.y),
+            [
+                {"id": 1, "x": "new x1", "y": "new y1"},
+                {"id": 6, "x": "x6", "y": "y6"},
+            ],
+        )
+        self._assert_data(
+            connection,
+            [
+                (1, "x1", "new y1"),
+                (2, "x2", "y2"),
+                (3, "x3", "y3"),
+                (4, "x4", "y4"),
+                (5, "x5", "y5"),
+                (6, "x6", "y6"),
+            ],
+        )
+
+    def test_upsert_no_update(self, connection):
+        t = self.tables.upsert_data
+
+        connection.execute(
+            upsert(t).update_columns(),
+            [
+                {"id": 1, "x": "new x1", "y": "new y1"},
+                {"id": 6, "x": "x6", "y": "y6"},
+            ],
+        )
+        self._assert_data(
+            connection,
+            [(i, "x%d" % i, "y%d" % i) for i in range(1, 7)],
+        )
+
+    @testing.requires.insert_executemany_returning
+    def test_upsert_returning(self, connection):
+        t = self.tables.upsert_data
+
+        conn = connection.execution_options(insertmanyvalues_page_size=10)
+        result = conn.execute(
+            upsert(t).returning(t.c.id, t.c.x),
+            [{"id": i, "x": "new x%d" % i} for i in range(4, 29)],
+        )
+        eq_(
+            sorted(result.all()),
+            [(i, "new x%d" % i) for i in range(4, 29)],
+        )
@@ -32,6 +32,7 @@ from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import mock
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
 from sqlalchemy.testing.util import resolve_lambda
@@ -1075,6 +1076,87 @@ class LimitTest(fixtures.TablesTest):
         self.assert_(r[0] != r[1] and r[1] != r[2], repr(r))
 
 
+class KeysetPaginationTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(20)),
+            Column("value", Integer, nullable=True),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.data.insert(),
+            [
+                {
+                    "id": i,
+                    "name": "name %d" % (i % 4),
+                    "value": None if i % 3 == 0 else i % 5,
+                }
+                for i in range(1, 31)
+            ],
+        )
+
+    def _assert_pages(self, connection, stmt, expanded):
+        dialect = connection.dialect
+        connection = connection.execution_options(compiled_cache=None)
+
+        with mock.patch.object(
+            dialect,
+            "supports_row_value_comparison",
+            dialect.supports_row_value_comparison and not expanded,
+        ):
+            expected = connection.execute(stmt).all()
+
+            pages = []
+            bookmark = None
+            paged = stmt.limit(4)
+            while True:
+                rows = connection.execute(paged.keyset_after(bookmark)).all()
+                if not rows:
+                    break
+                pages.extend(rows)
+                bookmark = paged.keyset_bookmark(rows[-1])
+
+        eq_(pages, expected)
+
+    @testing.combinations(True, False, argnames="expanded")
+    @testing.combinations(
+        lambda data: (data.c.id,),
+        lambda data: (data.c.id.desc(),),
+        lambda data: (data.c.name, data.c.id),
+        lambda data: (data.c.name.desc(), data.c.id.desc()),
+        lambda data: (data.c.name, data.c.id.desc()),
+        lambda data: (data.c.name.desc(), data.c.id),
+        argnames="order_by",
+    )
+    def test_pages(self, connection, order_by, expanded):
+        data = self.tables.data
+        stmt = select(data).order_by(*resolve_lambda(order_by, data=data))
+        self._assert_pages(connection, stmt, expanded)
+
+    @testing.requires.nullsordering
+    @testing.combinations(True, False, argnames="expanded")
+    @testing.combinations(
+        lambda data: (data.c.value.nulls_first(), data.c.id),
+        lambda data: (data.c.value.nulls_last(), data.c.id),
+        lambda data: (data.c.value.desc().nulls_first(), data.c.id.desc()),
+        lambda data: (data.c.value.desc().nulls_last(), data.c.id),
+        lambda data: (data.c.value.nulls_last(), data.c.name, data.c.id),
+        argnames="order_by",
+    )
+    def test_pages_nulls(self, connection, order_by, expanded):
+        data = self.tables.data
+        stmt = select(data).order_by(*resolve_lambda(order_by, data=data))
+        self._assert_pages(connection, stmt, expanded)
+
+
 class CompoundTest(fixtures.TablesTest):
 
     """test compound statements like UNION, INTERSECT, particularly their
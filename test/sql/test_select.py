@@ -11,6 +11,7 @@ from sqlalchemy import Table
 from sqlalchemy import testing
 from sqlalchemy import tuple_
 from sqlalchemy import union
+from sqlalchemy.engine import default
 from sqlalchemy.sql import column
 from sqlalchemy.sql import literal
 from sqlalchemy.sql import table
@@ -513,3 +514,228 @@ class ColumnCollectionAsSelectTest(fixtures.TestBase, AssertsCompiledSQL):
 
         with expect_raises_message(IndexError, "5"):
             table1.c["myid", 5]
+
+
+class KeysetPaginationTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = "default"
+
+    @testing.fixture
+    def row_value_dialect(self):
+        dialect = default.DefaultDialect()
+        dialect.supports_row_value_comparison = True
+        return dialect
+
+    def test_single_column(self, row_value_dialect):
+        stmt = select(table1).order_by(table1.c.myid).keyset_after((5,))
+
+        for dialect in ("default", row_value_dialect):
+            self.assert_compile(
+                stmt,
+                "SELECT mytable.myid, mytable.name, mytable.description "
+                "FROM mytable WHERE mytable.myid > :myid_1 "
+                "ORDER BY mytable.myid",
+                checkparams={"myid_1": 5},
+                dialect=dialect,
+            )
+
+    def test_single_column_desc(self):
+        stmt = (
+            select(table1.c.myid)
+            .order_by(table1.c.myid.desc())
+            .keyset_after((5,))
+        )
+
+        self.assert_compile(
+            stmt,
+            "SELECT mytable.myid FROM mytable WHERE mytable.myid < :myid_1 "
+            "ORDER BY mytable.myid DESC",
+            checkparams={"myid_1": 5},
+        )
+
+    @testing.combinations(((), ">"), ((True,), "<"), argnames="descending, op")
+    def test_row_value(self, row_value_dialect, descending, op):
+        if descending:
+            order_by = (table1.c.name.desc(), table1.c.myid.desc())
+        else:
+            order_by = (table1.c.name, table1.c.myid)
+
+        stmt = (
+            select(table1.c.myid).order_by(*order_by).keyset_after(("foo", 5))
+        )
+
+        self.assert_compile(
+            stmt,
+            "SELECT mytable.myid FROM mytable "
+            "WHERE (mytable.name, mytable.myid) %s (:name_1, :myid_1) "
+            "ORDER BY %s" % (op, ", ".join(str(c) for c in order_by)),
+            checkparams={"name_1": "foo", "myid_1": 5},
+            dialect=row_value_dialect,
+        )
+
+        self.assert_compile(
+            stmt,
+            "SELECT mytable.myid FROM mytable "
+            "WHERE mytable.name %s= :name_1 AND "
+            "(mytable.name %s :name_1 OR mytable.name = :name_1 "
+            "AND mytable.myid %s :myid_1) "
+            "ORDER BY %s" % (op, op, op, ", ".join(str(c) for c in order_by)),
+            checkparams={"name_1": "foo", "myid_1": 5},
+        )
+
+    def test_mixed_directions(self, row_value_dialect):
+        stmt = (
+            select(table1.c.myid)
+            .order_by(table1.c.name, table1.c.myid.desc())
+            .keyset_after(("foo", 5))
+        )
+
+        for dialect in ("default", row_value_dialect):
+            self.assert_compile(
+                stmt,
+                "SELECT mytable.myid FROM mytable "
+                "WHERE mytable.name >= :name_1 AND "
+                "(mytable.name > :name_1 OR mytable.name = :name_1 "
+                "AND mytable.myid < :myid_1) "
+                "ORDER BY mytable.name, mytable.myid DESC",
+                dialect=dialect,
+            )
+
+    def test_labels(self):
+        expr = table1.c.name.label("n")
+        stmt = (
+            select(expr, table1.c.myid)
+            .order_by(expr.desc(), table1.c.myid.desc())
+            .keyset_after(("foo", 5))
+        )
+
+        self.assert_compile(
+            stmt,
+            "SELECT mytable.name AS n, mytable.myid FROM mytable "
+            "WHERE mytable.name <= :name_1 AND "
+            "(mytable.name < :name_1 OR mytable.name = :name_1 "
+            "AND mytable.myid < :myid_1) "
+            "ORDER BY n DESC, mytable.myid DESC",
+        )
+
+    def test_nulls_last(self, row_value_dialect):
+        stmt = select(table1.c.myid).order_by(
+            table1.c.name.nulls_last(), table1.c.myid
+        )
+
+        for dialect in ("default", row_value_dialect):
+            self.assert_compile(
+                stmt.keyset_after(("foo", 5)),
+                "SELECT mytable.myid FROM mytable "
+                "WHERE (mytable.name > :name_1 OR mytable.name IS NULL "
+                "OR mytable.name = :name_1 AND mytable.myid > :myid_1) "
+                "ORDER BY mytable.name NULLS LAST, mytable.myid",
+                dialect=dialect,
+            )
+            self.assert_compile(
+                stmt.keyset_after((None, 5)),
+                "SELECT mytable.myid FROM mytable "
+                "WHERE mytable.name IS NULL AND mytable.myid > :myid_1 "
+                "ORDER BY mytable.name NULLS LAST, mytable.myid",
+                dialect=dialect,
+            )
+
+    def test_nulls_first(self):
+        stmt = select(table1.c.myid).order_by(
+            table1.c.name.desc().nulls_first(), table1.c.myid
+        )
+
+        self.assert_compile(
+            stmt.keyset_after(("foo", 5)),
+            "SELECT mytable.myid FROM mytable "
+            "WHERE (mytable.name < :name_1 OR mytable.name = :name_1 "
+            "AND mytable.myid > :myid_1) "
+            "ORDER BY mytable.name DESC NULLS FIRST, mytable.myid",
+        )
+        self.assert_compile(
+            stmt.keyset_after((None, 5)),
+            "SELECT mytable.myid FROM mytable "
+            "WHERE (mytable.name IS NOT NULL OR mytable.name IS NULL "
+            "AND mytable.myid > :myid_1) "
+            "ORDER BY mytable.name DESC NULLS FIRST, mytable.myid",
+        )
+
+    def test_last_value_nulls_last(self):
+        stmt = select(table1.c.myid).order_by(table1.c.name.nulls_last())
+
+        self.assert_compile(
+            stmt.keyset_after((None,)),
+            "SELECT mytable.myid FROM mytable WHERE 0 = 1 "
+            "ORDER BY mytable.name NULLS LAST",
+        )
+
+    def test_combined_with_where(self, row_value_dialect):
+        stmt = (
+            select(table1.c.myid)
+            .where(table1.c.description == "x")
+            .order_by(table1.c.name, table1.c.myid)
+            .keyset_after(("foo", 5))
+            .limit(10)
+        )
+
+        self.assert_compile(
+            stmt,
+            "SELECT mytable.myid FROM mytable "
+            "WHERE mytable.description = :description_1 "
+            "AND (mytable.name, mytable.myid) > (:name_1, :myid_1) "
+            "ORDER BY mytable.name, mytable.myid LIMIT :param_1",
+            dialect=row_value_dialect,
+        )
+
+    def test_none_bookmark(self):
+        stmt = select(table1.c.myid).order_by(table1.c.myid)
+        is_(stmt.keyset_after(None)._where_criteria, ())
+
+    def test_no_order_by(self):
+        with expect_raises_message(
+            exc.InvalidRequestError, "Keyset pagination requires that"
+        ):
+            select(table1.c.myid).keyset_after((5,))
+
+    def test_textual_order_by(self):
+        stmt = select(table1.c.myid.label("q")).order_by("q")
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "Can't use textual ORDER BY expression 'q' for keyset pagination",
+        ):
+            stmt.keyset_after((5,))
+
+    def test_wrong_length(self):
+        stmt = select(table1.c.myid).order_by(table1.c.myid)
+        with expect_raises_message(
+            exc.ArgumentError, "Keyset bookmark has 2 values; expected one"
+        ):
+            stmt.keyset_after((5, 6))
+
+    def test_none_value_no_nulls_ordering(self):
+        stmt = select(table1.c.myid).order_by(table1.c.name, table1.c.myid)
+        with expect_raises_message(
+            exc.ArgumentError,
+            "Keyset bookmark value for ORDER BY expression mytable.name "
+            "is None; use nulls_first",
+        ):
+            stmt.keyset_after((None, 5))
+
+    def test_bookmark(self):
+        expr = (table1.c.myid * 2).label("x")
+        stmt = select(table1.c.name, expr, table1.c.myid).order_by(
+            expr.desc(), table1.c.name, table1.c.myid
+        )
+        eq_(stmt.keyset_bookmark(("n", 10, 5)), (10, "n", 5))
+
+    def test_bookmark_scalar(self):
+        stmt = select(table1.c.myid).order_by(table1.c.myid.desc())
+        eq_(stmt.keyset_bookmark(5), (5,))
+
+    def test_bookmark_column_not_present(self):
+        stmt = select(table1.c.myid).order_by(table1.c.name, table1.c.myid)
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "ORDER BY expression mytable.name is not present in the columns "
+            "clause of the statement",
+        ):
+            stmt.keyset_bookmark(5)